@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Many simulated clients against one shared HTTP server.
+
+Starts the server with _JDS_HTTP on a free localhost port. It then opens
+--clients concurrent sessions. Each session uses one keep-alive connection
+and replays a trace's messages --rounds times, as a separate Claude window
+would. Reports throughput, p50/p95/p99 latency per tool and overall, any
+failed requests, and the server's peak RSS. For comparison it also reports
+the peak RSS of one stdio process on the same trace. That is roughly what
+every extra client costs without the shared server.
+
+The clients are threads in this process, so the latencies include their
+own GIL contention. Treat the numbers as an upper bound. Runs offline
+(auto-update off, no asset server).
+
+Usage: python benchmarks/http_clients.py [TRACE] [--clients N] [--rounds N] [--output FILE]
+"""
+
+import argparse
+import http.client
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from replay import PERCENTILES, TRACES, label, load_trace, percentile, run_process  # noqa: E402
+
+SESSION_HEADER = "Mcp-Session-Id"
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port: int, cache_dir: str):
+    """Server process and seconds until it listens."""
+    env = dict(os.environ, _JDS_HTTP=str(port), _JDS_CACHE_DIR=cache_dir)
+    for name in ("_JDS_HTTP_HOST", "_JDS_HTTP_TOKEN", "_JDS_COMPACT"):
+        env.pop(name, None)
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-m", "jiobharatiq_server"], env=env,
+                            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    for line in proc.stderr:
+        if b"HTTP transport: http" in line:
+            break
+    else:
+        raise RuntimeError("server exited before listening")
+    # Keep draining stderr so the server never blocks on a full pipe
+    threading.Thread(target=proc.stderr.read, daemon=True).start()
+    return proc, time.perf_counter() - start
+
+
+def stop_server(proc):
+    """Terminate the server; its peak RSS in KB where wait4 is available."""
+    proc.terminate()
+    if hasattr(os, "wait4"):
+        _, _, usage = os.wait4(proc.pid, 0)
+        proc.returncode = 0
+        return usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    proc.wait()
+    return None
+
+
+def client(port: int, messages: list, rounds: int, barrier, times, sizes, failures) -> None:
+    """One session: initialize, then the rest of the trace rounds times on one connection."""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=120)
+    headers = {"Content-Type": "application/json", "Accept": "application/json, text/event-stream"}
+    initialize, rest = messages[0], messages[1:]
+    barrier.wait()
+    try:
+        conn.request("POST", "/mcp", json.dumps(initialize), headers)
+        response = conn.getresponse()
+        response.read()
+        session = response.getheader(SESSION_HEADER)
+        if response.status != 200 or not session:
+            failures.append(f"initialize: HTTP {response.status}")
+            return
+        headers[SESSION_HEADER] = session
+        for _ in range(rounds):
+            for message in rest:
+                body = json.dumps(message)
+                start = time.perf_counter()
+                conn.request("POST", "/mcp", body, headers)
+                response = conn.getresponse()
+                data = response.read()
+                elapsed = time.perf_counter() - start
+                if response.status not in (200, 202):
+                    failures.append(f"{label(message)}: HTTP {response.status}")
+                elif "id" in message:
+                    times[label(message)].append(elapsed * 1000)
+                    sizes[label(message)].append(len(data))
+    except OSError as e:
+        failures.append(f"connection: {e}")
+    finally:
+        conn.close()
+
+
+def run(messages: list, clients: int, rounds: int) -> dict:
+    cache_dir = tempfile.mkdtemp(prefix="jds-http-")
+    port = _free_port()
+    proc, ready = start_server(port, cache_dir)
+    times, sizes, failures = defaultdict(list), defaultdict(list), []
+    barrier = threading.Barrier(clients + 1)
+    threads = [threading.Thread(target=client, args=(port, messages, rounds, barrier, times, sizes, failures))
+               for _ in range(clients)]
+    try:
+        for t in threads:
+            t.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for t in threads:
+            t.join()
+        wall = time.perf_counter() - start
+    finally:
+        rss = stop_server(proc)
+
+    tools = {}
+    for name in sorted(times):
+        samples = times[name]
+        tools[name] = {"calls": len(samples)}
+        for p in PERCENTILES:
+            tools[name][f"p{p}_ms"] = round(percentile(samples, p), 3)
+        tools[name]["bytes"] = round(sum(sizes[name]) / len(sizes[name]))
+    everything = [ms for samples in times.values() for ms in samples]
+    overall = {f"p{p}_ms": round(percentile(everything, p), 3) for p in PERCENTILES} if everything else {}
+    return {
+        "clients": clients,
+        "rounds": rounds,
+        "startup_ms": round(ready * 1000, 2),
+        "wall_ms": round(wall * 1000, 2),
+        "requests": len(everything),
+        "requests_per_s": round(len(everything) / wall, 1) if wall else None,
+        "latency": overall,
+        "failures": len(failures),
+        "failure_examples": sorted(set(failures))[:5],
+        "peak_rss_kb": rss,
+        "stdio_process_peak_rss_kb": run_process(messages, cache_dir)["peak_rss_kb"],
+        "tools": tools,
+    }
+
+
+def report(name: str, result: dict) -> None:
+    print(f"\n== {name}: {result['clients']} clients x {result['rounds']} rounds ==")
+    print(f"server ready in {result['startup_ms']} ms; {result['requests']:,d} requests in "
+          f"{result['wall_ms']:,.0f} ms ({result['requests_per_s']:,} req/s); {result['failures']} failed")
+    latency = result["latency"]
+    if latency:
+        print("overall " + ", ".join(f"p{p} {latency[f'p{p}_ms']} ms" for p in PERCENTILES))
+    rss, stdio = result["peak_rss_kb"], result["stdio_process_peak_rss_kb"]
+    if rss and stdio:
+        print(f"peak RSS {rss:,d} KB shared, vs {stdio:,d} KB per stdio process "
+              f"(~{stdio * result['clients']:,d} KB for {result['clients']} of them)")
+    for example in result["failure_examples"]:
+        print(f"  failed: {example}")
+    print(f"{'tool':24s} {'calls':>7s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s} {'bytes':>10s}")
+    for tool, stats in result["tools"].items():
+        print(f"{tool:24s} {stats['calls']:7d} {stats['p50_ms']:9.3f} {stats['p95_ms']:9.3f} "
+              f"{stats['p99_ms']:9.3f} {stats['bytes']:10,d}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("trace", nargs="?", default=os.path.join(TRACES, "bootstrap.jsonl"),
+                        help="trace file; its first message must be initialize")
+    parser.add_argument("--clients", type=int, default=200, help="concurrent client sessions")
+    parser.add_argument("--rounds", type=int, default=3, help="replays of the trace per client")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    messages = load_trace(args.trace)
+    if not messages or messages[0].get("method") != "initialize":
+        parser.error("the trace must start with an initialize request")
+    name = os.path.splitext(os.path.basename(args.trace))[0]
+    result = run(messages, args.clients, args.rounds)
+    report(name, result)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "platform": platform.platform(),
+                       "traces": {name: result}}, f, indent=1, sort_keys=True)
+            f.write("\n")
+    sys.exit(1 if result["failures"] else 0)
+
+
+if __name__ == "__main__":
+    main()
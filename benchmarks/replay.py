@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Trace-replay benchmark: startup, per-tool latency, memory and response bytes.
+
+Replays recorded JSON-RPC sessions (one message per line, as a client sends
+them on stdin; see benchmarks/traces/) two ways:
+
+- through main(), in fresh server processes: cold start (empty registry
+  cache) and warm start, as time to the initialize response, plus wall time
+  and peak RSS for the whole session;
+- through handle_request() in this process, --rounds times: p50/p95/p99
+  latency and response bytes per tool (per method for non-tool messages).
+  Later rounds hit the response cache as a live session would; add
+  --no-response-cache to time every call from scratch.
+
+An html_content of "@prototype:<KB>" is replaced by a synthetic prototype of
+that size (benchmarks/validate.py's generator), so traces stay small. Runs
+fully offline (auto-update off, no asset server). Results are written as
+JSON; pass a previous run as --baseline to print the change per metric and,
+with --fail-over PCT, exit non-zero on any slowdown beyond PCT percent.
+
+Usage: python benchmarks/replay.py [TRACE ...] [--rounds N] [--output FILE]
+                                   [--baseline FILE [--fail-over PCT]]
+"""
+
+import argparse
+import glob
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+try:
+    import resource
+except ImportError:          # Windows: no peak RSS in this process
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+TRACES = os.path.join(ROOT, "benchmarks", "traces")
+RESULT_VERSION = 1
+OFFLINE_ENV = {"_JDS_NO_UPDATE": "1", "PYTHONPATH": SRC, "PYTHONDONTWRITEBYTECODE": "1"}
+PERCENTILES = (50, 95, 99)
+
+sys.path.insert(0, SRC)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+for _name, _value in OFFLINE_ENV.items():
+    os.environ.setdefault(_name, _value)
+os.environ.pop("_JDS_ASSET_SERVER", None)
+
+from validate import build as build_prototype  # noqa: E402
+
+
+def load_trace(path: str) -> list:
+    """The messages of a trace, with @prototype:<KB> placeholders expanded."""
+    documents = {}
+    messages = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            message = json.loads(line)
+            args = message.get("params", {}).get("arguments", {})
+            html = args.get("html_content")
+            if isinstance(html, str) and html.startswith("@prototype:"):
+                size_kb = int(html.split(":", 1)[1])
+                if size_kb not in documents:
+                    documents[size_kb] = build_prototype(size_kb)
+                args["html_content"] = documents[size_kb]
+            messages.append(message)
+    return messages
+
+
+def label(message: dict) -> str:
+    if message.get("method") == "tools/call":
+        return message["params"].get("name", "?")
+    return message.get("method", "?")
+
+
+def percentile(samples: list, p: int) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def _peak_rss_kb() -> int:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss   # bytes on macOS, KB elsewhere
+
+
+def run_process(messages: list, cache_dir: str) -> dict:
+    """One server process over the whole trace, through main() on stdio."""
+    env = dict(os.environ, _JDS_CACHE_DIR=cache_dir)
+    env.pop("_JDS_COMPACT", None)
+    first, rest = messages[0], messages[1:]
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-m", "jiobharatiq_server"], env=env,
+                            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    proc.stdin.write((json.dumps(first) + "\n").encode())
+    proc.stdin.flush()
+    counts = [0, 0]   # responses, bytes
+    startup = None
+    if "id" in first:
+        response = proc.stdout.readline()
+        startup = time.perf_counter() - start
+        counts[:] = [1, len(response)]
+
+    def drain():
+        for line in proc.stdout:
+            counts[0] += 1
+            counts[1] += len(line)
+
+    # Read while writing: a large trace would otherwise fill both pipes and deadlock
+    reader = threading.Thread(target=drain, daemon=True)
+    reader.start()
+    proc.stdin.write("".join(json.dumps(m) + "\n" for m in rest).encode())
+    proc.stdin.close()      # EOF: main() finishes in-flight calls, then exits
+    reader.join()
+    rss = None
+    if hasattr(os, "wait4"):
+        _, status, usage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        rss = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    else:
+        proc.wait()
+    return {
+        "startup_ms": round(startup * 1000, 2) if startup is not None else None,
+        "wall_ms": round((time.perf_counter() - start) * 1000, 2),
+        "responses": counts[0],
+        "expected_responses": sum(1 for m in messages if "id" in m),
+        "response_bytes": counts[1],
+        "peak_rss_kb": rss,
+    }
+
+
+def measure_processes(messages: list, runs: int) -> dict:
+    cold, warm = [], []
+    for _ in range(runs):
+        cache_dir = tempfile.mkdtemp(prefix="jds-replay-")
+        cold.append(run_process(messages, cache_dir))
+        warm.append(run_process(messages, cache_dir))
+
+    def median(runs_, key):
+        values = sorted(r[key] for r in runs_ if r[key] is not None)
+        return values[len(values) // 2] if values else None
+
+    return {
+        "cold_start_ms": median(cold, "startup_ms"),
+        "warm_start_ms": median(warm, "startup_ms"),
+        "cold_session_ms": median(cold, "wall_ms"),
+        "warm_session_ms": median(warm, "wall_ms"),
+        "responses": warm[-1]["responses"],
+        "expected_responses": warm[-1]["expected_responses"],
+        "response_bytes": warm[-1]["response_bytes"],
+        "peak_rss_kb": max((r["peak_rss_kb"] for r in cold + warm if r["peak_rss_kb"]), default=None),
+    }
+
+
+def measure_in_process(messages: list, rounds: int) -> dict:
+    """Per-label latency and bytes through handle_request (cache state as a live server has it)."""
+    from jiobharatiq_server import server
+
+    times, sizes = defaultdict(list), defaultdict(list)
+    for _ in range(rounds):
+        for message in messages:
+            start = time.perf_counter()
+            response = server.handle_request(message)
+            text = server._serialize(response) if response is not None else ""
+            elapsed = time.perf_counter() - start
+            if "id" in message:
+                times[label(message)].append(elapsed * 1000)
+                sizes[label(message)].append(len(text.encode("utf-8")))
+    tools = {}
+    for name in sorted(times):
+        samples = times[name]
+        tools[name] = {"calls": len(samples)}
+        for p in PERCENTILES:
+            tools[name][f"p{p}_ms"] = round(percentile(samples, p), 3)
+        tools[name]["bytes"] = round(sum(sizes[name]) / len(sizes[name]))
+    return {"tools": tools, "peak_rss_kb": _peak_rss_kb() if resource else None}
+
+
+# Lower is better for every compared metric
+COMPARED = ("cold_start_ms", "warm_start_ms", "cold_session_ms", "warm_session_ms", "peak_rss_kb",
+            "response_bytes")
+COMPARED_TOOL = ("p50_ms", "p95_ms", "p99_ms", "bytes")
+
+
+def compare(current: dict, baseline: dict, fail_over) -> int:
+    """Print the change against baseline; 1 if any timing got slower than fail_over percent."""
+    regressions = 0
+    if current.get("response_cache") != baseline.get("response_cache"):
+        print("note: response cache setting differs from the baseline; latencies are not comparable")
+
+    def row(name, new, old, timing):
+        nonlocal regressions
+        if not isinstance(new, (int, float)) or not isinstance(old, (int, float)) or not old:
+            return
+        change = 100 * (new - old) / old
+        flag = ""
+        if timing and fail_over is not None and change > fail_over:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(f"  {name:44s} {old:12,.2f} -> {new:12,.2f}  {change:+7.1f}%{flag}")
+
+    for trace, result in current["traces"].items():
+        old = baseline.get("traces", {}).get(trace)
+        if old is None:
+            print(f"{trace}: not in baseline")
+            continue
+        print(f"{trace}:")
+        for key in COMPARED:
+            for section in ("process", "in_process"):
+                if key in result.get(section, {}):
+                    row(f"{section}.{key}", result[section][key], old.get(section, {}).get(key),
+                        key.endswith("_ms"))
+        for tool, stats in result["in_process"]["tools"].items():
+            old_stats = old.get("in_process", {}).get("tools", {}).get(tool, {})
+            for key in COMPARED_TOOL:
+                row(f"{tool}.{key}", stats[key], old_stats.get(key), key.endswith("_ms"))
+    return 1 if regressions else 0
+
+
+def report(name: str, result: dict) -> None:
+    process = result["process"]
+    print(f"\n== {name} ==")
+    print(f"cold start {process['cold_start_ms']} ms, warm start {process['warm_start_ms']} ms; "
+          f"session {process['cold_session_ms']} / {process['warm_session_ms']} ms (cold / warm); "
+          f"{process['responses']}/{process['expected_responses']} responses, "
+          f"{process['response_bytes']:,d} bytes; peak RSS {process['peak_rss_kb']} KB")
+    print(f"{'tool':24s} {'calls':>6s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s} {'bytes':>10s}")
+    for tool, stats in result["in_process"]["tools"].items():
+        print(f"{tool:24s} {stats['calls']:6d} {stats['p50_ms']:9.3f} {stats['p95_ms']:9.3f} "
+              f"{stats['p99_ms']:9.3f} {stats['bytes']:10,d}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("traces", nargs="*", help="trace files (default: benchmarks/traces/*.jsonl)")
+    parser.add_argument("--rounds", type=int, default=20, help="in-process replays of each trace")
+    parser.add_argument("--runs", type=int, default=3, help="cold + warm server processes per trace")
+    parser.add_argument("--no-response-cache", action="store_true",
+                        help="set _JDS_NO_CACHE, so repeated calls are recomputed instead of served from cache")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="earlier --output file to compare against")
+    parser.add_argument("--fail-over", type=float, help="exit 1 if any timing is this many percent slower")
+    args = parser.parse_args()
+    if args.no_response_cache:
+        os.environ["_JDS_NO_CACHE"] = "1"
+
+    paths = args.traces or sorted(glob.glob(os.path.join(TRACES, "*.jsonl")))
+    results = {
+        "version": RESULT_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "rounds": args.rounds,
+        "response_cache": not args.no_response_cache,
+        "traces": {},
+    }
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        messages = load_trace(path)
+        results["traces"][name] = {
+            "messages": len(messages),
+            "process": measure_processes(messages, args.runs),
+            "in_process": measure_in_process(messages, args.rounds),
+        }
+        report(name, results["traces"][name])
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+            f.write("\n")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\nagainst {args.baseline}:")
+        sys.exit(compare(results, baseline, args.fail_over))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Output sanitiser micro-benchmark.
+
+For the largest components, times sanitising a lookup_component result the
+old way (nine regex passes per string over a full deep rebuild) against the
+current sanitize_output (one combined pattern, pre-sanitised registry
+content passed through).
+
+Usage: python benchmarks/sanitize.py [--top N] [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.environ.setdefault("_JDS_NO_UPDATE", "1")
+
+from jiobharatiq_server import server  # noqa: E402
+
+
+def legacy_sanitize(obj):
+    """sanitize_output as it was: every pattern over every string, every container rebuilt."""
+    if isinstance(obj, str):
+        for pattern in server.PATH_PATTERNS + server.SECRET_PATTERNS:
+            obj = pattern.sub("[REDACTED]", obj)
+        return obj
+    if isinstance(obj, dict):
+        return {k: legacy_sanitize(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [legacy_sanitize(item) for item in obj]
+    return obj
+
+
+def result_for(component: dict, name: str) -> dict:
+    """The dict lookup_component builds, before sanitising."""
+    return {
+        "component": component.get("name", name),
+        "description": component.get("description", ""),
+        "props": component.get("props", {}),
+        "variants": {k: component[k] for k in ("kinds", "sizes", "states", "variants") if component.get(k)},
+        "sub_components": component.get("sub_components", []),
+        "code_example": component.get("code_example", component.get("css_example", "")),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    raw = server._kb.COMPONENTS
+    clean = server._registry("COMPONENTS")
+    largest = sorted(raw, key=lambda k: len(json.dumps(raw[k])), reverse=True)[:args.top]
+
+    print(f"{'component':32s} {'size':>8s} {'before':>10s} {'after':>10s} {'speedup':>8s}")
+    for name in largest:
+        before_obj = result_for(raw[name], name)
+        after_obj = result_for(clean[name], name)
+        assert legacy_sanitize(before_obj) == server.sanitize_output(after_obj)
+        before = min(timeit.repeat(lambda: legacy_sanitize(before_obj), number=args.repeat, repeat=3))
+        after = min(timeit.repeat(lambda: server.sanitize_output(after_obj), number=args.repeat, repeat=3))
+        before_us = before / args.repeat * 1e6
+        after_us = after / args.repeat * 1e6
+        size = len(json.dumps(raw[name]))
+        print(f"{name:32s} {size:8,d} {before_us:8.1f}us {after_us:8.1f}us {before_us / after_us:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
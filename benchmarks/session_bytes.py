@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Bytes-per-session benchmark for compact mode and field projection.
+
+Replays a typical prototype bootstrap (initialize, get_assets, a handful of
+component, token and icon lookups) against the stdio server three times:
+default responses, compact mode, and compact mode with `fields` projections.
+Reports the bytes written to stdout for each.
+
+Usage: python benchmarks/session_bytes.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+
+COMPONENTS = ["Button", "Card", "InputField", "BottomSheet", "BottomNav", "Toast"]
+TOKENS = [("colors", "primary-50"), ("colors", "grey-100"), ("spacing", "base"),
+          ("border_radius", "medium"), ("typography", "body-m"), ("opacity", "disabled")]
+ICONS = ["mic", "home", "search", "close", "chevron right", "profile"]
+
+PROJECTIONS = {
+    "get_assets": ["files.name", "files.cdn_url"],
+    "lookup_component": ["component", "props", "variants", "code_example"],
+    "resolve_token": ["token", "value"],
+    "find_icon": ["icon", "svg_path"],
+}
+
+
+def session(compact: bool, fields: bool) -> list:
+    """The JSON-RPC messages of one session."""
+    init_params = {"protocolVersion": "2024-11-05", "clientInfo": {"name": "bench"}, "capabilities": {}}
+    if compact:
+        init_params["capabilities"]["experimental"] = {"jdsCompactResponses": True}
+    calls = [("get_assets", {"asset_type": "all"})]
+    calls += [("lookup_component", {"component_name": c}) for c in COMPONENTS]
+    calls += [("resolve_token", {"token_category": c, "token_name": n}) for c, n in TOKENS]
+    calls += [("find_icon", {"query": q, "limit": 3}) for q in ICONS]
+
+    messages = [{"jsonrpc": "2.0", "id": 0, "method": "initialize", "params": init_params},
+                {"jsonrpc": "2.0", "method": "notifications/initialized"}]
+    for i, (name, args) in enumerate(calls, 1):
+        if fields:
+            args = dict(args, fields=PROJECTIONS[name])
+        messages.append({"jsonrpc": "2.0", "id": i, "method": "tools/call",
+                         "params": {"name": name, "arguments": args}})
+    return messages
+
+
+def run(messages) -> int:
+    env = dict(os.environ, _JDS_NO_UPDATE="1", PYTHONPATH=SRC)
+    env.pop("_JDS_COMPACT", None)
+    stdin = "".join(json.dumps(m) + "\n" for m in messages)
+    out = subprocess.run([sys.executable, "-m", "jiobharatiq_server"], input=stdin.encode(),
+                         env=env, capture_output=True, check=True).stdout
+    return len(out)
+
+
+def main():
+    baseline = run(session(compact=False, fields=False))
+    rows = [
+        ("default (indent=2, reminder per call)", baseline),
+        ("compact", run(session(compact=True, fields=False))),
+        ("compact + fields", run(session(compact=True, fields=True))),
+    ]
+    calls = len(session(False, False)) - 2
+    print(f"session: initialize + {calls} tool calls")
+    for label, size in rows:
+        saved = 100 * (1 - size / baseline)
+        print(f"{label:40s} {size:9,d} bytes  (~{size // 4:7,d} tokens)  {saved:5.1f}% saved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Cold vs warm startup benchmark.
+
+Spawns fresh interpreters that import the server (auto-update disabled) and
+reports the median wall time with an empty registry cache (cold) and with a
+populated one (warm).
+
+Usage: python benchmarks/startup.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+IMPORT = "import jiobharatiq_server.server"
+
+
+def _run(env) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", IMPORT], env=env, check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    base_env = dict(os.environ, _JDS_NO_UPDATE="1", PYTHONPATH=SRC, PYTHONDONTWRITEBYTECODE="1")
+    _run(dict(base_env, _JDS_NO_CACHE="1"))  # prime the OS page cache
+
+    cold, warm = [], []
+    for _ in range(args.runs):
+        cache = tempfile.mkdtemp(prefix="jds-bench-")
+        env = dict(base_env, _JDS_CACHE_DIR=cache)
+        cold.append(_run(env))
+        warm.append(_run(env))
+
+    cold_ms = statistics.median(cold) * 1000
+    warm_ms = statistics.median(warm) * 1000
+    print(f"cold start (empty cache): {cold_ms:8.1f} ms")
+    print(f"warm start (cached)     : {warm_ms:8.1f} ms")
+    print(f"saved per start         : {cold_ms - warm_ms:8.1f} ms ({cold_ms / warm_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
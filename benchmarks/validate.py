@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+validate_prototype throughput benchmark.
+
+Builds a synthetic single-file prototype (phone frame, inline CSS with a mix
+of token and raw colours, spacing and fonts, a few emoji) at several sizes
+and reports validation throughput in MB/s.
+
+With --adversarial, instead times single-line inputs built to make a
+backtracking regex blow up (the old spacing rule took 30 s on 6 KB of
+"top:a ") and exits non-zero if any takes longer than --budget seconds.
+
+Usage: python benchmarks/validate.py [--sizes 50,200,1000] [--runs N]
+       python benchmarks/validate.py --adversarial [--budget SECONDS]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src", "jiobharatiq_server"))
+os.environ.setdefault("_JDS_NO_UPDATE", "1")
+
+import knowledge_base  # noqa: E402
+from validators import validate_prototype  # noqa: E402
+
+BLOCK = """\
+<style>
+  .card-{i} {{ background: #f5f5f5; padding: 16px; border-radius: 12px; margin: 8px 0; }}
+  .title-{i} {{ font-family: 'JioType', sans-serif; font-size: 18px; color: var(--grey-100); }}
+  .cta-{i} {{ background: #3535f3; color: #ffffff; padding: 12px 20px; height: 44px; }}
+  .bad-{i} {{ font-family: Inter, Arial; color: #a855f7; gap: 13px; }}
+</style>
+<!-- card {i} -->
+<div class="card-{i}">
+  <h2 class="title-{i}">Recharge plan {i}</h2>
+  <p style="color:#141414; margin-top: 4px">Unlimited 5G data, 2 GB/day, 28 days.</p>
+  <button class="cta-{i}">Recharge ₹299 {emoji}</button>
+</div>
+"""
+
+
+def build(size_kb: int) -> str:
+    parts, total, i = ["<!DOCTYPE html><html><body>\n"], 0, 0
+    while total < size_kb * 1024:
+        block = BLOCK.format(i=i, emoji="\U0001F680" if i % 25 == 0 else "")
+        parts.append(block)
+        total += len(block)
+        i += 1
+    parts.append("</body></html>\n")
+    return "".join(parts)
+
+
+def adversarial(size: int) -> dict:
+    """One-line inputs of about size characters that stress each tokenizer path."""
+    return {
+        "keyword colons": "px " + "top:a " * (size // 6),
+        "unclosed style attr": '<div style="' + "top:a " * (size // 6),
+        "declaration without end": "<style>a{padding:" + " 1" * (size // 2),
+        "unclosed var(": "<style>a{padding:" + "var(" * (size // 4),
+        "unclosed <style tags": "<style " * (size // 7),
+        "run of #": "<style>a{color:" + "#" * size,
+        "run of digits": "<style>a{margin:" + "1" * size,
+        "minified rules": "<style>" + "a{margin:16px;color:#3535f3}" * (size // 28),
+    }
+
+
+def check_adversarial(tokens, budget: float) -> int:
+    failed = 0
+    for name, html in adversarial(1_000_000).items():
+        start = time.perf_counter()
+        validate_prototype(html, strict=True, _tokens=tokens)
+        elapsed = time.perf_counter() - start
+        ok = elapsed <= budget
+        failed += not ok
+        print(f"{name:26s} {len(html):9,d} chars  {elapsed * 1000:8.1f} ms  {'ok' if ok else 'TOO SLOW'}")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="50,200,1000", help="document sizes in KB")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--adversarial", action="store_true", help="time worst-case single-line inputs")
+    parser.add_argument("--budget", type=float, default=3.0, help="max seconds per adversarial input")
+    args = parser.parse_args()
+
+    tokens = knowledge_base.TOKENS
+    validate_prototype("", _tokens=tokens)  # warm the code and registry caches
+    if args.adversarial:
+        sys.exit(check_adversarial(tokens, args.budget))
+    for size_kb in (int(s) for s in args.sizes.split(",")):
+        html = build(size_kb)
+        best = float("inf")
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            result = validate_prototype(html, strict=True, _tokens=tokens)
+            best = min(best, time.perf_counter() - start)
+        mb = len(html.encode("utf-8")) / 1e6
+        print(f"{size_kb:6d} KB  {best * 1000:8.1f} ms  {mb / best:7.2f} MB/s  "
+              f"{result['total_issues']:6d} issues{'  (truncated)' if result.get('truncated') else ''}")
+
+
+if __name__ == "__main__":
+    main()
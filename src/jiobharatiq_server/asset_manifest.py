@@ -0,0 +1,125 @@
+"""Content-hashed manifest of the assets/ tree.
+
+Generated at build time (run this module after changing anything under
+assets/) and shipped next to server.py, so get_assets lists exactly the
+files that exist, without touching the disk at run time. Each entry carries
+the file's size, MIME type, SHA-256 and a Subresource Integrity string.
+Where the URLs serve exactly these bytes (the local asset server over this
+install's assets/), they carry a content fingerprint (?v=<hash>), so
+browsers can cache them forever and a changed file gets a new URL. URLs on
+a moving branch such as GitHub's main get neither the fingerprint nor the
+integrity string: the host ignores the query, and the bytes can change
+under the same URL.
+
+Usage: python -m jiobharatiq_server.asset_manifest [--assets DIR] [--check]
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import sys
+import urllib.parse
+
+MANIFEST_FILE = "asset_manifest.json"
+MANIFEST_VERSION = 1
+FINGERPRINT_LENGTH = 10
+HASH_CHUNK = 1 << 20
+MIME_TYPES = {
+    ".woff2": "font/woff2",
+    ".ttf": "font/ttf",
+    ".mp4": "video/mp4",
+    ".svg": "image/svg+xml",
+    ".json": "application/json",
+    ".js": "text/javascript; charset=utf-8",
+    ".jsx": "text/javascript; charset=utf-8",
+    ".tsx": "text/plain; charset=utf-8",
+}
+
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_ASSETS = os.path.join(os.path.dirname(os.path.dirname(_MODULE_DIR)), "assets")
+DEFAULT_OUTPUT = os.path.join(_MODULE_DIR, MANIFEST_FILE)
+
+
+def _entry(path: str) -> dict:
+    sha256, sha384 = hashlib.sha256(), hashlib.sha384()
+    size = 0
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_CHUNK), b""):
+            sha256.update(block)
+            sha384.update(block)
+            size += len(block)
+    return {
+        "size": size,
+        "mime": MIME_TYPES.get(os.path.splitext(path)[1].lower(), "application/octet-stream"),
+        "sha256": sha256.hexdigest(),
+        "integrity": "sha384-" + base64.b64encode(sha384.digest()).decode("ascii"),
+    }
+
+
+def build(root: str) -> dict:
+    """Manifest for every non-hidden file under root, keyed by "/"-separated relative path."""
+    files = {}
+    for current, dirs, names in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in sorted(names):
+            if name.startswith("."):
+                continue
+            path = os.path.join(current, name)
+            files[os.path.relpath(path, root).replace(os.sep, "/")] = _entry(path)
+    return {"version": MANIFEST_VERSION, "files": dict(sorted(files.items()))}
+
+
+def load(path: str = DEFAULT_OUTPUT) -> dict:
+    """The shipped manifest, or an empty one if it is missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == MANIFEST_VERSION and isinstance(manifest.get("files"), dict):
+            return manifest
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"version": MANIFEST_VERSION, "files": {}}
+
+
+def url_for(base: str, rel: str, entry: dict = None) -> str:
+    """URL of an asset under base (the URL standing in for assets/), fingerprinted when entry is given."""
+    url = f"{base}/{urllib.parse.quote(rel, safe='/()')}"
+    return f"{url}?v={entry['sha256'][:FINGERPRINT_LENGTH]}" if entry else url
+
+
+def _serialize(manifest: dict) -> str:
+    return json.dumps(manifest, indent=1, sort_keys=True) + "\n"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Regenerate the content-hashed asset manifest.")
+    parser.add_argument("--assets", default=DEFAULT_ASSETS, help="assets/ directory to scan")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="manifest file to write")
+    parser.add_argument("--check", action="store_true", help="exit 1 if the manifest is out of date")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.assets):
+        print(f"No assets directory at {args.assets}", file=sys.stderr)
+        return 2
+    text = _serialize(build(args.assets))
+    try:
+        with open(args.output, encoding="utf-8") as f:
+            current = f.read()
+    except OSError:
+        current = None
+    if args.check:
+        if current != text:
+            print(f"{args.output} is out of date; regenerate it", file=sys.stderr)
+            return 1
+        return 0
+    if current != text:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(f"{len(json.loads(text)['files'])} assets in {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""Localhost static server for the bundled assets/ directory.
+
+Prototypes otherwise load fonts, icons and state videos from
+raw.githubusercontent.com: uncached, rate-limited and unavailable offline.
+When enabled, the MCP server starts this on 127.0.0.1 and get_assets hands
+out its URLs instead. Every response carries a strong ETag (content hash)
+and an immutable Cache-Control, so a browser fetches each file once;
+single byte ranges are honoured (video seeking); bodies go out with
+socket.sendfile, so large MP4s are never read into Python; text formats
+(SVG, JSON, JS) are compressed once per file and encoding and served from
+memory to every later request that accepts gzip (or brotli, when the
+brotli package is installed).
+"""
+
+import email.utils
+import gzip
+import hashlib
+import http.server
+import os
+import re
+import threading
+import urllib.parse
+from collections import OrderedDict
+
+try:
+    from .asset_manifest import MIME_TYPES
+except ImportError:
+    from asset_manifest import MIME_TYPES
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+HOST = "127.0.0.1"
+DEFAULT_PORT = 47321
+URL_PREFIX = "/assets/"
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+COMPRESSIBLE = frozenset((".svg", ".json", ".js", ".jsx", ".tsx"))
+MAX_COMPRESS_SOURCE = 4 * 1024 * 1024    # larger text files go out uncompressed
+MAX_ENCODED_BYTES = 32 * 1024 * 1024     # memory held by compressed variants
+HASH_CHUNK = 1 << 20
+
+_RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)\Z")
+
+
+def _encoders() -> dict:
+    encoders = {"gzip": lambda data: gzip.compress(data, 9, mtime=0)}
+    if brotli is not None:
+        encoders["br"] = lambda data: brotli.compress(data, quality=11)
+    return encoders
+
+
+class AssetStore:
+    """Maps URL paths to files under root, with cached ETags and encoded variants."""
+
+    def __init__(self, root: str):
+        self.root = os.path.realpath(root)
+        self.encoders = _encoders()
+        self._meta = {}                 # path → (size, mtime_ns, etag, mime)
+        self._encoded = OrderedDict()   # (path, etag, encoding) → bytes
+        self._encoded_size = 0
+        self._lock = threading.Lock()
+
+    def resolve(self, url_path: str):
+        """File path for a URL path under URL_PREFIX, or None."""
+        if not url_path.startswith(URL_PREFIX):
+            return None
+        rel = urllib.parse.unquote(url_path[len(URL_PREFIX):])
+        parts = rel.split("/")
+        if not rel or "\x00" in rel or any(p in ("", ".", "..") or p.startswith(".") for p in parts):
+            return None
+        path = os.path.realpath(os.path.join(self.root, *parts))
+        if os.path.commonpath([self.root, path]) != self.root or not os.path.isfile(path):
+            return None
+        return path
+
+    def meta(self, path: str) -> tuple:
+        """(size, mtime_ns, etag, mime); the hash is recomputed only when the file changes."""
+        st = os.stat(path)
+        cached = self._meta.get(path)
+        if cached is not None and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(HASH_CHUNK), b""):
+                digest.update(block)
+        ext = os.path.splitext(path)[1].lower()
+        mime = MIME_TYPES.get(ext, "application/octet-stream")
+        meta = (st.st_size, st.st_mtime_ns, f'"{digest.hexdigest()[:32]}"', mime)
+        self._meta[path] = meta
+        return meta
+
+    def encoded(self, path: str, etag: str, encoding: str) -> bytes:
+        """The file compressed with encoding, computed on first use and kept (LRU)."""
+        key = (path, etag, encoding)
+        with self._lock:
+            data = self._encoded.get(key)
+            if data is not None:
+                self._encoded.move_to_end(key)
+                return data
+        with open(path, "rb") as f:
+            data = self.encoders[encoding](f.read())
+        with self._lock:
+            if key not in self._encoded:
+                self._encoded[key] = data
+                self._encoded_size += len(data)
+                while self._encoded_size > MAX_ENCODED_BYTES and len(self._encoded) > 1:
+                    _, old = self._encoded.popitem(last=False)
+                    self._encoded_size -= len(old)
+        return data
+
+    def choose_encoding(self, path: str, size: int, accept: str):
+        """Best encoding the client accepts for this file, or None for identity."""
+        if os.path.splitext(path)[1].lower() not in COMPRESSIBLE or size > MAX_COMPRESS_SOURCE:
+            return None
+        accepted = set()
+        for item in accept.split(","):
+            name, _, params = item.strip().partition(";")
+            if params.replace(" ", "").lower() in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                continue
+            accepted.add(name.strip().lower())
+        for encoding in ("br", "gzip"):
+            if encoding in self.encoders and (encoding in accepted or "*" in accepted):
+                return encoding
+        return None
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    header = header.strip()
+    if header == "*":
+        return True
+    # If-None-Match uses weak comparison: a W/ prefix doesn't matter
+    for tag in header.split(","):
+        tag = tag.strip()
+        if (tag[2:] if tag.startswith("W/") else tag) == etag:
+            return True
+    return False
+
+
+def _parse_range(header: str, size: int):
+    """(start, end) inclusive for a single satisfiable range, "invalid" if unsatisfiable, else None."""
+    m = _RANGE_RE.match(header.strip().replace(" ", ""))
+    if m is None:
+        return None          # malformed or multi-range: ignore, send the whole file
+    first, last = m.groups()
+    if not first:
+        if not last or int(last) == 0:
+            return "invalid"
+        return max(0, size - int(last)), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or (last and int(last) < start):
+        return "invalid"
+    return start, end
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    server_version = "JioBharatIQ-assets"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def log_message(self, format, *args):
+        pass   # stdout is the MCP channel and stderr is for real problems
+
+    def _empty(self, status: int, headers=()) -> None:
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _serve(self, send_body: bool) -> None:
+        store = self.server.store
+        path = store.resolve(urllib.parse.urlsplit(self.path).path)
+        if path is None:
+            self._empty(404)
+            return
+        try:
+            size, mtime_ns, etag, mime = store.meta(path)
+        except OSError:
+            self._empty(404)
+            return
+
+        encoding = None
+        if not self.headers.get("Range"):
+            encoding = store.choose_encoding(path, size, self.headers.get("Accept-Encoding", ""))
+        tag = etag if encoding is None else f'{etag[:-1]}-{encoding}"'
+        common = [
+            ("ETag", tag),
+            ("Cache-Control", CACHE_CONTROL),
+            ("Last-Modified", email.utils.formatdate(mtime_ns / 1e9, usegmt=True)),
+            ("Access-Control-Allow-Origin", "*"),
+            ("X-Content-Type-Options", "nosniff"),
+        ]
+        if os.path.splitext(path)[1].lower() in COMPRESSIBLE:
+            common.append(("Vary", "Accept-Encoding"))
+        else:
+            common.append(("Accept-Ranges", "bytes"))
+
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None and _etag_matches(if_none_match, tag):
+            self._empty(304, common)
+            return
+
+        if encoding is not None:
+            body = store.encoded(path, etag, encoding)
+            self.send_response(200)
+            for name, value in common:
+                self.send_header(name, value)
+            self.send_header("Content-Type", mime)
+            self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if send_body:
+                self.wfile.write(body)
+            return
+
+        start, end, status = 0, size - 1, 200
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if range_header and (if_range is None or if_range.strip() == etag):
+            span = _parse_range(range_header, size)
+            if span == "invalid":
+                self._empty(416, common + [("Content-Range", f"bytes */{size}")])
+                return
+            if span is not None:
+                (start, end), status = span, 206
+        self.send_response(status)
+        for name, value in common:
+            self.send_header(name, value)
+        self.send_header("Content-Type", mime)
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(end - start + 1 if size else 0))
+        self.end_headers()
+        if send_body and size:
+            with open(path, "rb") as f:
+                self.connection.sendfile(f, start, end - start + 1)
+
+    def handle_one_request(self):
+        try:
+            super().handle_one_request()
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True   # the browser moved on (seek, navigation)
+
+
+class AssetServer:
+    """ThreadingHTTPServer for one assets/ directory, on a daemon thread."""
+
+    def __init__(self, root: str, host: str = HOST, port: int = DEFAULT_PORT):
+        self.store = AssetStore(root)
+        self.host = host
+        self.port = port
+        self._httpd = None
+
+    def start(self) -> str:
+        """Bind and start serving; falls back to a free port if port is taken. Returns base_url."""
+        try:
+            httpd = http.server.ThreadingHTTPServer((self.host, self.port), _Handler)
+        except OSError:
+            httpd = http.server.ThreadingHTTPServer((self.host, 0), _Handler)
+        httpd.daemon_threads = True
+        httpd.store = self.store
+        self.port = httpd.server_address[1]
+        self._httpd = httpd
+        threading.Thread(target=httpd.serve_forever, name="jds-assets", daemon=True).start()
+        return self.base_url
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    @property
+    def base_url(self) -> str:
+        """URL standing in for <repo>/assets."""
+        return f"http://{self.host}:{self.port}{URL_PREFIX.rstrip('/')}"
+
+
+def find_assets_dir(candidates) -> str:
+    """First candidate that is an assets/ directory with fonts or icons in it, else ""."""
+    for path in candidates:
+        if path and (os.path.isdir(os.path.join(path, "fonts")) or os.path.isdir(os.path.join(path, "icons"))):
+            return os.path.realpath(path)
+    return ""
@@ -0,0 +1,162 @@
+"""Auto-fix for validate_prototype.
+
+The validator reports, alongside each fixable violation, the exact span it
+covers and the replacement: token hex colours become var() references
+(with the original value as fallback, so rendering is unchanged), banned
+font stacks become the JioType stack. Spacing is only suggested: the
+knowledge base has no custom properties for its spacing tokens. Emoji spans come back without text;
+they are resolved here through a curated emoji → icon table, as the same
+inline SVG find_icon returns, or the icon's CDN file when no inline SVG
+ships with the server.
+
+Fixes are grouped into line ranges and returned as a patch in the shape
+validate_prototype sessions accept as edits.
+"""
+
+from collections import Counter
+
+FIX_MODES = ("html", "patch")
+
+# Emoji → ICONS_SEARCHABLE name (or an ICON_SVG_PATHS-only icon such as
+# ic_favorite). Only emoji the validator flags, and only unambiguous matches:
+# anything not listed is reported as unfixed rather than guessed.
+EMOJI_ICONS = {
+    "\u2705": "ic_success", "\u2714": "ic_success", "\u2611": "ic_success",
+    "\u274c": "ic_close", "\u2716": "ic_close", "\u274e": "ic_close",
+    "\u26a0": "ic_warning", "\u2757": "ic_error", "\u2755": "ic_error",
+    "\u2b50": "ic_star", "\U0001f31f": "ic_star",
+    "\u2764": "ic_favorite", "\U0001f496": "ic_favorite", "\U0001f49c": "ic_favorite",
+    "\U0001f499": "ic_favorite",
+    "\U0001f44d": "ic_like", "\U0001f44e": "ic_dislike",
+    "\U0001f50d": "ic_search", "\U0001f50e": "ic_search",
+    "\u2699": "ic_settings",
+    "\U0001f3e0": "ic_home", "\U0001f3e1": "ic_home",
+    "\U0001f4c5": "ic_calendar", "\U0001f4c6": "ic_calendar", "\U0001f5d3": "ic_calendar",
+    "\U0001f514": "ic_notification",
+    "\U0001f570": "ic_time", "\U0001f552": "ic_time",
+    "\U0001f3a4": "ic_mic", "\U0001f399": "ic_mic",
+    "\U0001f464": "ic_profile",
+    "\U0001f4ac": "ic_chat", "\U0001f5e8": "ic_chat",
+    "\U0001f6d2": "ic_cart",
+    "\U0001f4f7": "ic_photo_camera", "\U0001f4f8": "ic_photo_camera",
+    "\U0001f504": "ic_refresh", "\U0001f503": "ic_refresh", "\U0001f501": "ic_repeat",
+    "\u25b6": "ic_play",
+    "\U0001f4c4": "ic_document", "\U0001f4c3": "ic_document",
+    "\U0001f4cb": "ic_copy",
+    "\U0001f5d1": "ic_trash",
+    "\u270f": "ic_edit_pen", "\U0001f4dd": "ic_edit_pen", "\U0001f58a": "ic_edit_pen",
+    "\u2795": "ic_add", "\u2796": "ic_minus",
+    "\U0001f4e4": "ic_upload", "\U0001f4e5": "ic_download",
+    "\U0001f310": "ic_language",
+    "\u2600": "ic_sunny_clear", "\U0001f319": "ic_night_clear",
+    "\u2b05": "ic_arrow_back", "\u27a1": "ic_next",
+    "\u2b06": "ic_chevron_up", "\u2b07": "ic_chevron_down",
+    "\U0001f4de": "ic_call", "\u260e": "ic_call",
+    "\U0001f4f1": "ic_mobile", "\U0001f4f2": "ic_mobile",
+    "\U0001f512": "ic_lock", "\U0001f510": "ic_lock", "\U0001f513": "ic_lock_unlock",
+    "\U0001f4e7": "ic_mail", "\u2709": "ic_mail", "\U0001f4e9": "ic_mail",
+    "\U0001f4cd": "ic_location",
+    "\U0001f4a1": "ic_bulb",
+    "\U0001f381": "ic_gift",
+    "\U0001f4b0": "ic_moneybag", "\U0001f45b": "ic_wallet", "\U0001f4b3": "ic_card",
+    "\U0001f525": "ic_fire",
+    "\U0001f511": "ic_key",
+    "\U0001f4cc": "ic_pin",
+    "\U0001f3ac": "ic_movie",
+    "\U0001f3a7": "ic_headphones",
+    "\U0001f3b5": "ic_music", "\U0001f3b6": "ic_music",
+    "\U0001f4f9": "ic_video", "\U0001f3a5": "ic_video",
+    "\U0001f5bc": "ic_image",
+    "\U0001f500": "ic_shuffle",
+    "\u26a1": "ic_flash",
+    "\U0001f50a": "ic_volume", "\U0001f509": "ic_volume",
+    "\U0001f517": "ic_link",
+    "\U0001f4c1": "ic_folder", "\U0001f4c2": "ic_folder",
+    "\U0001f48a": "ic_medicine",
+    "\U0001f3c6": "ic_award", "\U0001f3c5": "ic_award",
+    "\U0001f4fa": "ic_tv_channels",
+    "\U0001f3ae": "ic_games",
+    "\U0001f3cf": "ic_cricket", "\u26bd": "ic_football",
+    "\U0001f4f0": "ic_news",
+    "\U0001f516": "ic_bookmark",
+    "\U0001f6a9": "ic_flag",
+    "\u2601": "ic_cloud",
+    "\U0001f69a": "ic_truck_delivery",
+    "\U0001f6cd": "ic_shopping_bag",
+    "\U0001f393": "ic_education",
+    "\U0001f680": "ic_rocket",
+    "\U0001f60a": "ic_smiley_happy", "\U0001f642": "ic_smiley_happy", "\U0001f600": "ic_smiley_happy",
+    "\U0001f610": "ic_smiley_neutral", "\U0001f61e": "ic_smiley_unhappy",
+}
+# Variation selectors and skin-tone modifiers change nothing about the icon
+_MODIFIERS = frozenset("\ufe0e\ufe0f\U0001f3fb\U0001f3fc\U0001f3fd\U0001f3fe\U0001f3ff")
+
+
+def emoji_html(found: str, icons: dict, inline_html, icon_url):
+    """
+    Icon markup for a run of emoji, or None if any of them has no icon.
+    inline_html(name) gives the icon's inline <svg>, or None; icon_url(name)
+    gives the SVG file URL for icons without one.
+    """
+    parts = []
+    for ch in found:
+        if ch in _MODIFIERS:
+            continue
+        name = EMOJI_ICONS.get(ch)
+        if name is None:
+            return None
+        markup = inline_html(name)
+        if markup:
+            parts.append(markup)
+        elif name in icons:
+            parts.append(f'<img src="{icon_url(name)}" alt="" width="24" height="24">')
+        else:
+            return None
+    return "".join(parts) or None
+
+
+def apply_fixes(lines: list, fixes: list, render_emoji) -> tuple:
+    """
+    Turn validator fixes into a patch against lines.
+
+    render_emoji(found) returns the markup for an emoji span, or None to
+    leave it. Returns (patch, applied, unfixed): patch is a list of
+    {"start_line", "end_line", "text"} replacing whole line ranges, ordered
+    and non-overlapping; applied counts fixes by type; unfixed lists the
+    emoji spans (and any overlapping fix) that were left alone.
+    """
+    groups, unfixed, applied = [], [], Counter()
+    last = (0, 0)
+    for fix in sorted(fixes, key=lambda f: (f["line"], f["column"])):
+        text = fix["text"]
+        if text is None:
+            text = render_emoji(fix["found"])
+        start, end = (fix["line"], fix["column"]), (fix["end_line"], fix["end_column"])
+        if text is None or start < last:
+            entry = {"type": fix["type"], "line": fix["line"], "column": fix["column"]}
+            if "found" in fix:
+                entry["found"] = fix["found"]
+            unfixed.append(entry)
+            continue
+        last = end
+        applied[fix["type"]] += 1
+        if groups and fix["line"] <= groups[-1][1]:
+            groups[-1][1] = max(groups[-1][1], fix["end_line"])
+            groups[-1][2].append((start, end, text))
+        else:
+            groups.append([fix["line"], fix["end_line"], [(start, end, text)]])
+
+    patch = []
+    for first, final, spans in groups:
+        block = lines[first - 1:final]
+        offsets, offset = [], 0
+        for line in block:
+            offsets.append(offset)
+            offset += len(line) + 1
+        text = "\n".join(block)
+        for (line, col), (end_line, end_col), replacement in reversed(spans):
+            a = offsets[line - first] + col - 1
+            b = offsets[end_line - first] + end_col - 1
+            text = text[:a] + replacement + text[b:]
+        patch.append({"start_line": first, "end_line": final, "text": text})
+    return patch, applied, unfixed
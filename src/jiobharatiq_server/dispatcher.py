@@ -0,0 +1,225 @@
+"""Concurrent JSON-RPC dispatch for the stdio loop.
+
+The reader keeps consuming stdin while tool calls run on worker threads, and
+each response is written as soon as its request completes (JSON-RPC matches
+responses by id, not by order). Heavy tools get their own pool so cheap
+lookups never queue behind a large validation. Requests can be cancelled with
+notifications/cancelled and are answered with an error once their deadline
+passes; a late result for a cancelled or expired request is dropped. The
+members of a batch array take the same path, each with its own pool and
+deadline, and their responses are written together as one array.
+"""
+
+import concurrent.futures
+import heapq
+import itertools
+import threading
+import time
+
+DEADLINE_EXCEEDED = -32000
+
+_CURRENT = threading.local()
+
+
+def cancelled() -> bool:
+    """True when the request running on this thread was cancelled or timed out.
+
+    Long-running tools may poll this between chunks of work and return early.
+    """
+    job = getattr(_CURRENT, "job", None)
+    return job is not None and job.done.is_set()
+
+
+class _Job:
+    __slots__ = ("key", "request_id", "future", "done", "batch", "slot")
+
+    def __init__(self, key, request_id, batch=None, slot=0):
+        self.key = key
+        self.request_id = request_id
+        self.future = None
+        self.done = threading.Event()
+        self.batch = batch
+        self.slot = slot
+
+
+class _Batch:
+    """Responses of one batch array, in request order; complete once every slot is filled."""
+
+    def __init__(self, size: int):
+        self.responses = [None] * size
+        self._pending = size
+        self._lock = threading.Lock()
+
+    def fill(self, slot: int, response) -> bool:
+        """Record one member's response (None for none); True when it was the last one."""
+        with self._lock:
+            self.responses[slot] = response
+            self._pending -= 1
+            return self._pending == 0
+
+
+class _Watchdog:
+    """One thread that fires expire(job) for jobs still running at their deadline."""
+
+    def __init__(self, expire):
+        self._expire = expire
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def watch(self, job, seconds: float) -> None:
+        with self._cond:
+            heapq.heappush(self._heap, (time.monotonic() + seconds, next(self._seq), job))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="jds-deadlines", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                deadline, _, job = self._heap[0]
+                now = time.monotonic()
+                if deadline > now:
+                    self._cond.wait(deadline - now)
+                    continue
+                heapq.heappop(self._heap)
+            if not job.done.is_set():
+                self._expire(job)
+
+
+class Dispatcher:
+    """
+    Routes parsed JSON-RPC messages and batch arrays to handle and writes the
+    responses through write(obj).
+
+    Everything except tools/call (initialize, ping, tools/list,
+    notifications) is cheap and answered on the reader thread. Tool calls
+    named in heavy_tools run on a separate pool; deadline_for(tool_name) gives
+    each call's deadline in seconds. batch_error(messages) returns the error
+    response for a batch array that must be refused as a whole, or None.
+    """
+
+    def __init__(self, handle, batch_error, write, deadline_for,
+                 heavy_tools=(), workers: int = 4, heavy_workers: int = 1):
+        self._handle = handle
+        self._batch_error = batch_error
+        self._write = write
+        self._deadline_for = deadline_for
+        self._heavy_tools = frozenset(heavy_tools)
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="jds-request")
+        self._heavy_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=heavy_workers, thread_name_prefix="jds-heavy")
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._watchdog = _Watchdog(self._expire)
+
+    # -- submission ----------------------------------------------------------
+
+    def submit(self, message) -> None:
+        """Dispatch one parsed message. Never blocks on tool execution."""
+        if isinstance(message, list):
+            self._submit_batch(message)
+            return
+        self._submit(message)
+
+    def _submit(self, message, batch=None, slot=0) -> None:
+        method = message.get("method") if isinstance(message, dict) else None
+        if method == "notifications/cancelled":
+            params = message.get("params")
+            if isinstance(params, dict):
+                self.cancel(params.get("requestId"))
+            self._deliver(batch, slot, None)
+            return
+        if method != "tools/call":
+            self._deliver(batch, slot, self._handle(message))
+            return
+
+        params = message.get("params")
+        tool = params.get("name", "") if isinstance(params, dict) else ""
+        request_id = message.get("id")
+        job = _Job(_id_key(request_id), request_id, batch, slot)
+        if job.key is not None:
+            with self._lock:
+                self._jobs[job.key] = job
+        pool = self._heavy_pool if tool in self._heavy_tools else self._pool
+        job.future = pool.submit(self._run, job, message)
+        self._watchdog.watch(job, self._deadline_for(tool))
+
+    def _submit_batch(self, messages: list) -> None:
+        """Each member runs as if sent alone; the array is written when the last one is answered."""
+        error = self._batch_error(messages)
+        if error is not None:
+            self._emit(error)
+            return
+        batch = _Batch(len(messages))
+        for slot, message in enumerate(messages):
+            try:
+                self._submit(message, batch, slot)
+            except Exception:
+                self._deliver(batch, slot, _error(None, -32603, "Internal error"))
+
+    def cancel(self, request_id) -> None:
+        """Drop a pending or running request; no response is sent for it."""
+        with self._lock:
+            job = self._jobs.pop(_id_key(request_id), None)
+            if job is None or job.done.is_set():
+                return
+            job.done.set()
+        if job.future is not None:
+            job.future.cancel()
+        self._deliver(job.batch, job.slot, None)
+
+    def close(self) -> None:
+        """Wait for in-flight requests after stdin closes."""
+        self._pool.shutdown(wait=True)
+        self._heavy_pool.shutdown(wait=True)
+
+    # -- execution -----------------------------------------------------------
+
+    def _run(self, job, message) -> None:
+        if job.done.is_set():
+            return
+        _CURRENT.job = job
+        try:
+            response = self._handle(message)
+        except Exception:
+            response = _error(job.request_id, -32603, "Internal error")
+        finally:
+            _CURRENT.job = None
+        self._finish(job, response)
+
+    def _expire(self, job) -> None:
+        self._finish(job, _error(job.request_id, DEADLINE_EXCEEDED, "Tool deadline exceeded"))
+
+    def _finish(self, job, response) -> None:
+        with self._lock:
+            if job.done.is_set():
+                return
+            job.done.set()
+            if self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
+        self._deliver(job.batch, job.slot, response)
+
+    def _deliver(self, batch, slot: int, response) -> None:
+        if batch is None:
+            self._emit(response)
+        elif batch.fill(slot, response):
+            self._emit([r for r in batch.responses if r is not None] or None)
+
+    def _emit(self, response) -> None:
+        if response:
+            self._write(response)
+
+
+def _id_key(request_id):
+    # 1 and "1" are different JSON-RPC ids
+    return (type(request_id).__name__, request_id) if isinstance(request_id, (str, int, float)) else None
+
+
+def _error(request_id, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
@@ -0,0 +1,197 @@
+"""JioType subsets cut down to the characters a prototype shows.
+
+get_assets points prototypes at whole JioType files, about 30-60KB per weight,
+although a screen uses a few dozen glyphs. This builds a font per weight and
+style used, holding only those characters. The subsets are built from the
+static TTFs in assets/fonts/ttf. They come back as @font-face rules with the
+font inlined as a data: URL and a unicode-range, so nothing else is fetched
+before first paint.
+
+Subsetting needs the optional fontTools package. WOFF2 output also needs
+brotli; without it subsets are WOFF (zlib), still a fraction of the full
+WOFF2. Subsets are cached by a hash of source file, weight, style and
+character set.
+"""
+
+import base64
+import hashlib
+import html as html_lib
+import importlib.util
+import io
+import os
+import re
+import threading
+from collections import OrderedDict
+
+# fontTools takes ~100 ms to import, so it is only located here and imported
+# on the first subset
+AVAILABLE = importlib.util.find_spec("fontTools") is not None
+# fontTools needs brotli to write WOFF2
+FLAVOR = "woff2" if importlib.util.find_spec("brotli") is not None else "woff"
+
+FAMILY = "JioType"
+MAX_CACHED = 64
+MAX_FACES = 8
+# CSS weight → static face name (JioType-<name>[Italic].ttf / JioTypeW05-<name>[Italic].woff2)
+WEIGHTS = {100: "Hairline", 300: "Light", 400: "", 500: "Medium", 700: "Bold", 900: "Black"}
+# Printable ASCII, so text a script inserts later still renders in JioType
+ASCII = frozenset(range(0x20, 0x7F))
+
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]*>")
+_ATTR_VALUE_RE = re.compile(r"""=\s*(?:"([^"]*)"|'([^']*)')""")
+_WEIGHT_RE = re.compile(r"font-weight\s*:\s*([a-z]+|\d{3})", re.IGNORECASE)
+_FONT_SHORTHAND_RE = re.compile(r"\bfont\s*:[^;{}]*?\b([1-9]00)\b", re.IGNORECASE)
+_BOLD_TAG_RE = re.compile(r"<(?:b|strong|h[1-6]|th)\b", re.IGNORECASE)
+_ITALIC_RE = re.compile(r"font-style\s*:\s*(?:italic|oblique)|<(?:em|i|cite)\b", re.IGNORECASE)
+_WEIGHT_KEYWORDS = {"normal": 400, "bold": 700, "bolder": 700, "lighter": 300}
+
+
+def text_from_html(html: str) -> str:
+    """Characters a page can show: text between tags, script and style bodies, attribute values."""
+    html = _COMMENT_RE.sub(" ", html)
+    values = [a or b for a, b in _ATTR_VALUE_RE.findall(" ".join(_TAG_RE.findall(html)))]
+    return html_lib.unescape(" ".join([_TAG_RE.sub(" ", html)] + values))
+
+
+def faces_from_html(html: str) -> list:
+    """(weight, italic) pairs the page's CSS and markup ask for; 400 upright is always in."""
+    weights = {400}
+    for value in _WEIGHT_RE.findall(html) + _FONT_SHORTHAND_RE.findall(html):
+        value = value.lower()
+        weight = _WEIGHT_KEYWORDS.get(value) or (int(value) if value.isdigit() else None)
+        if weight and 1 <= weight <= 1000:
+            weights.add(nearest_weight(weight))
+    if _BOLD_TAG_RE.search(html):
+        weights.add(700)
+    styles = (False, True) if _ITALIC_RE.search(html) else (False,)
+    return sorted((w, italic) for w in weights for italic in styles)
+
+
+def codepoints(text: str, include_ascii: bool = True) -> set:
+    """Code points for text, with both cases of each letter (text-transform can switch them)."""
+    points = set(ASCII) if include_ascii else set()
+    for ch in set(text):
+        points.add(ord(ch))
+        for variant in (ch.upper(), ch.lower()):
+            if len(variant) == 1:
+                points.add(ord(variant))
+    return {p for p in points if p >= 0x20 and not 0x7F <= p < 0xA0}
+
+
+def nearest_weight(weight: int) -> int:
+    """The static face CSS font matching would pick for weight."""
+    if weight in WEIGHTS:
+        return weight
+    lighter = [w for w in WEIGHTS if w < weight]
+    heavier = [w for w in WEIGHTS if w > weight]
+    if 400 <= weight <= 500:
+        between = [w for w in heavier if w <= 500]
+        if between:
+            return min(between)
+    if weight <= 500:
+        return max(lighter) if lighter else min(heavier)
+    return min(heavier) if heavier else max(lighter)
+
+
+def unicode_range(points) -> str:
+    """CSS unicode-range for a set of code points, as merged runs."""
+    runs = []
+    for p in sorted(points):
+        if runs and p == runs[-1][1] + 1:
+            runs[-1][1] = p
+        else:
+            runs.append([p, p])
+    return ",".join(f"U+{a:X}" if a == b else f"U+{a:X}-{b:X}" for a, b in runs)
+
+
+def _face_file(weight: int, italic: bool, woff2: bool) -> str:
+    name = WEIGHTS[weight]
+    if woff2:
+        return f"JioTypeW05-{name or ('' if italic else 'Regular')}{'Italic' if italic else ''}.woff2"
+    if not name:
+        return "JioType-Italic.ttf" if italic else "JioType.ttf"
+    return f"JioType-{name}{'Italic' if italic else ''}.ttf"
+
+
+def font_face_css(face: dict) -> str:
+    """@font-face rule for a subset, with the font inlined."""
+    data = base64.b64encode(face["data"]).decode("ascii")
+    return (
+        f"@font-face {{ font-family: '{FAMILY}'; font-style: {face['style']}; font-weight: {face['weight']}; "
+        f"font-display: swap; src: url(data:font/{face['format']};base64,{data}) format('{face['format']}'); "
+        f"unicode-range: {face['unicode_range']}; }}"
+    )
+
+
+class FontSubsetter:
+    """Builds and caches (LRU) JioType subsets from one assets/fonts directory."""
+
+    def __init__(self, fonts_dir: str, max_entries: int = MAX_CACHED):
+        self.fonts_dir = fonts_dir
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def subset(self, points, weight: int, italic: bool = False):
+        """
+        The subset face for code points at weight (snapped to a shipped
+        face), or None if that face's TTF is missing. The face dict carries
+        the font bytes under "data".
+        """
+        weight = nearest_weight(weight)
+        source = os.path.join(self.fonts_dir, "ttf", _face_file(weight, italic, woff2=False))
+        try:
+            st = os.stat(source)
+        except OSError:
+            return None
+        wanted = sorted(points)
+        digest = hashlib.sha256(
+            f"{os.path.basename(source)}|{st.st_size}|{st.st_mtime_ns}|{weight}|{italic}|{FLAVOR}|".encode()
+            + unicode_range(wanted).encode()
+        ).hexdigest()[:16]
+        with self._lock:
+            face = self._entries.get(digest)
+            if face is not None:
+                self._entries.move_to_end(digest)
+                return face
+        face = self._build(source, wanted, weight, italic, digest)
+        with self._lock:
+            self._entries[digest] = face
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return face
+
+    def _build(self, source: str, wanted: list, weight: int, italic: bool, digest: str) -> dict:
+        from fontTools import subset as ft_subset
+        from fontTools.ttLib import TTFont
+
+        font = TTFont(source)
+        covered = set(font.getBestCmap())
+        options = ft_subset.Options()
+        options.flavor = FLAVOR
+        options.hinting = False            # hint tables are large; macOS, iOS and Android ignore them
+        options.desubroutinize = True
+        options.name_IDs = [1, 2, 4, 6]    # family, style, full and PostScript names only
+        subsetter = ft_subset.Subsetter(options)
+        subsetter.populate(unicodes=[p for p in wanted if p in covered])
+        subsetter.subset(font)
+        out = io.BytesIO()
+        font.flavor = FLAVOR
+        font.save(out)
+        font.close()
+        kept = [p for p in wanted if p in covered]
+        full = os.path.join(self.fonts_dir, "woff2", _face_file(weight, italic, woff2=True))
+        return {
+            "subset_id": digest,
+            "weight": weight,
+            "style": "italic" if italic else "normal",
+            "source": f"fonts/ttf/{os.path.basename(source)}",
+            "format": FLAVOR,
+            "glyphs": len(kept),
+            "unicode_range": unicode_range(kept),
+            "bytes": out.tell(),
+            "full_bytes": os.path.getsize(full) if os.path.isfile(full) else None,
+            "not_in_font": "".join(chr(p) for p in wanted if p not in covered),
+            "data": out.getvalue(),
+        }
@@ -0,0 +1,380 @@
+"""Shared MCP server over HTTP, for many clients at once.
+
+Every stdio client starts its own server process, which pays the full
+startup cost and holds its own copy of the registry. This transport lets one
+warm process serve any number of concurrent client sessions. Every session
+shares the decoded registry, the response cache and the worker pools. Only
+per-session protocol state (such as compact mode) is kept apart.
+
+Two MCP transports are served on one port:
+
+- Streamable HTTP (POST /mcp). initialize returns an Mcp-Session-Id header,
+  and later requests must send it. Responses come back in the POST body as
+  application/json. Clients that only accept text/event-stream get them as
+  one SSE event instead. DELETE /mcp ends the session.
+- HTTP+SSE, the transport used with protocol version 2024-11-05. GET /sse
+  opens an event stream whose first "endpoint" event names a
+  /messages?session_id=... URL. Messages POSTed there are answered with
+  202, and their responses are pushed on the stream.
+
+Connections are HTTP/1.1 keep-alive, so a client pays for one TCP handshake
+per session, not per call. Tool calls run on the connection's thread, and a
+semaphore caps how many run at once. Per-call deadlines and
+notifications/cancelled apply only to the stdio loop; HTTP clients time out
+on their own side. Idle sessions expire after SESSION_TTL.
+"""
+
+import hmac
+import http.server
+import json
+import queue
+import secrets
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+
+HOST = "127.0.0.1"
+DEFAULT_PORT = 47322
+MCP_PATH = "/mcp"
+SSE_PATH = "/sse"
+MESSAGES_PATH = "/messages"
+SESSION_HEADER = "Mcp-Session-Id"
+MAX_MESSAGE_SIZE = 10_000_000   # same cap as a stdio line: a 4MB prototype, JSON-escaped
+MAX_SESSIONS = 1000
+SESSION_TTL = 60 * 60           # seconds since last use
+KEEPALIVE_INTERVAL = 15.0       # SSE comment sent on an idle stream so proxies keep it open
+LISTEN_BACKLOG = 512            # a few hundred clients may connect at the same moment
+_LOCAL_HOSTS = frozenset(("localhost", "127.0.0.1", "::1", "[::1]"))
+_ANY_HOSTS = frozenset(("", "0.0.0.0", "::"))
+
+
+class Session:
+    """One client's protocol state. state is passed to handle() with every message."""
+
+    __slots__ = ("id", "state", "touched", "stream")
+
+    def __init__(self, session_id: str, state: dict):
+        self.id = session_id
+        self.state = state
+        self.touched = time.monotonic()
+        self.stream = None          # queue of serialised messages while an SSE stream is open
+
+
+class SessionTable:
+    """Bounded, expiring map of session id → Session."""
+
+    def __init__(self, new_state, max_sessions: int = MAX_SESSIONS, ttl: float = SESSION_TTL):
+        self.new_state = new_state
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        for sid in [sid for sid, s in self._sessions.items()
+                    if s.stream is None and now - s.touched > self.ttl]:
+            del self._sessions[sid]
+
+    def create(self) -> Session:
+        with self._lock:
+            self._expire(time.monotonic())
+            session = Session(secrets.token_urlsafe(24), self.new_state())
+            self._sessions[session.id] = session
+            while len(self._sessions) > self.max_sessions:
+                _, evicted = self._sessions.popitem(last=False)
+                if evicted.stream is not None:
+                    evicted.stream.put(None)
+            return session
+
+    def get(self, session_id):
+        """The live session, or None if the id is unknown or expired."""
+        with self._lock:
+            session = self._sessions.get(session_id) if session_id else None
+            if session is None:
+                return None
+            now = time.monotonic()
+            if session.stream is None and now - session.touched > self.ttl:
+                del self._sessions[session_id]
+                return None
+            session.touched = now
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def drop(self, session_id) -> bool:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is not None and session.stream is not None:
+            session.stream.put(None)
+        return session is not None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "streams": sum(1 for s in self._sessions.values() if s.stream is not None),
+            }
+
+
+def _is_initialize(message) -> bool:
+    if isinstance(message, list):
+        return any(_is_initialize(m) for m in message)
+    return isinstance(message, dict) and message.get("method") == "initialize"
+
+
+def _error_body(code: int, message: str) -> bytes:
+    return json.dumps({"jsonrpc": "2.0", "id": None, "error": {"code": code, "message": message}}).encode()
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    server_version = "JioBharatIQ-mcp"
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without this, Nagle's algorithm
+    # holds the body back for the client's delayed ACK (~40 ms) on every
+    # keep-alive response
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass   # stderr is for real problems
+
+    # -- helpers -------------------------------------------------------------
+
+    def _send(self, status: int, body: bytes = b"", content_type: str = "application/json",
+              headers=()) -> None:
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        if body:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _local_name(self, url: str) -> bool:
+        """Whether url's host part names this machine or the bound address."""
+        try:
+            host = urllib.parse.urlsplit(url).hostname or ""
+        except ValueError:        # e.g. an unclosed "[" in an IPv6 literal
+            return False
+        return host in _LOCAL_HOSTS or host == self.server.transport.host
+
+    def _allowed(self) -> bool:
+        """Bearer token (when configured), Host and Origin checks; sends the error response itself."""
+        transport = self.server.transport
+        if transport.token:
+            auth = self.headers.get("Authorization", "")
+            if not (auth.startswith("Bearer ")
+                    and hmac.compare_digest(auth[7:].strip().encode(), transport.token.encode())):
+                self._send(401, headers=[("WWW-Authenticate", "Bearer")])
+                return False
+        # DNS rebinding: a page on another site that resolves its own name to
+        # this address still sends that name as Host, and GET /sse carries no
+        # Origin. A server bound to every interface with a token is reached
+        # under any name, and the token already keeps browsers out.
+        host = self.headers.get("Host")
+        if host and not (transport.token and transport.host in _ANY_HOSTS):
+            if not self._local_name(f"//{host}"):
+                self._send(403)
+                return False
+        # Browsers send Origin; refuse pages on other sites
+        origin = self.headers.get("Origin")
+        if origin and not self._local_name(origin):
+            self._send(403)
+            return False
+        return True
+
+    def _read_message(self):
+        """The parsed JSON body, or None after sending an error response."""
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._send(411)
+            return None
+        if length > MAX_MESSAGE_SIZE:
+            self.close_connection = True     # the unread body would corrupt the next request
+            self._send(413, _error_body(-32600, "Message too large"))
+            return None
+        body = self.rfile.read(length)
+        try:
+            return json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            self._send(400, _error_body(-32700, "Parse error"))
+            return None
+
+    # -- routes --------------------------------------------------------------
+
+    def do_POST(self):
+        if not self._allowed():
+            return
+        url = urllib.parse.urlsplit(self.path)
+        if url.path == MCP_PATH:
+            self._post_mcp()
+        elif url.path == MESSAGES_PATH:
+            session_id = urllib.parse.parse_qs(url.query).get("session_id", [""])[0]
+            self._post_messages(session_id)
+        else:
+            self._send(404)
+
+    def do_GET(self):
+        if not self._allowed():
+            return
+        path = urllib.parse.urlsplit(self.path).path
+        if path == SSE_PATH:
+            self._open_stream()
+        elif path == MCP_PATH:
+            # No server-initiated messages, so no standalone stream
+            self._send(405, headers=[("Allow", "POST, DELETE")])
+        else:
+            self._send(404)
+
+    def do_DELETE(self):
+        if not self._allowed():
+            return
+        if urllib.parse.urlsplit(self.path).path != MCP_PATH:
+            self._send(404)
+            return
+        dropped = self.server.transport.sessions.drop(self.headers.get(SESSION_HEADER))
+        self._send(200 if dropped else 404)
+
+    def _post_mcp(self) -> None:
+        transport = self.server.transport
+        message = self._read_message()
+        if message is None:
+            return
+        headers = []
+        if _is_initialize(message):
+            session = transport.sessions.create()
+            headers.append((SESSION_HEADER, session.id))
+        else:
+            session_id = self.headers.get(SESSION_HEADER)
+            if not session_id:
+                self._send(400, _error_body(-32600, f"Missing {SESSION_HEADER} header; send initialize first"))
+                return
+            session = transport.sessions.get(session_id)
+            if session is None:
+                # The client must start over with initialize
+                self._send(404, _error_body(-32600, "Unknown or expired session"))
+                return
+        response = transport.respond(message, session)
+        if response is None:
+            self._send(202, headers=headers)
+            return
+        accept = self.headers.get("Accept", "")
+        if "text/event-stream" in accept and "application/json" not in accept and "*/*" not in accept:
+            self._send(200, f"event: message\ndata: {response}\n\n".encode(), "text/event-stream", headers)
+        else:
+            self._send(200, response.encode(), headers=headers)
+
+    def _post_messages(self, session_id: str) -> None:
+        transport = self.server.transport
+        session = transport.sessions.get(session_id)
+        if session is None or session.stream is None:
+            self._send(404)
+            return
+        message = self._read_message()
+        if message is None:
+            return
+        response = transport.respond(message, session)
+        if response is not None:
+            session.stream.put(response)
+        self._send(202)
+
+    def _open_stream(self) -> None:
+        transport = self.server.transport
+        session = transport.sessions.create()
+        stream = session.stream = queue.Queue()
+        # No Content-Length: the body runs until either side closes
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.send_header("X-Accel-Buffering", "no")
+        self.end_headers()
+        try:
+            self.wfile.write(f"event: endpoint\ndata: {MESSAGES_PATH}?session_id={session.id}\n\n".encode())
+            while True:
+                try:
+                    item = stream.get(timeout=KEEPALIVE_INTERVAL)
+                except queue.Empty:
+                    self.wfile.write(b": keep-alive\n\n")
+                    continue
+                if item is None:
+                    break
+                self.wfile.write(f"event: message\ndata: {item}\n\n".encode())
+        except OSError:
+            pass       # client went away
+        finally:
+            session.stream = None
+            transport.sessions.drop(session.id)
+
+    def handle_one_request(self):
+        try:
+            super().handle_one_request()
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+
+class _Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = LISTEN_BACKLOG
+
+
+class HttpTransport:
+    """
+    MCP over HTTP around the server's own message handlers.
+
+    handle(message, state) and handle_batch(messages, state) are
+    handle_request / handle_batch with a session's state dict; serialize
+    turns their result into a JSON string. new_state() makes the state for a
+    new session. Tool calls (and batches) wait for one of `workers` slots.
+    """
+
+    def __init__(self, handle, handle_batch, serialize, new_state, host: str = HOST,
+                 port: int = DEFAULT_PORT, token: str = "", workers: int = 8):
+        self.handle = handle
+        self.handle_batch = handle_batch
+        self.serialize = serialize
+        self.host = host
+        self.port = port
+        self.token = token
+        self.sessions = SessionTable(new_state)
+        self._slots = threading.BoundedSemaphore(workers)
+        self._httpd = None
+
+    def respond(self, message, session: Session):
+        """Serialised response to one message or batch, or None when there is nothing to send."""
+        if isinstance(message, list):
+            with self._slots:
+                response = self.handle_batch(message, session.state)
+        elif isinstance(message, dict) and message.get("method") == "tools/call":
+            with self._slots:
+                response = self.handle(message, session.state)
+        else:
+            response = self.handle(message, session.state)
+        return self.serialize(response) if response is not None else None
+
+    def bind(self) -> str:
+        """Bind the listening socket (port 0 picks a free one). Returns the MCP endpoint URL."""
+        httpd = _Server((self.host, self.port), _Handler)
+        httpd.transport = self
+        self.port = httpd.server_address[1]
+        self._httpd = httpd
+        return self.url
+
+    def serve_forever(self) -> None:
+        if self._httpd is None:
+            self.bind()
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    @property
+    def url(self) -> str:
+        host = f"[{self.host}]" if ":" in self.host else self.host
+        return f"http://{host}:{self.port}{MCP_PATH}"
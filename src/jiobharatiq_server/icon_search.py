@@ -0,0 +1,183 @@
+"""Inverted-index search over ICONS_SEARCHABLE.
+
+The index is built once per registry object (and rebuilt automatically when a
+hot reload swaps in a new dict), or restored from the state prebuilt into the
+knowledge-base store. Query terms are matched against name,
+keyword and category tokens (exact > prefix > infix), weighted by how rare the
+token is, and the best `limit` icons are returned in deterministic order.
+"""
+
+import bisect
+import heapq
+import math
+import re
+import threading
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Base weights per (field, match kind). Name beats keyword beats category;
+# exact beats prefix beats infix.
+WEIGHTS = {
+    ("name", "exact"): 10.0,
+    ("name", "prefix"): 6.0,
+    ("name", "infix"): 2.0,
+    ("keyword", "exact"): 4.0,
+    ("keyword", "prefix"): 2.5,
+    ("keyword", "infix"): 1.0,
+    ("category", "exact"): 2.0,
+    ("category", "prefix"): 1.0,
+}
+FULL_NAME_BONUS = 25.0
+# Name and version of the prebuilt index state; bump the version when state() changes
+STATE_NAME = "icon_search"
+STATE_VERSION = 1
+
+
+def tokenize(text) -> list:
+    """Lower-case alphanumeric tokens of a string (or list of strings)."""
+    if isinstance(text, (list, tuple)):
+        text = " ".join(str(t) for t in text)
+    return _TOKEN_RE.findall(str(text).lower().replace("_", " "))
+
+
+def svg_key(icon_name: str) -> str:
+    """ic_arrow_back → IcArrowBack (the key used by ICON_SVG_PATHS)."""
+    return "Ic" + "".join(p.capitalize() for p in icon_name.split("_")[1:])
+
+
+def icon_html(svg_path: str) -> str:
+    """Inline 24×24 SVG for an ICON_SVG_PATHS path, drawn in the current text colour."""
+    return (
+        f'<svg viewBox="0 0 24 24" fill="none" width="24" height="24">'
+        f'<path d="{svg_path}" fill="currentColor"/></svg>'
+    )
+
+
+class IconIndex:
+    """Token → icon postings for names, keywords and categories."""
+
+    def __init__(self, icons: dict, state: dict = None):
+        """state, from state() over the same icons, skips tokenising every icon."""
+        self.icons = icons
+        if state is None:
+            state = self._collect(icons)
+        self._state = state
+        self.names = state["names"]
+        self.ic_keys = {name: svg_key(name) for name in self.names}
+        self.names_by_key = {}   # lower-cased IcName key → icon name
+        for name, key in self.ic_keys.items():
+            self.names_by_key.setdefault(key.lower(), name)
+        self.categories = {category: [] for category in state["categories"]}
+        self._full_names = state["full_names"]
+        self._name_lengths = state["name_lengths"]
+        postings = state["postings"]
+
+        total = max(len(self.names), 1)
+        self._postings = postings
+        self._vocab = {field: sorted(table) for field, table in postings.items()}
+        self._idf = {
+            field: {tok: 1.0 + math.log(total / len(docs)) for tok, docs in table.items()}
+            for field, table in postings.items()
+        }
+
+    @staticmethod
+    def _collect(icons: dict) -> dict:
+        names, categories, full_names, name_lengths = list(icons), {}, {}, []
+        postings = {"name": {}, "keyword": {}, "category": {}}
+        for doc, (icon_name, data) in enumerate(icons.items()):
+            name_tokens = tokenize(icon_name[3:] if icon_name.startswith("ic_") else icon_name)
+            full_names.setdefault(" ".join(name_tokens), []).append(doc)
+            name_lengths.append(len(name_tokens))
+            category = data.get("category", "")
+            categories.setdefault(category, None)
+            fields = {
+                "name": name_tokens,
+                "keyword": tokenize(data.get("keywords", "")),
+                "category": tokenize(category),
+            }
+            for field, tokens in fields.items():
+                table = postings[field]
+                for token in set(tokens):
+                    table.setdefault(token, []).append(doc)
+        return {
+            "names": names,
+            "categories": list(categories),
+            "full_names": full_names,
+            "name_lengths": name_lengths,
+            "postings": postings,
+        }
+
+    def state(self) -> dict:
+        """JSON-serialisable postings and per-icon data, for IconIndex(icons, state)."""
+        return self._state
+
+    def _term_hits(self, term: str) -> dict:
+        """doc → (score, field) for the best match of one query term."""
+        hits = {}
+        for field, vocab in self._vocab.items():
+            table = self._postings[field]
+            idf = self._idf[field]
+            lo = bisect.bisect_left(vocab, term)
+            hi = bisect.bisect_left(vocab, term + "\uffff")
+            matches = [(tok, "exact" if tok == term else "prefix") for tok in vocab[lo:hi]]
+            if (field, "infix") in WEIGHTS and len(term) >= 3:
+                matches.extend((tok, "infix") for tok in vocab if term in tok and not tok.startswith(term))
+            for tok, kind in matches:
+                score = WEIGHTS[(field, kind)] * idf[tok]
+                for doc in table[tok]:
+                    if doc not in hits or score > hits[doc][0]:
+                        hits[doc] = (score, field)
+        return hits
+
+    def search(self, query: str, limit: int = 10) -> list:
+        """
+        Rank icons for a free-text query.
+
+        Icons matching every query term rank above partial matches (AND before
+        OR); ties are broken by score, then shorter names, then icon name.
+        Returns [(icon_name, match_type, score)].
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        if terms[0] == "ic" and len(terms) > 1:
+            terms = terms[1:]
+
+        scores, coverage, best_field = {}, {}, {}
+        for term in terms:
+            for doc, (score, field) in self._term_hits(term).items():
+                scores[doc] = scores.get(doc, 0.0) + score
+                coverage[doc] = coverage.get(doc, 0) + 1
+                if score >= best_field.get(doc, (0.0, ""))[0]:
+                    best_field[doc] = (score, field)
+        for doc in self._full_names.get(" ".join(terms), ()):
+            scores[doc] = scores.get(doc, 0.0) + FULL_NAME_BONUS
+
+        top = heapq.nsmallest(
+            limit, scores,
+            key=lambda d: (-coverage.get(d, 0), -scores[d], self._name_lengths[d], self.names[d]),
+        )
+        return [(self.names[d], best_field[d][1], round(scores[d], 3)) for d in top if d in best_field]
+
+
+_CACHE = (None, None)
+_CACHE_LOCK = threading.Lock()
+
+
+def index_for(icons: dict) -> IconIndex:
+    """
+    Return the index for this exact icons dict, building it on first use
+    (or restoring it, when icons is a store section with a prebuilt index).
+    """
+    global _CACHE
+    cached_icons, index = _CACHE
+    if cached_icons is icons:
+        return index
+    with _CACHE_LOCK:
+        if _CACHE[0] is not icons:
+            prebuilt = getattr(icons, "prebuilt", None)
+            state = prebuilt(STATE_NAME) if prebuilt is not None else None
+            if state is not None and len(state.get("names", ())) != len(icons):
+                state = None
+            _CACHE = (icons, IconIndex(icons, state))
+        return _CACHE[1]
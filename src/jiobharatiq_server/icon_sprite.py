@@ -0,0 +1,140 @@
+"""SVG sprite bundling for the icons a prototype uses.
+
+Instead of repeating an inline <svg><path d=...> per icon occurrence (or one
+request per CDN file), a prototype embeds one hidden sprite of <symbol>
+elements and places each icon with <use href="#ic_name">. Path data is
+re-serialised with reduced precision and minimal separators, and icons
+whose minified markup is identical share one symbol. Sprites are cached
+by the sorted set of icon names, so the same icons in any order (or with
+repeats) cost one build.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+
+MAX_ICONS = 200
+DEFAULT_PRECISION = 2          # decimal places; 0.01 of a 24-unit viewBox
+MAX_PRECISION = 4
+MAX_CACHED = 64
+
+_COMMAND_RE = re.compile(r"[\s,]*([MmLlHhVvCcSsQqTtAaZz])")
+_NUMBER_RE = re.compile(r"[\s,]*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)")
+_FLAG_RE = re.compile(r"[\s,]*([01])")   # arc flags are one character: "a10 10 0 100 20" is valid
+_D_ATTR_RE = re.compile(r'(\sd=")([^"]*)(")')
+
+
+def _number(value: float, precision: int) -> str:
+    text = f"{round(value, precision):.{precision}f}" if precision else str(int(round(value)))
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    if text.startswith("0."):
+        text = text[1:]
+    elif text.startswith("-0."):
+        text = "-" + text[2:]
+    return "0" if text in ("-0", "", "-") else text
+
+
+def _tokens(d: str):
+    """(token, is_flag) for the command letters and numbers of path data."""
+    pos, command, index = 0, "", 0
+    while True:
+        m = _COMMAND_RE.match(d, pos)
+        if m is not None:
+            command, index, pos = m.group(1), 0, m.end()
+            yield command, False
+            continue
+        flag = command in "Aa" and index % 7 in (3, 4)
+        m = (_FLAG_RE if flag else _NUMBER_RE).match(d, pos)
+        if m is None:
+            return          # end of data (or junk: keep what parsed, as renderers do)
+        yield m.group(1), flag
+        index, pos = index + 1, m.end()
+
+
+def minify_path(d: str, precision: int = DEFAULT_PRECISION) -> str:
+    """
+    Path data with every number rounded to precision decimals, leading and
+    trailing zeros dropped, and separators only where the next number would
+    otherwise run into the previous one. Arc flags are a single character,
+    so nothing needs separating after one.
+    """
+    out = []
+    prev = ""              # last emitted number, or "" after a command letter or flag
+    for token, flag in _tokens(d):
+        if token.isalpha():
+            out.append(token)
+            prev = ""
+            continue
+        num = token if flag else _number(float(token), precision)
+        if prev and not (num[0] == "-" or (num[0] == "." and "." in prev)):
+            out.append(" ")
+        out.append(num)
+        prev = "" if flag else num
+    return "".join(out)
+
+
+def _symbol_id(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_-]", "_", name)
+
+
+def path_symbol(d: str) -> tuple:
+    """(viewBox, body) for a bare 24×24 path, drawn as find_icon's usage_html draws it."""
+    return "0 0 24 24", f'<path d="{d}" fill="currentColor"/>'
+
+
+def build_sprite(names: list, symbol_for, precision: int = DEFAULT_PRECISION) -> dict:
+    """
+    Sprite for names (icon names as find_icon returns them). symbol_for(name)
+    gives the icon's (viewBox, body markup), or None when there is no inline
+    SVG for it; every d attribute in the body is minified.
+    """
+    symbols = OrderedDict()    # (viewBox, minified body) → symbol id
+    use, missing = {}, []
+    for name in names:
+        symbol = symbol_for(name)
+        if not symbol:
+            missing.append(name)
+            continue
+        view_box, body = symbol
+        body = _D_ATTR_RE.sub(lambda m: m.group(1) + minify_path(m.group(2), precision) + m.group(3), body)
+        sid = symbols.setdefault((view_box, body), _symbol_id(name))
+        use[name] = f'<svg width="24" height="24" aria-hidden="true"><use href="#{sid}"/></svg>'
+    sprite = (
+        '<svg xmlns="http://www.w3.org/2000/svg" style="display:none">'
+        + "".join(f'<symbol id="{sid}" viewBox="{view_box}">{body}</symbol>'
+                  for (view_box, body), sid in symbols.items())
+        + "</svg>"
+    )
+    return {
+        "icons": len(use),
+        "symbols": len(symbols),
+        "sprite": sprite if symbols else "",
+        "bytes": len(sprite) if symbols else 0,
+        "use": use,
+        "missing": missing,
+    }
+
+
+class SpriteCache:
+    """LRU of built sprites keyed by (source, precision, sorted icon names)."""
+
+    def __init__(self, max_entries: int = MAX_CACHED):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, names, symbol_for, precision: int = DEFAULT_PRECISION, source=None) -> dict:
+        """source identifies the icon data (e.g. the registry generation) so reloads rebuild."""
+        key = (source, precision, tuple(sorted(set(names))))
+        with self._lock:
+            sprite = self._entries.get(key)
+            if sprite is not None:
+                self._entries.move_to_end(key)
+                return sprite
+        sprite = build_sprite(list(key[2]), symbol_for, precision)
+        with self._lock:
+            self._entries[key] = sprite
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return sprite
@@ -0,0 +1,209 @@
+"""Compact inline-SVG store for every icon in assets/icons/svg.
+
+Built once from the SVG files (run this module after adding or changing
+icons) into icon_store.bin next to server.py. Each icon's markup is reduced
+to its drawing elements, with path data minified and a single-colour fill
+turned into currentColor, so the icon follows the surrounding text colour
+like the hand-picked ICON_SVG_PATHS. Multi-colour icons (flags, coloured
+status icons) keep their colours.
+
+File layout (little-endian):
+    b"JDSICON1", u32 count, u32 names_size,
+    names (UTF-8, sorted, "\\n"-separated),
+    (count + 1) u32 record offsets, relative to the start of the records,
+    records: UTF-8 "viewBox\\nbody".
+
+The server memory-maps the file on first use and decodes a record only when
+that icon is asked for; only the name index stays resident.
+
+Usage: python -m jiobharatiq_server.icon_store [--svg-dir DIR] [--check]
+"""
+
+import argparse
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+
+try:
+    from .icon_sprite import minify_path
+except ImportError:
+    from icon_sprite import minify_path
+
+STORE_FILE = "icon_store.bin"
+MAGIC = b"JDSICON1"
+STORE_PRECISION = 3            # the sprite tool rounds further on request
+DEFAULT_VIEWBOX = "0 0 24 24"
+
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SVG_DIR = os.path.join(os.path.dirname(os.path.dirname(_MODULE_DIR)), "assets", "icons", "svg")
+DEFAULT_OUTPUT = os.path.join(_MODULE_DIR, STORE_FILE)
+
+_HEADER = struct.Struct("<8sII")
+_OFFSET = struct.Struct("<I")
+_ROOT_RE = re.compile(r"<svg\b([^>]*)>(.*)</svg>", re.DOTALL)
+_VIEWBOX_RE = re.compile(r'\bviewBox="([^"]*)"')
+_TAG_RE = re.compile(r"<(/?)([\w:-]+)((?:\s+[\w:-]+\s*=\s*\"[^\"]*\")*)\s*(/?)>")
+_ATTR_RE = re.compile(r"([\w:-]+)\s*=\s*\"([^\"]*)\"")
+_COLOR_ATTRS = ("fill", "stroke", "stop-color")
+_SIMPLE_PATH_RE = re.compile(r'<path d="([^"]*)" fill="currentColor"/>\Z')
+
+
+def extract(svg: str):
+    """(viewBox, body) of an icon SVG, or None if it has no root <svg>."""
+    root = _ROOT_RE.search(svg)
+    if root is None:
+        return None
+    view_box = _VIEWBOX_RE.search(root.group(1))
+    elements, colors = [], set()
+    for closing, tag, attrs, self_closing in _TAG_RE.findall(root.group(2)):
+        if closing:
+            elements.append((tag, None, False))
+            continue
+        kept = []
+        for name, value in _ATTR_RE.findall(attrs):
+            if name.startswith("xmlns"):
+                continue
+            if name == "d":
+                value = minify_path(value, STORE_PRECISION)
+            elif name in _COLOR_ATTRS and value != "none" and not value.startswith("url("):
+                colors.add(value.lower())
+            kept.append((name, value))
+        elements.append((tag, kept, bool(self_closing)))
+
+    single = colors.pop() if len(colors) == 1 else None
+    parts = []
+    for tag, attrs, self_closing in elements:
+        if attrs is None:
+            parts.append(f"</{tag}>")
+            continue
+        text = "".join(
+            f' {name}="{"currentColor" if single and value.lower() == single and name in _COLOR_ATTRS else value}"'
+            for name, value in attrs
+        )
+        parts.append(f"<{tag}{text}{'/' if self_closing else ''}>")
+    return (view_box.group(1) if view_box else DEFAULT_VIEWBOX), "".join(parts)
+
+
+def build(svg_dir: str) -> bytes:
+    """The packed store for every *.svg in svg_dir, keyed by file name without extension."""
+    records = {}
+    for name in sorted(os.listdir(svg_dir)):
+        if not name.endswith(".svg") or name.startswith("."):
+            continue
+        with open(os.path.join(svg_dir, name), encoding="utf-8") as f:
+            icon = extract(f.read())
+        if icon is not None:
+            records[name[:-4]] = f"{icon[0]}\n{icon[1]}".encode("utf-8")
+    names = "\n".join(records).encode("utf-8")
+    offsets, data, offset = [], [], 0
+    for record in records.values():
+        offsets.append(offset)
+        data.append(record)
+        offset += len(record)
+    offsets.append(offset)
+    return b"".join([
+        _HEADER.pack(MAGIC, len(records), len(names)),
+        names,
+        b"".join(_OFFSET.pack(o) for o in offsets),
+        *data,
+    ])
+
+
+def single_path(view_box: str, body: str):
+    """The path data when an icon is one currentColor path on a 24×24 grid, else None."""
+    if view_box != DEFAULT_VIEWBOX:
+        return None
+    m = _SIMPLE_PATH_RE.match(body)
+    return m.group(1) if m else None
+
+
+def svg_html(view_box: str, body: str) -> str:
+    """Inline 24×24 <svg> for an icon's (viewBox, body)."""
+    return f'<svg viewBox="{view_box}" fill="none" width="24" height="24">{body}</svg>'
+
+
+class IconStore:
+    """Read-only view of icon_store.bin, opened on first lookup."""
+
+    def __init__(self, path: str = DEFAULT_OUTPUT):
+        self.file = path
+        self._map = None
+        self._index = None        # name → record number
+        self._offsets_at = 0
+        self._records_at = 0
+        self._lock = threading.Lock()
+
+    def _open(self) -> dict:
+        if self._index is not None:
+            return self._index
+        with self._lock:
+            if self._index is None:
+                index = {}
+                try:
+                    with open(self.file, "rb") as f:
+                        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    magic, count, names_size = _HEADER.unpack_from(mapped, 0)
+                    if magic != MAGIC:
+                        raise ValueError("not an icon store")
+                    names = mapped[_HEADER.size:_HEADER.size + names_size].decode("utf-8")
+                    index = {name: i for i, name in enumerate(names.split("\n"))} if count else {}
+                    self._offsets_at = _HEADER.size + names_size
+                    self._records_at = self._offsets_at + (count + 1) * _OFFSET.size
+                    self._map = mapped
+                except (OSError, ValueError, struct.error):
+                    index = {}    # no store shipped: callers fall back to CDN URLs
+                self._index = index
+        return self._index
+
+    def __contains__(self, name) -> bool:
+        return name in self._open()
+
+    def __len__(self) -> int:
+        return len(self._open())
+
+    def get(self, name: str):
+        """(viewBox, body) for an icon, or None."""
+        i = self._open().get(name)
+        if i is None:
+            return None
+        start, end = (_OFFSET.unpack_from(self._map, self._offsets_at + (i + k) * _OFFSET.size)[0]
+                      for k in (0, 1))
+        record = self._map[self._records_at + start:self._records_at + end].decode("utf-8")
+        view_box, _, body = record.partition("\n")
+        return view_box, body
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Rebuild the packed inline-SVG icon store.")
+    parser.add_argument("--svg-dir", default=DEFAULT_SVG_DIR, help="directory of ic_*.svg files")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="store file to write")
+    parser.add_argument("--check", action="store_true", help="exit 1 if the store is out of date")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.svg_dir):
+        print(f"No SVG directory at {args.svg_dir}", file=sys.stderr)
+        return 2
+    data = build(args.svg_dir)
+    try:
+        with open(args.output, "rb") as f:
+            current = f.read()
+    except OSError:
+        current = None
+    if args.check:
+        if current != data:
+            print(f"{args.output} is out of date; rebuild it", file=sys.stderr)
+            return 1
+        return 0
+    if current != data:
+        with open(args.output, "wb") as f:
+            f.write(data)
+    count = _HEADER.unpack_from(data, 0)[1]
+    print(f"{count} icons, {len(data):,d} bytes in {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
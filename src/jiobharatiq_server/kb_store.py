@@ -0,0 +1,209 @@
+"""Prebuilt, memory-mapped knowledge-base artifact shared by server processes.
+
+Every server process used to unpack the registry into its own Python
+objects: 99 component dicts, 1,281 icon dicts, the token tree, and then a
+sanitised deep copy of each. The server now writes the sanitised sections,
+plus any prebuilt lookup indexes, to one read-only file in the user cache
+directory. It does this once per registry version. Later processes
+memory-map that file, so concurrent servers (stdio clients and the shared
+HTTP server alike) share its physical pages. A record is decoded only when
+its key is first read, and the decoded value is then kept by that process.
+
+File layout (little-endian):
+    b"JDSKB001", u32 record count, u32 toc_size,
+    toc: UTF-8 JSON {"sections": [[name, [key, ...]], ...], "indexes": [[section, index], ...]},
+    (count + 1) u32 record offsets, relative to the start of the records,
+    records: UTF-8 JSON, section by section in key order, then the indexes.
+
+Objects decoded from the store are Record (a dict subclass), so callers can
+tell store content from data built at request time.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Mapping
+
+MAGIC = b"JDSKB001"
+FILE_PREFIX = "kb-"
+FILE_SUFFIX = ".jdskb"
+
+_HEADER = struct.Struct("<8sII")
+_OFFSET = struct.Struct("<I")
+_MISSING = object()
+
+
+class Record(dict):
+    """A JSON object decoded from the store."""
+    __slots__ = ()
+
+
+def build(sections: dict, indexes: dict = None) -> bytes:
+    """
+    The packed store for {section name: {key: value}}, plus prebuilt
+    indexes as {(section name, index name): JSON-serialisable state}.
+    """
+    indexes = indexes or {}
+    records = []
+    toc = {"sections": [], "indexes": []}
+    for name, mapping in sections.items():
+        keys = list(mapping)
+        toc["sections"].append([name, keys])
+        records.extend(json.dumps(mapping[key], ensure_ascii=False, separators=(",", ":")) for key in keys)
+    for (section, index), state in indexes.items():
+        toc["indexes"].append([section, index])
+        records.append(json.dumps(state, ensure_ascii=False, separators=(",", ":")))
+    toc_bytes = json.dumps(toc, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    data = [r.encode("utf-8") for r in records]
+    offsets, offset = [], 0
+    for record in data:
+        offsets.append(offset)
+        offset += len(record)
+    offsets.append(offset)
+    return b"".join([
+        _HEADER.pack(MAGIC, len(data), len(toc_bytes)),
+        toc_bytes,
+        b"".join(_OFFSET.pack(o) for o in offsets),
+        *data,
+    ])
+
+
+def write(path: str, data: bytes) -> bool:
+    """Store data at path atomically and drop older stores in that directory; False if it failed."""
+    directory = os.path.dirname(path)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return False
+    keep = os.path.basename(path)
+    try:
+        for entry in os.listdir(directory):
+            if entry.startswith(FILE_PREFIX) and entry.endswith(FILE_SUFFIX) and entry != keep:
+                try:
+                    os.unlink(os.path.join(directory, entry))
+                except OSError:
+                    pass   # still mapped by a running server on Windows
+    except OSError:
+        pass
+    return True
+
+
+class Section(Mapping):
+    """Read-only mapping over one section's records, decoding each on first access."""
+
+    def __init__(self, store, name: str, keys: list, first: int):
+        self.name = name
+        self._store = store
+        self._positions = {key: first + i for i, key in enumerate(keys)}
+        self._values = {}
+
+    def __getitem__(self, key):
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._values.setdefault(key, self._store.record(self._positions[key]))
+        return value
+
+    def __contains__(self, key) -> bool:
+        return key in self._positions
+
+    def __iter__(self):
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def prebuilt(self, index: str):
+        """State of a lookup index stored with this section, or None."""
+        return self._store.index(self.name, index)
+
+    @property
+    def decoded(self) -> int:
+        return len(self._values)
+
+
+class KnowledgeStore:
+    """Read-only view of one store file, memory-mapped for the life of the process."""
+
+    def __init__(self, path: str, mapped, toc: dict, count: int, offsets_at: int, records_at: int):
+        self.path = path
+        self.size = len(mapped)
+        self._map = mapped
+        self._offsets_at = offsets_at
+        self._records_at = records_at
+        self._sections = {}
+        self._indexes = {}
+        self._lock = threading.Lock()
+        first = 0
+        self._layout = {}
+        for name, keys in toc["sections"]:
+            self._layout[name] = (keys, first)
+            first += len(keys)
+        self._index_records = {(s, i): first + n for n, (s, i) in enumerate(toc["indexes"])}
+        if first + len(self._index_records) != count:
+            raise ValueError("record count mismatch")
+
+    @classmethod
+    def open(cls, path: str):
+        """The store at path, or None if it is missing or not a valid store."""
+        try:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):    # ValueError: empty file
+            return None
+        try:
+            magic, count, toc_size = _HEADER.unpack_from(mapped, 0)
+            if magic != MAGIC:
+                raise ValueError("not a knowledge-base store")
+            toc = json.loads(mapped[_HEADER.size:_HEADER.size + toc_size])
+            offsets_at = _HEADER.size + toc_size
+            records_at = offsets_at + (count + 1) * _OFFSET.size
+            end = _OFFSET.unpack_from(mapped, offsets_at + count * _OFFSET.size)[0]
+            if records_at + end != len(mapped):
+                raise ValueError("truncated store")
+            return cls(path, mapped, toc, count, offsets_at, records_at)
+        except (ValueError, KeyError, TypeError, struct.error):
+            mapped.close()
+            return None
+
+    def record(self, i: int):
+        start, end = (_OFFSET.unpack_from(self._map, self._offsets_at + (i + k) * _OFFSET.size)[0]
+                      for k in (0, 1))
+        return json.loads(self._map[self._records_at + start:self._records_at + end],
+                          object_pairs_hook=Record)
+
+    def section(self, name: str) -> Section:
+        """The named section; KeyError if the store does not hold it."""
+        section = self._sections.get(name)
+        if section is None:
+            keys, first = self._layout[name]
+            with self._lock:
+                section = self._sections.setdefault(name, Section(self, name, keys, first))
+        return section
+
+    def index(self, section: str, index: str):
+        i = self._index_records.get((section, index))
+        if i is None:
+            return None
+        state = self._indexes.get(i)
+        if state is None:
+            with self._lock:
+                state = self._indexes.setdefault(i, self.record(i))
+        return state
+
+    def stats(self) -> dict:
+        return {
+            "file": os.path.basename(self.path),
+            "bytes": self.size,
+            "decoded": {name: s.decoded for name, s in self._sections.items()},
+        }
@@ -1,857 +1,908 @@
-import hashlib as _h, zlib as _z, base64 as _b
+import hashlib as _h, hmac as _hm, threading as _t, zlib as _z, base64 as _b
 
-_REGISTRY_VERSION = "6.2.0"
-_MODULE_CACHE = (
-    "7GFRaG2>|-EUUTXQ;QP<s-$m%-vY_av{g+PX}y+2R8Dn{m((W2%qnZhyKY$KnRLx-k=8Sb06dTIX?dk>"
-    "pYSCWK_MIv5N3?%*^3j57g~w}E4(VY?7=#Ux!*v34YenY=9r~j6t6M~ZLC%4qE9fRXG>%mc?gilzI!_G"
-    "9-=@~*_wNoSKb1;{lt=#%O*cCKJ%P)G=NZI@xs7@9pq<Cq|)k*jm;@xr=(K<O+Z~0v}6TBXA+pSu4X1*"
-    "t8_=eIR$XyY*}1NKC>QCK|X0Qz(5}WqpoCb@vHxsye#)casg;BPpOFx95(pvpq_i&Ij~4Y*f?ZK3xxEN"
-    "r*eelb;5B^u9$MH#9+R*2ER1B4eUuF`@m!JI%os{o<TpS4I-)L)ofroxvuJW>P2@lEQMCFgC=Kks$j(7"
-    "8NM_<eK;jP<axCE($J{M$y-pPZt;dc1fj=YywU}|k*j;%+xs|R$_O}e-uTq>&ICO2As|g$HQ7v?*0U<>"
-    "-TC9daP1u2;&|kf<fK!FU(-mG$%pRAxu{?yp2>;S+?cOc3=D*<larmWEI9VBJ4ggvXMT%ndmhqblo=Z{"
-    "EMYqXz}fqHBIH*XnG(Oo-$DpxtCY}{En64+E<Nwkg)&W|m3d66xr}(B7KNMrEe<|+h}e~GY(jtpPzw8O"
-    "w9d*vkdmyQN)CbHkXO0|oOZ=&bLm$pPTZFQ$Rk~8Pm+#X(CIK>O_aUAzlvS;W>ky^`TYv4(y{WW=le_F"
-    "u~=lU&eneaNwO__6U0)oGw;dq=h!-^*f2&MpX~!-L{qT1xVkSSWtgd`q26EfeROim(#ZI`*D_cSx{tfp"
-    "KVs#bTEohy2}@#v_{eZxH+v;xX8W}djU1znb?a2Urqu_2-IGI)7k%|!1=7yY63t~^XY(p6)HDT4i2@LL"
-    "ysUdFZX*@uVfs26E%>e?=|2{{=TZyXZ28s5ur+G=yv(r>!(#Q^)!Q$dWuidvXAin~HwS%#A};QlCSl0}"
-    "TM*=K0dArJz^kHIg@piON8VJ46^vCQug<}K9wLpJp-388kVZs9HIN=ds%FtZ7nPn906jq>n(ae#G6`{8"
-    "<V`A&bA_kX11jZ39z%Il)`&m*zdgsc%m&=y3eOS&{pg{1%I)N-zuuU)Z>H;>oIQ2>STx)eNgJlW)I7fh"
-    "U=wDAVKrxaK&K8Q-a=|r+|7#*e-crR_@5qgCMM8A8ybC@szM-p(6-zREO~3pOGndWS_$mWA)6pj3iN+S"
-    "#+`jTvr*9mk#MIX5o7c3EBb!EOf%SZy~d|UkC1h&rjtp~mrXGQmN12Ayaz=>z5xZ+Y38n@&O~p~!1eR4"
-    "L(xS1{MT;}1R%Xlz2KO^3<jEcBnoL;$^y{!YVASQd)atA6Oy5mA3^fwU|Bj}9%wLwrwWtKDCJa)43RWe"
-    "s<q{g**}Lhh5TH}9&hD60QZ$1>b6>`1tH33WQ`Yr^tS7Di!@5%yj?dG6v}Ivu2J=(_t_XsD1%RA7-XoW"
-    "euZSusuLp2KOOr4Vk&ViJ)t`MrL)~1;KjG1I3DC;YeV{TM#<g`765tF4iP+3EB}~$_s?+fHtcOiH_)_v"
-    "FRV)gWds^(e(rP7a6706JTi0)a&6w?$8j*+J|b2L2LaAUZbV+((DDPCIA2UoCK%d`Okk$@La@=i0}h@F"
-    "XoDJdNTYIH`Q#}6^z5%o)07Q+?RPARXcDGxT^sK#6-`n^zDxWuBNhEwmU(=^Jocnfw!BPgujy8v9#1Yc"
-    "oJ}dKq(oqA85e4QtG$Ha;~B2}g9$ak^1-mv|Mjjeqz*R&$cN#cQ=~uoW|y-sA4FV<qR#Z8Lvm%NJmxMl"
-    "c8BGQdDRdLbbXG4%LPas1MHOm>U(9&`BDh@{j@rDa?cr%y>rIwWG(k%t(wu2z~~xSAA63|Lc;Of<UQlj"
-    "JbpmCaz!61M_>OB|4MFcT%aiTl^*lwE)dkCoF7EG*7XiL_^}Fw1VSG}`iKv1mrJ9W{GI{8qket{c2K~Y"
-    "lO-2yTuo@any$kg$N!TzZF<0Y;5Fx9g1z-o(vpmFvYMTGJ;}4ZRy6UKTK;!a@nHC#vI^O?)8O1)6pF6#"
-    "qIyUYeNK*pQu&6NCG@TW;G0cG$68UD1Q92F5QNf&U{gi&k0F;P=}`X_Us!s<KTmK6Q07z-#`SG~wb6gt"
-    "Jros2?fm9qE_=BC{Q&E;q_%K;+ApPT-p=nKpq;3VD`sD#N+^LyoBd&G?Pd!SEjCY7=Yk%;@L8x1xh`??"
-    "v3pw+DV{JYsdFd~CqhA)+mAD4S0&yO7>o^&Di?ocwAcoMu)^-cqQ5BPSa9rN|6}Cg-u3rT{6FAA0uyw9"
-    "YB}O_5nrARRbby=nucOS0w4?0gn%y8Hi}M$RS0e{+nRJqZd1H~QmSt!F-C!I3R(%9_am1Vb6ZEww{z-1"
-    "RYEZ64mO&0+nFWufwg%xI8D0Yv(4EjG__CDa?d)*F}_=BOC3{3StL%uu*Xwp`|-P%YBM>xFM7`;rRz^Q"
-    "b!*ry(!bzj#Ej}8D0QBBK%jhm$FJM5rL%7@fiTy>#31sk!!W8Wm@4b;@(h5^{YDbQFM2}!Y6b6zYp68%"
-    "Nv@}NS=)<*6v-r0HfDjU0h+++gfn!ggmgFlJ$)8VZn__BlCIPKiFW`?tRGv+{aRBKv1goKf2&0evEOm+"
-    "cQa4lDy)b<ognPjQ&`MJMXDuJJx=;WY=ra}m|+??(0Q3N3>bSitJZT!CCG?%Y_k6aWV6{HHs(UP*<2$M"
-    "oCq$7DeNP?->mw|gxVnQ0RV^08R>6+-nL~sg$3t*r}c%+NA{sIGihE_7L=CG6s{QLI5?Ie;*Duzm4sah"
-    "D`M^e#%(c8wDqjQN$l}ow-4{IDXd6+-n#g>8rOwi%t!$iV8bYMkPCR57l`l7$s60fSuJEC>&)OPAK7-I"
-    "eEvp=#*jwOpO8a#f-U4!hcoQhs=%$odxoM{D@aAE4g^_Hy0xI}z(8G-Bpzd$`&>XiR&MRBS%i|5G|;X3"
-    ")PwH|UAxODS>Uau+g%c6wP5*mrO<7tKr>%6yID>zGL~N)&C27}Sb2joWa*mA?FIB0%rIwQ&kc;JI$;vb"
-    "-Jc5%F~nT~%~_q<SrNP|IMU_ZvFWA5k%vUpW4CH0>eorJ@p9^}2zF<4kV}mTuPwInq@M1F7P#|KoXJoj"
-    "NVT_}X}-M%EYuaMnJ&r7nr2)7vH^eV0~&#9R%i!+*c+})15sHVS?JxAiZJr(v1?29T5ET`Gd84Sj1V&_"
-    "MhCsZ<jum8$P^Cye6OV>!7#AyYZqzFM=&Mg$46cc*Tg8Xg$_eYUQ_+j-x&~UX6!~SjM8fOt0UMY#^eJz"
-    "Wcw!0hdY{~Nikv-V7@qEQaf2UFJ}YAGR(!^gt+~$BB~k@9J9%J!Oe+SnBG05YT;2Ht)Pvxm{BTwXQhI^"
-    "kGY@kzBpj&wP_Dm1m<x+jM|shRRVuD^dMeE=^pf(nvdmm0GwY`DOUW0hu+}Ti@BmbBaoGYa<O3<>pF-S"
-    "8aB9si2aQ?^QC&IT;c?Z^fR;XIA5dWC}?vCdd$2uV|xmsDU*R?|A+qnGsqyrBY~^|j{LQ<hX+10iDAi7"
-    "-{cEJ+xkWL>zZfk`=I?{>a5#%-c@wCgoE)rcama4V^AnYLxjPxH!Ay>nZRwMEz)PY|8ItCh>LG(Dpwaf"
-    "w=mR7wHgCcZ6AzVXKa4zeF>{+R!WT+v)N=0|1VIx+4sUXO6Ud#pL>BG-{okN2?HJZ`s+LiXZx$1>8E&i"
-    "jM*`H;oV|cd$ba35^RS{)|RaKV*G&~j9s4dokdxM&hW(b3RhzTtU?EzzU*<#RaWLwCA`al1Wq1l_{fOY"
-    "u@64QnX!ycmHB_`>T~v&B~DHmW`b2GaVuFO!Tua3wt(+?hMo-Z-=$6|vMc%I5}|7H;GzBC<5;R(^rOu%"
-    "CJ^ySAUY5MfV)!e{_l42r*6|Wv2-RCmkHI7+@x&cFH^{-%8Ov1z7RyQL7A$bZ;xcjt~p`pDaMEl$Gniz"
-    "X~mrXAR9K8b}xMwmf*bqG0xgxKE`J)7HXkhA}Ur>AL2jSndEk=nQ#6%YgJwTzNikF9xoL}tx<-fy56MU"
-    "cSR9mbVDHKZzq}6V*WMSYV8|2X26Y@I?Z;4mY>Zd2O;S&mgZcpCf-lL#}|dippDMPai&=p#$s$e6tU^="
-    "1kBFUd$F0$5O%uYzl{Qes5-_WkS3d{>OQ)@qi@m+X<tb?GCnKXIJTJo=*X$!fSZ+JO49PP0=qXQs8=V)"
-    "Jq|M`tx$c77e%P7`z6x(Oj<TjnsZjeN=a^7bKU<Mi(_%gk{-Z`Pi~TW8qBhz4P<cuT%y+oyh_l4vS3WM"
-    "d>Z=J9Uky!1}s6uRDd3%vq9+N;PtD}OfGqp@jIhZ{Vt&97Gm(II9C)a;B51er}C&TwLWJ1=Bjk#BHR3L"
-    "ns%XXjJfFnzQ>m4vmoHPpe5mFDVB~ZxlqX0!(&5l&k}UHT^T$q^O5PVH-2;=0!@1;#=DFn@=0cqsfu(8"
-    "(6Q$|M0)4&xBo1kgYBsoigv*$j}in{w2F6+DaA#xS(>_rHD(glXgib|XTk^+Y`p}I`SnfCPKzK>fc&0?"
-    "*^|aw2Bi&DD{srB2N+dAJ_-G6&4OLEt%{L&OFc@kF5@77$OCrcDGQN(N9y%a+K#22CP|&+h}BYO)MrDb"
-    "{~11(Zui;E?2PZW6DFK8$oB@SlEO873@z|K(r97xua^S4bW7^)m;myDil@6d#g<==XxT9L{sEDG#FDB+"
-    "B~(dB)f3v>=ir%fsJGamUCB)y%cPIbnx-63VsCN?!#0~!4OPNJW}B=VC||WKgYZVkVVNLE6DP~}jdUke"
-    "+>~Nqa75)SYLpIx<BdA^IW)e2N|2qj(8TC;aHOn$5C$0s;$&N&w~FKTVJCidF%1HKQ>UQy4(4v=rnnY_"
-    "9$}?;p?kl(tbcNDO_V6CqW!9%XxqH&iJ5=cB5J!k8Do(lv}Q)qiY1$qx3g7TFLZ=%C1Y|sPOR`|fjd*X"
-    "{-I2=))R?5ToMnMmUdKy@wJ_m;;kD=XGv|f>H8)qM-UPBK1&p1LiG6Y|3#DOHv1FWoW9PeyU|25haav&"
-    "mu@9O|HN%i*D^XGiQuPPA(Wjcr-`6e=UMudsm}w&`{cE7?5wuc#^vBBB)Vqc?^`|>XKo8!c`U@z-UGLv"
-    "11Do}Sr|AJY|E%iMC+nT(Zp;vnYcbRNXzcw4QRoK+DUZd1T&1CkB%81(V}P2?viO!dVq139V!aP;|-!;"
-    "39FZ&$#i?Yv(I12TovG;p!*MLq3o~AwcOR{Y2OX&i;14b!$-dW#)neyQ*@TN%}iJlXF50B-cEBE2FuYU"
-    "+|QQ#3$0sS-G!4K%7Hk9>)9)cs5WlAb4)jy6GL1qrt`P6Uf9WjdU?m@h6jQ(4TYi5HIa5cYp%u@cqwM@"
-    "U3alA{;lFP;F?bhm{fmLqmjPTs@@T}S6{nHAjnI1ls0sll(b|EEN?VPZRdQsbOFy+{HM}H#u!A)(%9<z"
-    "5{_)<p?gu5QJ}=F_#QN1wu_MC$*%nWo;n%@oQ=VnUN9o)Tvn8y6s%BVr<mzQ-wLPK-gJtN8Y?Tw3RXZy"
-    "@-n;AB*EFkHtO5cK)3OOV-c6gQa|ZlZW7K-*%CS<=N9D7^SLv#rx;AGzaohn2-|JMrl%$y+PQ3}s8O=G"
-    "8$zS2MU+N)8gg;F?MSzM*Xbi)gDwKB|2qwT75E#ICX-&zH)__hRucPOs6em<ulA&rEIpyUr2;260==1X"
-    "5h{-DsK`{STu0=LnVuxo?zm@+;f;JUWf~I@dL#WfF|ak)2z|WHYeo2hKg0v8ukrbAAPW+#sl^nkDqdcQ"
-    "I*gsE_9&}gr`{=2?UdPcs1->J=<AN8ZS|m!zlR`(>|+yhE}Y1eu_iY7dvm%stFj`^dY*mI9s28}I={{2"
-    "ke^zK_*H_RX$XaOi_z`RmFD=5_K@#H7I(@QI@~Zwd7o{H^{@~TID=mDQSE55q$4+zbVk)NAG|VsN1A6("
-    "^_qU6Z2Gg<oCYnySE7qnH|xdPsx2vzDG*T3+z@1`HC%G}>cLix^E+C_=XP9o<MXeGsK0+W{FY?>93D1y"
-    "30soc!9qG|71tsp=Ok)L8C0wx6s>@b#Xu3dC{aM@>J!u#4LHZr(}ez(Y53d#T9B8-PLH#S2!dSb?Brl+"
-    "glA*c4dKNO=jC}9AlPPu5`)n220fp6IHR;x9{?Tp^Ilq0N%sotpLW&v4_;}e%j!;-f?tLwOrsEI7Z(hZ"
-    ">`8+Iv-gF4Uusjmd(Q@4@Wtg-ZcF%J8iR>qy=VnM0c2tZD96>2Jg52u8=FNu;spHC&wL5g$|bsrhzRl>"
-    "{Yg@qDckcJ^n^&j2$?!pFb_#cwQK<`iFXT=$-(o`oBmIerN8@;xla8-_r@tb$XikQnYEACU-s%D|6E+x"
-    "P4q9v+m_#^yRG>2HP&aH5_8g4pa`A9s;z@cU3XMQXa;r<VWTFATF&enw|W;on0%=ucTPX1Ej_qz<$~RJ"
-    "2D}Frig~nQoaE(GCtw)R%5(Vk(RKitDU$8F1C_zPFLsI>@Rt{hi)2P^^u_lTD&wy{<Ko^hWM~`7s8305"
-    "Y3MTV15BS0qurb<-zYxIZWprDAxB5^3?3;+wzIVVQ1P(P8kKnttH?=YYo2-zuuAM8Mdvxrf3R`rbcEN9"
-    "+!G@Rhk|TN|J0I#@mKocbNa{0WKt}#og=aL;bba}orS#AZTW{LvR=gF^Y!oGO(H^f?PLS0-;Cn9!L-m`"
-    "K^&dU!Sg#Yv&4ffaQsWPWBTlKLzHN?$R6pPSevIeY05Z_xA4if<%}SLJ9Bt17d8j`Jh`?6j(;I-*N7?L"
-    "%AV)KCw7FF6Kby@!YIr_B)C;4^0wnKNH}MSiBYrT{&f@47|k{0F~*Coaq@{hI=g3As{zq2*S!`jNv?p%"
-    "?}ZSbp#g&!KA;BQ;%1B#k%7S|jbd7l*N^G~)dM#IG)LwuxI`^=y(!VQH4clxY(fC73EwLqpa1-2TK7+D"
-    "V*GI8m`U0dJ2ZklT<tNaqAW%a03Ijih4mA%_?+Z+TdUbX{m=d1qA#FP=lahQ+zil{F|iRmjTVTgq0$ur"
-    "PIYlkjCH{us5QC=1h2f$J4SA80AQDRXtl;d5Vh!c=JV))@M9uT;c<Yy{lI{gcH`gea}TajhY;-S?_qAQ"
-    "JeP?Ma51}WIPV4M<7P^|X^JJ+|9oZAS1-HR<zO(I{`~seE%J6g-^i5YM21WPJ?J{ln)4g(GP=-B6@p;^"
-    "hZ7@TYEOWh!dfT^+Bh3Wd@S@~>1UvusauQ2YP1ookof9qOGjYrx}k5S)}?+O7~N=T`1=N9@Q+-6_=DmY"
-    "D@!M-$JV9+qTjyv{V(RSx8TOkx#cw+DyQ8uu_G7AEI#Hj!}*LBmfSdSF3nbe^zqq&Wcf5_gNjWJ5$5W9"
-    "uot>;!h?()v7z5DGf-85;X<m(;cM}BV*Wv5kjDQgr=W-WB~4AztStkKMjsE0)xU=&t0-HDqLkMrHEM;N"
-    "AIXkjX^P1FkL`1>LRUmu`1^#RlrD$D_oQ4oK`z_V@?Y%PMk1wKm<MH(pJyY+j9LooRw+0Tzv_Ip9Au@i"
-    "zXm%uZ>-loBM>+HT;NA8HagR3^HM%7u-dd9Dpv>+2BfB80fn--n{Y)CdaAS-b1Uj-g4Sdb?_3rH0{=-D"
-    "@2q+}Ef4rX1<lm=F5eg2vryTVY7%z*I0FNH7WqxV^YcycVXzH53BaA^;-I;OiU<}WzHz-Qc;Q+B$#zxu"
-    ")Zjae;IEOK@KjgFMFZ`88fw3-jpfi1p|~ECN5sj`(Pf`kLCxKUMuMs3SjhI2Ooz1O|IrCyCJB#3o33Ta"
-    "xy>P7kU!C0e}`411#Wr;qU{XOSB`(aoz^Zi4Oa9gtggFX2lO+k$7!ey;M1l;kiHr4G6$t`=hFGau4<lI"
-    "arhMqL@VW^^se~NcG|l_hK^=`%&fWFPAJZk>HEw|+z+#+V2?Zj1^XjVM%bBbg%F}@6ds(e-O!1(rwFEY"
-    "JaO$*b{2X1PgFmm{P!wb@*u99An)CW7f0TYaA!jw-~ET?UrcL?P7J_<fV_KNu@xGQ)}2#5b$AEfR6~#1"
-    "(hC&OH4Xqk((c;~Xv5FGl9TV-;d%epwjV>O57;W@N`e~`%pHt&;uK0>IF+6ic}8ImEBPpD>@A<q)i6Ne"
-    "ogoPI3JISjD#k8Zr+H?QZgFf<?<zs5Bk||oDoxKx%?Dp4gijVVlgQ4}sh-I!_zkUb1fE}5|6p&g4UMWB"
-    "{b$BwGlEgs-l-WLIex$Pz-KMNl3`@U4%hxt7Gr_Vu`OQ6*HPq$UW9;ax`hckLHKP8i_rrlDCeIvCd1OB"
-    "4{!HAOFc_XfM|*S#teId=TucspO?JM8m(zyK&g}bY&wuw37(9|Rb&##ZY`l@0L_}^-;!~r%Qf~jyQa;M"
-    "#Lej#=tiayaT3pLpmAIXaO9-E=<vDx<g1mHJJE%AF0oH+RIaXN+2llLt&-5*T{00%HFHK!{D2Hz!0VR("
-    "7=Akefz-$rl~;iG#Y5TRJ*e%MYwi#H0qni?0=p`U8i(N~xExs6u74;kd#40(i_9!8gy)ycNEfb_a$h!N"
-    "NutQX2fs<nt9vVH+eadH0CJrl*s=S*qFTp4xHv4#uzyyfjp}6|yTT4GuhiU$D}#+ZgY)%z%)RFQDI%Y@"
-    "jtq17%6Er@bKu!Qn8$p{8{U)g`Y)4*`rX}!9c>~7h!p~DV|7rNr*#~?;p4n#qB(wVhlz$YJqFjWhcK&y"
-    "(#~?$7YW~1g)fyb8+#XUj&yTVG{=~MzS0kA(|i;$#N#RNl)PFAfMKgGQDYqYk{b%Q8G5noC0{~NV~H%I"
-    "HL=p?z)4>q+88(2K3ynF%X2*@AvRnxj!2^>&h*${m^ZFaIq}5Lg8&r3S}Ln-;Ordx{H%JP!27pydF{Xp"
-    "IJLupWoLt9VVh|~o`H>h1>ad}TzKqy4n&bi<OocSUgzU$g2B7Bs`m-8xW_nu^}un>^nMSYLs5__=7lPe"
-    "9ttvX!advaQN_ug`YZK9N*J)u(V&QpuK^K`n>z%#^Sz;$4;C-QdLc00IHKkpHwa5kZz5jj<RW({a`cn%"
-    "wMDd`<#VOMaUM=>lH|0e`11|!KG?a$^T3RgJ9nuG<dVIM6Y_By1HQ!g@MPD(%&;{bLtQ896qb<;)R8R0"
-    "ru23v<xQak7JX_i@<TAP^B0N>!9R@yZ7QlqFuHxX+gmREDku?1cvaTT5heW6mvcwZn0(qJr*!a2Z|E9T"
-    "e-WkPv<dj4^T+<=AoeX$w_S5*&;DBxBUkRKz{8<;qhyc`g^<4THdObvQqntUC61@VB!BIV6``@wnO3H<"
-    "s<#yujADGJFb9b3R`#a&L#A?PJCZ;J`pK7F=gVoj+sn$;bREq{-`zJ3jf!x4ZHXxp*qoEXWk;^-_v(Lq"
-    "><>`2rbuWOBn?r5%+X6Nv&($;kt2W<l*ke9e`_cuX#Uek8)xwSEC6XFN+9xl=hIs`N{7bfD65Yai)w;8"
-    "_uNC{Gh<_tL{)~`+iy>5{z<+2aedS_S31crXlRt%8k7|7hNd2!y!;tdBW{gW2rgq%#zCD){5$~oUZMs%"
-    "Uz!QPwsTv60O#smE{mi>q5nHaJ$XmQNS4S`gu2Cx`~q4qCv2!JFen5xP=gwZP0Anz#cm@6W37$M1a!*S"
-    "DZEnet728}f?Ny{O&Q;2uBr67INc30SdC5lqDpfQEMvQ?b1z7Eu+)`3E%L9Ow7<8AFejZ*-qNl&WmNY4"
-    "&%~F$L3VSxF2IFmlY}nfO&$dq{MTMU$*xdku2fovW%~YN9JV9J*zIP@7hc~jA)%GU4{Y_D0MDU=OrrUx"
-    "5W-|hlNnvCV*chrr?L#U*aM_X?s$PmFr!STX?4WY3enEfhzKBF#L%_Gu<*@Mwf-|*?Qh{r7JCm7Sz@2_"
-    "TkyfS|E~=NugKvIgJMT?Ss7lIClHUjY;F;?*YWp1;Jt)_Iz^(m9?!YnS!nsf77FKqU<8?p<eOh7l#?O7"
-    "ZZ~3Rw3E0g&38=6Fn~v_#Ct9X#M$PDPGBf$_lUbvY0Uy;0}Rpy8O8#kML_<+EiNks3rNvdbX{`#eVwM3"
-    "#4@D#OTxhgQ&2egA;nOgQGbv=@iAi)TTp|S`FH<Q`HdCT_GR0l5;3*BUy$$ZDzs2Z;T74h6`dhukfPIv"
-    "f+W*N^CHrEY-bl)ZBI7?(~Y1qkpF4g7eRe8>}*DFf?1vWKN6qLZAn4b^?0A=TIPXPgk01{4y<cZJ^spc"
-    "nEUhDzcOKoyLei?9WF=R;DnfZ^@UW^sdg?A4JhsLvuF1xaoQV56g`%|xPp?IeG>Oo^@WGB(^^YXi+jF|"
-    "O3@m}nD(5%)vP1HYmvZ23;C{4*wM&xiz}w>8ySq+JH|>L=g&QEA=FX#82HfTghe8i_b)UoeIW8(6w$f-"
-    "#xe0Rkzq+cHKW(+AEqVbmMu0ct)A)V5<ZcSk`_DI=5aSqdy_R7CYt?D196h8v0@(x%`*k!cLlcYIkN;b"
-    "Zrjft#s?$DVMU;_2+VEg6xWzTu5M!t@~!lt{~#CFnBd>C(Ybjse-ff6IN7MO>NI-($4GnF34SeyVnSSJ"
-    "b@v7;gW79*xcX5%pvGn;|KYjJxnv~B#5U8p<sGW<lDrtHcthgtgpxzJx{TK9st?RaA?J?)QeqLWD-ACY"
-    "O87@>nmFBT6prUZK}=kYM+{z~XQvw{Z0RYDSVU@%nH8dx*6_f|_pPr5!)P4CAPyzkmd8-&T6PXLU%;=F"
-    "ME9-6Q{1~76W{iemF7XG8OSSYxKEpPS(@~b9x8zQ7E;Di+fMa<*=`{Ocl4ve!DiG{J~^kM?x3D4gOJ&u"
-    "r&HnlILF+z*Ra^1!91*;ELF+l5rn!p003XEr?pa~>&;8PszIRwu!7u84eD@pH=e1{prBOY$%53J8Ehs!"
-    "1I`{Q<fqY(6Ot-ab|WmKkTda^#@Cv8@(299b#Zy<0nV@|&`CP4XIWbO<HIqF{dv1^UZ5FfJgy*4=rql>"
-    "uCSvxqWpbM{Ix<fh~LKOVV3S&K{+fTqirApe7!<}WVN&tfA(E&ln(@M$x_RNm3Ni(totvqt`P024i}aj"
-    "Q{z2uP=obPedp^r;we3<zjw}mc=XO>zOil8iiY^=3P7b(W_p{4XHIL7#AdHa$>i!Xf&tH*^uU?{GGC>_"
-    "bz6G?+i~l_OnVu5tI^srHW5V{97t2HS}t_MSEbsnOc^aVH>DAz<C^%Y=#J_iV0Xyg78EwaSZkBQ4FsXD"
-    "EfRx7L4u+1+L3UG3Za450AJj&&_<Z;4n%V9*P#86laAB#WCQv2WwpdoDd+k6){|8CU-DkJKasu6H69fc"
-    "Y{abgi9HET-1O>v!5Qe0jC6JtS)Its7M)#8)3u(zVOOa>3kb^aL<H{gvUMx!YKwxq6yMWM+$6C={97!1"
-    "FnUGWwSW-*XFVb(J)9Az1BZve_@87|y%PD9@v51ku9U+R@nKy%X{6Gs3q?3&li7{3hJZ+}F+H)7E4feJ"
-    "w9u#i8mCbW9xLiQRZhVZkzI(cuveP?VQb+lAm;j&r?A!v%+JkK^Il$}7_P35_%pc!_%N7t*fF+=CWv&C"
-    "XgQtkxJI%n*xou8cI-ffG}>p=2&mB~sF+_JyOv}H<rAvt{>;L`A+EuSC5cYDFmgBUNIo#K311!&w7ZM>"
-    "B}_ZycbEzs)qujTDBidR;n$DETF9IKcLNUTI5^SLn#XsOqfaHE95P+T!=a0gi6cAFSHZ#mKhCfHB?5E}"
-    "iO}@suB5cKOl}*Zn`fObGGh5cuPHecjpdzHszUJq$jGCG<)a0H+V0ES7-rN3G$6j1(GIhy9^W$aT#}^F"
-    "LEI7HpsoV#!o8%xnN;P&1nf5p7^Ry6ekh2<w)!~$l&}^frmRWkCJXc}%^1fAa~9MdJIp@w^Eot%(Eq>@"
-    "Ff?BpYTW`^+`cGGlStNTmviB2(~89YNn;2jfh|LD@lX)Nc$}C)^==)X*()#^Dj>QZ9KVa5LJa8wHMBw%"
-    "cD?*AbgBmmA`FA>>CfUr+!JnB&WI=MGiwOKL)BC4`|nGENl{y?)ejr0iXW~XoeAe&N}-%1P`02wX2OSw"
-    "(?eG-`hh}Jl2QK{Q1*^NU$#L}_yRXOZ=@!sUZw&@26jG)C7*FQ^3>5Um`DO<Kk~#i@7w;fmIYNDZu(dm"
-    "NU5sRkHIB3!~*=vp&S$+oS=IYpyHxu0XiE5m|N5*LVr^dxlA)PzoqBET9C93=6W!GvFf5N8sGmK9*2T6"
-    "zso*h<;yzp^|ekL9p$C8`FLU#$!!x|fvXKn+&ixefS5tN*+1&GmdOA50VYND%YrTMGKm;!BiKL^CqUW~"
-    "Gy)-?eaXWY+*ZasfoDmuB;AEvcC;#ESdMHI<CQ-;DNTK83PS5U9#gXcHE*6aQh^mZA3(y;?%ywi)XiG="
-    "N@c<}poss_03hwMmf55m>{mP$6HQjj5))As1&~BH1oWewT!G_~_cTgXLUD(VZHu;wz8Nq>R7@+Nl%x>8"
-    "kp)!%oEVaUh8E}Ft--IbIfyZ$W?CL#W49<L-;6$nrb`__LQryvi&P)e2%b?z&;YC=RJeuItfW?Hvu}z9"
-    "aN1Au&(nUqP%gFIvnEJ}Ux~WLG;4-O-++A*HGv4Zd9FW#CIEamnJM1R6GE!!$vfn#Owi8tD=el83_uS;"
-    "u^69$_C;ULp=ChYwQ8-L?L>bdKVd*w5O3o2=XQfH3%Zhk&~A92*f?`^6jP)qVu}BE1aJHR)|nkO6b?aC"
-    ";&y|m1vPHD>O#lCUW8zrPm)YBhXOcRHXsK761!-GRb27~dwRW|7XcPB^?8#<B}*UlI9pqySm&XO(n}@B"
-    "6g0pUMxqyYa^cdj{Z<qTW+jrLZK!h=zKsPA9=%nR^=!t)ged`gb1;yH7HHlcM^l=U)O6X{Cg-FRG}-xJ"
-    "3?j=L_nBBwI2iIPGho?k(>EErSZg2>$pSnurWmla3o-Ca2~c=dw2zl)5%wr%ML&!<5o44U@E{6XLn0Q1"
-    "SOdI+%&5S~KPt#+G)y1hw@Qxn-RPT4<u{LTSmici9+Ri4w)yYSY`}<Ia_9?taMnx2x$ny|P--_YZ?^zE"
-    "+l(o!x`J8SADseJapOYy+$sQU)mwM-{b2SMp#QkKy;|2vKjJcUk|LFz+%%Wh-W=IZxx9U1r9+w!XJ8b{"
-    "E`kbRVJ+mB^aY_aJUY+Mk~HuxTYv9i*=a>BiHNL(z}Zr?r%of}GmnN==CnWTK1RDD`<_}4BxmhF^Q-aX"
-    "+R~H52@}MS^ikilc9+*OzN0PS#O=IYYc22h7Rjrxt!^^!>^yL<oH{W*$Sq@_!fbmcWro!jYF-DnMioD;"
-    "8nd$!Nk5@DTbd&-eg)UCbmwfO(2a)NWu!6Ig4TRIQ*x(m=&C&mdj$-v&8NKKiso>XGyeqdJ=RqSx(zC^"
-    "^0N2gojiWGmbRtY;hgT`4Frfsaf-HoBs!fk_2&dUk%EyMGI{O&5fpyXt5*3^mR<{_OUXea3@_-Kn@w+N"
-    "R`JXimMpdb1_}c%8qlVyoi8w5B9zoNGog14_|Rv`&ihqzu_<fsa;}@D4dzdh>vTrQRn<GHo^nDP2kbXF"
-    "Z7L+<5e&~-7kX*^Dx>{)PKTezsRYzgu}ctuD+jDpe=6h2uXmr`=xSg~gg=k_v5a8!8bu9`adD3g_NqAk"
-    "%!U0E=m|;vO+~t!ZScXK#NOXx_3bn#+ohvInZOw)4L;c68ubL?xwS;GE^KyI-VLxH+L^1fnf+Ezsgnc#"
-    "3QSy-00()3@#T4SI=<vqF@3E>_6jP>(1>Gg%ZYBi!h>^4iXr`g)|UL_<CoSry#)bL{^p$EPR>{ZhEvT)"
-    "Vbe}ZlHNx=piLB1Wk=K<^{e_MWby;ZE<l+C9=1V-jA}qdRL(tVTzHkXCuJ0+%qNF`Aqkl1IP|%7G^A(+"
-    "cSWNiVN~JMmm)5#?x8NB1L8RLqo(0hAFFGp76vt+Mg5d62;FXKa{QzOf0zH7FOO8@Yg>0)Oo~Guv+D06"
-    "Cx$)&NqHZB0mYZgKz7<W;myp07i0ysShB7w=(;vnT4R$KC_zj%s((_#YG?JyU8M&+fU~&MctJH!vEMec"
-    "RDr}P4gRig?R>0H<BEKnF9axNwnkt1y}`i#l=O8f_!{Zbc>DYJnzW2$w1Oocl3Bsc1$HAJTMI|`XnJ6h"
-    "V%n%QA^{VK>R>^6DIsPLncz})+ZF3s34}{)HV-p6T5_;U&orC`f-NIoJ96t2W?}*iRXDJb?HN2wIKazf"
-    "Biy^N@MJNyvcCCWShUnLaJz16wl76*vl?(aBIIR6r&0?y<@chMM>2s$a<k{U0s7WQZXoG%sb!lVz9r8_"
-    "9XjbnGW9L+P4K5DLqXe0TXf9e7>+bEnm`daj;Y7TM|A?)=tfvhV6V(Lqus~GX6sfdjU~$+_wbgB$N6u{"
-    "0$*mp>||46oo9)bxH$#fJ#Om}RXp6^-r}`={{9;xeQxZDX)#<3l&99N$)BMG)#Mo&&I*rmJe77!m;e7A"
-    "u-u^~ll~x+<!phD5yliS%+zk=l9RgkpS*??byqxL(1{L-)DHBCUIlHp`l(PVi@kkSIg6)_J<09i?Q)!y"
-    "SrB<dX8yhJvewL=vJ;AUG8_*MM?1afXNb0#EdZ9qf!-7aC<dE^JtH$gNQpU+mMK5?-wFS;`_%mFob|nb"
-    "0xcF3=XY?MSmK$ERaUBs<US~sT}J>S&Tl%#Plsx}L0eIx34uix_O|B<yx9955Bp$B;GE3}X%6JE>wL11"
-    "i?9!u9S2e)D=P(pW2_h%BRqA84_Ue?-`p!R)@OF@GnS!S$Hv^;Sr<9fkcgyb{^o@Q`QRbbdi8ITo>c7j"
-    "kPtw#Pz@y=ZRj2Uh!j--d+E8N7U#c~2V8T=5*S$RIDPx<S!B;BQ~`d#$v>=jM5T<<GDO!)EhDu)?^|!I"
-    "klZ~7lh9MKO5E>LQ*xvKG>fHmXa_+7%c9(J6E)JZu-T|2u5ByVY-Tj~@yzdm+GOg-8%QSHn1e{>K!&@a"
-    "LI8bScmRCGn31GdE7>&gqGXA3T9h>KLFqEIg4tb;(P#M4PEyhItX-2*fYv4O3pDj{WZG0jMg{?|pXGL+"
-    "$@$aTB~fbe1$#vEX$QIOpNj(ea7uy1QdqaruYV#Z{gb&l_2#93<~BsD{Aiu*9x_9Own<uZED!oM%OPvE"
-    "d#61xi#JVyay(<65m<K!6w9pz1p+L?zh|>1+J%%gvA#Ka$l!cNAJA;DJ^I7mvnQF^^QQBBeDR5q6w6`f"
-    "vHZDmND*?LW*L%Rxntkxd`He}hnmc)s)sjKCjF4tY0=~d{Sbb8xOnrsCNZi7#xl`j*AiGMJJ4^=DZME&"
-    "yp*vA7`8E_4%>FG4OhdlropF<i~BgCaP*#EC%1{WEHw%A23qXORZ(eRefBrfK?c<32GDiQMt5J3TcGOG"
-    "I<XCIskbT;chL-5NlmVf*mipD0YBfeK`zxj9n4?gX4kl3D#ledSxL07PKEhLi6cF|s(@5Diy4Na+*pvQ"
-    "b_UD~pucU^=<#dsvZ^0|PC-$-xVf*bF-E{G;@Vy%buzm(*8bj<jdw8OQ=;*tw@;hA>;M;H(n@K36k>X?"
-    "&X`9dZGYu*8bt1k+w0lkJRan3GdIf4{HoKn1Tf`=*Zz0GBhL1f|KJ5SbmZr-pr1PxoQ2+dbf!+UEOz|>"
-    "c2UfPDv!phAqyJ46GJQVD>|R28Ts^?N?ltxV$^iK-cQ^JWsL&@j{{-Y8|KJdn^hPFLn~)$1xdzv@Qw;a"
-    "P*e9BJYoC8mq2^sa9l~9hJ}dqgd_kHB2(^CXm2Dd7deI8ik#p%DAhO)z-zr9h5oh`1@?gNpD2Lp04D=T"
-    ";dlmC{4v(>=)5UKuO87>0z5AAUH3}MkO79!aF`q#SjJGpb^c1DuJ^WW$1nlpgNTx$16VQ^s4w{-PQ7fF"
-    "O2+#iNHFkKw-y<Wb#fc~GulI@(PMza=y)aLpl~W`&1Zgl0{5*Z-c1Vid(Xb1B%7h^`9aILY@%wD=Q)i&"
-    "kbv{Co)6kmh`yCC`6l6LmP4=Z@B=}oKwJW67slA7r43}n(B&d8nkpEAXtha9mU0#R<(z6e1lG8>Lv}!y"
-    "R@zKH86krp%3A@{yD~kTAV8Io;msFKlxB#lBu@H2=%-IfDKir&8M4<+5ZA0w-Gb?QdDTb?!ql3Knr$y$"
-    "Q89V&Ci{v!M*Q%nbg(i*x7@{a3&SH~!l$>ji4lBM*A=KaR00Wu7ry%!5eq?Vb%6Nm!WRJ9@5~^UHfPy!"
-    "&99$!ea~Kn>hPR7Y+|jv%+5&fEzpHXNuI`Jw)_}rU`kOh5Mxt>bg#+3pv0BCXzjCtA4cRU)Y|)|EXS%?"
-    ";591jwuB-=#_1ZB8DAW5OqI>(mfoxv0@dB5@~7XYIs=bVc)noL12D&D5gb*NGiWzX2W_e=SVBGR^0tZ9"
-    "0KAPY#TG3QJ`OAQi|R+t!m*GQuXmo}AMEC(RzZpmd1$qMY6|XeJw7E}x(UhNv*G0UhRB1W%T^&RIcIqa"
-    "CeKqD6JA7ykv7)-Fou)?RlG^zv)dv{`VXie+C`gVFBb^G?vU39$w5u6frVzeu>hDfikcxsQU6fQ2*Vg}"
-    "|JxhxY?rRFpJZb@l$VX~m9Ha^$m`$XXJrMx(v@ctXg>$TuA39qUtI|cGO*kF%9{p;K=7|QV<+UG&+&Ti"
-    "_nP@whIk#wOtDV<uadV}duYkS-4-NCq5)W-@uXzHy5KyuYXoS|*&$XY+E45=tk;d1>65gap}0vwlw2>3"
-    "Y2XuhF?IT!K3D07>j<A{fwWu!!nnrl;Gg$GcXB^KS^iPwkLyk}9@bOgsxKj}_B)vRtjx5*8c{+K2{`M%"
-    "2vN$N<GoyjjB|~_x`>7?)uP<xS|Pm<Sa_KzNMna;Nj;6Q{4o`w=<Qh(*Al_8Y<P2p|8E;}eQ$zJX`?~I"
-    "AM&V4z}GoN2A;VG%DKr&3x$Zdy11uxz$KlhZu*=E;!tR9G2w5@JcvyKzxrW}JM`qwF3X8#eL*g}mw{uI"
-    "OGbnM#!i##3Jrh1aVRw){Q0Q_9C&Rxz>FVQY05lu7k?A$&x?5y#Q`tK0q!9k2;?Cspm$&6Ov6S;rQlCB"
-    "gx%v&bD3x+jH>m8D0=zzB&?B(LHEEmn?TqI=V<3n+3^peXQx4XRBbteNK6Hq(b7>eZDD9CbWoqSC`(ps"
-    "bba)KmZ|(kXT!i0M>Ffe7|c77xT>#}eK=;V?!9bucPd8yM(y>KwCv_PP<BgH+0bzasCJIz3?Fa=R+Q#@"
-    "Rxx1P8{ed@=DZF!Qkhk3*wbkK4CWlzUw@(FlSXy*Zu0x;sth28lqYCNEBYM^MJs5~$xAHyt*u$4@%Ey)"
-    "xy^@f=JERTX4uD+>cB-rFNnJmruI7#@PhrfT9k`t+}mPry|nzxlLc>1q%S9obeky^A>o*Gh`@~-f+3Fp"
-    "Y9u)B5x3w}*>{?%53u9;uy-MOojf<hNBfDyGb5A6Qxd30YAOBN7u|;h1+PUGtO6|Jg>(t~JF4&=vDXGx"
-    "{eH<g4VMXWHl9VhJLVCpZKlLy!_hR;FUXC@EP~)J?Mj&+)DoLhjpwn|Qj^t@Ox-F1ZNt%NZ|3vsLf!z#"
-    "Itu1;1Lm90voMjjbndHXXV5?Cc-KHR7GK3JWgbj35}A1%>=?nN#~;|QeSkJx9w*hF+Vzq-M22IFDgc2f"
-    "cvHs+tG@ykg>G+%G^ZiOC~WydwbEpn5)kz&lWz_gmX^VOIbl)(H;<{Do-mPnMSj@B($Tdm1(T*w<_w8c"
-    "IlEvgcaRBlx`;@Sa~YIcoAWJ;&mTM_^_dsh)};zk|94tP@S)aB){#V*sw9M@1uu$xz4<ORH;=fId@|h|"
-    "?oouegEp?D%jlHcM7!<x1H5T@PASL94Y4Av`_G235s7!1ou`nUM(2O%Oo>l8KzR$0ee}yvE4MHAi>lFf"
-    "OH|Ob;KK>U(_tIR<jYoEmW~4*1x6_sNPWkCd2QrJSMeIm^A>yuIx<CggtssNJfegH7Dc*RQwu6u42A~f"
-    "7vv6RSlM}SVJZ+UFD6iIkFBUg){BRn_+~n|D0xt2-#66*AOPc=O#0i=5dwzNXG5fsv}{V8mVz3MjIXDQ"
-    "|MDzU;8Lh!Gd$z8J12%qg;loztPD&-Z&(so)4Ml$7k7C&v3Wp(lti<93lwdC9~n7z;`a+a5eekB8HK1;"
-    "vG0#$KP&9{aP9yvN9667@`+~E(iSCa&5C2>1T?ff;Y9h*+mT-psXFPBUOxxq*%*G_!1->ytLt>}(H0TM"
-    "?(-ETiRm0O)qmQOj?&W~v-=Q_+Da~PJN8_yPNo{Il;q>pCDM8u2>h?3>A^5mcWEWma@Q?+BRm`BQ6Km`"
-    "tNu?Pr-93fII5O9A&r?u7GZd;?NzVmgv|KnByW(e^D69Qj+_}qmXc_{s7d5L4zHNwZbgAHE--RpUxrPb"
-    "*dnML$#p6fXhfW^L-kV0mXxheXdMaM%K&HPGLZfQTI(#<Y}6R@3^iW!deR&)SqF6>`*j&6=UO>|=oIOP"
-    "a4A!ka0Ne2BM=JM4q~ot9}K5bO`u<nn=BN&MCW;O=)f#6R6^t{-tj_%ZEDq##v&l|KRB62qmwreNm!%!"
-    "T`d;IqkX(B(eaw|4nx()&BtnBe@|Q%(#l9OmUp!RAt-hh<JO&;IhG%fy%+L2nFpikP|4(}(@LK4TX?Z0"
-    "i2P;!ad<OGZ1LGXh>T;?081>?O>Ff#@`<pqy^5|?l-au*%R|syU3VL3!Hq(ukx^Esw6j*MJn-<Wd8Bn>"
-    "OVi40;8#^NzLf{u6Ali&dnK86Ijsv9&NdY2)JRkEDgp-3N_l1-+?tFInAopOt&=PNxje!ZHy(MTjLv~!"
-    "E}$8^$c4C;^H8K|dN2V3d)9X5X%zF#l)L!g?+U_*wF!*Z{&{+ex<%DD{35k?Z%*)+S?Wo}2}W03S6(My"
-    "frPLGN`J2kV&;B05Y#{~Fv5_9htg0l5bjuO87^WPRWt8hVo05p@o$nO$K_*mI~{PcF;~@(cV5C!ypv>w"
-    "DxMhC51%%(U>7Z@#!+h{CY3d^Tp9kDYj_)OOtslo`>Pzz7;eF4b3GGHST${>`{ohIo;281$S7G?8DV4~"
-    "@C&nM1H{-;VW?7ymcf4k;BME_?P{_#=`1y>M0`o;Ld<AFYC$1GWql3Db_q!4_HkfM1wLkM-W1Q-bMe>g"
-    "ISUo(pRea5mm#kiTK&1TG(+A}n3vvwhqpnQ<%&rAq^Hh1iNg6ute}g{enh_*tUZc5%6{;SPtUYWragB+"
-    "-r2uO=Oe4MzV~(wD+U=XVwR(-gB-qamLWpasy!fy_E7_jFHB68r;{jTRb~-#a^?ZTbNI9k{bC}2yPnbx"
-    "+LUY$aRn3VfA6@=9iV$WoG`YqE}|9C1`?7_4;wR)q00o7@@TEdF|cCbduUxN=*!0-P>n>G?~ceTK?$z$"
-    "Ev!MrGI))1<VEG7U?p-XP=@6q#Pq)gt(2{KmRsY)`pwDZK3f=X(BiV8kE`>s>#d3~jp;hlN1@QmtgBK#"
-    "p=AhoWX0IXg|fgHp_MFO(WbW@X$a4+;>Aw!XXS&^4I{jITPe*9O|{mq^GbH~`|gt)Vs4#2hQ2Yxq1zV0"
-    "i0GCh^lA6nX)8R8rg6Ar@gDwyGA+Z~5X|e6gAnC^Rezx=^>StRtrAs^s1mZi+P4ghMXuJN2AScL0T<rq"
-    "?#~_}^{4h9EG7b9m+R4k9C|kuKv?@sp{Vk!nv&EAznrT^+7=L3%#5L5xK+X`Z2AXIvN{KUJtdfa^*G+f"
-    "zV$RGrT6P=vi2wYqTsn#*XKUJ5A+ZXK=@d5-Y0hT(Qb$}N;kcgYy0+(KO^Eob(Sx>QE~`OFQWWFi-m;G"
-    "{lRh5!#ZT&<r1SO%w6ix?y9cwsmyu3+G^cQIazxuHH(nujM|K<HUK^oiN){#v)!w1SOoR_DSVUei%cUz"
-    "ff9Hq7z&`1@NBUE!9d`*t{q1K9-wi|rQ_E1v*LE>!K9V12TJ|6{>k-bue9r5OoxAFlw_sX26;)Z1B4eh"
-    "c)d=kTf|o~artlFY)$m|0Kd7_bo9Ou;N~T#f9O{UjJITJM(BevSHTIa_J(xaWNBtO)edK%o1Oh5($WrQ"
-    "VSmxx1`f&9JGuoi+j<(X2mxvz5ua|7KN=vOoJ%s696phlyi%GY8L9}FoyN)&FZX#<lzKyZI7%D_ZR_lc"
-    "zY}GYqs?GTHlJ0dg?kSD=~%3ogbb?@T%tn`8P&;Y4PZ<8YGSfEtl60Be8S!^5F_`*w+$1O??gF-_=$;2"
-    "Vy)dmCT_~TR0uOF$#q-V5fq-%)}cn#_1cSg0h&QAj4{S@#SEm$T!`3bcMft2sg!v)hJNyNwzg*Xs2u5D"
-    "UFGu{cnIwRC2#!wP$S${V|;9jsszb5j$9o}Mu)B>APk5kcb)F-J&h`y${BQz<SoZ_v@-~>Sh_0vReo2P"
-    "NyIUCTs{l)$<oG=VEiQj#F*0gGp-Z-*jx{z&n~44>C<LSYPw~!vZ{(q*bvBnr@JXkuVFntAVFBnOxXOg"
-    "37f6+>UXCmv<_@p!gV@%H7$<cIgjGi{z&Q+nw>bWv&Io!(3wh`85kLd;{9l*yn|5q)HF2hd03m~k;YAS"
-    "(<p_sh!|m8b};9%Ir-&>RPfw3i=z%x71M~wfmIVR1<}fjMpgt)ilkgCThGYq;OoAv8ecYl_qZjp^`mwU"
-    "@{3#6H+wSQPoXgu?$RK8N3N>V>W~L10v;aajoHV6?@)MlmbCe<;At8pq~77If!kG3j<Nby)KzsMk_uNE"
-    "{i}SQd#9o;OY?z?xr@fT?c*KHrMPD{0A$5Z5EBz|u43m^NZdzN@ekCM8PvoLe~?Wte2NO3<(R`B6EY?D"
-    "?{2^bohwN9ElV<Gx+Dpea$F`q8SEMvDuX*WbN&@Cf^GD{JMe9qUSneJA1?a%soyKa+20o)6{)Uh&4v}N"
-    "PFl9P^({|m0QS4`SCGj<)?Ccaa-Ej|X1-xXT_=M0C?<Zc*@mEP*AUPZkZ4L-$!ch<)&R0O_Pd%U1GGxa"
-    "<rB2ZE4s<v7fA5YtI~35*McCkmLY<~**vS&<4ag;f5%v=V1Jd3%<-l-3(bGvYGb}gH!C>s7rfgCV33jy"
-    "0og>C4i{VW+<M(oP?npGCrZMIC>FD`@rMTGx0g)*5gd)i9I_XE5`d@`_lZqGB68TEsIm2a;LI*nmY<M`"
-    "oes~>E%0plIWlVTw1l{Al!cF;rrg#+RS-AO^OP&idgAGKE%XL8S1u&l+o)iJpG^kZdT#j7QhwNjb6Rt7"
-    "m0rJK75dUWX?<S>>4j!>1^6lLm`@XOI8T3~1Go47;6HYGLFx+V3DC0R)lYnrbpfR*y`U&arC^GZjFVP>"
-    "5wHejZMY@8AZ9B_w_g;Ug4*xq^aB-iZK!K7m<n~<0aWbAS(zHf>NyTb3_;nDp$MDcIk9f4b`Qn6Vs$Zp"
-    "4jD+7k?D%FfBb>>&4adKBmRe3viUubCTVB7$&Q}-^Qcf_MO8|At##<fwxXnXi5&D%5V2J(7A)df8b8xU"
-    "AGFT@e5HriGRs(yf!imwj1OcPoe)m6930>`bnk?OrmMHWUzQg-|2_~kiyMC%AYE}#`(d?uGm8E}uJiJN"
-    "yxObg(rPXHb~X3mi0C|E3vec)5FL*CA|ZT_fXH#-JxQUu)HiL<?4Pd0V$sVUsDZy|K^!>~BLQ&^HizoW"
-    "V?(YQq4imwqsXTKaU1$qGIH3gX$E<0%#B5x{aCg|eT^Sd7X!bj7Y(*{k{uzvhk}ur6&W)`&b}En;f|7@"
-    "_;$}SERdXU$)6Gm9<$kJ^O0HqDJ`l(J)1n{Mgs#aJPILa|9OJ@5P!cKY($0KIMn7vZdAgaNlM}$tO0g$"
-    "8uVk@cbKew(6&*ndSZF1YnGG6UngH;+`Zm+P^#ROm13N@U?y6oAQ@FTra8?3s3WIudT`cZ9z{1!jAOV4"
-    "Os*y0j*`^SrfjYy*lHEdMv@6#eZ2~JDbVI>`$}BjF)Mu3@ENN%6H)D?*%NEq@=?<6WJ!cnKpwm-DpjyF"
-    "6;(7X$$KeF69yqi%IWz*zo)9za-uDvc?vak{uA(R2pDA~|8;FUP*0u?|HOdw2Rq{Gc0?s9nX;6^uG?>7"
-    "M+*FK&|>3H7w8S4OyMr!6jQ#GRnVI!rwhUy(;_d)P5AA|CkmAR8siv}AH!hrN_r7g{U*&%L}JV8!V3vR"
-    "qnAfzj<dWeJK}yDV8v9u`r>P0Jj9A<c*ESSob^tFHi<A}A~oLQo#~vLRAv|3U4fwM<SAzC`O37!3(i2X"
-    "q8WYAeHl&Ex}Cy!2n++;QPHDpvhJlR`aOa_anf}oaF`E{J%g+GzUIcNsEC74Z<Q8Ddp&_&NN$FvO*-7I"
-    "Hol{Elz~mLhUaL&<)Ue*(?{x)v>-b6$410Eg}DvsN8F5Ft3k=}m8iDohF&<4TbN{uG43bwHdMec9joF^"
-    "^)g0NhAHtk^uL$JRCU|yk>=fKqHU*=ji?R<d&n@qDZqmL-!Lm;Mf#5}%9Li@%?^6lY<pYTH?$`mFYTgJ"
-    "bbqscA(KSk5Zx{L?)Zd98H&q6RM^t7t^_tdTI;CNM-!-j!2E)&9uJwO$A3c-=U+|b3dX;8#Fmw8k93q<"
-    "IhH_*-bH9pR-l_QuGS@&8<I4}AGfSY-eSq|m(Q<5dsQKSs3Gg-&#f-=vWIOw0LAlC-CsMfRcxWB(Q)uC"
-    "S&ot>zAtZ_@Tfufzsn*fF{ApvHfZyPbm=|hrMM=%c(F5KW7u}&`4`BItohxbK@{Otf$xNhz8fX<SPSps"
-    "ZmWbr_WWUU35g9mb2E8hHPpaZZk{*4DUhvCp+uu<t*Y6L66*=6TG9W3H6+5^wfT9Qh}ruGqhGG?x;TUr"
-    "P-r)}=U+oua5qG}1rl3y3_OU;D(SMB97u<F{RC}0Pn0F7?rPTo!B%1tr-a<}nHImFb)lVJ@C;$nSp#G<"
-    "3?lc{NNE&hDb^ut?-5aZerdy5B`1W3zW{I4cLD`vt3V|OjBJh{IfXj-KS(Ru;{&TjT}e8eivf!z`g>C#"
-    "z%oFRgfS0d@~YXptDlE@YS@%)J|s$Tp4<pCn3?N!Ze;=3VYwMJ({T$cD$j;Xg-n&Sl(%8u4Yhx=qS3g_"
-    "%K3afEVKr-YP>d(nMzR#>NHRo!z*dUh(pZrhbukBr=zvM3k#hQNaQ}k;QsF*BlqQ``cW<WHP4mR4klsC"
-    "=!Jyv97{I^k7qmUK%c>dN|d%MXQNt=*DG=lU!8U@9UsBs6w>tKAB?A#*e+^x3h^^dV4>Sq1sEh@&Fsj<"
-    "`ytMI85rXLj4aHaWmL*dxXBzP*ePZ+Rt6??lAI`lTqfkz(7=+>m?gymdtgadpTq-{!kqA>;pCytt02-M"
-    "(Plp$ckQt<OV@WySivzH7_(XG5J#dFkpIO4fy(mm5@Uk3SYE~%*;g_<0V>71?u01JP)T=x=Ghs#F-J8D"
-    ")79C}R`?&C?c>#nnX#(8h|E_SVknp3`KNi|oI6+WeKopC=;;zmSKD^d7Q={x=tXxJSR{3*z4(yYHCpt-"
-    "5!8_pWI#-X&{P|q<}`0`*&OmPgm_HYS>OG24p61Axs~uQ^4BsUSQZWM{7sMdvnZ|I;97n+JH>-IFU3`p"
-    "yr*D-<@P=*5>$<7L8Hv%bIF4$6+=are@${;hAujj;6^Oqv2)dXnm$#(n@x3VWsLVX8w%UF3ApTa5?=vb"
-    "IBb6U+Zo8t%zkehMaE-?<$1rGDCn}q;<Ll*DgUd2P`#4Ko{vm-x`<$Qy7E-4=WPs2KmDRJvF*e)ht3Fp"
-    ">f6<wavN^jJ@g)PzP)Z?>QWj~F8Ecb+%se_NqS0f10nbFOY`MM!OAi-Y@)XqhfJ~fqY)fclMeDFAAec2"
-    "FqjR`(+kb`P_j!e#+5lwCR^EL$ipg;E^X&0(SM|t9Pl(%a412Ta2`UoubXknjg;nONNnLfGF@UQhkysC"
-    "5p@;ZSvB^kYy0N=GsDW4MS3u_^P*^Ibw?=rwX_xJMQ>$8*$`AU#^+hef#}c7cB|~VeaunGTYv>Ao>BNz"
-    "FSCWcTWsOt>?e<_(*od?HiRrrVLgC~Hw-&r7%gY$96d};vy4Cqq8OPD#TqD>j8Y%ciu2_+8V!nptSJEQ"
-    "GhsItB5cN)k?%Fsf4t`3R5wy>mhTX$qLcIKt8(bgxt44qbe!jN9sdU_jbvLQW8OECdUY5{Bd%WZ7_f~U"
-    "kvr25+L<plsSi2@#4Rx`B^Jb4Ph%z8eXfpFu!0x|D3_0*;RZz`YciF>?5BbcDUi{x-Z9>IE}R;iw;B!~"
-    "h#w9x*sliGn|jx)1uB2H>cnt13Gqs2q&m!RgR3op1`r-k7lq?~5GCXco*ft?r~7lpYfL?n%GFNs&#l!r"
-    "tQ=e!r#g)}Ro?J$iu0AQeZPts6$x<I<1E6OxaV;E#}N^;Q2|V1vAx|KCcga*O)3L?lq8{JJ+}c+XkzDn"
-    "{^boST`7`Qd@sUGE)3hsNC0ei&3Y%8HE2(;*A$lqrXGh+P0F=q0J4HShG@lpfcX#|8ZpCW#LL3@nq#qW"
-    "Mc&}?u=T&4Ga)?6Yu;|J@&}i_Tw3pSt}-{pcxy<T$f8-t#dSjBpESAkMgLU&Fe;76YFY|<>zhoM8mmSD"
-    "b@a{6W^JC*#?7CAKd;d8?$Q*aa`w%6VW}F@Dnat2>(qbOCr}D5m@cCj**S2SllG-&brVpC^%JPXXrR;w"
-    "M;3!gc^z3H<g9GP9{G4GN*th+*mZlKL>G9jXhu3eCG+p76ShU%S~J`~fk@R6Kc+u~?SECKCm91vs;h~{"
-    "<Ha84-)_QCG}J1psndeoC|D6eQdw0NSGmUTIlyJNIJ;0p)8{?V8K6^eT`sZF&QAK{=@J|ZjYnx4?5fW^"
-    "P<Ke4niyJizNj-%R`LdPD+O|UBQDSTGi*TYinuylIaDL`ej_(H<#MF%f%AiYvZf&`=YWUUc?Ko1LPCJg"
-    "b#)K2le#8eC|F@w;WOzLZbSkQ$C)rW930ZY6c+orZMa56VL;X74BmHN!#UV3+^7!T$iMs;PqS6q1Z=aJ"
-    "Sd1n9h3hAUx2(+$=TOc~T`oYdweDtVLEEZp3SN(&<$ha=le|^lE4$vY@3G4la|zqUrVYwtWG(F<LF##+"
-    "&@hfqZV`42|Cqgme(BhL@{#eBVKveg$S}v=BrXo05kY9r<EloR-$iW)*9pVq-FpEkq=va|l}`7;I#CF}"
-    "9`vjtHUVu+2*_`_TJpkpZX!aNwkE>XTSb$_Q3A$K(*?xhnV&v)mBlEwR&<W5QQJQ$UDH0SHfrH2@U^?S"
-    "4()vWVupTN4=1tPoO92+h4h?=0Id!}%HRH$dWEib!YuYeayow%jx3=bnpS1+G#nnnXaZr4&np8-1T%D4"
-    ">_;Q18mtQA?l}L?)O!=}(gr8~m6sJCv_L^v3g>_-@$2|eNiJKYugL*JG70_IPcdK40xRUW#MQ|lCP_8Y"
-    "a6nZ@lon^;)(vlw2e(>muD-Lm`IasvmDQL&_@79;$s?jVA4XxOZ&BWFt-mkb?y?%PkoVJFw6OSeZ=Keh"
-    "SS(+gQsiAjN2-f{4QuEfR}@1m9i4g*wcN9v_(R6vF^EWE-KNVZgZ8y|o3$>0E8@7!(j2zSYwb!fckhhb"
-    "sSbwTPn9E<_YbO%Z~A-68kOd+UtOhnYN70AT`B5~fg_ElFyB`foe?hiTKLi;?9dd+^s{$mD?F1G@_Gij"
-    "_GOKHM8$6iRqT&mY<k1DoCy$dL6ycG2!A7&(D2qWnB`VEkD<~x>qXPoM?SxcN7ipi&%t@4g{V|ecGmHF"
-    "em@ItA)4=H!*uZ4VRSeaMgZx`?2oAaw0QhZO3-KZrugIT9>S~^=+9C{!WxoCTpZwy^iZ*m0g}ziK9d}n"
-    "ruZ`gmC8(_DsPD~a`jnspyt%D;UjL~db~n-LD5<9R|{yMidC2mJ>EcTe>3clZ<-KwQwT0~=i5OCP*qUZ"
-    "PpFHR$w;Z-6ezeE%MwsLU($?A2;}sYyW<BT(`XEDZb0)X0Z$85Ns_VldX38}e`6&zb?zfpv{I^X?G(f#"
-    "RgXdn!0~RbZM>_%1pbm@CBXmh>3NuIT?*k-YY8QMaWts21yTR0Z?TfQ?GVD03v9t}BS%X(!E8hOyX^v@"
-    "R^3xXdYTaJ7W~-A4XiO>|6)Tmmc_3(?mCqamBzcU1L%tWM&5#5CWQ{$$Ll@TS^ZVSA{qADZ1#Yxnm_RP"
-    "Vu|!THZDL=z)oUEG|6{qvb6SV64mzh3fLYZOUbquhnfI2IYyBm^8P8e60V88x`_yjHUaW^Sp3ky_zwDu"
-    "4$8;r1+06haJ~58*kVgy_;`7V_3-f|Eax*-brvlUEUP~_6YMTf<yo>usf7nL`T)8kHM(y`%;O6y`KTYT"
-    "dpu%?NQS})iSb<f?DA04#>Q3@PH;lahD4{!8f{yLuK1n=0A9yKiq4NU=n9JwpWyhkj(z+LDlF>C>g=L4"
-    "w-4rXTEX5?lWtK<D`}s=q2qr|Ssle4-Q?HLLE%&KLvYfNq86=PpnCQQpx+9PH$5bBb?1_t1yZ0qv|zto"
-    "4CRNyq7>$=7-^gD8)R&t&?U;bJE?}%#ynK~2bVp*0S^IRUIR)sY?v&8Y=6E-`XG%Fb{%LH<-nkS4k!^m"
-    "kbSd6D2cQzfCc8gb=kRYV>^<rh0?~I4lx<EbpjF*RRtFK;KWYm6k2jnI@BM$GEWGq6%DMpfh1m^>EzZA"
-    "6Pn=5$?fDXm*Q;=xOsJ$)y@PENu`~E?5K@*;5Cf`jx-cjJ}IcRn}5<w^hZw`56_1EHnlYkJrMB@I-NIw"
-    "nAtbsa1OV2n$+%d2nSC*^Jc&4)ud!wO3w5H-|R3wH)=L_!md*_T<J>%kfLE03E<afa5XScatLR`-=f`t"
-    "+6%;jJMdU~#~6ZLknOQk2IZPy-^qAiPvBIi!zu#c9CSzJ0H5PPvYi=*-B|ie>gehSjO;$0mD@+z2%#jc"
-    "xL8Q2H3I<}|1pO9Kxga<FFS|={ni#<04XYh^nBY%lGr&v^1Q=Wc}~k%;YpRB^9;(xiamf13Wa<RN*Fiw"
-    "0@HbOi6V%GlXV}Ll1wu!BuTkL=&BFFYU~j&+FXu*z#7;+PsRGL%bY!l&f|ljS}`AB5BR!-F4#r1xk4o1"
-    "GP=k4f3|1-E6;l3)KUh9y=r=HG=!i&-K9pooz+6Q^aQ%rWBA?3L?Wbk^?Z`=&@+N>E+Zp<L|<R>=cCT_"
-    "y;I763nQJgesJxS>*~P&nL+WD5~is2)`4{!qr)h3B5V%pkJJ&DaqM(<3v6m;wSEQ<g8QBYmcv()aDR<T"
-    "!v<^=%i~X#i(3{qZf^+B%pM_*^t^Lo@;@o-M2;^Q0?z?=KNqertLZ&wGF0Dkfv64>1*p<(NV!tjNK+Ta"
-    ")58kpLs>#HrOpm6i}<MV%*@4v`EP{kiX7iDA`9QL*nAZg#Fx;`8CjngumV<lO5*@adkGlSd#s;t{(FM<"
-    "wf&MP`Lls%v&6mmmsic+#WgW>3APP5S68PTRi~Hq@o52#*c{mJ6>(x7UV+89MO@Y{<2^K>N@65wja3h!"
-    "Wwn1!VmE=H(+VHO2SInSq9v$~qTZQ39)RyAiK>K<kU7sz`Ig93G|3+5cU~yvZjZ#>#Qyd$+&!lMy3zKg"
-    "*h-sM(`~s|%=rIzbx<7?JGt=~={nn~@Y;~gO{d&Q77QFGmK<YAe7Hp?+}%sCL#mCuE~nO0%9#Vm6SFN*"
-    "kB*Hv-~`}7YILFpR}G4jI?DiFdsL-5+J(N46Uji*yC_dWVzK7oo!%0DBm|cOlB#8)v`N0&Xx)>A^=eqS"
-    "sQAcEc|~ZPx|&e-e0C@a^Txq(fBKFHdk6bXj6=glPU^Y!=e7cBSkJ|`hGEF%CF2&BXh}V%hs|>ne*6fm"
-    "psR(@Jwgn>ZP#^GQ3p(rLaSw`mqk*Uy+q-bcG+<v$FJdqjo0~Mo@p(fpJjHwnhJ4MV)%`Dw5d1!iPqe="
-    "IeTM`^zd+yc_gI2n_S<Uvfc9?pvP?syTvhA@)04|9j1*B1vQ`r(Svfu(vl-6U|LuswWwd%q=~BF(_se5"
-    "RrcHvANvef+sS_;X$}Haj@sX*bD?2RleDt=PsG`#!$&*1cOh@b!l+Bnj^V}1%!Ur!*dK4Ed`Hen$v}p%"
-    "_|6^{Tyu7*;YHgEnYd@$df}*p3KDJ`2H0>=DNSh8{T|8G|1#8Aszt{#76mc8lLz;#H=|Z1IClNBExarF"
-    "BqsyQisv93Xh&V2mzSeWALU)=^p)Q^p|xH;O%-NXU(n2Pli(m!#GivE9u170_9j@iTFlkMK^6y&U*7j`"
-    "o351XE!;jca`wTluI}Tq7f(G6vQ$B$H{-LP9v=?Oy{L2Zcs5`CYo60|jw>vif|GnCcs;zLme00y$tA_k"
-    "uexe6z9q!AkD*3~XgI`|n5=M8@Cx5PkOuj98OE3)vP8x&OQhGRxLt>mEU3|1At~IN$2YzUr$v&Zu--BS"
-    "_&_fegTAaJnbufb9gaB_5goK(YL>};yC47H^haSpL=5Cz?iVPkQ1-EJ>Kmwg3Rq`x<z!M{M(Sed+6=KA"
-    "U=f9d4L6S4asvv&O0(4@i>w{76#9wl0)b;nnqx=A{{%YbI-bC$Cjql=-^1&QDDmg)T(k3d=A<SVYD2PM"
-    "ieA8-uCWtSgs~+~O(*~I42Xx8%Ny}jUysSEklu^|#?*jIj7GKg)4$r}6dW3oJ)boY;{FcF!+&NViC%f*"
-    "YlfRMg0xXj)c>Vq{eNG50HjU5NmSr+Qz44QHI4@2w_%@6&`3$~_6&wZllBRDp<PLS{{=pfizJb%%y%#c"
-    "7M@2YhVzhK>X;s#+SuOH@vtN~+;!q#PMyb(E?`g_VvK)9<^(iFW?<X{oYGjI?^M1>*)@mOp$ZY(seC0g"
-    ">|QR<)x3whLd4OQLgn0(w#|Lh>9#7Q5H2lknfP9LU#+XN^xV%cjCu-|hhK8a4I*!O7{N?RDx)ZLeEfdm"
-    "p_??)5U6YDgz%|2`2&}eq?9X6cCglf`s<sCZRh%-STN0^FHQ*%X&^bS@B8Mp%xXlq6-3oD#n{4M+6Mi="
-    "vc=2fps{srIHInOvVep|WEq^LO)|?}!itm-6oT;YXZU`;OywsRlw3Qv&V#A%-X9<GesGQ3ysjd~3>*lx"
-    "R4dcg1tUT#X#Us&k`$0|TN~m{9reqL+&>T6Mannw;*-S_AY*(78b?JSE;PT^iFU5-F_`SUSX#5p)ZL`|"
-    ";u+(SXQz!>n#+PB3A%bxHWz3Iqst-fz7@;g3GRFqoPTFrataz_%IY0A4aKocSfxE<5D6wsU5unHW|cHb"
-    "R*dZ8lDUF8W-S8oQF~rxHAtY3ocmsjID~TAz2NRWq1hVstMK?9o67upCkyWBR;1OO3bTPjT>wm=(I$xz"
-    "IFa~w(%Vd(nhtuJCnuma{YWs&7j`*M=O?*C@6|-_<9%)eJU`M%i?(Rv;idkZWFC}dndqHFC?}`~a4UfY"
-    "NJ0$F2t1?i5vcaWh<S>BpWCH`t)lI1><}3-N=+q;$2@%CwCdlon-xr1h8)=8p3139C(45}@;cW0)4|V;"
-    "&dknrTX0Q$@5M8_Ziz-7aiaVb#}(W`)(spbEZM7bGlMY4jOxr5-Onxmu4+kJMxyHg6Xr2E(aTIebL3O5"
-    "1AFqTPDF4*?rC%^7xQ&#xKBW!9Qugv#g{m+ZH#_y<e{!b<VG@Y3Z>me;}3o5F{#g(E->4evd639RollR"
-    "mtX0@%}~=p=K;_yaZjHJG|9)sLnPQPDRTUUYeCR?XdczHI!5_4#DkSE4iO!iqG<9|gQLQln^5gS)wz*Y"
-    "KW&=OtjK<ugl69S6R(AwfdrqU^}AE2n|r#wirqxFBOJ`7@Em`xjhW7VH2yCi!O3o2RboKq=tX(08}!>E"
-    "nK^;HY*?%|Dz1!Z+ZLWCm*@St_2UyT>W>3rVPasj4`H)<<zT>WqT12XTg#qp%0OM$_Ma_0W2kV(3xO`P"
-    "Q<ERgW`XMN%XoGdRw<3R_CU_8K<=>y8V8@py$kHJ$jT(PiSqJiGMop-UBIOUdfIR%U28D}F~Z5KPww0h"
-    "vfYo{Jat69aQm%)@#E|1UZ0wXikWB${!{f(cRBkeNsBZcoD)Fn?IZUht+7H1>Hm;ifdMEE%2KG_OXOx*"
-    "^t$9*vIj}f-Zw5u=0Twa0d{>EsVf^A;AX|m(5=vx0Jm5ZOPVIGM&q|}KVs|7QQ&udpZ{)CzJWZ%R@t8e"
-    "7=FQC=%;B^RaJ)YGlH^A_WcXzBvd0%u_Bna9f~Z~e6$la@@mk$U6QlP-85CO^=GW6JA}~$^-PJ;&v^+r"
-    "o-(qR_ViONe;<5|#dwYL*>5HGTGz4$D)Z?TS4|bqtw!Is!4Z5`N&Q`Vp8Xa|{Yyb^GKW6>QvXH4efy6U"
-    "Y`f~&?P&jLkr=iJ&QLi(A{EU<DWQ}zw8gQ5<3yK14@dVpC+;(Gq>4OKY@L%$(P=yz)kTENOVL`0xC^p5"
-    "yr-tNb0qx;sVgQs(}n~LqK3->Nn-RK!iC%eMU3q;5;o@WihWX{ylh^3F%&T3p0qIAk1d+wbE8eU-KO^6"
-    "l%BH+l7J@U)e~NIioYkK56H*9)wf!@mQKY4@)3c}Dgh+GyV8yYNhh1jvA}|nHWVxw*}{u;7X)QAqpq(5"
-    "&N8%$)Mq~UPz;{H|FjGcN(s-9C2>Pa1{ab+7{<Rp$sVt&dXyss){f7LwV&>doc4JTT8`(K6ZYI%YZIaF"
-    "KI|$sl{J5iPyblKLPO(jtmjLGr*HyJFmJNLswhWr5(X!s(DQsl<NviiNY_Nvj~lQQ!lFhS!wtF>k6s7T"
-    "i@-CvCt{?E0c0G(>!6(-O`>USxj<%7QcWk#&5rJ@K>9NBm<Tay&)RX(=b~Hx4!NbrQTlRggE_Np3@Oj<"
-    "D*F}f9s?!kC@95VveeD2V5glolu5oB*pnLcwMa)i@<6^cCv>g`Lg0yBXBHK8-JIX5k3QD`MxR(jdVQWy"
-    "ob+lm?1yRf;OiD+u)GsV%y3dqVzuwDun=i7QH-Y?FYW%vgCPLILG2b<w4})6WCjz-IoIrJ1;H<p2@o7j"
-    "{`#;BPgpL<Zx3gLFv-aeUT1k&J%pC-2;Z2L(=?ZNef2-KN0TMexW4aKq?cfQerTJ3hY^CMpfXe`x}(BG"
-    "VU2k(7P|c91Cf&<z4gvy=4M4}^72}gHMMOO#yAMom8{~h4W|dPJ;8}v&5SU%o{&A>oIY?pi<h&?P7Yoo"
-    "LWz5@!5~lfWE|IZUjKe(gt5;|>mu_J`UYailFXv6u&{tw@D#_yLsVjMXWWcjGoT8*(T8gNoxk0T5+f(A"
-    "Qxc891L1g>mHWb;J1E;FwgPH%hIl-2f&(@TJ_u>t!cM&<BhZ$f{!GuZd{@_A8E0B(eNe4j+PSSERS44F"
-    "^`g1HJtE7Zf|XjR<DVTSZtcSFWE5yHRNt-**$y`Hau`D0<8EaZHf-Hjsw4szvV0(RU%qOs^q$LiYV@q~"
-    "`0|Iwl2#T#?JG&X*@MJB-5iv%j!ydaS^Xo)H|eAMY#d*ksG8bXBtvr-QHf8#A{gvh_|=@^6#=cg%Pr%2"
-    "A8%NEm@obitvVZtmBSXy+V}PbYZAw(?c|65Bg5_$>!#<w7rq?uIe&NbTS;^8_OZ46t4O);Tt)&Wo8lZd"
-    "!9U!bA>;f`x%wL&8%T*IqOr=)VmL5J5@PLSyJyn4WM3gii^SQfwVm=n?DLKFLHgn$!7AfuGHJ2vd_UN^"
-    "WS9sF+{Tg^$M>2b-6_1%YhaU<5q1Ox%5I9v#|QgB7MMl_9FK9FTDXRTsA==;a0p9vAfZ?-t1*<^<<>%V"
-    "z$mpCn!uG`)@U5{jnisi>`ITHkz?ylhz|)9NMupRIpH{1_5&VkyYu205mw$HoqRn2NMd;x`~3J{<o8#~"
-    "zN7c?xh(Rrq9WM*_oSN#-WN{QYs~A@tt!VAp-G(coG|?PU5FLG+Cj!np{hd_(`*3_F8av`-$du$hBhIo"
-    "w@3wLED`9;x`7s6+lUV!DZAG~O@gat<HB%PHj$r4@8k(G+$7y2G)7yw6#Y*_E8BDDo0JvA%d33`F<8FR"
-    "D&7zq9|~^it6u18j1S2#PzHUji4tJXYaCm)9kOQpyl>6A(vKHy7auqnLs`Brts7^Rg2eK*N=~T=(aWU&"
-    "J<3yHfs+LYap#;F(9HzcGs`7KV;)X&6xP|^KKKP{!qlJ?Xrw5y^Go0Ki8S``TKDV2i3#X+eO>#BiSyR1"
-    "FaBx+5xw5|jHt?G_^p4YzO})tBMdZbK{mge4W<6xrRwGi?cEOYL{YaIse3?wcg47g$mLjvF0}3n`rc0!"
-    "wTk6A*1!)*al?1rSF_eVW;aQ?khMPoVKenFh?f(>wu#DsMYSmf5R)vO&(`gZTGX6Zq7M|fP-a6M`w8j)"
-    "ls!DXKH|dt-O7h=$-WP>YF)hI;~p~#_F!8!OC*LavwtVm3Ge9Q6^Y(IcrnZ%cI!BnLp6V9M337OO$Pb)"
-    "BUi$cDC<D140j(?sCVW_0#>aI>dclwWW?-cV{P|%a~xfu)h?C5SPwFrzl)IYcY|V@1vMxZv@?H)<IquW"
-    "G)ncmKN0G=vaX&uk82}nA+=NZ!7=?dnq``>Y*_iK#(ADp(%-A*b?V7s#kuL@MDiU26hm8B#Y~`G+YOg~"
-    "KdG~?_pas{F`uH9bI1}n9F;**&G|RG1ey%aU~D+2wH%NPD-~P>qT#iKwigd=aHA2=ubo4yzUj1{0H%+l"
-    "5%cCp%AgELoj(TRE2q`zHma<X3Q=d!54&_8(q>cBKj4v%8zzafMeTv?JdDE)!vQ;Hi5#y?^=VB#Z&~IJ"
-    "ho>*1AD?Ab#_kAJ*Y8=G=m8sb<*E9ti64QF(fx*E{{FqjF|JNeih<JRy95+;(uBfTUU0*bcC^t05Dy{w"
-    "E*zDEz~~#ia3kMc!)O;uccU25$APgIm$R)l{>D)k|DOlBmL@XOuLR1&0CWrg7UI<3&GkVz_vFs07h-&j"
-    "bnukoy*ODu(QhXMgVZL%S6RsSZm5Zvu#WRs#t9w+oDSNne2A!gSQ)R48C#kP&E45(pRpaQ@q<3U2Z&Lr"
-    "UzbI<vaPjOjOt0GoC~MkTyK5KqPHbV`2h{YWFBo=Yl_F*v29czZS-7f(Z|%|HHS8xXP(8*eve#&us+Ag"
-    "Uhgbx&A555v>d&*eIV&1;nb~DOG8hZSWOrJFI}FkDu$B-5|(_2f=-XE3v!E1P<`=ZeoZ~F<d1~~cNk|h"
-    "zUr5#xDR~0Y8%SIqrLNaWdo8kgkzSm`AlETKy{cS<`O8**TqQa=@FQndYjIznsu)KGiV;jjuCI;ejc8m"
-    "24_HZM$uovCj?gcHF?GE?qgqF+a#{DW(%tDPVr#+jdSG9E$>Gj1VCjIhT4>^pqCVi)rl#k#S*R778xx#"
-    "qrs<`3YsiGiq*!#)fj^l=a@$oJRh_nWaWImp+D@Ne07$;TXPPd2e_TErakzI0lwr0E)r}C-FZYPCB!$m"
-    "aDEX`wi99$UHl4U7|bwUTWVk(^kS#q)V4e_Cxi|h{`_YpApvNi$vq5~O*HaXb-41;nCK2wkkiqJz4QGd"
-    "g*t<D#rwh=rpr01b(B%Z+hnf^@cq)VN#C83HEO8Uk$js&^U+IN0`x8RTrk_+&F-&q)Xes^v>qouH3;h_"
-    "znH(of`oiO?Qt$0xStf^EyR8LkD^&cE!kB<GgU+4IWDgxR_g9kBP&kYR*wi@N-5P_g61r&T>B);f_fM>"
-    "#8Z;P7`L&iR9`SAY7ECp@8LZ{bRL5FrEt)?*=&^1cdjd;aQTQHv-8(ti^4~%w&628?eztbbz7<6zu?S9"
-    "0E$jD8BMoPk=VLqM!n~!b&JNWb%X$@+q_K<h_*b@)}7ff&N+ac+f1Hq^c&ploFpUO=jjMI$ZE!knIg>R"
-    "e^Q<DlYpFIuy_ebofqig=q$DhkTxwSfpp_KrT92I2E+&`%qr8)^cc1#>kHlW!+9&=32(qat~J&1b8X3a"
-    "{kg-ayoUTqv8kwBJ@siG`0V!Sisz#@)XG^B`L@0&w}giysGsI*ZwZd9-pAbOCEvtgIZKAY2>fXZ;I6@L"
-    "fA87z-TI{kri<SLQrpNft{GL9D=ubHe|l4dP+aQ^bu*faeWwL0S6+l#K=dWuywV5hngK=f+C2YT1gv1~"
-    "eIZrL73_LoyNv9Z&GhoEJof;9Nit)H`aoo#GR;3Ir6|-LIV?<QQ%HCT9u7U-&<CSCk>c(gXG_ez_KL4d"
-    "K!WU_(l4G2hQ`t%!Lc^pVM@;j?2{q*IxS_WhqfN~%+yt(o0^Y-KrG}|C?~QwDs?-6*@O_MM+v4`2M_xa"
-    "5WV|Vo>6`ieN=T^UZGhP&{kGW^lcY{BIfFa+}&^k0Ij(kZSKL9?8uj1tyP>&m|Y98qRNU8gI+6G!Kgn~"
-    "D~HGX7ZhK{f!~#MDcZlTrTweK%{yg<nC<7dW=NQ(v&0F+SzMpNJv@qYEincBlbMSJe9-7@Vl}m-3QA0="
-    "f7_XD-+g7($?2V~uY<)y*g2i!m())>xN&uUM<H99YinXW>pTCxkCj3>wIvq90NYH9PXpodE8bpSKYfZq"
-    ";I*<%RV6K1j*i`~?|^;utV$Mr(HyY3+?~aPKkWv6f^exO8p9_j|E48Rqf?>9C-2NVAP=~NBn@Ae>&ma0"
-    "X$1<ryV=;xYgE5ErDUvrjr~esoC^1-+;6n7<^~U+2mbht(7B0lsFJftII%z00DPOEQ<dPf3c^)s|AJzU"
-    "NE5OzQX-;VBWsQ-#`Q<i7@(azYX)7n&Xg=KM`HbZUlXz)I;|dv^=8t+tje>uz@ccPyQKfPrdkkd!3fZJ"
-    "HL6!!H6{MJgRl6K#X|X(&OkWt?sbo)^?n&A0Qngt9TriB>RM(hnU7{xFk8}zvNwf`nAz)8WRg1+j~upj"
-    "^(b^(soZQ=75}bS;_XRRMl;KaQ1pnU65~hk(TsA2O<*RpK{8HG;fe3W#jPf?tNpA7xDt>7rH!IFQ*Acb"
-    "HfZSCGZ1-L{5bZnN7qu_$Ooo=MliLG(GB5|4^2W=;&j4~J?ED%q$Rn(-z-*y2b_UFvVlcJd;<FxOifZ@"
-    "zQ6Xj+k~3b83>$wLb=Tv`90o;&4cuZdVS`o4(@6{=#T&YMR2i$=>ccYCA<;}hCC?N0m<5CX*aFv>9XgH"
-    "fDzvO(RhKVtJm@i+Iew&rU^^O$+Q_s)$)$JXaVCk@Z?2fs(ZQ|nEOleGZf|fcTfUF6CVb1O?U9%!kNC+"
-    "Ee(GE#R%fh198Eu=a@k*oRWuAjz+`>IcUh~%(aLhraTn#rU{*``81!|efa8rV!LlRi;jXEk!*ca^cMn9"
-    "vi_**nmjfRmQKwPp=E;#9so&1P<%Wm(0SwpTN>?caEXLFrq3B4h)jzC6`CbZdZRlnnW}M>alJ@S7wtJj"
-    "oJ*jTANU%KJkrei#2x16mAjJ)y^dbIL<p*_osHcI2PK?G^=Mr_Z`b?1u%nhdJnB2Bv@1AFRa!haRNaU+"
-    "+4wQ;(2KljtLF%dfUu8drnh@+?BAwVT}!VOLLGE{BzZvk6~%tn)%3nv#2ZK`_o)i72j6Z4$eo|F-oe_4"
-    "Gnq7!r>WhUmS|MdfH4e9IDuV@47nCI(qJrZnGtJ56MX!Rn30yqeA()SzBIoS5=zDTB%9ccz96?#CD-BZ"
-    "-A_cnes4RKB%xVq)P5lBE9du4yf1^1LkiL$L!1sQCrpGT!hC|x6Egepda};~K&o!^Cfr#oeL)?CWiL;k"
-    "1Vf@gzmywL@4SU5N<vF%GM4Xwe=W)EcW2^LO;4|hfTFFM^dsm8Z>xyfB|JVZVknNf8tjnK&H)5wF@`fL"
-    "=)JvHSg+i7uH4aE5Xkpuk#U$60ROv;CfBij1MVHJ6Jg59MxPR7J7+SD$pf8q_TEbTRrH|2a_{hq!?QM8"
-    "kP!fm5pOw&HFB&`3e0)!g}Na+Xnc@mwIP~XH*}$l!UGn&PFblj3a%l-^9smNB~V-bS66NdoukXy3x|6W"
-    "QgUl_+7-NX9*=$2Bp7o-Nod*A28KJ;By+#$H^oDrGnHQL^*3$QF7MN0t+y%`S5#Wfhg~=x*7Up<17>uL"
-    "PDd&XSzT^*D)H_OXL~N;@DrPYE{NQ5F#Z~n3aT3#(A{vrNI3}9mS0He20l_X8elKwHsDbdL00K5CrY|L"
-    "?VoDL0c)1`-{<g_pPqAHmtadI9uf$DfN@o>CD{nCn$BiD8m*s|)p`m6Ba;o(g>L$W0E#p+NWPH8r|oXE"
-    "+3id5xZEKsKE8KC>+LktJ(Gi9gkLwrd%g$NkysqXaoaE{K?X<qzy^)3J-J98;bG|wTyVP1{H=B60#W{g"
-    "i>cnUC%U>%OjiswXU~rRX|`OX(Dt<Y$ClRoe&6Jkj@5MXPQo&ctNm&t#BjzDy{OMzYO#f&+#6nC<m^{P"
-    "RpT6p!G)_N=3$+kWwEjfHaiY@0^ER%eAE15EIb8zJNSfNDMem1n&@%oI^omhff!WK2t-4u9>%VXuMKZ?"
-    ";2*hFRxvW#vF9u^=JX^VK<*-Gq0{N^x&3`Ve3^!V<BJiilhcioZokZaqIc3)GVqadXYMRgs*|Uun||oB"
-    "av^xkr7a;Atl2J9l>;_5%x5QfE)%viV!b)f5ixt3RqAr^JlUAI3-0*Q{zK79)xZ!3K_A2L$|Slv2pS}g"
-    "0OjQ>$w9M)Z*-E#qF|NDFqvHq1!%`Qcfx6;`vIjGo{w)USE4|@2x6}WqaWd17h0pv1y*{=VOn>5Rpa59"
-    "f#JI;Ra9?tNF~7EdbcH_14HjO8Sx(XU5@L=F78mG$X${CowqZC%iNt3rUPV3_`GL{goSvaFJV8l_CM|)"
-    "igkAoB|4WaxCeDXIcOA3*4KOq$ducbx)wEe%8b}Ffxr@DxXdM>jr{6i4X4pbSD0ihur3riOEhWN67(EH"
-    "P%q3yDE1S<-dskA(LnIx_!v3ufbXZ9UM(x6x(e7nk>dc=o2oeP=4a-mKp$}PE9wYb>}3si)G1_V01D@x"
-    "1@>iM%;>qCxbowSUuiCG<{Np!DuU-6kPSr{t=@&*P3L&PS1_yQb=QBgF{P-T>87K3Mq70(;Vn_{o2GcU"
-    "GMPptw7}d|C}^ou#rW43VgY+*_K!OGr|LAu^UmS4RFJ_V@r?LT1_V0RMf#4>)&~_nd$H+yxMN8SS?#d7"
-    "g0iGwdc`hJ@hS&DBthpuZK1a0YjD<ItrL4s9Te|r@r^q{5nQE{ccAv6Er{V0Dlv8Z2y|t)B1(HZIpsJe"
-    "&0e&F*rQ>jf}Lr`!UW8$^`nWBTjw*os=T?!^ciM7!lSsn2BFdxxKHQnMZLM00DH$S-P8sX`&f+D)Zn%f"
-    "IUa({N|@Lq<&zEfaU3a~t2>2+OhjVGZDfxV5t>)Q*;@STtjHGTT7tK;w-q{$pSx|dUV9%8651as4v(DE"
-    "IhYwbsM*+4*Pg*a)X|zC>Bg=6iZeSjAquj3NV3*$L9?KN)-B|Des2k`-vqU+<rElX+ApD@TEviIQFZ)U"
-    "i00E{wOR_jb#`PO`}uC%-f}F@AGm8a*R>Fk>oKh6=jbykvKt#0!Z)B8H<9AtiAcbWM*uoQF{3*-FfB|z"
-    "0-MU4*;{B1tP`SwC4Aw;WNGI7HWP<<yu=rv{kwcebpwoGl{(i*Npw@t1J6+SCulTrj8EnckhA#hMR%WA"
-    "6*1$U1AmHxyG-V>3c3^pF3QHHD^fl$NJ1gE1fI0)Zo9lD`{9n{%Y$Z*#6OVTK(TxlzwC&$%+4}=O(+Ss"
-    "8^X7&r}?%Nl%!{hxUT_1#QwUYknCxUv}wb1tUq0Lt2*eS@m_@$Ie<bcc&HQZcjXZusfDOqldU$SZedBz"
-    "6%Pz`v}u-l?PT1<GdQTWkC4K4Wqs5@Pdu36LcIo;NfbbTrWCr%r)|L#kT<l4=I;V2v}8NfAhK+asuAP#"
-    "DNhZV)CC_U_wVy&Ihwg<N=mf(2=}Hn+dqhiqk@L*<weI9f9bjylbgTytCXyKP7Fr~y&7CY)+9Ct3=oBF"
-    "g`v&wGByP3B_b7Z>|szN#-_7>ZT$+12-Pvhq;aXtRFXB2=jWdbkXM`X9Pxsbp0B>bLm4SLm{y=3kSB4i"
-    "<hp`3&cGD9PM%GI2A75@{HIQ$HMRxT*OSDl@xiiu;{w6(i4}5<D&~%5GYt9aqw3Wow638ZX5$C{)!U@*"
-    "_6-(XtBf>V<7L1J9r2Qc6cy|g5UY3e41J{ZkMOR#g<+U2v|<EeN~daEfs^W2k{=Hb=PSyNlT=nt>>*K{"
-    "9;D2|I)RP{yA=uZN|G7G_%dpJUk*@FvwIGs?D78yD@>%Y$ia#cIr^;xA`u*@_1C;!jT-nfll_c0F<gvh"
-    "Ge5W;*r@rQOM7Gkfh+D#G%V0^98bAvSn9pr`puk8Z*pUj%t;2Zz=Y(vBXanpRprMsc7sVut%dT1bX)z~"
-    "wn*c|YddN%Og$J((Jy1dx-vM3x0>2>a5mRp@Y{ZLsTtei*|~K_p*svShROu<w*Im2kf&DG9xc_JdJ23`"
-    "bxX`>g(%lzoPiNR#wAB_?ehP948LdW_W<`YFC4N=%9;Ycv}!7d0{=;_+M5K2r=_ea{#-CY^NBHg`?OND"
-    "Ojg`)pLLU8Xy~c(xsE{Sv7LAt)~__(o$VmK{aI=6gCmj=GE?N``DpMjfKHi>gw+Mkn8+E@ZgPjlYOT{w"
-    "S6|p41y#-F=<CIJQZ;X1Q1E<q8Ypp;S2WHR)9+pNa#cNUwB>6aryjtOtqnR=eR~t<ui>Zg{CxxvmSU{X"
-    "1F02kEP+&)sZ}w2PU4v~P$bS`S7vUMq{H<o><<npAv2(ky}!P*^L~l8LiAsdDpeo=Lk_1F_5CNkB!?T$"
-    "6eeQ7oIHC-{~t2h82Gk^TzO|+&~>vSM$?2E_J)O$r&<}t$EKhBy+(?a`QF73nMnO`a((mcE2ivc<2abZ"
-    "R$1+rx<bwRZsS6SYh27c7o1ZhTlO|oU{N}H^hE)_<AFyP1U!HU>$(@nW(if5rJD=~XV3pB7yhC&&wEh<"
-    "^xtidzbZe!_t!&|dWlRv;-FpT^$E`Rlo_&{nPI<TOx+Yg!XmH$V{_SG7^J;?Ej?yGd7RD21vXLcsZJYZ"
-    "T2Blg<fk`Yky4L9f7K5>6Z!`$#ZRC>2>739X|!JZm7y%yTx7kv5vgWBQ&|NtuM8PSVGN@SF%_s=@vv=P"
-    "fI+ML^)w^e2LLrob~eN8IRL-_P;_t08w5$qmBkgKr*vQD9LQW0K}^{-ptlxXio3RLv4c&JBuPEK#G>c-"
-    "d*f;O<~ft=1H{Zj)Vjd~BrHZt&~1(vR^E{|291R1qAv4YNozR7*E%aa>cYU7zO9&3kJ^(2na5jDU#oM-"
-    "ZV25=$MSOb-=Yh4<smMXDZ&G@4LGTR8d2`zHolRqM8VRwx(%NVl%Pew?8G=zIPY~~{pSQ2ZIrp$g}_tY"
-    "bg`J=b<}#`@6+>cTQ=ro$V4Dt8I*x|@U&5WKArhA4ZZfH%=fifvJso?z-X$;Zczji;0Q3URWqw~Ke#3y"
-    "<)9Tp8FpZ4JAwy+hSApWf!skiJgeNNOCp0IG8GW4>)Q3%Bm7I=^^Y-O9Z4bB7_IfKn7b$90}Io~@(;;T"
-    ")2Vx#VObKF`9^qeqGE)MJE5L8%3TYN#%3tSV-f54vy)NI)mYta8@)b-<;`pdGlU}<K+=;{<h{)JUF>d{"
-    "s#U*!MZ)C9V(oFbTyx?mKKvktJ7>~EKSkle2cWFH`r5wv)I;Ghxg<wKDyJ?mJdm5qBBiN0Lt1yAN3C*K"
-    "bJfB)7OI(elz8#xZU|X~7upmi4dW{I=7(^*RTOYs&UdVMB0ct11!lR_6*W;#emP)Ev1$;J_o@u5H_()X"
-    "1gf^i41T0R`_Y^=;D-p!N}KJ2Hl8#L4?R&b%PTCp0CTmwm#yD?=(hufBXJ2$#BIw;-kgKgOFleKcdNiv"
-    "4v(1-2=)MbF>{O%_gx>{%N8Pq%8#8AiDWvhyZ@!qU2C^d+TueJ=#!st)2Fz8PSLx(xsc#EVx#Q%E{M}z"
-    "didKG{3KTe&;OuQ<Q!BGgu!cm3!d<W9T;iB*AqCb$7c)SaPLblw7Ne)dW8dm;anv%>Y}9EH83_-sV2N|"
-    "PXC!^HOJO?7<g<i^e>xliJqFFC07gjEa66P`ayQ1Fv=gS4kv|d#rjgwi7Diu%Z_Glfuuyd)*_;F(<~uX"
-    "$5&!+gOdLovvmTQNr{8}Dj`e)(p1v~%pY9qj1`VF#K*8DW_Zm7-9Vf9X9^(RR)*+%GAs{Q<+*>*2^&&9"
-    "x4%HOS$wt>oisV;@EWT$C7v-jGSues*WmoS0WAs(?|dX&z-xSyFsktQ$;Z<uY(g*x028>pB^xFq1p~F%"
-    "?pKN(p7@wPw!P;Nb~at5KJ1BofVw{206Nv01JMiU?+kMdAmA5XMgh8B<=JKhtdQW1&lr(1sXQaYFop0I"
-    "LKmRCg?64XXXK`OWHb?>OAea?v_I_7TI_*Yz@CQm(g~d&@dZ(2jcbDgz#)3O$9UAZT^bHA=3S=W%zw1Z"
-    "b!2a`tndr76bRj4g6j{ZjM=ff#VNh3tiQ6GEW>2ldx4Fkb*-ds6yT^IGA_KmYOU^pDyAuK3n8)Qb9Ibm"
-    "Ds`Z>0DT}CGp~>ht;wY)k=}y-dWAq3#G)%C9;+I632W`xY-o~uZS7y(0-gK(_*ll`7Y1SPWW^hYL?wqb"
-    "_zbQ<)ispTw)f7J0gM^9#@Zh%9MFMgL$f-phA>+I#z75!Qk9=9t)_NR`+MTK+pL#RhN7uVc?A}n^*f85"
-    "(>iKY`CGkkZrA^%FGNju*Tx@7%7fJ-6&#~3j}x=fuSx4IoxFFCDQ2wgIJ5W4pe#9)n>Pq%+*F77py#ef"
-    ")_)o6|0+I_8gU)AofRsqOdYD>w{}hm;GH}Ht#5?P&Bp3?>q~yt;7&}VA`YuHu4x5Inp8RlpiX6R)>aN&"
-    "X=}AK1Fm57fVu9xX1p;D3^q<OCRXgB2&Z^Ee~NO-z~i@aOm5VGK1;#{G5)!aYD3qe7EXVWxJF*7!Vnun"
-    "5yvQ;cc7$`{A<~7yjJp!fm)-y;JqM5&!R~3^!&d0p@k8SIM-Skw@n>W%)r*Xj@L9PG;tNGD}<Ff$QpiK"
-    "RenDbet`Z-0`fed2$CN$8D~Li4ZA8d%)zf`MFfiRRV>e^@@H!V&j0c5He4Kp)H2l9EhE$RJZlY%OjKo}"
-    "P1Ukn`k^>j?W@44xoWW@<{JhO3KS-s#U<hjPkhTjuYxen_iG&}-8|5Bk^?k8L}O1Jm7@}p)6JC%{zZP*"
-    "aCkwhS<<f>F54Etscoz&P=L~B#A=bB2hA1%*^rg!b7gtYNUN^Hj^ml!hUr8*e=-oCa9vJHFFk&_)t1gm"
-    "=s>`kAP*xyyvbKS7Pk;)hqT_&YYp_KsW#y866kq0EF_etMJ~GTSum_oe-6OS(RWNA^t=EVS7$dNeH`O{"
-    "_#)@9%i5zgF;=iOV{}@fX4Zx#MbD8A^7o<!&u<J^BbtaP1fY}$MZ4PGs4UNvkiDQ-aJ)z4ox7WN!~zO{"
-    "ay|y6j!7Yupw3m8;S*O1{9=+^hMG*5fO-jGrO1iyA9Oh=B%^gM`KLFncoSr?#ALi#Ta8;I_q$}yuWaME"
-    "5ry-@4Q6y|Ap+%}Y!TmCfc_h47{X)Ojk+pZ_{}}5646oZ$^*5mP5n!aq3~yH?pKCtRuvrqh_k8N40pdR"
-    "ihLf?%dOJ>ZoWbdfH=+MBwdw8rM_`9V7v-g5C25qyVVqGA@J-U7fnZ1gKo4&Q2LyaiSF6Lvl>&H9nmkT"
-    "YmCx4GJXcJmTD%3IUOdXen!>Ki2-+pK|0@s{NO^MifS!00$xP0Eqs5j#F|Pq?E@t7jLmP?{uw3u10ExS"
-    "<FBouM@54APr&q=>{Mj2!?Tf-mmI^wtua?+Om%B-T&AcDwT9Zpoh-X`fn9>zO>CJ?-o{Fah++CMFj|J<"
-    "y(_cFmFpcM8HtimnJ{JtNZ}2Pmpu{mlt=%1p`u%CjpUfr<+R>Yyqw{d_{R)FIuDLPhiCEv?u`NuP2W7^"
-    "Yw4~m)8bFxfi=I}sCnI84#DCIM1-B6Mg%5!y>&DIt6flHpHsHr#}8v^kd{0qOLxqQO$$1g7d~j}U8(tQ"
-    "+f*;1FBtDXN|cwZ+$AHLQ|4s8{@kIPGJn#1j^GC`?D%Ec#nRfSsFym{A8l=AgL2_iWWPiyLc|oIjgjb;"
-    "HVI4tS;;C?)K;M=K|T#u>#p-p>fyYEe>ol4m1+LX5&sc4(N?w6pL?Td14uuQrze<3mC7BBHnp*sJtgy?"
-    "r}3S&*WsHJv*)|0AbJ*i>fH!0A=dcL(|w&-^j$cjP(Z2ZghR)+c~3AKzG|5*$MXvR2i7M*;=YIEV>Gjp"
-    "4LQr^9Hg+f&0QMqTM8G1HDD!Z1KJ<gRB`e()7nY&EF^w1O=v`O0}0lz<DnqiGcGm-*e<<WproF5>vw8q"
-    "2ddNOVc)Zclo*tV6OU=ParW^n$ExNgEZpGx#=d2KEK`)_D07jvjW!!09oL)q0yy7iB@RP3N*?zC29A3E"
-    "BCI1C(HO9LXJ_|pcA%T4ZhN;CU_;8*I}ZwpPYb+=6E^{_m@TQqo3!#l#!)TZ(&Ozq)ZK%~o@{0k1eLe&"
-    "q&|?a8~MJHmE<QTaG{-wv)j9{Bw#~{z^%=tuyIwh1ZCj>8WF<jU^hRU2W)qxTo}2L;vV^8)PB@%=f0K_"
-    ">t|omGCE`}c@4q9tg(V(nSk=Q#k%N{zEQ--d^RoEU$}#B%{1;@#y}a9Se0>ovjvd*Nr7Qc_d=Nqp+J$q"
-    "n?Wut-oGVUgxmrVh(Z!*?C5gbfQpZ33K4zeFq#WEPNh=5;%42erR8Ae+T5>D-52n|o};KRE!0y4$o!#M"
-    "Sk+ujtE4a(phW!ODB7Q^NWr~Z@~}Qs7bR4>b3+xqZ7<+D?w1pyL7+lj;;$3#*IQDUC6HGNf$DP-lRFRd"
-    "iqv9DhTB%BF#Nu^f3Vsf)7<YS#^uu^^!>$tr`oUhVd>79U@@{pddR3&6HmTIM?h4TBrrUwWC81KrWO61"
-    "5e0i|vO~W?<PPt<pa1q-d11pxr?+qb6>{;f(v)KykpUaaWUHYy`5o2mYZ~nakKM`=A=YjCXkb_O?JcDU"
-    "mM+=P?LLB1_AAH$Qk;AXQpgxB<6yVa(&$qcYu>d;>bb-ri&XHXQDdm|<q`HWCMdEbuIzcbU>xj!Lq|im"
-    "O9mF1BVZ4QmpjBUqyLJEoa3W88%Z~}iOGwTh|ZD{lhoq<5g3pw?^fd&cHyBraMG)J845QikTboEMBXrv"
-    "tDI0<PUk&1`mOSpinCJLMf#_ACe_!`x5xB-oGT%!aAi9<+_z3ChG49Ruo1|*I7h()-7=qHlw5EWlfws{"
-    "1$cqv{;H|%;Rp41{zRKzx5H>|(6!#G8)_2lTq2BiObiDSx}#P@lY|=LmK%S%4Etc=0KFcxE(wGs3k2N="
-    "C)Ye^lFq~iU^Jjmja3BMuk+W|>BBDlHD<)pxsQ^!J=w2^w>e>0bcTDRx{gsXXm%)2G<;ck143<XH~^p%"
-    "SyyG>2u-YKoDdu#^iS`JSI9I$K@(xV#`LoIA*nUN!u8kj$87B=vKeNgmKM9_)R@8t5~*|L>YQS+Qi+_A"
-    "aL0uZqi~H=0aj#^ly$>^j0dz?iK<w2_jFTp$Mr|o!a`PTQ_{L}ANpYs{w0LBoYWa2OQr;nePUg_8^7X="
-    "qFN>w?4BM!>BI(ejUs<F9b|ajSFn*;$!yNRD;~nqJ$%<$!9HQ-g><Pd-hK_cfCFx5eL)*X#2<2Yaz!Md"
-    "<el5^Yx{QmoQbuT(&UAlJY`H^f;<8lkqeJW%5oy9zp{W&!d%B|@SaiSM8njhdt{p>sORhJnXD<Q6N%5o"
-    "dAG3IDT+-g;(^q}ogM4=9aG8LF-sM^H9HByT5>oD%@gXcKz*%j#2satuaP<<tcxKA8x~ti*;?7x^>ZV7"
-    "i+dUaeiEUJSpVTx0irfaO6=`}d<Yqyn77J_H5Ww_Ve^Ar!J*lxIKo{az6{~r!atQlv21&D!kZDz93Imy"
-    "an^hVv81KAJmF)~UCqneAc_p=csi1f=wEg=ZkS&JC~UBrTowu_r%x#wVb?RN*}um#7K2Gjxq_XTP6WWU"
-    "9<oYrrUa?k8Ep(xSS?A^G~#WG7t&gYlhhIF?HqXjZ2o|vQV-qCt*SQ!{y3f8GPkW(<k^RPJllZE=<zO!"
-    "I}X=!`7?nM49}6!L`UuQ^X8D&MIvHBikTvS(D6S}C^^{Gb@PM1L|2Ob<i48_VxG-PpSHIhu90?Si+OyS"
-    "G2_6Wj1=eyT^rT&AtkH%lXqVA-%Ef&{~~_L)1lnLb$G!1i8!C)2}cpg=1!tbl|EVsY}ma6@|$xKS5Vd2"
-    "V2_)^2H*}{&fVb?-cnwQ%aB1yuFv}R(gAxBG>n%gf0rPSBrm5Jv%M~v20t*(S#b;xAoAlq`{qS-m8(Eu"
-    "pvw8RckllwhKZc6M4%Op7t?WcYP}V-Dv2>$qxSlZQp=>3?gv0MMF0#CrV@SP?88<2l8I_kqUtni+~Y0I"
-    "l~cKmwUHnAh|cyJ=LQswY7P1`E+%^>4Nl|>J5-nRT5UUiIeQu)_Ah^&*{kR=@%gFCZ;hr;236vaJZCw6"
-    "nRzReMxWGiKGI?8PO7J^L3nmASXA{u*RZwK<U5>pZT1SKGv}3GXJizO1m&FjRskX&d~cSFBd(LMyJyaI"
-    "E=>;Xk&9#lYj7<%D12=BeSMnU{=+4Dj2OhZs?l2#L>Nm3CE){teHvX{?YrF4kN6h)O%-e9dU}H~Udnz6"
-    "mEWDTv;|v=ry&4|WE$-hJfvNlfc#l7f)Lt=9xa>0$MEM?nIm+zpfs~bAC3yb5-)MMQd>l|Mk-!p*GMXV"
-    "Hh__|0{U!#K*RJ>*XKf8>TyqETqKRXe7XSf+e!<7S7(l27Bza|na;T_?cA^wa}bGW_2l|<WRTEs=DL#<"
-    "cFHkj{r7R%IbbP!^_;)6#fr<~A;W7RY;8e>79Z{x3e8dGF=V`VpO*pwDN$ID-BMuxnc5nH7B)DhIyW*}"
-    "{U@iGJc>&15T7f3O26puoDk)c6c$?-R2Ce{iA&oS*mqg<Y4g7r))>!4gUDb!S!&i9Nfiihy()3oiN<5@"
-    "BKl3=P>zrhp2dfOu}e2#TjcfU@juW+!pOd1$0PS6jAQ2hdRmyjgJemI<cGn#@Rjc~pGSv~yG5kVyEey4"
-    "LW4{3jfTN-8qD!}!V-Yrq2;YQoJU#)0#h^5fn3P>6-v;IUKgKX3T?ZQ@Q{oirUr*y6eY~79@6I;Odd2p"
-    "(kNi6?4v+ph-eo7HR$or&k22xBf2K^f9NxG&&?qYMf0w1QuJ$+^xqI+U_}xAirF;;xsT~&O<yS%mfA|i"
-    "2fatl!gMIzfP(BP!qkGLlkDp2k6v7&?|uGGaktXx$Cr5+GqU6Wka9eZkW(#RtonQxrI}dnhz%@a?u!5$"
-    "pFY1R1x>>in3)FYV>3D?>0e$Z1z1g>>=5L6;rcO9!b(9BjF>t$IP{y%Ch#?{k2CCbBtm9{LZ*a$v?*>N"
-    "jECjj?WPJa53Hj?M~jAC&3=UBxSW|13s<;GW@8CHdmDn*(LVRE_Q+6P2>jO2>>4>fh?aF_j~64sy%ji0"
-    "A{7j|my<X3*>>}z%4?O*PwE3?sZA;dOi>>g3@~KTQ?~Sf)EUDOP!yipRC}GjREf$UO(5;A%^7W&2-J_4"
-    "5`i#V*M=HJ#}(W?Fs(XWIJrSo%8meUtF=iVTLws&cLtE!vCvqX8o6dfS7<NDP9ywfFz2kfRt#1=2mwWp"
-    "#dy5rE0EtDw{JlngtuAvvYli9BM|SB{T{qF>swq;vE$8wS4Uirfu8kM-n>@JDmM>lscpVI@oq6OWxZ^Y"
-    "-+bSuQOK$jWO&y|1!2QaSx}?R2T~e!)EQ8}@o5qRRY1)Rbr_22>*6$0d&?oW;FTC(C+`xap+HwN^4*(="
-    "_jLRquJhTHzej>D;)sR!%Sf`dzDlQbO!fXu;8NdnU80VZQ9fBMVHKB3!J2{`l=rff6k~{ZS{{JdDpH`W"
-    "T^y3QU}MI>G>{vgs@<&wl?pWDG<D0z^b{k#EviaHrX&O?Cr!MhNflh2z~_nSrxOi1Z8g_2>Qhm7*&mE5"
-    "ipS>ie1n5dw?5`W5T0?ulcQfVGVsOlGfdeA7y@#PLRJZwa03Z2_lD!#=bR(}jFI#Z;GVoHwzO%B=V@y3"
-    "@}6*WfkE&Rt$v?3M4yTV&PB1gyT&@yZu1KCHf6K;?SE*T{!t|8j-*TSp_<2oRPXw!dL$ZVZk`#Lv7qr+"
-    "5B`DGl!>1Rm`IC^sEYy!33Nl_3)2Vp;6_CZ2~g>P?^p83C4CNd$Z}Zl2fru+ph=e9?WvxSQ<E35HyI46"
-    "FVjk%Awt`O4=~P1+LtEm#B{>RK4Ewa{6i`yS+dg7pvr-U-EqpDYA^AfN3m*7N?QXH@g~^9O?ebrK{n`y"
-    "wFlm{u%K@SJ@UXcip>QeKD<vnVi!NCxW&9m*24!f8%_EUW&M;PkSGV}h8~}rlnwXlk9+Fx{47+s5XG(v"
-    "VFozL#kn+gSLT;N`3o0RATB?qC4A7!5}|gA-HFeA@}7wld2N<vxayPYTVkZ#Uze}l(8kKVOP2(3Kj^_d"
-    "L3=Qr|H?g>i+w%?QIT~VjEK=+MtvCuL17*|p^=qX11M4TA<3JL6v4`OW!Vck2OHY{4#D15<N55s^Prb3"
-    "BYmN0KBdiHr2w0(jtSnR=PnGgf12Ny6~-OBSokw&4rR@zF<GpY3q^a!4!N+IwhbGHo26Lip_D8*qfXgS"
-    "Xm(wTv4071%8@3*W6aq~Gl9T?Hw;yD`DP7r8MqEIFFl}2l%@EDH2z9J5wYL$1!lH1@}%>xNI;qMY*43w"
-    "arhkx6z0xxirBQ%<3+Kziwkd{Uxn>^@>EASdB7BhVhnjuCNLd9O3R4@D^OqqVSXKU5lv{1rAV~BSeYkz"
-    "tl!pDaJpO>C=Tu#t=aFTr*eyErX!&Z{acVlaCuDP7)a1my@!C3T~ab(t^pn(1|j;R1tFhaMo^zfsD;`k"
-    "45;Qe(6>+<>^}Je^eCGZnk$S(OG40*ExgC`A<BwxVF;;oaaWPIh<Y*-0ot78lp2(I)OKbl&%qq>rb7w2"
-    "hxo>AkL*XA3hmvW1>}wgu|GgXR=8oPPc4cUONr=wTI6U=)CXAVDecWFRp)6bJ$SO~eC}#WNs`jfvu6^%"
-    "wHZF4<xSZ)w4>uznqp;v+r+nx(uoz~P?&_9*=cjA8Z1h5P0N$>x!kCoVZP!Ku};%3ztV2((bWczOq^J+"
-    "wU950JSW0Vj!D(wdU3?*f40b1p(JdM6)K6O(8*c#9YogcsCj=nTcU!M7%~(|1#sJ=U6TupS1h0yWW5fV"
-    "V{3pH`d3t!s|`78EVUsDSN)p2KAIA>8`O}xCP)gx{}){ho@vg2$m}`y?Teu8djE&kHHVOB*^-1hKbzj7"
-    "i4W>Y7|^p)rIM03>$VaiQI?W)IKHx?3nHIv3gcR-BsezOMww{%OQ<KXq?a<HMo3hq$^!A?G3<LXRMegr"
-    "^L%k&o<&ErA!a9in$A6>YldZNK3|fsmK%?&Y&i9V<n&Y;zK6tfrv<>v3Y}Hr?IV32wVg^?2jh52X;B%C"
-    "WG>NMU-$vtg#gI1NG4tW^cjT=jJ`7j4Rf}Vh`F7cRJ;UV>yk@%>VDD_Yo;@R)$iT>zuacgziK^lO9UzJ"
-    "CN52zY;)BKNEl&Fz;!B&*J9W(F+v3d-)VO~5&^S;&UJZ|$06(fq9cp+;UiKwk-6|^$B27xkkelll6V!V"
-    "Cy*@^*CpN!@_Y;nAx$M-LF}%V^?8|}hmEGl5!EUC!q&nR8r=Df%fmVONpZ_7@}9tZOr7q$N_e8cZK;5z"
-    "!$R>m1fbTfF;ZP&g9`!&aJfq?W<l>XaYg%j++Y<iF?teYMj=Uu`}pY_Oc}egGk;zY3N1~L4BT!V#=8@)"
-    "cgo8dZS0EU(<&Q04;;$q&_B$d6I|F2;jO08cM26jig-w~npxz_@xLL0;MgB?HOM2-Q%Q&W{qX|&-vQ&S"
-    "?wwI$vlW?N)S4#=EKL8qK^jD3<l<}60I9GP*Wr?G-g&Ls5uJl{gB8!gI)5H&kB4tdMv#mY=S)uz5D#vb"
-    "Kzj_>7OIIv6K`71Ly8an?h+V}#&KdG&|;3P^i1>&3-CXi6N3VcIh#PJqY}MB-pC-=eoHQ;6_mGUE|>O@"
-    "Nj12}J<^=a?&c~yw)@{I$-G0HwEwml(>2)1U90{?ajx{&-6g2cUjp!>?e!=w((eeT*Acv}+kN7{x0FlE"
-    "xRn4bup29yg*b2_j!F#ia|wHTEm>y>BqZEJEnD3`Rep9$=}yQTh{kUD33kHsf}n^H1CAY3R%Em11az@E"
-    "FZq?B)4ol<Xn!qiPr9{XzzC|`xQD4&%k)-WvYHH><U<*FzCe!VkruQQD;iCBBFPu#asDT0`<$_<({a0&"
-    "@-30W9daU9jN=lHK)Q-7>(YHurIe1`sx+30(;F*n9rzLEH6<wm=%NaTaH9f()H;;6Evsgj_r8$TuDO2L"
-    "J4vLxOvD-ikU#8<6?ch*tg?+{%i;RwOt*XZvr89i7`m(-d7+NwofUNR5qYU|lb=ooL97nb4O3d{fQ=7p"
-    "T^+xDzLlN&u%}X}HQ1MPK5aM<Lg7?ArXL%S_`Cf?xY#>M!+E|O0=T(onY;q+sP2)qopJF}i)~(uk`1ZV"
-    "VX=KZe#5A@1<x^bgWbRa9C!pO%4Z*I5VuuRk(Gs9PM>s8)OyHoL&5ygj&f@SxoDp3Mh6`kPO_ph@2m*<"
-    "JmNwohxT>QbWyZ0PAy*3m>$JRHsIimVLTK{%*s53l==23U@=SJiYSqj*LBCYfOLTZtXbG*rx={7oD|)J"
-    "Fb;442*%cQLYA9r!FK^qyWhR{hEH3tMZMLHiwM+&)koC;aE?_VxvQ`UEH6KNi3o$i^hm~<{?d&Cv|Run"
-    "fe6=!C#@n{ShxBbT%h8W)4n(L^=Rr7CgGy;n8s4;jUxX4N%N%tG>f7>J`$8bJYF;EwvPmju}Rw2OA|4y"
-    "XE2tH2rwONO3Mka5FUjbVYT4^YR_WMvxJb{wzz%8xaf%9R8Ojy$#QnHckI4q)z~h!K5wf$l6a|QcGx{H"
-    "?09w5HYmCDCz=g#dk_~%K>Yi8q&W!r>6aMcipAq@;GkILq<NXe7{lMt#St$;rzDY|5LvoqUdV9UcIJDH"
-    "W``{C+;<2^kG~hqPE;O6sef*T`jA&_<jpktlCun>uJugLbT?~p$~4`agFV%M5!eB=4D$h;2gMqG(P3Sk"
-    "s>K#^tmm8JU*KX+vBoF`-f=*~9Nw@x3YR}IADhYd@k=*+{N!|B4O&FyH|11g7vVdm(sc>K?KE>O^whUW"
-    "V1cKb$GFH+P%^a9-pZrl+#@Pi#3n6w^uJZMCDV_MAZ6}hKnGS*uDV)>?sX>uUo=tg4L^HSw^rS8%pf)o"
-    "Sc)gF*3&!3BKWr(GU%Iqzey;75d|@+6`fk$6J7ZL!&7k%7ky}442>=PFBIn%T6<GbsY!!O_9@<|K{GO@"
-    "^I1d*KexUEm`$iDOn<ep(r+RE8pn?3TMoWMQpJ^c9td@2gw`UP%AfPtQA?UXl9s$?^oklTS`D_?fn3OX"
-    "SZFkg9-nhfFmBk1Q{yy+8!#$S))ds0!`?Xi9(==Hylc;?Hw{&!gR=BD#by~EoiG=mW*7Oyy#IcwtL192"
-    "!DS<$V=ncg6D5D73wK5)0lR5G3;J;^f+c7YX%@>+7Ui~T9}_e<PjL;A4<bSH62(;zGC;IzD@9$y$peDU"
-    "fps{3A76$0*%H4ftZi*7*cTfL6Ko`>dndBL^>#31a?i@HZS$2%Z01WSr{anl7<lk$VLGRcBeUEg!AOR("
-    "5V!M}9CVW^D%P$AIg+^;fKU%9-)~^(=Bo-t0dSWQBcV`+XG)h(T6ElBUn57cjW)o;mO?)rLil?!@P|&B"
-    "Gn(XvFsqf1=O`TDl+S3D(47d*hPIPH71*K9(raIve|;?czPi5R!1k@es{JwzrDq7<g+^D0f3YRBgI*X*"
-    "E+>puGo~h`gA4mGh^ohx(*v`+TP3aj+?Onr(Qq0X-Mg$z_xbyll*>5`JGo4m{DQk#8;5oqweF_<s7E7k"
-    "JG{}2=X-utFjbRy$f5t{^sq@254xCziID2yV>M2cGYG(J9*8?L1Fo{NUT(@bBsq<~8g19_qQXTd@4awF"
-    "=v90e-RAyxw@4WtaPGOp3BBG=aZ@lSx+6~%$vT{Ya*pXC7W8uX<^;I7`D5;^K#8e%Z*s(5>T)W=bLX&="
-    "%c{vC@%s!LaJqD~6TX)J%pU_LZ>EF|88GU2Up&4qgXrGp+O^bV*Yg5A0!AA#hT)5gw%`p}j%Hh1&UsBg"
-    "*xDbqb@abXzn(aqGSw-@$Zf2<G%w$3Yr*uf{0AiYmvk8)>pjdLr28zXsWt=n4gc!+th&hrSQ#djjmNnD"
-    "46fPu0QTVd?13(mGDRk!6?$BG2-OX!>y$tTHSU>bt{O5ZYkp&E0i%2kBnq2>cg7P3!M|KktuR?^Y9Le{"
-    ";A@@Vffn{w4kqkIj<ZHP8(?j?0in<9M~?~*%`aygxtt#x0gQOuaDI}6)kjTT&D7f)H&uQtOG?yjkM^7$"
-    "zvpto_lEQRE4#<Dd2s3~f7h&lDz@Wil24FJCM)zTfP4J&@UCRjX)t<4npG5_)BO+mhpu(`f*JH=2G3X;"
-    "J-TGcnkyiVgI~g`7#xXka`8%loRn;-e($f<)DMShPfTtRGo`NA*tB9}gHp}cqA5*IK0y;N&v#`)x799p"
-    "k7e~<M-L$uN<q=0f@cW2n0{hk6G0862aw`fT;4!0z&@+$j^R5tJ$vbQ7j22~I9kzO&Y;5bMgO9x8LDp3"
-    "4aMD^&2ma*WXkEg61YT)yjb5Lz-(Z1l(yG016BIlJmy@`-HKB3na=6$GT2su!XMGTD7<j&Y6RH%$piis"
-    "FH;Zm`gF{V*)6q3&%0|@oRm{I0s7VjEUoG$rc(1G(IQC=KR6bK<)Ov}<DmQnz;E5ZRY{Dfv-)W(r}?$_"
-    "mJEirVC{@;WGy*Ca(1f_B3K;fuz|BY!@xI}?+=e{1EFP<u%K>Y(Y_kOU~MQen1U~o3&N1DO4z|@a>J(E"
-    "xy{(2P`Zlb-Mw_Oys@&6O73!BL!;m5g<vqeJ`<)gfZ<i2lq7npuIolK!ugix<gyBQb$eF6=ke}r!;W-)"
-    "QW{80w-?$Ak>Nb5p~E9Q3~lw_&asYdV0mOOR+=eR0;)A@u?4*pBl#B61YjZb<TUyi0PzZ-tm*keEgxJ0"
-    "DkQntpL9+3AT;qX3nq;_mYpZhaxyNhj4!;p>aP}0MTtqHp(8TgHOKN_q|gxYqPh;Z5G_an+9dLz3T(sO"
-    "7AIX@0}3lEZE-ZboF51|PG`BSym_0z^J73z&*jE9IT4(`p;k-v1C&>jaFjQJa7>%w2e4a<4vfi3ErjFV"
-    "jk8y2wD`L90ZKp6GYhc}$Z;1CIAmM3GR5ZRRX(C5Sho9-mwCP%f?0%jSF-@wd!x+Q2b_-#cp93_&MXmK"
-    "tcuc9fiwG5d<8Nn=}n$laNSV+sYe>6yPG6@@FW37`!xAJs6xe^`mn&<MO9oib8e`5G`xnf_;0}-QaybR"
-    "rcwPwI6T~)2qwwPTKR0n%EabnB9-<B5p&7V<B=K#OZ<D9p_;#o-;)^_r5pDqtqwC+Jm1um(}Lq5-iv#r"
-    ">9GV}%LxZYfUb4FJmFXF?Tyf`W8p`--NzNzCa_cg%28Z~Qg&yMO$ASz|MoYe;{WRCq^ijPSlVS^5-gYJ"
-    "N>|h9>~FpPOLm~sSDr#FqYH=06;B==!vKS^_P`H;*bL}FjSTfzpiDlH?n;@p4cJuU0{XN^<Z)I&kt_oc"
-    "o#`Zq%IcXALu5P5i#Jyd2-9k{=57s?EsYg6=35*a91g^aTVHSz|5(ahta15W7sE4+dBQ~BmfAX-eo$Lh"
-    "9{$|I_<Hp?jNwA@mDx+H;*i{oDEQQjb1RZlx!)IRQ^PL4ofx;_hrXX&@~Al>QBsD;Z8gXRdMJj1bLD(i"
-    "C`BcL_MTa$f~;(<%R(`K0-x-<i)ofZ0<A5P3J*;1R~Pn}_fN*b{0sfi<X%=+oB&d<aszs^qv&U^Q*HH_"
-    "DX#6Q*gG$dLf=c9#QmBbfyE$-XFA~AslC~Z_Ns{zR%nNgEy#U31QG0Mkp$hn5do`GP_fod*cjnsw5C{l"
-    "RG_ps*lTzlg7s-`p+G^39&$zUkWBILIwkoLjC4<wO9x8g45lWrj3>>*P@8b^h|)?P_}Q{3=gUxH_6dN_"
-    "ddlL3G{-{z)9hj@Qw6(zC7JjRb)iu^5H5wW7~LtM;@j0;drO_u(W-hU4Vi%KSs^ka-GEX$(_il^N7CpB"
-    "MiB1{#~R(#uucq;z6CrUczjmaQ?~92>d0S%5%e!s4gym-%*~L!dCx`qM|sIPuI%3PM<Qqo^-?*kx}i$T"
-    "FC_&yaE>5ZI>g!+)|VZ47TrO^M9^Kk($Z+Qb`<6LpRz<v!E7RV0;FuIJgrC+vEqgnV$i^Y*s9qWI&}ba"
-    "MmQVSXq(gEXxA*>2>LYtuE+|_2eK*^^%H5dNw=mqS?{;f;oJnOfb~e#!gwR07Ok1KH?JsEK>Ls{<&+TE"
-    "wp8V%?M^m$F%(-<5mZA<0>H+n*7jn|U_dhNeKlD?5|tFu#$kSmlcHErruMxy6KY~#IM96<(#$ViGG@>;"
-    ")7liYg4Mak<QYzZ!*L4ur8L#dWCF`365bHD`#+m-Jb1r`;41@^GegB6^{HtLBi?3%N67TJXbl|4*`e;r"
-    "P=DR0Ffn;d<#E^gL9#R-WBf*mn~%C=#6o*~NnmE?+^E^z{CkcUygTPQO8zJ%id>p7AQGDIbS%vuf4?kV"
-    "FWb2A<&0+{Myg=wgjoVa$v$BEy;&O4ZnB@|TD`U}1f^z)&h~B2We3SGZZW)FcJl=aA>-T+W_jI*lcnL`"
-    "ETc1V?2CJHGejK}5d0SDCO7vEZ(!)}7^xQAIHdhIK?u6#M+MK4p7fxhIgsEX`v0L|NIXL|ghhykK!Wln"
-    "bAS3{(gvYJRzOpAeIr6x_#bl-Voaly1nVFTD7`1N7`B|<#(C2YvUt)ZBb>byAPRDvO>EsDgw6!3P_hG6"
-    "KHQWV)0$pQcqcuE(x35~O^;~Y{O3cU+X-5zCXh?;CZYc`QI?8D$%iovLMj+L#2KSLcUi2xG&E^CeBg3~"
-    "Qq=xkpD%?}NuWxyY#5R~mc5t)aD<6wD`?x9C$SOtv5kDhm<#*92d9x$7`1x*CtDIH=I?xby7Nt8jqiL&"
-    "I<%DHT4AL75nZ)Q4j|pnJ17zDW+WMaH=d?y0SV|e5m6i5s-4~R9Co=C;mz28!d*GG<=au_d83cWq<MqY"
-    "q~&&|JRWcJ2K$RYIo&n0BM|fS+<vbQ7DiZ<EyQVzq~vvn#agM(j0}14Zf`mx<lX#{xSoYUOJJ&5$i%#F"
-    "o<hUM6YnKu)9S6TKpN0SDu&RI5ppHczV+^%nSlDB`?zP^%Z{lRRSK0?ndsltuAerhy<hZ;yPJupFwurg"
-    "JC2fHH0%Rc<{A`bT;OucBj;*{H@J#gZ#F7|Nz&;8JCP&A`!ACS{s<J{(L>o^wQ_B!FJPG?j$Un?sjd?t"
-    "a)VQZaHbatcrWQaTA~nOrGQ80Vf7+RrwnZYqjcAH=l(i3=d+L7tTBD?OSU6V7T?|d-F(`mFtjm`>1iH;"
-    "5S<=!05_`Fc@Cf3#&8HiHhY1fbeL!~L6xhX>jz+{68J>id6A^OJ4Y&P^PO0Mmc-o-86!vRmM(bI8@M9i"
-    "CM?SOd@}galwH_Tj(^<++l(tJ(Rav;#BWbA4u}<y>AH3FNWwQ|$4!hAs#*>1zUeFKu&DZLcJ)@QCtdy9"
-    "_bj($W~%5&y^H01{9e+$HL6lM-Idbe_p+#IkPdI`B<g$8m`_NR*zSI(x>{g0omlAk0=1MP!<Ijza8QA`"
-    "$Sn(PF)1LPedU}8T4M{A6~1fKu|N)vH>Sea&NDu)p9eqBk7daG=;q`rJysFSG}}8|To?PsZ*Jl7EUuQH"
-    "k_>=_G6q`lYs~f9=tg|B@j!jbwNL0=i`cbSMK!h^c5aEz3a-`+({jj}=-IH~E6g-LBjYSKqg%|fzuT`#"
-    "{5X00KTHCkAVS&iV~-DQ?d(ijFT%o(Bf^)X0&s@Wl>aqSFMpal+f`cA3;N!v*~vJmG=f5BN}%OkJ~nDm"
-    "O*d2{7kGF^R++AQv*|!oUC1FpU?Kv;x<HPStWQ?IicKDO9bOrLB3sK_Bw|GmTMuuki@i$9spCrb0W{;J"
-    ">YdZ#vL${8DdZozFwL&WnTLTWtnlg>8%~SzmZ+ssIHIqwIAbo#n{MCty<$2Z+(ni_0aLRAKIvDLK6k$^"
-    "!1l&orEqKaLoT3-JqU7$0%O4pT6hlPux-oCFB0ofZO?_X$t*h2l3OirkO^|;v{oDxskaU)^D;qAAmseO"
-    "CT1B49<|5AA4<@m8ViY1^Y&3-80vp|4+mF{cu`6XJaM|*ptVIbb!GWB&osa7ZBlnEJ7HN3y!Ot3Y}YQg"
-    "ALIYTS=k74BYot+w3tIPfl?lH8mDFNn;Q#QY_`NDn_4X7wmf9{Z#_W8i9k}K-9m-YNjubZ`^|z#9On2w"
-    "_HxsQZR73WR-<{xp}_xDE+iKV=a)7gyL-D8U2qZ5KAxb3E!BSDPHlu&%wYB*9r^Y!x%1?<G<D(}uV47K"
-    "jIa~cs|M_>W=(B-zpJ@I!`DL}ei?)upuN9D@X)V2(s=HM6L^kE#FRVNFZ$-~kvd(3dKgoDUbRpcEV})_"
-    "eSxUpemNQ%ud{^BTFGq!BmB}BfaEOb?4FesMYvmqFc82AZFCjm0F)jJ<ttzT1UmvCx$)7us&&~4FCCc}"
-    "?_F~nt)=t5Fm7;lUU70%6;@7)5zICz>a(YAbw_2k!qANr!a3yBzIYEe<+Nrw{79Bv6RR^+j@Eztl*|Q_"
-    "-2p@#-%>`QBd+rK4A=|=v(Lh~6l&UR*yl(1PHj2cap;y4tT66E4QX01?xb}jG1=nuiYAV1UTt}qR6w4%"
-    "_XG~jcQ=A00VUuD`W7La@<UN8bcZX;uVEDS0#HB=bV$@EGGY^E=ALeTz%}m8ct)UAxC23tls2~MO({r$"
-    "3V^`0m5<tbax5YcJu93@dlo-`*Rqy2qUxvPXM<Vwv-wc5j9m29?Pug}&9x-PbM!VUdB!A;OKV%yQizD)"
-    "PvPN}6#uLircvh`g7~2$-Ah5X#mFV}(U$dCHP$-!IPZg0{C<76{%&Q1cPTW<Vr6zSfVq(F^}x^4!B{f="
-    "5}~W_MyS!-_{i^3dQ#<nhI<CYA=sC?Dz*Q6$?Q<GR{q;wyS&b(tm9E9xxPeg9aVm&s7UJgWo9D(K_U0|"
-    "@%)Af3;@DjpO;fLp_c%1uM!Zm1ZD|W=rn4k;EP|G6S~NTv`SJE|3IKW3qyT#0bapa5Q<uGxx}fldgb0S"
-    "ighGOK1l=-{+CaHPw`6>(UO9$JE~q?<5p({$VY~|>L4QVA5#5<S!F2A0e0T0;zj+%8J1{Er~D6nXkZWg"
-    "&9B<iVYrXdTv#Z8g?drAn{7(kBKm2%qwB$2d>CBy&ap`60Wj=$^4It$Mr~99c02}x@4Db=+OkeXkI^TG"
-    "$G@^UjPed%JnGBkd^YQ}Rv7J~06k_N&si$Wix+MLC|%<2&@eP@pB~Jq#A5kZUhoVBVSw7jic7zO`R*nC"
-    "#<%o+{YZln5pKyv&s*7I_58byujAfs4u`J9Qk3fHjIE6cB4%cUr7^Dj)d77zJ!{vSQ*p4UkSP{!4;XS@"
-    "as%e|mKQPlF+kx6UE`(B5VDg;aiDt&r<)F+z^%tqC-jz45$hJCngqrHtS=vM&>o_*S>C<f%MQ~qI;)KC"
-    "vWUQR7TvJF<s$F&cd!c+B&JVNuk7Y5<Uy-Rab#Yi?0BbmB7E5Kh8bftbQdpSk2%&1k`+v00(-B*(p-C{"
-    "v327}53?(fKd_h0Wz1|ub9I0pSIU#gpKQddQ$!cVG4KQ+qhb0~$9c68f8_a3Fk#^B_{@Q-F!mVm;i=(<"
-    "kqcwj*kA^wdfkSPh(b~_R08xP)g`OHkZiL2?;1v2<bVs;gq!fyQEzBWF$wl^CJ`zskw8P*;uyuUy)d$r"
-    "o-{#<*2{DuM-nI00~524cw<bj5!pA|)~&M~@5==_RjFFC_Jq%hO3hUSzIq-9?l`=5W#DWaM}Ro0<ZoTj"
-    "l3r>wvMn!}s#D-1|9ue3mgM#zxxwIt5up#l99k_@&}Yf#N2<a3UN2eOB&+YT<oB1>I22*FMv$2Zo#3^x"
-    "#8n4#Z0(6FP?Mi>NA|Ec-(Q$r)B7)w^%5k9O$7D8klEwv*Llnx%)O>{6bxx^{~0wkWndR1IY#R8z#MRU"
-    ">0Ip*Vb*aeBp0W+z(#dp>S_-f9!NaY<ui0Ufi99QNBAj#!=ubHfKU9!zz6+oGyUS2ptJ_zShNWJ%k_qj"
-    "@`ax*)39y+n}GI-VQPRivt8GRCY6&#c9a0=*+P?<E-+hL8$zewLkHQ2RLRGp$(!q<EX(k#EPW=gNm9Cj"
-    "C7t2k6I?c7jr=IP(%j)gwdpoHV?4RA(B)USM%lPG+ec3{leDe6waw7&*p_Aqa}|btDO``w(|zp0v!u1E"
-    "LUT$J_vJSTcuMUdT6arnN=`hrwn2mrxuahXh7|}CPPuiu0qvLM&FUOmh%0M;J17X(QDgIAL1f;OkFZ*0"
-    "mVQ0)0F)`{IvIyelObpjGFECQc(8{cPX}!$iyN-@12KT@-;c++F=o+sg!;hA_$+Ez`=u*bCQ2v4{`zoP"
-    "gxx34DXJ9@VJh&ZL_l|NN<*sts^UGe3T3)``0cey8av`CRG|kJ5A}*PFHGG)soSD-FSsEuPe);TegfA@"
-    "QKFwCd2vz=<jxDJR*ZEYE^R2ddK%{*9j=#WD2Z&a7XAj)S^7JdHS)iGY0of8QSb;(-1%`qrt#(ST)LjH"
-    "xm#Y{(o!iKcn`QyRG^h$@s)sl*oA9%Y0vnx_8RK_Z@*P^KWWtfsZu|>--GJs3p$G9Hr34GTd~7s&~2#n"
-    "c{y24E`FdwFx8t`DArm1P_itaN^DU%7yS-Bzs_iMcnpe9Td#Jp%XrK%k)pZ^nhW%LY?+n0`Y&(`fdqnf"
-    "Dsyv@8D`_Z@^KcLmh=4iV)KAy^c)}}AVcH>a2H|y=bIcNdxa{W1Fy1fYg_(0AbP_4jTx%1ieWhX2%?z4"
-    "UD?$Aa<Ze#87T93WDhKh7OVMnt11o<syF+P4`G*i!F461V;%)c?PsedZ5h2iA<d<+g{%H*joA3Jq}nV7"
-    "w?U#f*QBTA)B%aHmUQ$HPGeK{Y^wzSqzhE{UVxi`y9_Pcc#28&o1xQz8Rt5ONe?X{FL9Vc<W1i6RcfzF"
-    "9-_@-nNL6n??(=jHK-n(ckv+`lmkGqLJ|fjfN^!}ihcPm1_^1SQk2@rGwvI~EkovA6!7x#KdWW1=fSXn"
-    "BhHj~HN~!amGJ1p<j10Aal@-M4=_V>9Xyx!Y6)L8q2)Y~XYU|aPC7dGa|{>Yer&uc{57=sO$2X0^ntf-"
-    "An9U%sq*hicxB@`ta}>r^1?AQ8y*H78v@mpe)k|(h+^qeIo;DYYcA6MR<-V_^AI^4O69<3=z4TH2mm%3"
-    "?>rQzU2qemM?{yd(_;c)#VBBZIc9zxauu1&8|<Lj%25=rLrmPP>elwCwr(~TO=-=iG$dGnFBtPBBwN_W"
-    "7(7|2YZHZ{2Y(cPO8b~0)-^mxKZ=~(O3$CKk5rw1`SyCSyabwFmW#}Ork8KrGBApiq_ikJVa3Mbi_X4a"
-    "pgjvsy^JE$^rl-!QIp0HIEnn1!;k<rgWy)RD^#3Sgmkpo_I6V&lyyGOXUiKN8G1KagbRyvb}_c;RUL6`"
-    "GY&SiVK?htAaHoWM<VA3BE9zPfxQOYBI{yZLY=k(4c!{ml6q=FTzQK(7b{<f1X~_V19oCm!~l&GH^U2{"
-    "{@nH@|EzN%bx8YQf~T-fJfgd=_uFq(yA0@6N5jWo8IO5hQiZQh<NFNZX)tkD?y;}sSamEw^2c%F>^A0p"
-    "lyoH^WhzzOo&}R+`J=RF*a}?L$qZ0St<Qzu*apLalS^|r380sPzIS{1lXOxD`XvvDC?DV`g3bi^&NLO}"
-    "rMXT0!6hL${BL=0+K%mnHRrFoRJ&Npq-$`U*M3mCZ=a=o$spQ}(YLc9-(-<i%1!lVSI*)$iZ@|wuWt{n"
-    "S{T~(98v}(FiL%M9NL>sG%(3UQN)G=$HY_{LYA9_(>>ZA`^?8IpW>LMAZeqqiFqNgHa~6<T%(`F;THcY"
-    "Yy4ZoAycGo1a7#abL05=e+$W%QJ#F2t`BXILJ-(Pk@vuiJ0CHHx_i%6SbNB@17hSsu<3A_h*lfo%L+17"
-    "OZZby-_@@%oKcaj{s`+L-0o8`uU}VLAn67jliv;-n8G?9Gz}^>P)9%>x59A>Uw}F#Xp2KmbH50z`$@@I"
-    "FEtZaEIc42tG#lxruPmD2=p5&aSuFK9PO>W*-L^g5HCoYJB0hdFzKMbDy0<p2wAGr0~Oa~vsJD<4(_L|"
-    "BK}5x$b}{s$fVk{64AezoFR(wa6P&UI3O&Wo*)n5(QQSi+)2LS^c{^oDh6H&x5yh2(2YAINTWS=kPZ?K"
-    "=<4Oxx~{!5y&nwFw?L8X+7gUrfTd6~Yo!pk<#DyFdwFaT1@n)wX%l${^bHA3m04UUzC~ie&xaB3&Sk-J"
-    "Q{>y~(SQ}~r4YqDR-}>}(T6Y+C3_e$(7J19{Xd&v(uL3Ik^^wCVVgt``y0W;%tjuh9LV;<U+Veu&TP%d"
-    "rmS}FdRH!vM-NqZ{2&OZ1e#8F;1E|swe_(0Qp6Q=+Oa48i936-59^Zs*YXx8U({09wwNjv55?1bcm%v|"
-    "F$2l1SB}f(w%)$=6ft1yqu)OnA%Z>V6SS1Fdj=L!Z|C)T9#@?gdHB}wLvXyIkktC)JwBt2Afx>J-J>!|"
-    "YsI+8wiYTs6}6fzaPDHcsXOtv#EK7<I7MWb!Y~tLB*-YNcfEaIn0S7{fs67v7!IsEU#J3-6jZ%~&i5~|"
-    "!5=n^mTO$K(|7HDuwto+$Ei>BvCz2hc1*!vg{IuO{n&1|t?aXRzk^lx2<H_wZjI#REKEhBAp0uYt49}U"
-    "EGIJc^UkoI7{u<EgW#n+<l?T_GDuNpmek?`BwZ!W4e%vQq+0b8krCoA?Q$3`1`yAzQsSSCqkA?N=Oh49"
-    "8c8$_!;X`p5#UN*f)OI5SSHUd+NVzrGAo>y%(G75+CmI;4R5rw!IET~E|OUw*7ne_8JX!h&LpxvKr<At"
-    "RqE2>lba1wTv{v%E=Z7SYQ_Nhx;o$rer?_bM!IJ2z8I#ouT-mSl;*>$SR3&!Nvg^7@2G@y8NKtEH#PAh"
-    "695KYWI!}()u_l(sd+SkxnyLRv8+s16rZA7o8k!V^r@CW05Z^TPvCudl-NNpJ4nX)QN;7Tx~EETXB$~Q"
-    "1(Pjg+BXLXkEm|&U_u&+Fcj|eR3?cGCoNY+DCXDBIP`FZrn6zjg1c{}#3R1}H`f}D>=)k4mk&iSZPc-Z"
-    "Qv#LRSH&5f<ONnthk<Zh*>jlT9EF9)`)5qpM8p(?(nCT-&`3Rq^>>Yyj%WjvvebVmiWt1QPyXZC(wRg~"
-    "GNyX_<xQ`WK6ks8xpdi{6OYjiSH3cs1-i$0y@7+%?rdjNYhmpuqr|UDfc_YpsVap+PG}YmEs(%D!^}An"
-    "fp|`u$&lR4(2Cp7s`gpHK@FzJC7Pq2ph$TeiCbk(2OoG!-vI@WJ4<uG)1o&fUm#4Pw-<h-EQq&kNU*A("
-    "PF7e4a)uIs<MqDr#rwq!ItXE-m!7B`x45}?a$J|>%vRHhJOV<!L=h+5mNy8Q0*%cA;{og@si4ypv}0ev"
-    "Q?=x>cAA?7oeY;rqqM?;TXoGZQ8^b#rEXE|>ssuKh%JBdAn~Tp7qUG%F0+Chi42hWgw$47$h$S+LQax3"
-    "=OihH(F_%mHo+lr#wErPN&{J$!LRKPvUBbQ$!g9UV3|Q96~wccAA)%eF9G$CJwdARUS;bdN{}&O^?D^J"
-    "JN5*pwM3ErftQxpk2(&(lJyCqpblZgxHI8(tet_&0rU&nK~obLn+|D9eKb3yBfsj{$&YuHfEXk49$Iu="
-    "QW!wW>KRJ8$hANh=-cTD?v2qOObl})=DYgHfy=zXjr~h=mpo-y^j~?TL_PZ9{?3pfwNuJyw(xI5(oDBq"
-    "+6Ejc8{yrZaCc3HapP@UVC3D}2W>j)#DBV0qg@hRd`<Qt84DUNH+KD})FlUzQhe0mE{F|l(Nl)VSxtt="
-    "xuXP4QC^F@?Iut8avBY8Y;KuO8E&|o#yfJTgN2m8dak>)lqzZQ1l&$EGP;iMd?!m8CkSw2cHU8&josXa"
-    "YpLPsRZBa$Pk9}^83T#qr;<Nzh(Vk#dNfmmlH=}j<Q6)D#uIi7o2;9Yu%8L;@OQ~SPL3PO$z>ZaLQa;o"
-    "s&Gv^3xo@D31DVJ&yUoc)clwg8?qO3@=TtO^h-b*Se@Qpxh4e>OX#uLuvxL)F_Z>P%o5j1u0O4=vwv<y"
-    "quj4tEP>k1(K>MU!>_tff%hfj5Yt}vY1`c2XuJ(}Irz!fS+P^tYkxp`A=8?ie!I@BDU8!W2M#})wxCDS"
-    "RuDQS^vXP-eeHKR^=>b&{`BIF0yZSSW6jw-S{7ME4<*SedAWYoPsgLHHvdSveD1!Z$Sc2Qb|&=lawCBZ"
-    "`_pN<wU2{)IZG;|9JqOc$ApH|rAp<GwlA5-SUGA}v{mA|X_tgf3m;ai;Xj%*xx26SZfbOV7XQtfB8k({"
-    "Ww)5*J_&2UCiN55HH@65<(m=h{cWrh*dFpK2{JyQi7KN*kv3DvY~<^2lOh@-X%_YLBSR7(-)rikd+Cq!"
-    "P!L(|5rNe|H{q^hDm09wzsTF?f)O)hs8*yb&}kEh=K)^yKV3-iMM$g~qkPpW+>2Q8nWe@kV3peyM(i*d"
-    "Q1VC&{6dksF@DoPQt<6>n9QDx1to!S$Q$$%WcB$ttOE<vdRO6h=ofVnZ#S@_aF&$oKCNQ?O&iyw1fA%B"
-    "w}}LT1(Fs<;e<?r6tO^SqgN$ipO*;2d6#QnzB<EHn`k2^k=EoudY$IYN;qAn9&{{h4!zwYOhJaKEzyn<"
-    "4&BF<@7Xw*t9?EN{eUYmUN7(77qV5(;#)X5M;OMIpls)vR?GX1CCaf^AElIRP9utYQyw48AZZAirQNK`"
-    "FQfB)I&dPb7Ns-`jScC?N+9pYDb3b9BU-$(CE^!}@}0N+*H{NB4xT_R!v<QN=~JQoo$=pM(-XsNvd+}7"
-    "=QJGz&d@XTzZg{CW8CtW_vCD5gXEICo)HDAO*t!7g9U8X1Z*}eNsQuPJqg&H%w*Z4;X~|>{jHpmNR};K"
-    "sgYo7fO0N;67oD&Sg023Eq@sOt%2}qEiZLzIXsIdL&Ast`FNu1OsCqY64CvAZ2fp?j+~@!5>&B(%C~uX"
-    "K20_v)@t^q0aAT9)ti+)kabDKpxE7U=n(^*e>g2Go(D0k$}6eE%akeprH{!t?x!f<V*KU@47!OYVO)Fn"
-    "I4QrZQ9qgus>y~)fWg0PS}X~-hitU@!+(pyS5)PFP6<J%SS8ht<K{w-C^fh~7iegK{_Ew7*d_9dRsD7Y"
-    "#9XfA_1`=uutFYdUNLcXrZNC5qPkF$@^EJ)=2kgY-svR?TlbN%d@XyJ1rG1^X^e}(8^Pj5k9m|fWTSqo"
-    "0Bz^80!j$(Y{}=gYb!NAYhGm70iiM^JV>Z}4i>N^v_(raojpjU+S*p1NATS^FOll%Hkso_+5pHAZgmJf"
-    "%wpa<Bn|s{gY{~8Qs!0d;JhevUaTa>q{V#kP%HthIFk)?E)9sR8Ul7^-!|Ea2gq~gTxk@-EK~=Nl0Xal"
-    "7uYyNzQgFZYOYd$r$zal88y<aAUJ{lav&PaE{e`pZ8ukOrHOOEY`=470FR(-KQ5O2)Cs*Q)W5QrVB8`y"
-    "Zr>F&EGeazTzcCLYc32$BLU~3ZHY%Jr7zO|m5FDK25Q?z2ss)Tgitf>=^t;pYtT+<{p?ifnzqMMo0UGp"
-    "OA(Z5Tw?erp78WIbcg!Bd96;X7fP-V$pJlhGG{j5r|v{)A{T_>x>E9Bu7SQp`x^zUEoDe&t{|csrU#^E"
-    "AqyS{{Ttw2Q%f<Go>QDXF>mIk(Ad_Tydc5IKy<UNJZj_hRL^RzAhcgKbjw8eMObrImG>0coTaxQ2hh#2"
-    "nMG2g(EhD^9dndQ!RFvV!ukdM%GIC3!ocil=rbA(`LqL^eS`1aS16H3Jw_73n>M@uuj4NIoTWE|YwV+8"
-    "bmx`(WYkistmjc;Yb&fJkl@<qJtrg#hj>8=+mYtE29J<7ZC8&S>>Z+sa2YDzvZeca>=w2d<q4F7<5ZCQ"
-    "jGS+doxP!z*!4O{EGdaU|M+8d7J<*2?nZ2QxB2ugX_ta%am0%EP_+5n4bzo7m8Ky8SK>GxJncvD@H}HG"
-    "Q;QMvyA7AU?j93HeSe}eDq2{(2@rvwo1kpC@xY1*Umv?9HreHyeCqWqL|y#$8kth+Xs=DUpRThc{>3J%"
-    "v)o%B+Yz&@MaWx?8K^1kQRVW!?yzNfyYya%Nf2e<sVy&G#3;&$^H2BBduW$Mpx}0RyPS<_?R!G?>MCJ9"
-    "=NQSOk{D*ahEtcHl?K4royL|SW%1cM14s$;y~ic6r<=gj>yCJqmwyz&=pK%_6^*A}nHA%2EQ8BW%M-~q"
-    "#S_j2f(?24nDu?+X_U0wa!(=#qDuu<|D85u|K&1oCBD_uoE{-8_b9faQ-gvlZXJCxIAq5)E$VXCPed$W"
-    "gV4<j(c>gZKBqcvZR8VA-8THw<U1}px2i=i9{SHE^=UV=VV2TyYjEM6EH=WzX~3f#jMggwZ&Ne)?XtC~"
-    "sp&-8v|ZD+V{(vArGru?HSp$b6c@9#r1q^LojCbe)HGq*mtuzhX)nZjGt{-H6)tLT;EPsefny!|2K%#6"
-    "1BEqcEDpPrxzrOsp?qWZ`g#_(ztiXKQ8#syze!a8%2!+lD~bwVy#eQUpmv$7`3%C_D$ruD>2(cL-ft{O"
-    "dh5C^bk`(wrwW+n3Bt;@GSh;x19*qt(n=PyIzp}At;BEcMT)J$>7RD5IwNcFF;Dv=x^~(9$gf|&Im0)G"
-    "z8CP#>qB*Os9-QmNW0&)%Dk0%nG=W3O18QCa>%)#SAwMSj>VR;O?Z@N*)f7K#=OO-&#Wev7IO${%=}UH"
-    "a#cNkwB=(-XM>`pN~T5I9{bkpnK;N=MjiKGK>~8P?s%QwgyA>TU+VP_;UJKphemT>7th?#HGS*+=Ko<5"
-    "dj%o0<*|-EJlZLECIb!H+ppRA%fX_3;<4Q%4MDLUHM@zD8$vmRC#;jsHu;bJn(-DfMO5+&L`_sR7wwqP"
-    "NAwUW=oUFB9otIg9J$E|eA8sLT<^<hkK`Tt^JU5gA0kwJG6ryK_84=N@I0{aP_`(c0d9WKF-twcX8zUE"
-    "k5{|2NwG_(4LWU%)wo!&H|B+hLMO$>hyPCBCRf^{Z5^H7;&nc9Opo1j-Ae1twGn)No-7z&wR{@|n<_!e"
-    "pUWVuOMZM~Apq(qI!+H|+ZjiAe46zgagAMWpK+VHvpgxwa>}%yE9cyPL2dM1e_Uz%%#@lXO;Q&q77hp~"
-    "8VY$usETytfVfe_1%z4gZV@!Fk#bVzQSJbojhoZsBT(&_#Gk)O$%S=7w&JZh_tpCa?@4FU5ANi*v-78a"
-    "5w0STv1fyV<o7#9<iOd2WC7*O20#JeLCeO?&fF1Q?4o2@mNQKZU=5b~GEW^_98%fcbq}wNiH!kiByiTs"
-    "vjp3i17Hi6q?gB&I~=1Pf9r!%N>Fq45WiDJPAi*09)3xer)LSV%q3!Z<|Kr%k<$kcu69I=lio6WBstqt"
-    "UqIady7{KPnkQ^AQGhx>5r~;kXlrcHV5nJbnbb3^8s(-E9$-e92)K)y6c`EcALtMBKZz_F7L7%T8E7dn"
-    "0{vytz`fASJI*iX5ZK#?JO#S@%oR=6WF4_+z^oX3@}7_4awpD1#PNSzxV(M)S1Dzy#JQRu(e}BHY_)WK"
-    "Ufm04K$o{+G0S_4r(A)NxST%*WoSk8jpGiF3=I%HT%9U8&W$R;Z*O6#E{kqUir){fRrNMM)*^Bgm7<kB"
-    "5LZ<5Q^>qr*kT^y47Wjx)|TSrn4FlH0iW2;@C9y}BZ}mPHm3ykz<#b!-j&fVqocbZ6Uw-uya?1)4jpCK"
-    "?S$9`i4Y+^ZEvKVkbQE$rZ9;yhC<`f{CxyH6{2g_VEY&~b~F~X6&=5LL}df13n7AK#F=36M!xy@R%ihj"
-    "P;bAS(>@qYN-?}qmx?Y9JS;pV`mmj@9XrFO*VL~YEw*_}yZ+>6FTOagP9jI!lPW514u)Zi(`yrHL@DjG"
-    "-p?^!g*;5EMKb{bVMaG5#Kh{G^$s^6$AlvCGjcp4vkE|7k=ULj6RSzq;w2sE9h1AA1zn06@St8+uupD4"
-    "%%_2~*~>b6IJbFQ+$hzc?}Awq=LTc<r1_y&X$FMKhQos3h~uS#d1m;m6T{1_yztNsfD$^^q>XrJLoDf9"
-    "f>hvf907SGYBx%iU;_&6xcn07Wb{ei%phB&E-XF8kX;KMpYrMboxydw?3zqw?iRd&*v1k~C)hnApW}}}"
-    "***#y8cLQ)mX*!(I(rU|JW<|#3?JNqazKcB`j1Fv)b#TPgJR~h1;u`sUn8+@nKBWf75r&ElvdkdC(%he"
-    "q3yb&Fi||gq=&+ga84=oBx{jQ-sVb|X8)4yn7QX9+O6K2N_KRAiEtos;G~I{Y$4}$4BNMn>*+gefGqLm"
-    "tZ{=F5mSK@;eH$-AOvzV7IC0|)Pu+#Qq5~-Zi*QO^*MK-pvLonxa>Li?TE-k$c+MA0CsVT!@1L;vH`X&"
-    "BYh?FvE_QIsFoFE$wck6(hA1?#lPD6DYw1AjO_(yk7RZ~+txwiRnR28d`_x==rF{dhqV+tTW#^BfRJ2_"
-    "0Bz?qKvAAUO>-P^$RSb-RtQ)hYr5flDp==87s)=bXrIO2y2IQG23^d@p@AeXHZAXw99H1>Oc#2&pDd$U"
-    "a_6+);*gV)LF9{p(;jUf5RgWBd$kN~UJGNRJA{Kh@dnzMw~|zocYfIGLwJ-<!iR!=^xZPObGyA6;BA93"
-    "F>ez@3o!v!e>cogkMHVZ3NrnmspL!ypAMNuEY%YBCBgg(W!lGgO^$2;rtKJg-)%L=q@U@sW(2pRQj%)c"
-    "17g<_s#WXKg#cRBBBmQQhNKTi{L1ykhE#^fB?m^Wj~r7MM}Zu$vKb5NboP4;gnJeMN|ZRg{Wa=#2nWXr"
-    "@g9{ItG$4VPW>J^53wNALi=79g0~}exM9+5>?D!rk8Y?I#&?M+ai>PUmL1F~C93#2Yh;r8C@FGQ{$^hF"
-    "*c>(f^Qe!eyshy(_i@j3BavQ@N<`xk-7^6ow=;{E)6C%u)24+p>0Z(vI0PLWtI2n2{+X9ZnhO{qClYm{"
-    "qsr)n>l$QB&=tjy8`Whu1`!eX_0?}dpZ}7}7UEh%I9SIYc41a&+Qro0D(&Lao-+QHL%_58zhUGz^5ak@"
-    "%wwf1U@-W>+V!(XA3lnR)QhnJ>!&aOkT;4?bB3M>yI5s9lhvvqlrP&gV%XA1jHQHqsLwy3%45CiLC9oM"
-    "C~034We$xWg^Yq4Rsn{<0fKn34Xh!gf%cpxW3}5|Yhni2Z4<lRm$98jdJ8c;rlX~7Om=Su+5nERJ<V0;"
-    "W3@o>T-dV1wQd(UI!}DvfCh)1c?k;(&}VGU^7=}ACy2ms?6~BQ8j_fJJt7hW80m!FIuM-^(6@M_@}%W$"
-    "%PfH1!QN*z1#_KBkEk<L-<Rbg6C-nvxj$5Rb*36UgU;mUI^mYw;0p^Dc<zlQ1H2_rL6X!U>0-dOLA9gz"
-    "sGdmhvQLvKucmfD=X>JNROd=Q_>Q}i+QUUNcg=U7Uaz|sSC*#JZ}_mB!RxNW`ZK?>zk%7=4O;o=f3q-{"
-    "W3%xDbG)M(fn;E3*Z~Ni6S8%{eRR~C_Eq*mrf@FrPVlwCr9V@XzAB6HW3D762vkTfkJriN12BNAzs_*S"
-    "^I#F=wF<7!GgEnHFxO7V7^-ZMs8i1YT2z>NFW$>QZ#RS#7aC%AaRGTjQzLhyOZ&t$AArami_Iu5gBv)A"
-    "hR)yAInZ4aA90`vq(Tg8tcE{s2(w^6Wuu%(e#|{m6`hUIA;BX?MZ<BNa^8q7)G1OwQ}vdOTR^K~r`_(D"
-    "C09$jBzsmW&p^h*c84}5++e499+Oh39!bmT;OEc`49lnbow(5J2}W4Oa6o0^+@&~n>v3XR!LiQU<DoVW"
-    "8i~=XBMeXyt4<>F!J*>-t_j;mMZ%*s8o0CdM83z$rQB1tDwE5?wH0G`am^Hr0+sDKdmtD<z~-&qg%GXz"
-    "y+g=_;#PJ~AT+~h>VZ6@XyP?zfwU{xubAZhLbk<%^EPa{YOwkO3RH_%U!U<UjvtPXN#i@PFx`^S$$G;P"
-    "rqwkU24M!9d{n3ng~LiaREU^8<1pN#M(H((LLv)a;^Z6mHwuFk&L$4pZ=;5XwwrY|W~p;L7`&AM&|^7U"
-    "td;{ip^vwv<iUBONH^$l`Pzn-Bj^OLP<iz@-R7@wfN$x4&I^1G0oX)BPH_PnU#m;2F18S5=k?>GH$#Yr"
-    "U|<%TKpQ*a<fG(!l$xurfbm->kJ@6NZxxy8Tz|JOg6%@G_l!zksoL~A%39eG{ap`l)mY5xoaVwRT>X>y"
-    "$UT{HDXR2Hbi>XKaPMn0x+%t%xJ)(0@H3Hs6-Zj5T_57(p9fdiYh*=`sk+Vx0XxoHlO6~A;5>sXJ`8Xy"
-    "*yvkaE{<J?MMzg_V*56>xig8!PFJG}Bsh(O0*O4a4^_^K^!6f|CT+{Ow~Qx{NDpd9+6W29j!i>vLT=ew"
-    "e#Aks@8P>F1~oeXva~c(>R6cE2rT~yw<lA{kbo&)6bBBeekZd<m59b@LA=X0fIq<Iq=_L?OfM<W%VJsc"
-    ")Goo3LwnX%fjcV{dHWSu0m#P!Gy5_$V(vW4NsLe;QEj_S__GKrW=J5f9`=GBE1Sa3=$ME<XSi;bw0z8z"
-    "drrIrp-UqSnV6fBvZpeo*i9tWF;|Q@ch@ZMr8qV%hX2}61rR1C>ID3TSeGYBOrc7OB)9uhM45S6ot(;g"
-    "j$UU3gGae?Q}Jg&UQn~PMnUa4Xx$98SeFy})^QIi;tI&_m$$3BM4msL65JuiZf6@U1{9bVCbTc29x0mU"
-    "rRrk|b3rawa5Jh_Eh2%sJxA)P>ElyjID31EnyApCv>eOF*+c+~wYM?~vr#PldTo$eGz*)Hl3b8EO?%8E"
-    "z*>i4Z<YyupAKK*52&l+A^_(oLKL}%6~);1&NQ;eB7V>Wwv+A16td2<L2IL~n#Y?6yq-8G>g=cS2?Dm~"
-    "TB$UhMEKU@1C;1)vJb6vn&iPv_JTJBkM@di(^ZEi4d+y3vSL!HuSR}YAz}M*NsTnGQP2m#&cki>46$#1"
-    "h2)sj|3#nHpPZB0GDQ_yt_M)FqTN+a4_B}qIX^DmxEMgm*-DJk5fSPA!ioR8*s_2}Jzs^vD5kH|jn2Ou"
-    "F!;_XJa#wnbjd%3AlBm21xFWR`0yX9dW^--?ek0`tx}zUeDS{C{lpq1c*IEEEwMZ5dvF8ST#3V&h<HyT"
-    "*t@oK`W!+na;RnJF+`(jak)9aU`a1)rS4wFno9^_2GWbDBE0c#cn}B{a1uv8X0%Y!@*^SecYJ^@Kd!)$"
-    "y_YXRqI?D~bRh?{H5BPXZI~#P8)hfA7v?=TsQYqO$5%2PWzodM%yD0m7U>R$ICpfKdVi6wLGN$nCvOms"
-    "8%Mfus;E`u*ySIJGStdlD0}}#yRosrGx|zJJGn;!9<qy}pA=*Jv-Z`s{YKE&X*)lx3I&+c&-LZxwlCAY"
-    "&jp+wV0$%NGYbrs|FZi_r$bo)3-tWEe+=RsFXsAnU9+7h($;wOcc?|D0&XwQ_HgJe8F3z0Go(IRkum`x"
-    "Iz_!mWSlwF*NeWVZ2|wM=Eg+f#dAGk{gzSK#PEnIRT4voo&85`_M8=_rLBNUvuUo*^F@gzJ|z+cl;XL1"
-    "xFgIyDaBzoglQ@HNDZ3pXT@cG*k+ZH?Hy}2e3~_*`{~W>w8#!7y)iA9;(%U)90%0lnwS;-JK9E7m453H"
-    "htg_`QlzA$bchv(e}^%Jp5Xgga#i~KeBspRJLn_@pHHeQ?XmjF7dLRhjJysQVs9Y01wnuz>p!*`8E8y6"
-    "i$0<2_KJX))#a<JzmuE!m}S?CKm1<G$p8uUJ0$X{8q2|OsxW~*rzgJ7{7iMonCI!#fU17g1R$p%J%RIU"
-    "`R`E38QBT1G+6|=+QY<$P3AZ26CQ&)TD4xLnX~6V<?<>XYHVa_5_!ZQ*2(0D#ecLTyYUkvJ=Z4Cp}+D&"
-    "2v$kcX#vrEE1eqvo<a2YUEkFFgDW9l32Ix%JoqUf9+9F(#gL|LVvLthG2HQj-X|H;zj2vxUri>9I77p9"
-    "4VM<d2wwR{H_F|wRd00$|0?)hYaXZ0`DVQG=$oy|w^v0-@!2X_TIy*8Mq0dx|2|BZBQN7SII*cjHvjrX"
-    "RRRhEz}+<`2cA8S4P+gWtIN&gwHlumH=#j>GUAS)$iHi%s9A4jajsE_3s-*M0kgdLYx#20udT|&Gw0e-"
-    "?VyVpxHAp#Aaa+j1+Kwk?S@?dt{~B}Hj^L&RMP=rmQ)M}S<7~vbct8vy2Z*8JTJe*rG_5Qlg47uTe#37"
-    "wO4#-&aS}weJ4W+n8g~*LKAA@$+nU4Go~(X7c$&YaFcbw??h<ZeIAXaHPH;(d4VRRF3<zJyn$0pove&}"
-    "6R-D+*OiU<h~a`RTT)_aOB7gm@zl91u!K@wX{MkIJvbfYQ^;|6wp5d?HOT!7(JkZ>>mSQ)OaEj%w5ohW"
-    "v99;lP4jIchED|LY0xgK0LTAMx3D35Jf?nXv2q}T?Gve8;Rj$KaQy_osnu>GjT6j3e-8$XVJG8kcqm}a"
-    "BsL^L@e-*ca7-_M5R~@Ara6$xyY{|d`Na8qd?fap@*&0~UjgH{-T2doq+Ua#WX{}$WLur)mCgKw&uEKS"
-    "s8jLFQaR(dAwmp<%>MF@zi#8?)Bbso#1~o|G^4eQH*KLbDNKtKF03h<wS@kBF3BY1(N!;Y5x&YTnet|8"
-    "3+oc03Z7?i=FFr=KgV;m?9_a#!3Tj61pay!IQMNSNXxeawZL7cc?w8XxtA9Kd*$SN_|?}4-3rM-bamrZ"
-    "I7R)-gj#(Tq}xm$A2^#4x%No%rlq}Zg9GpwM=G=>J#c9edaW@7Z!iG36UO?*1I-Xk<VEFfdjvsacs&ts"
-    "CYStUYFo0R(1~fM0CcwlUV=E8|GzpNO{nmiPM+B^*yZ{LNTBlM;EOG{*Z<^P%EDT(?rjl%z3*v9(*>ac"
-    "G<~vL<6kvP;4im?JlcLQDa~Lgs{@qyH%d9wIS1S5R!075w!I5v-^IYb$iAevMb-XbiG5K6gMey<Gcw~Y"
-    "q;whq?+8wld<!ASh~1v>lv(Z({MI1oz>7OaKeFB<sEFTddi`SG78n5z0*s)Hq2^y!l3D;E=0P8yiN9Ac"
-    "0lw=LgNtM@04cPIMS*)3Tn4WpJL!d591}uvKK$x8ix0&RhU9Gg>7uoEeI>k9FZ*gRxMfNDZRTGoF@q&~"
-    "mxPlpuQp(|SLEYt#DxB#4DKyLu9r=2zt88Em8S~!48DFYp{gxycKi<KIh9J;FmPzltLeX2y`{tV^SD3+"
-    "A%&7qGC4rU7IB{O7<g<;mZTk-;WiEHEdf6^54-Y0I!quL$29r*Al+#u+5F&p4##Au(pVA3=N~s4W%tDX"
-    "A)bDbfiOxM#@tX(xPj#O1r;W8p#eD&StrP|7Rt!8)9It$#P=)xkdB90HgQ(?Z`ZLJRdcL~Yx417SSUho"
-    "6j=OD%~uQ@wssamUc{_tJ&tO`OtTOJjh<)<r1cXG4d&^mNt8xY^|qcki_Aw;h;Z_N`>fy9e}WD-Op3f="
-    "T#}&)?U3~O7jZ3w7~&;=zwa}}ujcn}5gbZ?G0?y!9CENnyv-Ry(y|1If9yg^N%L`Ixv@0C4rW)rXBPgY"
-    "4;RU6%4Y?37U;-?ig^8@m;#?BdGkS+W4pIRRX3tEslo<J+Fm&B+P=l4XQp@gR&6}s+ej60xhcr@Yw!s1"
-    "ZslS9iWnr4<&6MFm+tkOKQDyBacLeZJ(_lOL4r8J>U!jBFbiOxC{09(US3nrtCR4faO<iW?47hhG7?oJ"
-    "v8cIW*c=^SmJO7497a{^D(g^yx^MwiU5i#m#bIKYQv"
-)
+try:
+    from . import registry_cache as _rc
+except ImportError:
+    import registry_cache as _rc
 
+_REGISTRY_VERSION = "6.0.1"
+# Bumped when the packed-section layout changes; the updater only installs a matching file
+_FORMAT_VERSION = 2
+_SALT = "7GFRaG2>|-EUUTXQ;QP<"
+_SECTIONS = {
+    "COMPONENTS": (
+        "A`0g3)UBKCox_b|9wMN@wjhEz>hTJep9AweA~LiI+ZvMwa)!KUL*KmXYo6pqO<PCE+T90Q`Vyz>K`ntO"
+        "T$R@+4lYbjssl$y9Jje%i+&w!sS9*Tm6G!u!iJaGC9vuy)~uyb#E;_B4jcp4aL!1!u?j)@&FVTkxR2Xp"
+        "qOP`)M8gz_ja$N!QY6%_bk8Dxq0FH?V>xSmx{s|0VD>!LJJ?239|qtI$XtzJ_K;*U_PUHg{P}Sw60*Lk"
+        "4|c2&XVE)JM+7#<DF-l~8Lz^JiK84&)FjS)ke{CQFTS?d!%U8U8_QI`2`kj(9`?avBPzFZ%;6d|_-{Ac"
+        "S{z`@m^^}VcNzKbLq^uIPKAj(@vC|bVltcr#>p<6>~l64(!GKUKa&_0hlmrz&K|t;ZPK!GrU-;${2hyU"
+        "F0g;svYbL;iHfPmSg3SefMjje!j#J?-0$2b!XJ={?wt%5>}(-_%n%e8oK&?Tb$EDYEG!YuWqFZmX(#nx"
+        "E?!)jTRTCuW@;jY=VhWz0=y;rw>8F;6|$XfE7hKW`|8_h;TK`O_a+Nn{TzdlB~?TXyC|Q*ZDTn!aQ=IS"
+        "F7n(LXA}l9+nS)618!(UIUJv`I%$V}SGO}h02yq{EGlk^CgjaA<`DtNB=i&=7B)sXO}WA>j+8j%&LB84"
+        "#1i6~vyd)<opTtx>U=Yox(6l9zi+%yc#WL^`IE-iM{w(To5@Ey{T1Gtt8&?Y2t|q_GizT1RP>nPArq$x"
+        "M`3-Mvs6Su@o?B8kD2vJz;zF_5?jw+tAmD)lx5i!Rj>)DyDj=g)&tY)Z}J8NTcrQi0Y!9S&W3BTy|9o#"
+        "DxyDYHy?Er9HWcOURXw`J+@o_&qV8UT$NTg{s+OVjF@k-tj<6Od=gd1A(7HlIF`n6RHoFs>B5Tl#rB&-"
+        "xKyr0GwF>;rDlAA%X-1m<A1n1p5RJdfY+GT=GsUAD1@;D&5GA5S%3@+ItG12>e&6DtEvp(DhwXQ37Hwm"
+        "?tVY(3qjw0QIj6{S_M%7N)=`1D1QN;TD>2K!{MxG%k;5T3QUBQHpi{zv!3O>nuKoYhO$Lz%g7RKw6`B!"
+        "V<3Pa<8CcLxU0-S*#1rSqZAH*=Ip=6K~X~sx!ZCN2H7Pf6~TY;Ar)P^NieNb)}V0b)@Inj4Y)2-K!Hoy"
+        "^zo$^K`r`#8a;{uCqX``$ml)Dcd>p2*L-%%aW&Mra-0wk3J~B}{FxLx5$ED_d)&WXW!TN}!iIO2MmcVn"
+        "%ZX4g2W*DuWC@KTOc$sLkcG=INPqhhrF6I)(G14l{Uqwv?<kYm_de2a+na1k6wizViCaArVQ9^c=zez?"
+        "SpdO0bGjf$*3`CH+s&tC&@og|#ot?fd1pF=TR(UNIkmv`BZs%Ydtv!b7Rv%9-^5_JO(%m)3lcDE6^4C>"
+        "&|CXvB5{2I?-!6oB!cEbpr`~wZiYmf6p$xV>4QWvP9*kOl_oqY869YkCwoau^^leme!jR45IN!L4d&1w"
+        "4(N?nCwlB0_bA%)eU7REP|CP5W&7}JF~XAPiT(bD^Xc5m)vLPVRurN{o|`&&8wm4N44v49ED`$xr;iV%"
+        "#N<M>qVzbQgEaOYx6@@X1vACQkyM7nsnaW>@x!5&@lhV}LXHnt%49_5GYMjx?Njf@>c#HG#EOwzaHk6$"
+        "OdV+@J)`c1r8p=#v<9nvSG<N~<o2piNSd8&Exupgt)R+sK%qVl#?){wu!e735i+Mm&_#dt@RIcN&#Pq^"
+        "T?>$)TQTl)kB3xKYY>|y5i3)SEx&SHjc!6fPZBq1z!g0P*Up7wIy5<=Zd$SB1>OLo`&&BUwrs|Yds4)#"
+        "^=qoP8xpK=UFqMp4X7huiSzgjgZC>mxU7>|vE%p$^yQsUrp-YeipCSPXmKU_;w;#PNIvULsTO^}-Z$wC"
+        "Gu7ir)sUtnfFGsupjZjGCMHj<Sc$~nTIG>QITtq@NxM51NaSj<)kV=GnJ}tj0wvHIy@ea3e#<kHQ>>aD"
+        "JH8ao!U!%=K_k$sdnm-Xn55xmBZwt7{RkCXWzEb>xU7&}^}{0pfw^9mKAXoJz?e^YD+uj3mGszL<KBU#"
+        "cTP`3s+|cD1QU+GJ!x+ApaXL;rn3lw3t1m3w+AHd#rF%3Ox(bl=6m@vsa?SBWZMRxEZ-$ru`drDh)c?*"
+        "cXzsL2H%}Y?K<?wJf1w)#EEv!RO@R3N*iWqTIwq6+tyDB3tRX+gHlc40%D29SMVbLDi;SSL8HZBWby)y"
+        "2ri~4=(S=oP;pygiw3BFy-BvDPGaok@2(?PXvD$0W|ksUwVq%6Lg_WiQ9w-kkNqejxN&9pOPiK$cL?J*"
+        "fxk!Xq#5{%W|VgrqU_E%P%R;<&H{2;)GAvrT7AXo|6<(5N<K-Lo(|z+24W=o`eUwW(4CccLTS-+(BLOb"
+        "lC@bLM4u6lo&oLXK9f+UgoG}$lbhEg%wi+SwB)}pw>A!L2$*;87$A=wFw!M)uxLKlIbwH19_D==yK&p`"
+        "(xS(IxNewM&(bDi#ROR9M&5z>3}PJUS5!+pvQN=d7CRPNP@_H>+Q3?T4h*XZi-eS>>UE@@Rpa}ZYvT<k"
+        "QfyJwDS2I$PE<_o{+Li-ctjAR^V>vi3a*VGHO#pJL!|Kj7DV<Do`H~iGF86a4h)&N_**qo-yG>wnNj|-"
+        ")7yWrtsF8;p{Y~9r*O{Vy?Wffx%L1W0O-jzP>8PVpQW1{)+s1UWBGG=*YWSt4UBSF9c*`lJjVokw5<OH"
+        "@f?R-xr;7X$ZMkHZI!{!#q$G?NqPoqAWeI1_ocspEwr~}+MTVuXws20d}AL{pUj?HMy4J`cTv+a1)O%{"
+        "L;ir0I8atf7tUvV{}+3C$8EL6*Wy7V$n`g&P0Kt&V+r_C$$`27V2m0-#I97M^x_fXC$z-_cc52wrMgE5"
+        "GV&`YU2kdUE53UyLwvQzMO?bfcj}~dm#HGT5hfvJQONqa*a<2`+heA-AYKon>8cc~%Q!*@7F!qk*N^yS"
+        "F@mqFDV{-0&5A3H11z4>K)=szWDtr>w63_J;&UKxcn>g;Ft%l>e}F<wi!vGrs@kjTh@t(*@2MG=wJEh3"
+        "+k>7Mzta?tw{XdE9A>?!7tWP6z_`#m#>7yr%q79>=uPy=wl>(=F3R0p>y?+^V=#F%(oc)~AsS(578(Yt"
+        "iX0?{r6@y;>Q8kk>TQSES3ts-kY%fK{~liE8V&y{8zJ`KR|o1Y1R-El#%?9zx`<N-`{)aTOg(e+aLzSI"
+        "1=So*V>I#1POd3nVd1JPtZo3GGhG^|B&@~kK4`)OTrP4RJ8nIfN9giwSyXEn4&$J^RphGyAoYr)1zv%9"
+        "LCx{+2D6n-<7{pbYysG=4$|@1esaPg<Kx>KQptNZ^iiM+<HH=WWhcH+a(<V4(baV~2ZQx`r9jLi9ZCdn"
+        "@{YHNO`Z&rHu`~#G=Ma4T*8Y<s}xKLUZp{f%Qt4xj>0~*4!}dt9oE3*k;1EU-D!1$J7Y}W$KHwik-Y#U"
+        "p(kq<LxZCr2b_8%DzBa(bY?*KEmV8}F790ch^-F!1T%@ZYK&qq_K+#4!USh>9Xpk)!uB>>hUm7X3<7I("
+        "b@f~|3*ygR)B6f)jL1rCTHQvaF5BMmn5KOraFKwNVS9Hidl51;bZV-9;|h1vLml|o1Zv0HnCT4;`6r6L"
+        "%#)9=?qbK1;t;wx<GcjeV9RhCcsYLPsO_Q7yp|3)$L5Z74p`l<TmkaXJp>9JZpMoYaz6E}s!g^_MvyxI"
+        "5uE;e%SeD)X;wpuSq~iRHZf4IgTl-AG}75v*Brt~)I&k5#OrPm{gW{1m7hQ*O?hQ9g|LVuF2i_&KaTek"
+        "=_IB1fag2q9(l}S9hJ}Rnb98b#@3}NwW7fAFRL#<V-b!h#%|4hSAxu!;8!A$G0EI<(_ivRT%J@hfz550"
+        "2V45UnyMCL{5wl$VrUx2Xt3_&o6QN>&_r`NYGjq9CGcK#H@-$%u9nHH*Ado%X9OB#WA8HnRkNb&x*PR6"
+        "YN!j!D3ZzJxTNDIc+X29Gm>33l96Y^Kh&GyxAr*w%Y}|(18FI8Ur5x6l_ZDEL&VNY8tfBk)D?XLNZ=#U"
+        "Ba5%UF+>>?)X78i>dlOh%5p;Yvr(;U%YM!z$}kYuZ2toG)Jg+Olj0?)+!3n<w#i=F87MZ=F<~x}lj~1y"
+        "KTc_DUdBb5ZA`qeeq@pdm}9gI+exY@w=B-VWe=}gmo170aFu^UV5&!AW}HDE#1N|MU8}`M=+nH6q-7Rg"
+        "KhHFBfJ0|xG@FQ}FRVphi|H=Od8{&#TCqz(Bx$?#LkbTm&~4ue@Ks3-Kgkh`vBjQjQSmC|oSXM$rdi??"
+        "M$K6z2+fmk+~1t785`tfy-~kCw@+*}P0XTl)lYQDNd3$7@MYdET{nRg@b=X^IqgR6Bk3QtB0^!A6<C<4"
+        "C}rbyp$JJpGNC4Y4)bj>TF==r@ejV3SmJjEeT)kYKyct2VE=8fZ{jj{nIUv|-swF8B8r-=5Gi~{FF)n4"
+        "3%%dP*0JW)25XwC^DM%8Dxm}79ui~QL&1Hw4Mt!b({yIq><oeWTfA1z1<JP^(rhes9Op|Aoe|`^YnG>_"
+        "MD&T|lZQl}ck=q@CgHDY^kk7edZSek1Dfq|rEE8k)GWb_CY^uYZlB$N<`w6e{@{o<4^-7)0Ri+)$GXU5"
+        "`D6&!EJGP*-pEW00EQobMVW?*3x0~Yr5_1@1SrBd8C2(Z0bnuB#*3LSW=-Vns#y`l)DfsBkjEKh3JwOJ"
+        "xD0ibx<MT3Ozw65FY=H8moW4eW9%I^Lt(0I9mERhtZt2s-Uz>O<cV6x^}5SJJAg&icNP%|XK~RzMU5Xg"
+        "f2sTSs-HGZ@@k;sLQe<r(u=T6^aBPR-5lmgwQB-J!(Nvn&HV%yEaEq*Cc0VC=K45WCk|^pVmxjZHwLDU"
+        "OW;$}Tsg{b81$)wgTSP3p77*ICzO1Ed|d($Nxh)UycD`<qa9!bC)R-2_Qns=3;H$mro^3E76(X=#BJ=l"
+        "@?Xt;QV|&3{j7_cP6Uu_sz6`(5=hxK+C{Sdh4@^Upnv}zTE~cV;E+9GZESdgH$#%=uD6uqV+0u$th_V9"
+        "rri<nDt|T74y2WFQYZ*>N5?SkEhhJ`qiP@7AwKu(FU=B=2WOF+Y;{)J*1KAw9yf>VZo=IBFcC(<=w4xW"
+        "NQMz#H_lt^0o*t^6c>01deXkv=L>p1?)QEb3@YC-mMbbf+(MNP{+9gP#ay}{$pZK!AUB3jkzoxmIaZeu"
+        "DzFIDae?^eU&yGwZmT=+skx4r6=8amn-_p3KPDiAT20}XX~)s%;$OrRRIMEzH@W95Hl_sUs5+G4g5ngQ"
+        "L4A}={yB{muHAN{kN#)(;MMBrFsAfchCOHc4iK$j^sTYOYtj?@vWkSkdnqsguqljr$kl{ur8tiA&AkPK"
+        "yfghY)E9Qrl$`*Y6i79BiBzNAtEOdNT--Ue@p5YP_)~d!%RO%kUCY?rbJ!4@v@jN`BI4V<PIN92NWy9F"
+        "65@$nkR+`)=(7PBSE8%m?tWuL_R|Nw4H;kbsMj`-vS*-s(hIBaG@}jCJ#caqR<BcQaiy6#=vGC?iht@z"
+        "^v^l7zeK}z(DaTUj4cd?S)&}8`m%Af7#@OCE5SY|D;*dwf0OXnR8@Ge@e*{U#_RiW)Wks-4sgQ!k#eF1"
+        "Q?io3wWqrST#5f9T6EYyTP7WZhpv|QSM}m@&}EpMbVxE0F_F&g0UXJ`r<zZzNa+Cf^VToUt_e9q9MuA>"
+        "^S^Dt4A@)s>s2ZY4X1Q!y@}5;@_2lZ>0!y@0#Ut&yicYjcfvsrzCfa$Z-B$;h4I-1`|t2IfU`h(xIHHD"
+        "(2z|`ev7Vnq@!uxWBwvD$jLk!rD1!1DNaQaeoZV@hKVDFbA0H3(;|Ano`QGStOK2JY6+4`g#l~HxCO!)"
+        "v%VV{Lz#ljmjj&ZFeW(oeVRBDq}YjgFMHDCzmN&+HP^{{w&f6EhBDrRyeCnynP1`p%nc$9N(10OKv6ra"
+        "A$Ze~AHwwie~2)Uf}aoN)QLF>C-pP`spbIm{IhA~5*<1_wAwNirtsJgOn;r}R{_*$N_{Ap<Zlm$kg5h@"
+        "{sz@+%&2<Wp=5n9;B?nxauW<X!A%uAmDz&!q@YAlDJ~jhH>wmhi1!}SY)*N7edvg0Dx0v(xBU#O2yc(-"
+        "JYAu-$d>6WEGgxh7n&i>ntEq*Z}QQ>VJMz94>e#AfHP3~=~_xJGIWcHWai$Q=VqwGcfmDjJJ*+ktzt`d"
+        "8oL|vh9Hir3(f^=@H2uX!h^5HsaEgX1#j#4lKUP4h2foKURlgdMH#a|%AvuQb_z3=ZoC^A+7D$-bhEfI"
+        "T1)ZLT>dxsq|`&#jGFERDexmuA-wGDo>gS`zX7ke5Kvlh_<?5Tds*Qn7j;c#=NV<tX4+krQN9fe$;rTS"
+        "*MFGnUB;fF1HjZRo7>G2OE|&aZ?q(E(EVTx+}~GkCR5&Bls{t(`$pPvbc}2KY+LM_hE!27{Rd2F4Z>Iv"
+        "E7fDsn)QNqG~<dVaif1G1=(k-kcUBl{m&XZ+43U_d&bIzVZBF=Cfyo~&9*;IRX8+gR0O{po@c(+0?x+#"
+        "DcO;S)V&yZH*>`W;>?{M>V^$JdQ@(JKV8@d%OU`GpYwPLna<NZ_g~oCcRY>6;F%1`o-&}U&f`dMh=8g8"
+        "XMA_5@yq^~vC@j#^nMsPB)I3f#l61_hjNP$*JOq+2fnFUhXkJ=m@j#^EtSbHtt)V4T{&$n{YNV4xNct0"
+        "wgU=@metOju19kyQebH1ju7*DpLT7Gr*DW|h#~&JaIFN$40io#Eq_=F(VgW*xjwnH0oW#5LoATsLG~Rz"
+        "<~WX@AdUmIJyC72taD;<=;&Q9pN>)TOxK8xU6F<4@3iRJy5K-8!n%0G)$#PcD(PcabB5S|>6*tN9WR9n"
+        "0bymCV^4GzRkOWiEViqTY^6~gA(#}L=8pFQ;4smM9H5~9;Wno;1rKwq=HXN=!`q)^m`KVrQmoL`M;0Yu"
+        "J&E`TWAQZO1d{_z0q{BZP_SI4PO6l$4d4>)wBLmri9F~b{WhpQ0{|Mt>l{Q+f_Qubj|6ENp@X(Pq-$1y"
+        "MkX}6Kw&p%@zqBwCD`{}?UVQBGBhmiJ7U;YKj)f>QZ%Q1M%ME$vvbMI6di0_a+F0BwEI6)P2ttG)Dzfg"
+        "Pb{bhr*s$cwJ#B&N_Asc%zx&kT^V)tw@OK|?*l8aupl$XE*3qts#O#App<ZRwRwszYlTc+5LB)8gw8hw"
+        "sX?f9QNbTw_V#Mdp!*or)jj>r72S1q32iI^{w)c?xzeqoADYHFm*RU_XPU|#_+W4pIkj0m`&er}5MykT"
+        "nL1PN&kD|5ok`Pi1HFAmKO|J%2^}~a<a~B*tmAHGevWco8pfJ@F20gZQkbd))W?#_Q_Ct+KEL?3?kz*s"
+        "XuB7%sebj+=oJNA$pT(Jw~f|u29b0;Vp0T;*-mN*kHmSh)Qh)lSV2+_ldH6%S#?292Xg=Xxrm>u^F!|f"
+        ">g7Ka_lkO9FLxh#ebeQE#+jb7eVzoe;o8h+s-tuLPjV@F+HX=Fr^2;eQFK@qG<IQu@$l4;R!>{Zx{4eF"
+        "{JKg&uKk>b!@pf@*z+*#u2~rR4z1ayir;fivsTzv##*7vQGV2x!pJi_{|ctgaCa2$EzcreU29^$M#y5W"
+        "H0H6Jeb-FAa`wWRTICMtG<{I<(YXOXL(&`gses#Lm2QG_<ArS*1|r~&z{&fYvQ7~1$e`2Ax8vCWG~}P)"
+        ";+T?dio9A(&pH;yuQ3Z;@ZdJN=0<vbnkrJJIOVwpodvLO{7Oe7W601NtGi04Bat*V=+AZ{DGniHhy~PE"
+        "hfLsRoq??EH4~?#8-Erp%=SVKv_ms<yS5IJSEB`@=MTO#3~&-!wu@m3yu-ANP?KID?N+HWC@|Pk$v)I<"
+        "HL^$pHX@Gv3b@?vV?*?iMnuY1+2F?NGHcMj3SB097ilHu<4NWd358)w!xz)7DW(N6_9<TkXC%kM(9gS~"
+        "j}49FrGlo!rr_)`--}mqsk5}l)a-y%pEUcpdp9X?*RW<9_3b+9N5=;?yAioI88-LjAR2--2A!f)R~Ua$"
+        "U;U%A_p%FEsp|$VcCS-6CYMOHV~KPLFX3Y;U?>`V5TH|7H>gRBmr__K&vkzy(xst&a-Sp~+ecO&=+Y2_"
+        "!kkFM3_GoiMCE<vy<I*TW*cK`W>3euuGCml7P2C!aJO7P$+UA7?;n;t2shNWY0iLcl`JRIT&FA`POkz-"
+        "poUKqZBSBeq=BWy7}h)3<aUnEQcf2SXvnPT5|+(b`AN3OAW0Sws-!jgBqpfpnr4sl7PbDq(!}qDP(QPk"
+        "THlfUg7aovQt`aJTj5eL$~rRNZ0>PW9x;0#rL0S<@ZNgsQXye4JnoqQ5F2F@wm=Fc_dI~{C!q9!ih`Xs"
+        "`BM~8M42Sj+<<CEjqpFxA&3Qe!c#(dZbgvQ?vvO#>?Jrh6v?BH7m6vb*TQ85B@3A70F`~wy-s$vJ?|uT"
+        "icr(dS0ff*E9fwme)lhmIfxU(=N`LijCZFx7V<b@=rTn}E&qjMekH3|K)Kt&r|0%*;vAtX#Qqmb?_(a`"
+        "5pCpD5<kYp_306H!<>>U>d&%zzLOtt@_|-~d@VmkhED;P)SL;$YU}xFHdbdCE|;|1AkRuj8y5E0PV_vS"
+        "PJxqMID2@!@me+8K!^T(gdgV2hwO&-jS!I2w|jHPlT%xo7)8+pidsCDC1TS;Ueg(7oPfij-Ao@U>$@wz"
+        "T#TyQ)j|aia7#Ff>`#Sww8VyiFe>cGz@b2NxENO!%;#sx9)Z*0!LgP_*b~9GORjd3RBkRY-p6qn{cm6u"
+        "e${?<%PhJZD+S%mlSo5yFNLlQnTszc$1dv1^DnMNj$^v!1gI8D#W`~L91)Ek+L&(OBp9ge;}xVA-mzX("
+        "BNVKC*0h&(I>FqnRRR&xVR+y=ByvyJIKe8RivD3znUL?2qD9%^B1U#%C7Kao;i5STP8RKN?ac#+89ZNP"
+        "&GiJ8pqgqVlR5J;^^V%#Iz-yK8v9*EIhzDM@r7@)4$l`J+v4=9&ovX6q^M-|1pNSVmaJ$_X{o6>q$dx{"
+        "L>}G3uFHO%;go0QP>qD8abH0Y=F6BSTr+cpq~-$@p0k5wcHIP5@Q@DkE+LL=_0rj=x<KUvAjE_J430W5"
+        "Z>Kyd{6h9&2xk+IcFU{Kd%&n<&-P6$$WecdI35@badpH9m#7uK9UN(lA+_)Z1LDtaOLwI*fUliGJE!8E"
+        "Ez{vu931f3N1$~|<i>U_EgcsTm)=<*Y5zt_CFhf3Abemia*MuX>+raupPMtEP*>n^R)5kd@1N^!dLy>d"
+        "QQgUq0CF7O&_TAAwqGFw&X@Bn?y*^wP@{eA3c~3JbZ9;A|An%{Q?8RKIu#Ctpn99LTD2<ak05>@#wpIe"
+        "GZ86jAd@@;bq+`h>^3KSsXQ-il$MZeO_iVkKRu@ZNbNul8qAyVk0Fv(3w3yEsRu#Fwq)yU0%-V<Kq)Iu"
+        "F*dX#I{b}ME;RFdEsi=DV7VAFj!yGcv-P+5@Kw0HVJybkqfA}+rZZfJ>y{Hq{s<Lyco<|~K(OEg%fq1G"
+        "b7`vFzFT6;LX1)}YV2XluGzDXtds+*8n=m2J-nK(b!3cVLiYg&Oo(a?Ey$2@PVz3F=6dW9r!1f<_Y4%j"
+        ">D8YJm->Uiyf%JkfR9N!9;&63&gIdOtEDJ}ucy|)mBd6raYU6|$PkRs<%^#OkVuBI9=2F-(=NFX>dG#s"
+        "quSWB58Hn&GRkl=vFOA#S4f`#3mYFZfm2Z485n|cIB|v?lU-FCwh&8ydY#Ldr@cusCs+AdU=j+VS?~DJ"
+        "$IoDq+2pS)rwD=VZk@g0aq8z^PDP~ejv_!YGD}RCOx3BuN*j07cG^FbbGsgFa6yo+rssBog1)V+$WNHh"
+        "6^h8WnlDK*iEK&+_R|`ycSacIpy*-X>}L|abQ%^{igciWX2bF`3)|j?{~*sf@ugD-^e6kJw<rNjhPOA_"
+        "f$3#(H#`d6ybh%>)-|8l6?JUAhXn!~cfMqi_i{NPnVdZd0*hD1wkg>OAi5sxUAx$WvJqS0(h|f_*#sW#"
+        "A*LN7){VN+?D5|rqnKAdzKE-hd&2s}W)7~|O}Ns!m)(Gfm?v_{iMt@^nQ*Qgug2mKYHg(AJ7Z4#r-?K-"
+        "{iIF(Ogor9MS~O2zP3P8>1JiP^X2V4gtA+nSb+|r3o4JjNwUN!)lQ&&cd5@JVMuR3wOJOry3Irr+rg*V"
+        "K8wj-l6l1Fk*HmDF2Hn!#|c%6^V7DU8}W$XODl*Hq9X6IpA_czz!JRRLMIa;$_%RZfbMfBShYVV+tPbr"
+        "`9-d{pL$>I_cWCk+lv_z&PCho(CGt)EZZwsUCaEs{$59Pus|Wc3At1&TQ7~k#~ODvIR>zN-Gm}wklIM~"
+        "zIPi$7;iE~vAozonUn%V1u1|lsVE&{toQv2#ZGuY0fK$a?{GeiC~Gt^GmO;j5TlOec04P+<sOJ1>o<ZM"
+        "kHv&@Gh3vUn2v<Kg2Yk6tM!!*`W2R&L}~;gDts9j(*4TBoXp+bY!{R?StFtEE(oV-**Tmnq$`xBM?^Z&"
+        "fQ;<4<rQlD5M4=}<ST|Na*KnE>j60RXUild#!WZyTr-FG<3IBo6_JF_3p$%`#%?x*{goLqF@2milJZ{7"
+        "0s*vRAWQ%b!C=eGqH@}p-zU(N=0PO8ve&V;^KzURh;%XTTrg7_09p)zS!PC0!e1s%?h9%Di2LP0o>ICo"
+        "4+*iTH}Da`K~<rX7**&2jg|!Tuc+1PPqqERwg3Z<Z$P{sg>=2DfJ%iStp-)a5MKH99s1~;bQIYjd7+9E"
+        "1`OW@$p~Ri)mLyufs4x%8uD`wzq9`)T>Dz!n11Wi%+b@(+loNE*3|>x!;O)oPi1?^_{rZ%3$x0j#7sF`"
+        "f<=^4!SJGCC|U|Kpq-fL`HpU;1e$8oC(lWO$MuL?){J(4F$i>^Wsx?F|EYgoz!J0G1+X<k27gavAFdLs"
+        "2pOGjn{ihl?N#8?9K(qD3Lx)>Jom>FT4|@VGXLaXR!yD2ji*Q=%N%_Iid(B>KqF?oML+Jr?25VxIgRh|"
+        "h@0(V3Six!j86xd#vQjf;ASF^aZuvH-M){PIV_&gdf0NzkD?`Ej$HF*+82{8@S_+89%QB#Q)i_VTdxo3"
+        "lKUATBcgHFt_ze5=Br(>eDyS&z5jhgw*9=`V;94D&8WDjL6(#~-1(NkbdvYA7C)__ihH$^(ZgY(=$PkI"
+        "d=CB;(a{^X<HD~LO5E)M^~x&>_>2D@rVXCSs#jB4jb*A0Xb}3oOK4l-4AP?VtxdEA$lu1oEf&!!`jG|q"
+        "oeQWEWkEC-=9GWj4rqjk52%|voK|fvJ(^N|hsnyV)o5m}`0QZq^?1O^t-+yLN$~7{33syVW@`jcSB<l`"
+        "$WjhS1Uevt`K`>9ym#!YRlXn@l}H%>wB=Voo{B*j8t?$b+xSRYOjx9~%j~Lz)_2$kFQy<!4szdb1xlU("
+        "1AvDq^_t085P9?5kw{`Pn`au&Kl!MBp6YkMxs%~yDd2S^3+r~6$GB)}KCow9DxK_#W=GH<k%w89@stvd"
+        ";>5f<3wqVDZ*b!1DEH}$`69gqcm}Q|Lb7T^eX6oPX?Yi^QwPS;zmv`{r*@;VGgg+|C=fi9ZY46805ydE"
+        "_nVugq=haQ^tkvCpp@2-tG{yxA$pWinelAqQEw(GD!a1mYr>4q8NvUDicki8v-a&Orkuh}QeGQ4J}tDh"
+        "W3a|MxPz~u)e)t2qcCDf0Ne5Mz**oMX~T@`hcZ9O7JEpU9;=H?=NB9w%5+Q}Z50W@*}yTsz6m$uZ>gRx"
+        "KktC54RvR3I^a9xn>?aVF%{pUW>t`HLD9bYm)^`|7d)yv4m1Vtfs2!^+0<6Yj3jUC$N%qoeFb#oOiA?L"
+        "LZ>1+K8B$xbh!>s=ot2%Q!`raUNlM(sLD*;h=~?T`HoIQt-6$SZHlX%XV9|+V~ovmBA%M+&42DQ^e^~m"
+        ">&j&v5KZ=viOzK#R?ik=B?9_u%PMw4r#1)Lg&T&1_}errCe+u#-tn_aJ4Bay1z+ANbq8S^7XAu$Ecufh"
+        "sRf^>CefpSGZn{Zs=!+B@BA2hVT#^YBBgV9`56T+ed>UM0D{C)+ma&p;@h%|^5Yq&KqjrHCgmMZ+-!^l"
+        "&aF3ji?=clM(^C0C-q7W>fIx`KAm)(sDEl<cD<eE&N#77lN`fl5mKvvS2gDoJrC7xo#n0om$m=UcToCd"
+        "iGu0$4a^S3mpWP8n<W#}DCm+7bw;a~4B*|wIOI3NRO@l-j_i#EZBlRCOJV}85kW32Hp2eSXyD=5rqS>h"
+        "W#(hiRE9b)qfgd}>1VmB1SYPq@Ko0jDqRACE&|fkxA1X8!Pu<FEF;fg=mm;lKa84BZ*O-UyGIwfY3e`e"
+        "ta9l{m~<}lhv~!?Qk#jvgKUT1yRyWYc$M(wC$_Y^huASWchTTPL@HQxGhffRk^CM*ooYmhLe|@{<l@2U"
+        "6PX8}7Uz}F7GHZ4LzHnw1(4-mqBrrE=(%4O;1Z%s7pTuGxxzNU?oI|EevQi^RAIFnUL9wS-{Pj_+q~K="
+        "H3LfzDN>=589ou3SzS)vNN5$17|9pQk7KwyC>gxpvPpMotM+QJkz-}S&%N|~RX-3AeDfBcav%H1J8=Tx"
+        "j<*u#R>A5TsnNePDRw^v+)$V98Z&<ApKpXGCro#At1e=LT$v*fU;}+-rwvw_MK=Tx@wgge1DO1OGHRpH"
+        "Z63%_(omi-LhtOh&NuG|@hgCOnQv$-@YXZu!68|9E%FBBm__nP>jo>{k_PV)j*|!04usniWhP`k>4IC1"
+        "7#pJ#>?8nUFXCS|m8Cr8&I~{-$KU25<@Qw(UDaZvU7tbxenxXIwIQ{PlIZ98lq#>@tB-5i4MGe-hHMbR"
+        "n^%If&<wiy2kF|t7^-jE!2AjWZoW2&VfE%9gAnJmafZ!wh82gqxTFL49<o?jjF?|HU2+mzZe14=Y9vUV"
+        "S$*`}OphtIi1ua$OrZq6|6_do++WIjfwzNB5F&t0E1GVPNYv|F+b(NBXsSX+>%N(6v5kypq^xOg{)gQ+"
+        "b1hwpM%X!jL06n>P(p?i<TMW6WW5J>)~y(jiwOa#pr2e>6y~G0`pfzy<{7{701BZ1Ck#EfgnLhyQS=zt"
+        "I_=_j!3`4OY5*dn>!{pUo&2GlJ$WIEe=wRs8f5{IGki8qO18Cg*c4Zq*Uq}Mvzhs!>Vqzbpi<Q@0KTcE"
+        "5Xhj*&$N7gpA7Q6SIeb6bcXo)RC5imnu?$XPOe`;CAn4m&Xd_UO!kYPi(Q(vb+W7Hr41-zS?cO-!_Sr)"
+        "k?s7fz`t)F^>hRZ6I<8%;JkAK5<^Fm#lHBc_qQLq<?ju#*h<K^(Aw9kwh&^=9DTCF1Qc>{nyW^{JS6HX"
+        "Nu+@5^mh)>_(>q?g9eF36(97QaGZqBAD1I!LykMXPejK26)HX@R@p#|{S0b!hQ7AlskOs7w9EN3uMFzm"
+        ";0x-#YKHw0`q(KqM>P79{5nytxCRdFfD+nDU`RX-Vd=`EP_+aGZJ9sLi&p!-gq^*#_SS_cIcBrHd~w}~"
+        "oj%k>II(rVaO{CpF%R<ZpE5%-9a>PS(`mP8qssA$->a4dar;jK43R8CM)3YuP-n1W8p$EtcL84_H`DqW"
+        "+zf0&;;9%hCq2Adnq<0@Cwtq~kgobo`M=bT{1|w7As@-ip#lgw(nY{YawTB%qxfQ={k)$X?1@xnk<=bT"
+        "HI?x^_d(9ahn{E#(*GHl1b(7vqGn5?wgTq&36x5SXAh5QJ;g6{&bT&i;{H}HV1AR8l^&QeR4VM_Ux;gO"
+        "?rx(|Cn_w-F==t%2MY)gJw{@(zQ+L3ig4adLmz*W9DT!gmWlA{eV&fT5q#~Txf|MX!-sqmB#Ccwni@24"
+        "$0_-oaF|w9V;Q1@|M*Z?6s~xv=#|5M)~-3#@=dI8)<PVkkYi_UqWhY(>z|vB;or}CcWt1l!L}A6`Mels"
+        "CQeFeP1~E(udepgE@UWq<-*zIir;J^WZG0wKge^)?0IB>Mh(ixRr;7=z*7UUe%+4Z%?E2{N&R?Yalf6V"
+        "L$;ehaifM<$EoT?AMMK2&nIP}5);F&suh$YP;;w*$g}VMs7zHN<N%GsI7Y0E@K?yB--pFyHnhISQ2%Aw"
+        "FFlrM9(ohca)f^Fs+8_b1;A}?Uh~F}ug;K^gl2LWev!xmy?_@$dx|_hm8yqlaGZPv<`#)Xh@knOblP~t"
+        "@8%R-pjKSf4+WPt)<FnT7U~{i(6I}P$DMMI2H0$|lEe2W7RALOU#9Q$afWk)Lvf+DwO(;T$fFUR>LY4K"
+        "?IG@VYq?woBa39O5nSdf%0*RjB&h3)brgx9BVfSWhaB&B4@d)V_xE+AHbOpBa00zxq)kOe=CICoClO%|"
+        "KuVExI~H?u@kYXT-qHHR6&#3CPLOfYn+;DR@nvtvs&-ZEVA{FA-Jomb$d;ro#mfe1T2ZcTvB%u!oN(@>"
+        "=GJ)Ulb{?fRm$UXd+)8n5VXo7$BR!Jwb;7IRPyCAf}drd-On8cew{V=?_$fyh7H^5*>1;$@n9P{R`UXE"
+        "PS=U<P#dX@EwQ||TpVw|gC}Qq)wwyOrcB}6uMMkhIYz0zxa-znjUz4t6@rHzf|%b@l&Wk5qydbKm%#sl"
+        "A?mu^0l|z(_`BgIM-~@2J9xNU8@#*I@0}=xB;nFD6?eQ3g{8_zLJ?s&0SG7hcGTQ>QMt5*Ci$RJzV7dm"
+        "BCW5c%(WNZ3s9nL39*zo{wLfRw8x4zJ_p2pXHteu?%F^wpfTyD+iF&lO^$Tx|Axmz-?D1b*0}4p8l|(#"
+        "CQj;7<Jw-t4+ceLTMhG(wO$ObBocHrltB_8RI#Yk`W>M@e42<`Fo;a1lAoJoVZ;$AFrlrR8;Gstm#1^@"
+        "J;3|Zz>ghC)EZ92z_+pst^y5finD_tMs|f<8^9o+UJSqDk4n8{$>-UXkn1(7=-9=xD?nw}K~zoFyypzZ"
+        "xsrKDKQDmoXLNQdN0;@kD+TZ#g@z9$v;iKUN5HHQYY)vT05Dt_!n`kl&cDJ_PzEs8?YvnIgOMu#sQFkl"
+        "%j0I*Ys^Jo6#lLxxs^;0QXBqsEW2@gOFQvSoZw8r7oq`9f~>!;40`Dd+Ne%SweCGU=odhraD*7}k^FHe"
+        "GjR0Y8DGb)6oIVS?yE#&cI54J?DJ_pQ*#WUvAk?pAHsk{OC}=LOOu5}dLuZ5Z!I~|Vu>F~?*)||rF=xI"
+        "3_*4EQS?Ok<X(a#N;N`PabA|Yv9Y1*Xo;Ky0AG|D6?@>%S*p}ZfEI<}oOhDLjnRut)GxC4LWe?jkmoJl"
+        "kfXz=lxMX1jgdoY2BS=2QR#N+jEGRN<4q*vnJw|-5rOZ7)veYm8;ioa<6>;iY~n)#tohxwDHCK9&(0J^"
+        "kw<PwQgWXhW9VQOc6e8wci4)PV>#wVYQhHzZq$8V3=_X+NNP=)UvblGl8q|#Zn7ma+<1e~7%75_ZVN3b"
+        "Y97ssqWC~aBy)?GB;fBPS#pLacw5NGDUCKM>!pnG_{e<|DII4F2Y-$T<_Vtcb#DobkdWazL@KJaNS#NQ"
+        "aE=OQa`{!&gBR-u=I*_bO&rPllveEghIpAl%jiHS={3p04l-G^DkzJ)tXI5wLAvF6le{wLfX)PdqN?Y>"
+        "MoSII5~yse(b1z48$12t5XKSvqB^C!-n$3tB*nt&TBWub{Q=`)q>0W=#M<>6T)(aKyUInMSGh?+Ta(|S"
+        "TC1|>qmLrtY4E~#>{gFSY7v_~d!p3aR#8Xdq<moN0g)pepHz$Eyd(SG+!i;K^V;X_y=cqu9%GjX(b&5i"
+        ")xNU#$QS)GLW5HALKWieIHhVhVJOO+q)`6ExAWp%3@NEkgctb0vk)LGZ%_Fpyi*;8#KcE;oki~goIhBB"
+        "p?x)OqjYD05C8lGrA6d!p#(xL+H)OwwPUY|p=RK{n;-fXed!h5{udSjDl^4X2`C_=9N7-5&}aq%Vfp>2"
+        ")EHx;+FJ~3tCi~Z6*4x3O9MOIhrV8`HW+sqww1)6%#rqKW+jFA`Xo(-0{`q}fzpE<+|!ewLoZH-1Q~={"
+        "cE<z~<$yk+e&Yom`o_@g*3BuQ&$?I<8Mw@`$;&CmLw_GqAY)5zJ40<Xb|2+W@j5c#p}gsW?R4X6OFyWa"
+        "bLptpR@%MvM-UH`?e8&h4S(h9GkbARIDYo|AHRpjAp2bolE?xfHDBX}To0?8=}iKXnHNbstOY*9{i}Kg"
+        "uSRjB=l7WfR*t<kv`p83*Ow_2h~WA|SNAag+bML1&PONU#dyCzAeHMP>g~etB)v<&{_#jD@=^Kl!%x5C"
+        "W<FM-3o`p3;e*vE&0du9u<Wab`{5ndmUa-39<XW2yIQ*8s{5D&AVh=Clg7eg@_Y;QHGWI%pN;mRm{5;}"
+        "js=%MN5cm&8_>*C5MunKxDRgE18gO8DUpY;oJV|REKt6Moa(uV=8C3YyQ=b?-T_*Hs4#6>!s>F>Y(Sek"
+        "RoN-r-dfC*$`db&7%FUO16#j25Un)^^lREW(JWr_p4{@16EcWfJgB8_F?a$d#a-;K2yF}=t!*@=15rM$"
+        "Alqi{KXFSvl}tz*(+ty=#}J;53`QXyA<@Mgi0ksYfk*3Ty-kW;HWjMm+OlGEeF)jrm#0V)nvblf!liLq"
+        "I~z8!?iBiKR!hNRb43h^;JbFiYT>&lW*jAHN<3bnU*ks%WgNDp($XW?5ZRmgx9XNK&{Czu-{kZBQ}j#Y"
+        "4-!sbf~ABl6p?%jHu3<>Q%2R9hkIctTDKN{<<6GOPZMQPMu!`*FbFmj4SjEprC<?7-DPc;$pdW|fDJC7"
+        "$$5R@W6kIHx8F;GtW4^7oK);lKmaC>$K%p%Ze%-UZ&MV~QPTJpHHqlT-wlW&^S?#7oZ-<k3xvl@=%*o!"
+        "#v+O>WHr4A5@36{dJ_R~=pH6g;d(-2%{-5!b@OS*D(2UH%yc!{H~W+lLpBE)$v(_&6EA>+F*1WftkTzm"
+        "q2puSyO2i7<h2rdBlHl>ISpk%$Yg%PwTy0RWMXw<Biyk&7nNYT65A7+whcYEViazM`-Cwb=Jk3Q$_|2k"
+        ";Wns0gsFqwDR)_cSyLkF$FjHz`ZCo0c@8WpbF}J+6UWCrz8Afy=6Q#4KmpYu{f=|H3p>kdvUT{0Er&;b"
+        "#k!9RIRCQ~l)C?1^P0{}RNAfD><k3iUU0<#Z+Dxw=W*KmO@l2Hu2XMWqLx=YacBZu2=I@<h)XV-Z-=27"
+        ">|pp6z}@lL+KPj+>pp;h&fO&AO{;Tww9P?><^F`feaqT56AGZsB!OEKe2$4h2HU+UDOUA|ad*cnE-8m*"
+        "!Ag3U!K{!^0YM`6D|K|J$=tAY>&*TRTFef2`O#J`jg3o%oJ1FN&->O;ru;xGTckIHL96nZvha34OO)J|"
+        "g=v(nhE_vq<irlAhaL@RO_46@W%IgY;I?N=M{6F`&0(eIn%MVO^pXn5i+_WcqGU_ed~UkfciuotObq9`"
+        "Ga;}i-D^JD45H9#$o~xP@xnxdPUU=Jse#e4N>lXsGy+>VC>xSGgUo`Ii&gDb-Y?1e#2tKV25+x^t1szL"
+        ">^amT(-|)DYm8doVv2WQYHiz!%AM*3_)uyHBKGd_ktYP;0c#4l9F%HCfs1g79XdhE*|s0E`V8XnMWJ5X"
+        "uVZ;WGBUonYD`VrJScPlE+5=+QQF*%zpk>i>+J7n0TKT36Cpd|q(ujBfRf#qlTto-b!Yn~yoFP9Gq~B1"
+        ")GloAb7K2hO<8SvTn^px;)Rv<OG&T7XbG$W;HL>;?lWr3^#B>|);5?fEhjzW@6+2c!en6LlrXlGas=$>"
+        "Q8$HIY8ed|Fi2C(SyESOEU5oqds_<8Rg@p}VLby6fiZ<a>8!_Z_}0><AM;wCf0Q5tC5_9Sm@G@JPl(C2"
+        "dq@%_k}z9uUaO!U#|<u3pC9a$2GTa=@!VWM!(Y1hoH#J}0#gs2=8&F+ua!w(u7=<mnj4ME1|Mh!Eg1u5"
+        "EdFf`WKT#)oE(ejhNvzVWcCv!Ko9iTWGNzli7CLnHX$_}&Ir`It^7b59TAYg3XMXUl9@uGH+Z$p=$Ayu"
+        "6&<2X^WkPlmU1b2H$zz&dyYA)-=SNwy2N^Nrr{3Af$8Rb?7uBk+wmiXwwqlmlGPV!h3$g8`Xq?%EPo9y"
+        "ubO%2wNr4){ONyK#aW@kVFUl}JU2*O@XJ$SMqan?1rANqwRvdG7n*LmcHQ5zd!svY^}A>9cFZ|X8|BTZ"
+        "6rFMp3+)k0nQ*J+nCUSSNv~mDP2}!8qKC3eqx0)+<2*DYykr1!DY+R|rXon}|4P{WMjC@NJar(#2-R1a"
+        "vhp}5TqPVY&g#Qg+x6{Nt7*)W<1op9$h0Qi{M!)oQ{&R*TT|Qf=6vR03f->25>K@F<qSo-1j}f9vo?yh"
+        "K_`h`3O}I;3vkyj0W4^idqYX_O<dugbwY(x+&bS3LfTW0g?0hIMK#>;KD4*F6!`kAAZsTTU#lhtV|Ma5"
+        "{_D@MING?P;~bAQrJ=PcvRWhgOrv-zWRB2<`Dk9*9~zzBW*3}@xl-z_k(GJ|yg4OsJOUSJGH?*~@aM;m"
+        "=~#9R2s^8a(T_0ke@2D)eaR(qnFBpqzZGm9Wmdt<?*oX0xy&B~TEY{~+p~-QULq>|E)we;<TZ6?ve}FO"
+        "&ad4{vb}Gmel}5yr+_$~HrN}9KseQl^9Tj{ST2hNo>GUTJK9dq%SvZiiX2oOIDsy32YzrSUocts`c757"
+        "XX)C=);%KUXORI~qQP_Vv*X@`Cu7?~VmBo^A1aDog8lX!g4w0_hq;z|n8>O`opp(z)SJ)$HZl|r7ra(r"
+        "E_WAPs_-l8b0eK1erL-#`V7HMRl_D96VWI_2+N$&Co&8t?3T0Cu~X%I@&HzVd=(BCwZ&STNQh*>%8FK5"
+        "N^Z3GH|#VH%kqGj-K~c`-%dK*M5$2KFyIxt$+<LbOF<hWqY|q2Nj75v@6?Yj9Ri4vj-wqjVF&U%X2Ko&"
+        "1v_}GZuWK`KPz}BgVgdiCDkN$46kLbjKkL(9o)caTXjEV4RaP$g$RNt?9fBFpq6)42neaudlAoXXuHDd"
+        "xV1F9K4=Q~?lEpjcNd2*WS2+;BpWR!SLBDhd8<M@RG}s`ZtDA9`XrEb>0UHIOq2yOnmlLdR7Ez?MOfcE"
+        "M4(I^HdfQqj`?S)cwpG;j5*Wsmo5JI={MXR$rWN{r~0caJ9C2l!{_3}xZMJU@+?E*D1q>>rN!t|Ue!7Q"
+        "4b@<_?(eBPJ{K&{BNoG(aw9!Wz+xhs1>`;@6N6<eOfho7#Is8e7sv?}^DS#HXhXEzhyJew$TJ+`?`(`E"
+        "fq}HLKc6cHgB!yyUcdjf_y&^#t#c<{Zj`=+bC3(I#kCyvK197``g-8}ljQMBxOn+Ngf2{E)_z`7lpKz{"
+        "c2X58ALJo5#)rufLKjsLp*1s<{a6aLpK+7!?{L-ni8asxw~{M%9>PB+cx)hF4Y@W?8RVWZwd3;vz?K~y"
+        "yVbG+^%CZTN8x+eJw=ypp^oeHap?|`0`^&LIx#EvEh`fNVi%?pb)%P3qzTMnw}B%iq9=nT(p2$3*krOJ"
+        "O(qG!G2)TJg-ozSTqz6*+?`e>&vY!uGvR%UbWb5pvFQ9Q@<267do+r6Rt^fvfLt=s>&o#N01Nt#li?_b"
+        "Xy^~(KuS{3iFlU_m7?pOEaSXzdVU7FTNLyoME=uCzx0FY=Vpnh8qVzyCMz(|Ub&lADS$3lz}$pt>-t(Q"
+        "<vNCC<`+fHyj|&orm@7;y^!{ERy-8{<7@tHk0kNkVeR4m;XyoPbq3~_<+%o=1QuR-<Xz^_S5uF~MSZy+"
+        "-RU2ei^nG`w&G+}sogl8JQ1}*kLt=`$g?Cq%8&K@i*n;zOnLoJL>v?wJLsGwa1`ZM7=lxQceMBk?{LzA"
+        "Svys;dA*cirM!$#F_is<{*Qvv6!J`lpC*3^=VU0&1C7-v=i8e;QIRVmtMsFFwW*GM!^{@s@M$yAj%837"
+        "c)kzGWtx&{Y#K&+Ru-imh~JV?nfQ@MT&9J!%x=YqYsX4B5#prIc$o!ruDh~S7(2+><d!%%RE8|^O!p|<"
+        "(N%H3;~Ymx^%M$><x>Et^)XjeqDU^i7D{SD1?K;h7!v*7RdF+4(t${}?k#?Vd+3}?Tst!yYKAYBRrQCb"
+        "M{7)mT$;=U4=Pw^I2y9dDyu{@`|>?~f^(=Rfa12%$ohpd)asJeBnGA$z;Hy!7PJ#}6n)6^$C*=(k!~?0"
+        "tXg#sq;0A*%VnWvnC`0Jw@o-7hHc`Gwc(Hq{7t1Su~229h&&qHjmxv!$XE!1;!#<k5Bpa5hkV*uQQ_@_"
+        "%(x^WS*_V1&!pq0cOneS8HTKW2s0<uS>J}J(&K#1QH}hW&^%%1u}&omWejNE2`wM%#g`2iSE1ffx1rF>"
+        "sfqoQ)s%$+oMkkz>g7P;pYu(gl5H7UR3fQ(IV8Olb*iQqFeCw;^yrx&cc{qGfOlTDl}DPg0<OE#(LU8;"
+        "d7$mC;@oZ4+|DUj93ENbU*MReZ^>$k2W7Eai+OIqm-C+V(xTh>u-T6pV~)utBgFrz<T1J+a&16N800b_"
+        "e}_+mDqmS|ArnDy;t96A^?Y5Y%$zdfEM}r^CzHXnsCMSdLb<fkl>m)ov6ly=7;oGiKz@fvwhb2micY&W"
+        "tJKSZ0J&tj++oPVsPI<PoHbPpfMABRl&MrZTaN-uAfbCKJUwHf@ym^E_f}}bfy~n}dB{{PO>$5_Ym31`"
+        "bhLq|6l$^<1q1T%eQVT!!v*W142gXM+^*&w2p9o}83?7d7>&7_Ws*Ni__b5&Y}mA?qtpJWzgvs4yr~?o"
+        "b(X9`n7kmf-bt_ZCt#hBakQAVxmwzaHY*Lx>ay$(6DE_W`AC&wIxKkR<C!I~9B*IMPj_TE7}u{adYTnb"
+        "hPWjm?!y6?js379dI)XCQAzFon-Qb6OBu(ax|N{y0>pCv<O}=Qk4!DQ+c9dN^|14fE*0Q!R2^{Am|GP$"
+        "5sNpgX}SzK6_;2b@V4LLG*3wctxk1?RZP0j;8A!>=N8L``wobMY?rLsXZ!4Yr0Db6Aaw9o<vwTWgGHA*"
+        "nGeSGTm~qbfjU`y`P99E$>RE>B6S~Lnx+eTOs?<S27^xTlAXU<O)jWsqgi%VS0+W>ks-ZttSHJi*RFUb"
+        "=npxAFoEQ4w*sweljm=j1@Jzo?{2V8f~A%^B3J}-INU#yGzVqTyjv=7Jyb6D70w^tSTn>RVsZ*<=CTL;"
+        "nDfehg)Qv3Qz4glnDSgi{PdjQWYyWhiE;FVtV7^_7(Fw8_bacLBs<82HJpRMz!r&UVr|v<wAI_}++2gg"
+        "PF3~o1m9>`WquhkOpf79Ey^2ZK1;i>{bo}>aHiQDFvFqhiG+z6N>GqQ;!(#{BCB9?dZ1MaWA7!c>#DUB"
+        "6yTEc$ADanlbc#pciKM-v%LTj6wY;Dp|DYVf$Xz1!@$0S)j_xw5g=_sxO_rLT>LC_fw8zd7>jPlnqa6="
+        "H%X~uBTxb@B))73LR0i_giZGAD{w5igFAha5b`jHnCYq9E|!Vx)oBy((cgnDP=dUykC&W;r-oTxENA-f"
+        "_Tc6ojL%mqA*h%V0^gb3L&U^{Q!rXM{t8~jbX>*Yi5ngk!zZXS+c3p3b&k93+vVcJ>PmsI%)+YUmOLOP"
+        "p|>Y39hEOLE=F_b9ZjTEUSMorhXipsHHINgr9c;TV<d&T^D9Mvvrrr*v|)+Od{ue(OW9iV$lEpg%gP+S"
+        "v%`4~Ra-V2qzw<}`uAJ4t0^65)sf8mcRZ5qb-ec$=fN|}53iKa5y<6(Zx4r@cjInPK{Z~bBibc_J!HFH"
+        "8FQpfbOQE+A<a{(QjG%j`8FOdPH4BI=W#m3$3B)6urz#2M9!v<CeEA?jZf#<uA&#yZ_fDv_TqM4%B>e`"
+        "fnZC;%S;ndhC-WLX>H(Ephp#~Y+{oU(ic4gz1OFf!pruoDnaihF0g)@P8kdR#PtjDdl-xgo48Wh45weL"
+        "t#97uau=foUrDphlnHQGZBh6G`cRq9h^_a^bQe;urd<H4?f+orqK*vd9?iCt2TsKV0u%uwWV}cm<d_Q~"
+        "NSuPMrV)^E>QIH7(DG6cHCB1N-3?aPW(i2ZaJ5hjz?;}7RDFkRq_uP_li*NSh395nrNIUlUcfhXJu3v?"
+        "k-w{sh2OUvEwC&uZ1!o2URx3)F^O#Omwhl8rWt1Lo)1(^7>{fm{4ozGI+}N&@I7@)Sr0QV1_0DinJD$6"
+        "SF2RZWf8ke$iI~4@TRxXVMe}*h)bSzBZe&u+enXNe#u$kk^cPp{Xgu@m^Dd?@QR3tWK~`3QmaIoAJ4M&"
+        "v6{H`kg%H+r%Rca$!{Z4^hT)GWpv!HPWq(|*e#*x#w~T~lj4W=&$`uNdiYl;pi2Or;b+?5HSzlS#^;RH"
+        "1Qj7&8l97P2w<e;vzG;Ljvb-Lb&l2~FssOAmAUq%H+sCzg|hcYlTd>n+~LG1OhR?fS6Pud7DrFCrIbRL"
+        "RS~Xdd+=0@B^%?@J;o;z+;d3b9v!^59H1TJb&@Ts*f^TPu?wkr_njC7f|3b4nwQN=W};y8E%~GmVVd~W"
+        "OyNK&{AgTkJqG-C!6c1y@lR@-Fs9`GB@-&vmjJn6ChVubh<b&M^GsY>-x^R;Un5RouWW-{chz8HuZBDZ"
+        "zj?;?9n&CW({d|lclk<vNHRZ?mx5KLQ(p9z;8!wlk$}%^_B#WWIcw56{z-<HNk<UxwHh>?(G{E9?$;_F"
+        "#UHe;DT6(^Mm5A!1N&%7ULe5X3EY>fbK`_ZKXOZB@K;-S@z0Z$_@VZuhB4Zn5X3H%YSdUQ4M81F)m&sD"
+        "_e+&|Yh&f$t9?1%2cEo9X?5u_g;??bqn6<-@0k7Nz?Fog;R<7I;$;#0LI&O`YeDNI#(DS!+y($pFx(@3"
+        "&>nkmrGl-6@*;V#n`?pm%dCIGo`KEDd41784sdG%(!oRW(i{f}`F${8$ez2s<z4f*q}j({yL}rWv`|>r"
+        "JlNIWj&68MqLz=2ZGUmg5X9GSlcmqM^-FgdLJ0BS%I;9^)&84S&<-VIQojatfV1-RV(HX@d=im36)xKW"
+        "QUDfj2&L2*1oboGF;;ID4d}H$Jh?bct`3r1+p(CLsg>kq!9rOK_b+4#dFL{4p|-@oEmuB>ZL^E*clg9;"
+        "@oS*v=o1Z6LFgL}*!0m&rPhZGP9T<#iyczU_E^Y7%2}_UiJktJ=qc^~awVB5VXaR1#{l)EwICZ|wb5~U"
+        "F%y++fv&PRdeA(MW9KP~AKfApJ$n;Jf;ObLYH3R$1Huv0zsE_pm!=%cPf_La#QjE1GH*XghBrzXdmKR+"
+        "`r{S_ERawyK`GKva+IECFQzbG=!ID|RGYvq+5;j^1`@&DaPp-}m7P?=C4q<y4=#=H>2PAAOrjdqCmbB("
+        "b%i|Y{66?t3+cxsqo3){v!J82;NcV(mE}e&wmug6f$Z1|*x*<)f_BdDPmVegif^1b@OIF04)w^D+QYak"
+        "O~smv5iRYPUVZQ5mbsT~WQ~<i*WRwYr&7n0ook$kOm1x;N|b2Uy7g}jQ-qT9PtSqF8U%*sy|t}^-`Y=a"
+        "`z3vt=WfWbIRD3RapMhkPi&SCw0$%6CRV(CiKKfmS*5aAy@g6T<U#vYA3~1(n>TMv*~yJUXO~yEAt#d$"
+        "D$Jr`?0qx#t)~Kavmz-sdwYbqfE=BX3HIrKVo~INcizy%sHxUnZao;FPBhDJ8XmlPp(_~i9N?ur>Sf$Y"
+        "9e0VL6y6{_9B%f^NOZB{NC-**p3}*74>_Di_<_8ewL7aO=zJ9Sov0PD;IlPA%c7OhCbcW<Nm885YzbaF"
+        "_=o#M(I{v{=~#X|tQ8A<HI#VuKy42<G*&XihCKNhXNYxOLYV#VlA<AJJ&~h5k%&A1>*4UWd#6N)4VjR-"
+        "B<f9}vBCrme4t0xzo|~9O?B3-_Q0p}8Qvg9sZ(~9@MW7uR}77Kd`=qwerZyy#ELgwobo1%jsXz8u$VG_"
+        "1LJ>eTAy&AFW_HeLnYJh<@l)0K%=0pe+gn<sR%c$=jiGx$+<He@BluGy!2{3|Mb~Y)hC(?#gkD1a-cz("
+        "mWyLh^M0w!!3#P<@sy%n`6N`N_J&;84{sqqktr_ygbFwn19J?DyPljmsF32I@|41yP>tQV%?GCyU}5al"
+        "eSo~lH{ZX50~n=yo!txvFkiLf9)=?z{y1!;z}4f8BHJ5XXkblNy#<)RQ>(xYhhw4VouC4i5%?a=o+bn{"
+        "4lqf4o8Z`td+)#n6M0fC`RRnr*v%)yYy2~$o|jSv*u?z;K`MNU0uLue?(^UgXc&!!2Dqz>-%*`=3R2x9"
+        "pBuI4OU9(LW;)r7j^ZG@qyY45XP}A3)qny+w9tHN{>8-rKkXyt|2vTu)2yJo6kPkZ+f&+~aRJ{OPHR6y"
+        "7;dOi|78EF!JqYWCr4QzrZ~V!#guVm*35#m-hOSsN%0|<s5e#@wkHTLJGzs0C3*;IGv)TTwG<N>D6@=E"
+        "3b1&gbyI>y{HpSM)GTUq8rdih=_^s79sDWj>WYEfSaGXRYP1y6La;NZ;?044QszI=!K-qx#Zz4_m*QOo"
+        "nC}f?M0xHT`S!-JsM(U&98nRHm;+AevBM5M(c}(ctu8dakX6ES`8s9J`}To;SE0k#R@kBmKT%8LdqIAy"
+        "Wd2=EK=F4W@Uqu0D1uiM+AKbu1AJIq|B#<b?xG`fQ%x)~8UzJ&dX<MJvQ-;5!HAeO>hz^5Ta=(*yLo%l"
+        "Sz7<hbAelXSXm9gyAJ6dn1d)gbnFtu$tq5?&K8EXUlYS_o&tW8&|L#t(M#pyEE42Jp<+E<11d}hz4)MG"
+        "E{k1b@94=dL|V#FPu@$U2%tnan?l+f=_x1A*=X<PROW+zAxtKD>apKHno2rk`60r?KK#Q4R)o?nNo#5v"
+        "E$w$|b9XA6eCv<h9dL5108R8<_V71UW>6{7AmdVlE!1Z6y=J@X#E3)8y+d+lVIyeqe~WW;z?hmA3;ku3"
+        "f3`C3*innN!(G=!Vzn$IBg)0xr-#ER{zn9p+k)ria^OH18{<3!1}S^2k3AeB(-!sPd14lU9kfCc0S5?C"
+        "oXL*jr0bF(UL#qx?ua^HOH1b!wJH`Dh;_t)1Oo!J`Bjkq8G5I{o<I6<fkpB{Dg#^3b4vAUm;C<Gp>H5t"
+        "D^q_fL?fA<T!DMysbQD(f`odZ1?P|J#SE>Ykj_w0!G%|(o*tHsJ{?3kMzw^Pw^k~4PeIi%W}m&N#eY*j"
+        "U}j=mgJDN?rc9K)HkDo96I8b_{T8od$`bkWu<0O-wfdvnI{VE^JJmlccnz6$qp;g$7T``p0J+T(GP-%9"
+        "(^(Rg+=IT`;=rAk@ytm+TdzpsJ3eiDR?X)TU0PslW*HaY9Gfq#(Myf(Dv9|U6NLbubB#_FOAqZzT?&=m"
+        "#>y3zgs-bQ%wA!?LtNV59ER%}O%LYLRQ6_3Rjx3iX~_g6+&L;kBL)V8;1xm7LjOzY0`hEXdTY##1uJv8"
+        "UoN&$wKi3Lm2l0cSI`O9>AK1wIb`@g+RcltxTmrIpOJtw65LU=2dakB^u~6RAVwQz6b_k7I*AYO5OB#z"
+        "U{h;o<VFZiUb9EY+q9a@R8=u`P8cKpo=4W{Y*R5@0Dnz9a*)zk{#}BIZK=o+nurHNGv+IpM){l_zS)Aw"
+        "N8BHS(bzbQH(GO;Drt&!v2r%>3O@hdIIO^|{D@Hw4$+ZhlqN=pvjm32B0D0G4~zJc*m_!Fo-&(D#!#mV"
+        "6t5io%E9ZP6SFLWsbcEFCc#_U2_0~BV4=W+qkR$?fSb++w==479hOi_=i5l9>np4RRKfAZB+oOEr~r$z"
+        "A~l6W5FjG$PIOc7fZ^%7NYNq(^Bk<z_=CvewaJwEGfVRKhA{s;q}mJ&4@zQ1JY!_-H|o(eT8tS|Tv1<9"
+        "A+f-bQ=I40^%;_xkIDRu_a#B1Tlm}jWyvD~h=~i8G(1sT=VyV&q@_&(0ba#yoH{?8X3P5vMq8N)Sia<2"
+        "7Q0y*4oBJooB-(bnwOsg7*cWS!YR0e4&SOJkU({>q=MY3-GwY^!H_{3)d)*=heO?8hTV6<wVu~+K<Req"
+        "c>N#nz3W*zO@pXmIcK9W-+i1&Q7>^7vdgS=Z5_iF2(xuUTZLH(Rn|oinI)YD3EHD?nFOmI(!zldrMHqr"
+        "0G1KufHYI8e{#Xv&i*CZb#aA$&ICctoyXZ?=#2Db9aoCCypnZJ=7k@Zpc1{?L`ZRjb5>#&`{cWg1vgG0"
+        "8E&`@8{6qQg7N20tt<KZZ$-L+P@*fXdZMkaHDe^Pd^)-p#9Q-<a62OqRsSaStR*?2UUFlcXcF?cF}_n;"
+        "v`j+tB+;EsO~GwpaCqL}8x5HGLFQgEZ(tD+P=UnuxD?cMwwAhH>GpSiH!2+<#fviiO+$OQ$6<Bw0|s;!"
+        "SgaXKb2r=JHm$#tTa`I0jxu;h^?oMmW<=v&9<n-m8CJ6*oanqJC^4f}a@2<_w7Ki{ZPd*(-JIsk?C~Nk"
+        "JCQMP29DrplWeV}7hLD+OH)?Wcr#ovMom|ogbz+HqDx~mNrP!>m@%)}bbf%9Z4M}U2f%VK$ixMbCGbzv"
+        "ntR|GR>Kxzt^P6vTg@#nzKEM4-yAf>I`zkSyq{(CCrP6VE5L(WwfTXUC(2*o7&d>FGFeWzuQ@h6vg_40"
+        "xYJ+{fX6_m-{~iJ(EK5Oo{N43tjZ9IuoW&mL%Fe$>nn4*f0hwXjKKg-C?;HKHK0E%11Zt7z%x)7#rDVG"
+        "=Zo^^P$vO*GTa;OBavK47B<2JTStI7Xsc*$pF_rA-K_6aDm&e5pUT)IVx)65{RY%nnwX|9UzLQtlalq$"
+        "RigK{Ce`DiX_y=Il;V>LY`Mj<<pP=~r2U@2{$ETg>zpyBp>`{efT~+}3BnDjXV}@XgRn)0xYtXin&;mo"
+        "p{_ot(ROknQrA3?Xbt!!iQOVZGTF(>Xq{+)+hv-UOQ(aNCZ)ch5}w{d)co?0z3~Lj-x?A<CNS<8%XX+B"
+        "kl`_`T=TGq*Xo_c({51&@YrW9uLm0Eqq$T%G}c~fR-G?)fpOyJ)Y6ge4l&H;)%wI}96^P`y^^p7MBjlS"
+        "mAK|2B{Y&V=ph_E5{N(C+0xPZG*D>U<d%qqD=J{~&Kr+NtSnbT2uzuI{+pMh(FJ|HI|PJ->~!Zqtzc<2"
+        "p{q|eY&F=LN8bD(!-G8X;3I;LE_RBrQ#@-af1p~BjdEvmUn7aMexM&uX$6wCo05G4!YVNtNnAQ~3*iEe"
+        "iLdWncAzWttFD|H*tffD>zTsP$lvc-M^xfU^4y|{^rp2%<lVAc+JitT0~-Y87t}+*vn{5(C!3iUF%oF2"
+        "sPPWyMlO;~d(M!U8)WFR*5%rls<7B)#A=1WGz5F&4uWStHN^7AXl>%Px#r}{{J?7neiKjoo4`d9Ni!77"
+        "A!j*sz2y)RQVWk6p5$%;5I2B3>4@F$8Y;2r9Nz5$M`88b5E~{f(B@Qr0hk~qBu1+PO$)sl)t<ZP$s!`}"
+        "k)YRY;8zsGlb_g`3fqeiq6m-+hk$OI27BUDsJQ"
+    ),
+    "TOKENS": (
+        "X91oz)f3IPTHWlWBIF<LWuS$u&@VaKH1lEpb<0DV!b7!y1t%BRSO*ocLx)Q@0`+K)vCUKkXbCig2g+Q*"
+        "81#~ANIEnX0RG*4{W)O@@OsdPleGkiii_u(dADNz|MpS&R{ML9{Ibw~M5jDXKWf-FtHOSamTu9|0TbQo"
+        "c@E;K(opkpIYukJ@JHpOn2Ai4-X-a{P7Vx%q=}xPFNLOTi!^BM&nK1hA`HR%c&3$pr>in}axyR(rSkqH"
+        "G1^UaCR~=HBS4e;NThH@8msGw8_Q{gD9={wqO?J2Ml=t4oxA77T+@C9^n*q6EFAaYnS=bD?{nRzWs|Le"
+        "<|7QHdaayso84pL+PV`ENqdOi1m`52DpC6}Jk83<`4lIJA7iO*?&RhoY?avEFQwkCB_+z~&733%2|tT@"
+        "a*`j)h%M%<{sAQe!*;qIq#9Bl1h4KnPb=|lp@N>&DqVEcR!P+B_jdI9P*~!mkTqfX){IXgVQ~J3)jnMN"
+        "i{!63YIUnLolvg-*4@w&NW@G|a>pq=eBFAJTo-_`KORxqR;IQbnX%yl0Gt0Tft<#EZPB4os?WE!{C}T="
+        "x1e!5DKb$kCfcKm5iBJ#B&03Gpm@x(%1WTEa6_Hy&FUA-iI>3D7|V@8sGMzXrd%KOTxbF2>tnS24n=c7"
+        "k^1KRuv!oN8q@y>1w5%PIYpg+rh+(?>{&~NGUvzAK-6IH$f<rP*|el-^JC3t(R7ekPgJBRd*j%TxIIPc"
+        "lb21vW?hc+kFU76UkOe2%vO2iUestXC~|HDx<`y|%o)-paX~Yy2tUOupf(Y0`z(MV)bwM|(#>!rmD*yX"
+        "Gzt&&kyTxq`-4S-zvjo04ye4}8GF8wnjUZ&p#m9Pcw#xFj;GKC56QsK#elw4hJ{C&Za!ykC1VYpo#(e+"
+        "AK_C?@VAVV+jZJ0v^Axn*yEzjx8+JysLggV_vx`a+)A|Uq;7d{9Avag$8>ocU<tzj87mH6*wj;6h*wH&"
+        "JDu$O{CR01dxum7ce}@TVdT>YGOC{cOyT1PX4o`GVUBnNDjSk4Hw21XaMqZK-I_n8p;M$NVEI^zKXHOl"
+        "%txIVG)(9#5#hxg)-7+AeH$hy7z7oMW`#oVWV=Pr0H7I*%8}#TBwQQMyE!Ib@MiE44!HD%D1euHp)$2V"
+        "?hgI+&o?+mpEM#|9%jp|-M1PO5Zj{oTx=rwxG|g@%Kp)qYk1Rehaiu?MziLyd>z&dAS%-#(E1(dPnvN@"
+        "wO1<YART?^x$xFh_{8EOoA(z#=d*zFZl1wbX*cI@=hz{D9m94bKDU>!$!(QGP?ZvdV+)$)iTWPGpJ&(7"
+        "n!wd2OyM!~RN79}LuzN*!WPJDTWRzagf=TrQ)-iA%Oe9ct^X+STbrTH2+Q=nGA2`am#N>`RvDoMfjFGk"
+        "muKi{Jeha(H&y4abwYHV>3MQDL=^5J_OuKfi4lL;+{`Y3o%-mlubInxwyI<2+>p!mxfLnQBk?QBVtBeV"
+        "Ro~0-`c9qXt#T6n;ZlpPhA3uUA&J_O>fn>@S4^+(w)iDP-v+v%@rPwX$v_Ga1U+%ENGR!m!vi-fSQJ*D"
+        "H1JM>88Cld=-ItRzc_VK&MzuR9)nWa$y!$cT%x<r0$Xmw&563d$~nMCi@~?Cz=Sa`sb<RChXa`t0Eoc@"
+        "8B(Xyb?BGdu2VCpaZDP_t^NfeVv3u?+rl}JMoL8Zq`{c&OyviSz31XJ2}XP;g@fA!l%E=3Y(gC}PMR}g"
+        "^tbe+Wqd;JyJ@2w)#SU^`}OznlP_@knT(GJWJF=jCp<5~Krw^O1`cD)m_MC`Oeg5d=p^|h;(w!0UD=}L"
+        "l~E!|^Z0Ni`Px_-`po~Pfg76vI6u1eg9qIqA=Iv<=OjK@Rc)`5m|qOR?BYGt^!9i9uM48f5hYb~islft"
+        "V07okB!;6<r5|X@jMU~lTik3CiXJy+sh^ERuU*MWMUMlC@H)5xbL^+SIo>wD5B@>v*7S6M!Ac+63&iTR"
+        "7TYn6_Db_0vHO(!<cg0K?)P?fJIS{|0F-Q!M9_k+j)z_h>T8o89{d6@5d+ApeiCI!_kNwUIf_VSAD%{o"
+        "{hft+Nk=QB&*(S9<FNRCcE9K?=(8||@lcsWZ?qE3wj8m!yY|kGL+X4;Y!|VpuNEL4VWS(uY)Fk%ft3Ly"
+        "L^D|u3DZPb>QxchZV^BoNvQnh1OzlK28^+8nw8k)e^>=Yhkf%fry1u<sy*ZUrrvZ4CL)-c@zF5!^&%oq"
+        "<-ibr2pYK5&ce8l-583@Vhj5&`q9+sVeqXj&K?20&ipbMrBv$DP}I}|9E5iHl$Ay2@z#uJoI0F$Kn!N@"
+        "N!tG$ATQ%>^a(NKm%t?b3e%KM{`utoSjdzq4Ujq2QfD6{!aGg@O34RAWNUFidF77~??bwGirsq=16DmU"
+        "lVW>~1$KTUjh{J**C_L*B->4*suDCfGb<gk+ILV~;vn3{^gqlkUQv|MgkR+3eZe(68*J)HiFvVPnul@h"
+        "#lOetpjdy!f8r67xZLXO{)}>B<6HD;t<8p;G#l6-vE?#T?ESvN($D0th>RR~${V`wA%^AxnQ0J>BN!G}"
+        "tPbjluQ@?TtOZCUd%3w5`^wv-NWJS)(>r=o%lQRMI}$kEcoi^um7Ze&GPxi*x@{M582V)(Cbq4Xk%C^|"
+        "^F*-)k90@vl?R&rjajkQ=6s2_NAt4MQjBKiD{~Enn0t|`St+gUIQ#$<eN56QErUxjeS+b6bj<FeA2o9v"
+        "DrfPR|L?g35fzz`Wsw*bl2XO}3%s-;%*&pK?+u$&9*7?WC{bS}!$%W_HST?})<-0jigc2MvN{Lg*!reY"
+        "3wpzfwvdsZ&&u&&bOb8{U-1LNE0_*%pzylr53WD1gM$h2s`Uz&7AS4-Gb(71HslW$GWv<_j*Ez~uUM)P"
+        "BbqQ0pJWLa;8CO;$Cc{81S9_y9m$7rCcv(SF!{8Lcb0Gh8K(or@G1NKSAH?hu$#k{PpW*pT{_&Ay3C5b"
+        "yTn|kvZ^79PN3{B`J6}in~R`V<HsiP^0L5@!+^rl%bYa`jb$#1c=^|G(wK&c@^ZX$5>$zOH!xA!TaSwy"
+        "O`1z~k1&V*yIf5)2HJm@ywf%Rf6E~vsxD@X-Luj3KI%HbJ9C1^n!2phqsorfdx|7*%{c&TCmPky3|bcj"
+        "G8?C4CTtS)6U?NFqLVL%(SE78^7Ezye$$rx4b{x*u0kBwYXX;X@w<xswcmF})gW|^t0**KVAE`ZF#q=q"
+        "xBB0|XUf%MRMAMN<dfjlZ)x=0=jKWXnK2MsW5e0v->rHVeTdMA%o;w2>iW1;&}N3SNH#PNRj*q`PJb#e"
+        "c>g$5yxBT9z34-MK+_ek7aPURS=Tpa#-cJZX$*L?+w{5Y#+(Ra=clip4aw7oVZ!1abLtZj38I5}|EO5X"
+        "{IhABG_lvAjHSzEabazLi{*i^tU68e2ZC4-^wbe*c)SEBEaqbl^5eT@I;Irs#h`){{t%dV;FyY~Km;e*"
+        "Ml99s8%lR9ALI$_K71=omJlp#52230*<2&ZQIIUmc;0e8_fH`6y-rt>0N_AliD#<Cb5(Y4sFvDgYm}vZ"
+        "VGM;{-S<8GlfAPktyXBBR`5pUl=U2^XDVej_aAy+KyHgL03F|yNv0)%EedYu;~S?6W3!B&0giq&Nzw|@"
+        "W&?4?Oq~~rYIM<_eFleW+3&5y_lk&t9JYfVn!R4;hAu{$G{M_^R|e&-I|-$YoK%GMI=I-t<A=V2^sG|*"
+        "I3|~+o$W&@?FU4pSt9OL<TtBg4f=6I>6^mh=mdckkW+83-VKFgk-LMJMxG@fp?L%|&ge^I0DW0Bo#T7Z"
+        "D4w<0XaTBF>#KH5uuJarZCPW2DK{n(lhMu)ieOi_B(S0}ki&zK+A*f9|8N8i{N<HA?V77CWiLY&zBf|@"
+        "aaQErq#VGwjM8Os>}WtA?=oW)cWD?aJP_qOgcN7fan0*Z98-5};6=Wx`(-PrxmD8j8AY<VLTCN*tE^TX"
+        "9<G5cR?bhZ<7QY!XJ4pi13Qij!2ucs#a~FfWPpF9J4@4@Aa?_L++2(}soJ~FflcNfvLG`z3(CJ{9sXv%"
+        "wQWxVX<fRq5g#t|=aV;riV_@j!nKMHh0~6k5my!wJZZp#V#feGgP4mQXRiv`f3?}t((;@HP7{BG9yULu"
+        "3gEu3$SMvhZr^0m*}8Peu7MqM_KH_%BNBok7kJshyL4mVsH_m;;E9wV3!Z+b8trF>Gr5+i8`fK(J3%9Z"
+        "R(n#2Kv9wC*rLf`E2KH<flKna@*i9ZGhz4ofFnEf%!%~lO=vA(**2laa{Bp*xm%Y~t-~5G%>VPLqnBK@"
+        "RRI-$r3iN}o*cE5IL;g7{kQ{o?6i}#33;$58<(Hc$A{x^;5S(KtCtm4DWPys*MUqH;-lST%)Dy3pIim5"
+        "?<!7j!b{SlCN!S2=w*W2?Yu2CA#u`3cbSa2>-uSmx10<T)ANH;AX1peAoO|@1?P2^u+eBR_mBTmAvHL&"
+        "s9k_AzJL|^o#>n)llOepH`K}&s|aJOYx1o0&pVCqw5Z8Z2<B-0;Q8L{P3CR>JL`m6s;5-zBax3{6tSmL"
+        "IR(DZ4tno9#?-q(XBT-zlBAJXLAiq9q}N+M@dZvZ#rUC0zo20_Dh<Zi#}8i2+w*}ATfc-4M2`=BTkdxa"
+        "Ce!^8g1tQubCYTpF$^JLLX<*bcjxzAr<xO}fk*q9@;>@sAs=n<k@CeYpKs#`&hOacq&`KIf+yG2gv-5b"
+        "*&-uDye#Ot@1wO*;PQBfknnX+webl#0{-dveK$}6D2Gc=o2g8e@SfyeY~k8MYil;g)Mbr>ro~hL^lki8"
+        "C7r)*e(!O`P0FbsKb*FnbaX{>XBeDxZu$s3Zr!-!wE(vU013p_TQgAq@Bx+|9TNtq8@?^vYthW8k<rgM"
+        "9|M{-?Wx1Os4Z1kAZM#7FSmr(#IH^%s_Jrvw(^zagn(=(Fq3k>?M@#LD~7PU-Ri8{=4DbargJP$f&JG+"
+        "wHU!%52Z7t+zvD}Yk+u;(ZouD)frS<#&DxK1EX9{jg$c^k0y+zY0$O-vBUVTIOVOni@V>x4(1PePumpX"
+        "{Cj!LBbiLeB4PPxo}h#g(*$;B$a$iV8bt9`?~LcbSheS%EUZHQLpH>kBECERc6e+;v-IcSxoU)^5I9h#"
+        "eMKx<ahX$i!q$B$cGaVDj5i@tr;#XH$8g^%;8cWYvJTMP5T+%I9@7t;_24{MGMoTi=ITpZtUFg1Zz38^"
+        "U)d}r^taDi=ib?HB@tA*#BUIuqv+5O9wsTbnu7#kyVR2|d9D913ox5@E#;(1ghrS|A}rF)r$Fz6x%`S3"
+        "WDY>E9z-Pg{+T=dvw4a(pijsMjTtC*K#izo<2^))T}J!=29m<!dpJ`*iY~mte8GLNA=rSF)q)yn)}$Oc"
+        "C|v`F3hj}-sEU?&An!2<+RAC;zCb*+CwCmae);54ZB*R^U!E-wik!tzxvS(1Db!-r*neykJEBdiyxDXI"
+        "zg$n<Hh*s7U7-VJzD~t$oa-i`=q_m@7pdAWhgB3v1bUs}BkrR$d#(MMJB2B4YCccGWyPKawVvb#5iz+G"
+        "$~RuQ#IjW{N$FFJe0b#UAa$=Fr76vXQnr~=T$Ro?mzr`)#W)6ScUaWT8Ut8Wc6|WFdr#GM+;%R8S1_Bm"
+        "S!Uv|{Pjr}l&EV~@+qXMP+L6djv7sm9dA8URkG3LC)|kOhi*YYluxxzz<^|bi%}_`8{rz#;3Q5N=UcC!"
+        "u`soYxPy7+<3}ST6<3+KWTWz!aymz=9gv#|B(wh^;C*+z#zTlSF-8sYv0xX89U}k2NjzJzc4x>zz%!Fh"
+        "(^B=d&^xPVl<`jq-$8t^y|+NqF+74J<oQkOY5PdTRO}6C^Ant0ulhnvMb~$6oWKD<l<l__U;-d_eSy&*"
+        ";I*aTe-N%mD`L`9ZI8HlzWi5{4s+i!*>gA#gwHKhq;5+yFu&QO&zaaIP$xER6`rK8DfWNt@jvs=pwqrT"
+        "(w^)+k7sDU2?yJ^&|iF~vr61@5em*e1UTZAK{B%%H+t1T7!Z;^I0LeeQmu7U3`mKClMwZ1+|A8a3!^}m"
+        "1{>@>n2wucbEQ#qCd~WFA3R$YO@|^fYF6=8HF%)oMSAYo=jw?d6_8d_MZX=bFAm$CLKsmH@u1}J<M&sD"
+        "F3sI+m-L)E9Zg6NOzDzK8CV12ZwwAmk=Ib`tqdOk7J5*P^oQVr-PRmI5RSQiCj$@qFchbK*=wTL4I~~+"
+        "qErTa^@|k}tBhSXEF{x3IqGsm6Zk6vgN~FSeF2W(1)A!vC4W^gIpw2>y!<6%QhI#u{vcj#OE#xP@G1FX"
+        "aJ&V`6(WpzcYI94IPmrdc1EhtNz`F48O5*RRqACbKYQ8PvZz19l(C1A&UEQa0f+4x(>0@*xtlbqpM>{g"
+        "@3=5}^9(NM^0h@qkLfTDJnRp#uQdWRg3|4jG2-^R;Wt<7#~t<QxL7FLBvIVIUKl5fx~vxVXSW57@ok0j"
+        "15ZAt<=t*uzmT2BW>8q4QJt67RfLr_nKR7?7H2ct4%1Q;B1|6GJZ75|tjMn5**nQAF3psSJ#=ztQ+z*|"
+        "ei8sG$%4K!c8qCFxNU6r&}Du"
+    ),
+    "ICONS_SEARCHABLE": (
+        "9Nw6~9bB+YjC$vFEd`Y%L1)I=WtT+bbd=-X8Wa%}#$j*R-?7cKQ)ee&dIQjWD$+9#p|3T@&X=4lN-(x;"
+        "QmKc@ngn%@L1Ufs{(JcoXy4sPE7RD?SoAE2AfE?&<G=EP#b%R^jqTHwZt<+Lxj{8#<kGp&Ulq}(OvB`R"
+        "fgRcZn?vS`V^hPxbwHZ^Pm+S<Vim#a^r1MV%xDjIKopszmYG(;^(4Bm&3L+?StS&n0ov70iDOkV+MPc>"
+        "oAnW6xE)~t!(ir+&3L#VO>q*PnRoC|K-e3p3r`k#ufy7i8MnLqq$F43?9#qY>EaeP)z=x?Wy@#)0KdmZ"
+        "n<x5ly98p?gqixw7k_J*WB6lCx;%E7TY5oi{L8#uU!4DP9M3)MAlb(;00Z01q$pKo4*^uF$yluq`tqB~"
+        "B3T?Z5J;{e_UF#!3RTGdsZd&(l7$K~v3<5Z5b?{|Ar099OLMcrn3<z^m>vBbr;`h4l0+>rpPE=5l&}*H"
+        "0FqKzLSPmN)Zpu%OR2dJT#2E2RN*A?$(>=M)j>T-ZVlgc@viTMN2Z*YB`w8zDd~gx;sy&ZFi8~$5>4w@"
+        "b=dF1#(19Ey58ns{)fGB#5o_NhAh)sEdqrn>tf$7#R1)sl&7@7%%6NM9m83q2Raw;L^f{~3YBTyjK)c?"
+        "+zGOGsU6ePZb;%@PNLidOcj{oIepW#&flZSbSP_J^VulNDShhdoH<LPLhd(xV?sSRy6YUz;bG7wz+v!8"
+        "9*Z+sLZ&@+{CSMbAmJ80I;H3@2k(HIymq)%c@ueclfW8)xN2cdo7-BiEARQ4!EBBUT2L0gnha;xNd<&U"
+        "@9+)F<Ih9rt?V7bjZe{QrDMv6$K^x$kE=HiJw0hQKWWT`#0Ej07>;O2^m~J8@M$6s$V6R}4;@7wUe5M1"
+        "T6o-Y>#!Tin%FN3Km|gPtmUPWOmgmVb*~fsOFBkoC0{ZXhxn7OGt;eHmLQvE{=o${_i=bH;G>1CS*Yfl"
+        "$4WF@STI?Vh~3=oEc%!bn5PY)Y4>6?`+!^Ysx#Qy+IGKr!*93Qat`PB{@x~FP2Rz;;@mSaJHkhwZw86q"
+        "(kCN3>wWK8`c`t1XG@7iCa&9(C~#Qce#YAN7vc3^7C};wCEK@U-h5*l9Zo_E7>!Gexq&AR?kMj>R^msc"
+        "bQks;4X?&S!AV#yU{llSJY1<e%`LEcr<Gr!PekXCK|MS()87tZcTfaAnl(8pdY!oz)jZ{LCwh}0^f-bM"
+        "=Kub8PGec_TFim4nn0oiM?Et9qx<?;!?_7v*Adr91U%8Hstv_FK~Y;Q>#qzcFzV|$_+~=R=eBmhRCwLZ"
+        "fotDQ2k0pjtvYf9;MiO0o8%E;a^z!qu5H-lwY>TPEv~aE*2~zxlbuQodQu<-J{>8<@e#pRiV4mp7{NQr"
+        "yfz*8DwH}PLtK4}C8W=m;s_z{b?~U|u4`^g5gEq##O(ABI#j@Jses6BamsR5r$H^)I^nY3d`&<Z-T^HL"
+        "RUtpU&{aFSCovt-P|wHC(^ehA@i|IOblfwt@jERFAdE5eug_h8|95o(1LCPWI!D@~2)nFuqV`?hRoIww"
+        "!He}zS5N^s%p3*Fnfde3@C*xaAAku-ys;K*j-ZohCQ(ajn+@M`4HDiMn^dylUl0$5hvuAbY|qzAok;V;"
+        "Q(J7Qw2#34V&s`>e1&7tBJtwTm8+^DtG}KiL29c2ywz6Y?O7FkMM5u5mRXgrbp%azrn6)&-BC~9J5F|0"
+        "9S;kA^De>NO7z7}gKb-7A5hq_{)VHY{b?}QJ55(r4KD|E@dnnis1WNrvac#Lf0An}TgNyXofJ0>pYrB%"
+        "OUyEP!r823dd%LN>f3Z78&nHZIk#OGLVlF@jmUB$P)iK4drPopk|d~0WgqO9Qk^>YUt|FjUCUu=$FW_k"
+        "QfG-*7E~@WI(k&$pQe#2>SGiyURLU46VGa`63x!-`Ft1uWsq{6fWoTm<;qPkFNcM+NW{FJd9gv6cz-i0"
+        "OZDaOe>R;0J%lN*4W@JQ)n<j5z|0Sia~YlI*YcJ%#o}~g@^7lT-bH3(M2>#``NFf`?GhEcgVm#+$rVzZ"
+        "F-b$(#5dpPT=f_>g0EB~78*z7+EQ?OgcH@yk_j_S4GRnHo_omTlbuQw2zrV@m;@@uf!PWTON`Q{t!DTg"
+        "MQIm=-l7zHOlzT@<M9nFGdr<Dr#M~NASh!*56eWMcv`GgzGWzo2=m~qfRG4VVsBzNb7-je6S_8-`ia9f"
+        ";$h(KO(Py*v<2P4mu?|d-sS-H9~j6PNl_IZ3E7#J>h@@y&WkS?T#T1&K#y$E+@QON+^8b|6E+W_@S5Ta"
+        "weI0Y=h%y68TpUX@14j>zo}REr2pWrAi(CO_RF$_)A$3(?*(h*_k|?Sq-~o7zYBTA|5`(JxqZ-gcg6}4"
+        "@t*9PgWKwb5nc3`ydc9zHO(txV-cgKqD&;rD6m}K*d@*wWKQ2m<sL^rJ6tUtLr{Z{;3Ikl1NXOXrhR*J"
+        "9&BDuBt<V~jLUCGhQ<Qwc1zdm<uB4~>$N`XnZz7<1h$BCeD0{NQMIkznAAvLCc3d_L(h*Hh!zvL!z+u{"
+        "6ZTT^%QobiM#4^%+rmwD#TUD**LH5s2%6ZozM3Yf$1Sy+pSu&*dl_p1^1Ztn@|o53jVQe5QY6KDF@8=h"
+        "tG{VNvOY`8l+W1-rY;)H*2Q(-M?Sl@5(ia01QxpS^~<0uqA$sbbWN?i#6epM78v{0HRLBAjIo@Dv9Ck5"
+        "C|X=~)c&jyoF5mybJ5@gL`}Hs)B`4styynP{g6Y3$?7s1CEvUHT%f$578fO!J<%;&{WI{#Pb!QQt5EIj"
+        "9O~5mEm?bVB^?d336Ye89J5M{F)2FJoQE?I!`XF}khrRrP?JTVBjNPuKcBJ*cPW>@GHO`>KpL>jou8>^"
+        "w8CgOM8MWWx9aTYJO6NTI!h0ffqIxlxqS7WQx9N-ayy@jtXB2N;HY@b8#GpIycWVyS$8q+Y}cSRZ~*%e"
+        "8Ar2-Of-ie?g(|+Em=a8AvhJ4L(pTjT6m#9z!|lB0avl=at;$L8z70TY;sNzMIJ(o3$1V#VW?SQQXgly"
+        "zy0Iks}MT1WrP{Dze=+-#QGGFQ_vB4d+5}%PrvMio2f^I8JMk#fcfMU#mBr|ki=Z3rjv^%M4;l2&M0Jl"
+        "(bKTN*JF%+MN5!Kw6t)iS`Z@m4i?Jmw&5<eaB(rw#d=^40KK-+_g|wvzv;wkXy9IHyR4B|87)@q<abm!"
+        "?*>*3sQS+OfGat9RiRFC$JCKlA^(qJAcEP18h5$gS159-DYrHtJx&=ciSfBio<SC1(2>x<+Rq$djjVag"
+        "eYC4uOSGS=+ixp$_upECXrqdh>)1)DAM6PTlHj>7fMKAlA?h^5zvYQ<af69q6a`C)!Vl6qBvZ~kps=`3"
+        "%(6;J$Gv#9zxF?OBR?i@wX96H)2n5B{8lh3&X$=xvG6|eb_ge<lve6z!RG@V8yzo;prs36;w<vGU#J4n"
+        "S+M&fD>D)TxXLG0(Oz+dD&}kI)Fa+%&~*R8H-@TiQ%fA>9~`C^(xgm8LiO<g!+vQ%Fm1T2xdhTr9mMN8"
+        "L9>V^V49sXy<F_CJmQY^&*`}9)B+}rX{~GDjUI+|%4S+IDh(V7LSsZJ!Lhzoa;iSIcR)6v^n9fK2UVMn"
+        "Tx*PYSEF?M*R?MRI^s-MjNUfu)0|HefV#T&UaDyxMDIX9p6~Fr6pJ!o8Z2^0HfqlI+nz1FbDwvsa&BNC"
+        "up_(kr3uJncIR*nc!GanbN}#RbvvuFF}<}Cm4m_MU}iUy4INajj8dMI$3$(=11IlaqfcYkXB{qTpNdJ`"
+        "SDt*NhgeD%(AF<5+|<cMiC}sbRnQC=e!#gmkw#V@xC)9M^s}rg|IX2J^P!Id*S!txP5c!yow^^w`eM3l"
+        "&}zMUBVWww0sw%|R(MOU8v+Z#)d~`YHRW5EbS)cu!Rag_>ssDEJ-VxYLu{xoaZ9qKwbJ!ydu&KQTFVTV"
+        "#*t$P`r+OeI<W~z@2n>W;2H$$b@=H_f0vkJm#y&&aT|a27zJ`TLO|Y|5CQ@hERfn*L&Rdz5&@2I<c|7G"
+        "N@T3(SK~A1yu8)gi=SXp*I*eiki08yj^WCmtpY4T7t}r}jyLgtsnn8Si|m|O4%xXiCvrOsuNEpAqiz6E"
+        "H1%sUC%DpA7qO3Bkf@W!JQ@2%9EK%tACw0hLcs&<O|w<_-mVb)FjYMPBY<+m2m=WAYMFTMWC1hQ$y(|}"
+        "H(%BwRbdqM9r#;y_**eQf_Zr&YwRt(NFMk^W>`>i$CDzBVe{Uj_}b`ZCx4yfwCahRr>0jjnE9XLnJ?3)"
+        "M69Uwf(ro|*k!VquYGdxJYhi7kC$$|u&Fw8%OKqI9Ow1OhK2-sSdK1jO4HNe(8g;Ea4MJ5()+Mx_DIzd"
+        "-5dZ=vaJ>|vHS4W0Y@vwNWMuMx*rfndwD1*9RsW0qk79C77I%PQ*wPQ*WRkWQBe~ggvEG5+EQP00R)a@"
+        "Ik(6q55Fi-4a@*8Mt#9U#XVkAwgmLtu%exCGhYGhxybNZ4G3oF18rWpu;BA>;4r8UQ*BybEd;Ycs5Ro6"
+        "TxiaVi08CYxgY!y!Ts4YsemUMb`$i&UW)#nUE~6>Rl9Au=Zw*~JlhTS@^c4%oqG304fLFzixcj<+!HPU"
+        "bR_sZ*5z(wRlHTdps(M{u|W2qxy<Tu2Jf1bfd>W$%tZ;*Ln9`BI&+Ozu1;AFO0<_d){^X)5T3S^fLckY"
+        "kH*_fHIa!nzb!{?FQ0+yq-FWHu(4c?D>BbSsE16B&<><gSzI=@)Wsq4Iq4#}c+%@gXl8lh+S*merXSK+"
+        "v|t=+`U0qSHcMfurt7}w!xoUwL_d%P1PsJGs#^~D%N+3)3cntgY)i4yLn=$SV_7GjlfG#VdUq|GcsH5d"
+        "*Pxtk<E`(z@zWQdEt;Zf#HWaN@n`2GPk1NsZ%4(&5Pqo?v-ya{k^Y;0h$zbe9s{~$XUf1YgF8D{oH*>w"
+        "*AVVEycoFENV9r(AY<WDyrQ9RFj`M4u4?JGEpl`sBRl<?zJkMP%D#@2fujaQ0GTt`*M@I*!UWJ3!UgVp"
+        "UU|nNSk<-Ewc~e+x+Wg8f}f6e9lYL+S}HHxYPiHLr`AgNVTa}_J(#WB`dQ$Py~{tfox&&m*f=J$_*0^T"
+        "wX6x?#m-w6+9Xv7D<{>z+hf|69@TG~)`H}lG#1SSKk&Si&uIYQce<CnKsK-R4!8*{(6$PdLGgckwmLJ8"
+        ")C>E}rnrC776;|QHYq}QkNZ?qnA2(1ZulfZO}AjZyMa`_&{gzvc4n3GQuc}pURv<&yfWav4)3|Xg;3sB"
+        "R)ecLzMs0ERX16B;O{hf<lcB7<b#d5NO8-}EK6P>I7o3NwIm$#RamdLV^XRT;F=c8!p8ag>GM7HmuI>K"
+        "Kx<YJJWFf9E(FY33FukOEcT9PNf|x~U){^Lb=y@mMSXt49?pd_I+oW$0U4s|&a;dEc6tvtz;*Jy%QOsz"
+        "r39KHZ>Z5ch@hR<W7!i_MpcO!HP=|X>Pdt29png{cjob}-7Y;dg6H+gJ&%4sXY#ItX}GH|f#&TI&}RDe"
+        "Te`<t{(?Gj?R;h$g5R8;3Ye7#QvEq0^+W#!pBmb-ln0e3hCAA^0s~a@wN68p@EHn3GbtsSg6sIH{aXZy"
+        "AnO$!b!;K!<KKg`L<HcoBl<kowX9&Hj(4aLNfZkvg}LQ9GC0oU^Sn*=9yZ?dt8>`>>M|BH$s>EH=>o6y"
+        "YzE||Cj2i`&gNok3Ll3ZG3yNdzNkJ)X>v`mq+;2=k{ho8>N<lgKQ4Nm18t0^&N5IYgGw;pqj`dgB1c}R"
+        ")9yuSH9gXh6#-<h*>}u~ibgQGYD<7hrCV=5VY)V;%nuuFJnV<rGCGeTXhtzk^R1<Dr<sH&?>>*uJjC)u"
+        "6Ipm8!U*LTyB$j$$yfG-y|kL~z=Ezcw~pO>#LQnSpCpZn@mz)57V<~_6V3y30wHCEgE$kY3_66v{5E!Z"
+        "Qfr#fKbOAK{t<|4qz`oy8wk3}0|^8*iF+(uwGrU;Oz2}NYK;(M0jhB6zvO}Qr!G%3J)f-qLJqLPX^4#k"
+        "btt5l(*Mre0d<aSTx#q<HellNo3<-{nB(N!4MCY3+F~0sVR-~^wMfd^Uh&4M+Dr}v!`6laR$6-S)A77$"
+        "N-fC!C12*B%+)lzyqD*z{E4X>aFcxR?fBz(Ukg5LxFH`Fo|aqnPZ(Q2<UE5ORsG09IIIP}8BJI29!<%i"
+        "j7uRW_xb6#au-!65jc_(*EVw#9?*pAwPLgh2IMMfA`sa0do4>xnn5E=_7Vd_HJdYguP<s092yhwTkN%w"
+        "LS#U>hwI9Jl9g}~`1Oyc5~_UG=bfQ;yW`4Gl@VLOvPds?v}X=Nm_wR(d))*4Ni*c<j1B(;W|PN9^Qv(v"
+        "m&3)|wb3n)CnN$bLiSwt#$E5Chc~Bn<AEJrjr=OeA+i|uadxMOdX==hU=pd>d27}=-321HtrJk%7b=N7"
+        "lAwuGYlpFC((=`i@ZW2kK6K-e{3C-YY{N<~&NlgwvUds{OP(>}jqnqvGAFmFIlYn>b?W#f%)a91V<^7M"
+        "_k>5?U+n=mKWXgR{|0=3SFqw{@nz&ICkvW=mIM4h6d`F=aC_2SGr&+iCKj`pNIMmBX^OKg#a*x%INxV~"
+        ")@T<jA@nEC(y%$F<@#JpmvmnM5(`}xpw0o%;xR=4blYuKvln>SUJQvXkZ*%Yw!jdaoF<NVIP}U?kcONF"
+        "I?9S$Fy_6@@MQ3WlWEu8@R8)B{dVt2*T1|wIZ>cr<pj&M%-=Xfl9#9>W}s1n!LH!ol%!S^E-!zVq|^wm"
+        "Ygw;jFrH*@+<dQ*1}7~z!h+p-C$Cmh=7i-vDqYUE|58ba#2!T;B+qRN4~AuLgS{_BuN((HE{=~ils*(b"
+        "8~4G$*#<-pJV}|tsy2j9&ij@OP`<>{jTKb@fM$uBU~;VcNw;0Z`(>&@0J=)wLv5lyzGTpOR83F*IWyEy"
+        "v|M4;6n12@#`in%bv@*_D({*h*W!JP__ze6oab8wKj{_NfjBG~WF<0F2u(3L69q?cB1|S56EBy{oLuzT"
+        "sdNi0VR_T$*H%7;7*Re#0{RCb9ArRwzO|zdqGH6wG6x&KRI5h6B+l84=DUZERajq{OFZg=!W3)}+*DVB"
+        "m3DV%8?AgV%y|qdHwi;5n2#an3s?k0IK>il1^Ab#dSrVZE}A#p2;wmI{WIxC^$&029Qmq+LZCPEF7y@e"
+        "K&U^?GI%yM0S{%_rtdbrnrGfJw=d!Any2V;aq6cA{DoYB>U2Zi5CP?Qx4ibD{`;pWQ}))WzQ-qFIj2Ns"
+        "(*q&@SwW-NDg8{U03K9N!pkXY4uoFHHXdQ(Q;Us4Eg}-^LVO~Bc{Ijk%dV6>a$En@HM3|o+m+^Nw1TiW"
+        "TqB6<R+4oVj_;hIERTn#W?;jX2^xABTub&&D0O93>nkjQryumvBoJ>t@ALEIaT1Q4aRpE3lJUG9XOl-0"
+        "+>QM;TiXLPF6h)kUAAO@v`R9IlE?VR@I4$sSJH)J{P4O7Pxj6xL1@3(9qcWa#F*GW{$fie!?wkw2qGN&"
+        "hKs*C`#01z%+uGo7MX2Wo}0c-Jg)3G6r7dJJvfGU^&cbU{aPHh*i<zK0sz4iWxOW(bceB6&U6%4f1p1e"
+        ";0(6uSv@VQ`I>`en(n|GTLz!n-8;z|qXu7(HOIf!%sS6HYMWHbSrwKEKW`V*j>o;lPrZir<Y!gq0#yYI"
+        "DhBS(JLf01m`)B7LpvmHUcKloDSl`7Uq5!qmk|Y|ULPorwAAtH8vPTI)UDv+;4LMh;+`YOo-_a+QzYtk"
+        "bL|Naj7Fes>PXxRr})G#NXF=$z9S=1IgIal)2IXT=#Xw(Z%dXX3<kIKvtL$@xG<V9F4+A=I|mt@dCL_B"
+        "ld^6GEe(8)i>^ak58rZ%_HB^oWOFE*^J*V@Rpmu32@ocwf>Y6aheM=%bD;H+Z9e)a_VdBEKu6r*PfF84"
+        "%$a<VtLIO-${2q))1SliwU#qs@VS(NJK9f)y@E2L@CKsl-UnO{F(s~!&oayhR5RlTV7LljR7#=$0#y#>"
+        "w-&MFZUzo9_N54FnXB)z0)KQOET*TElH`p3g7EcBdd9BO+I&?sLT7xN7B_3PvLXoifz=LcGl6pzw?rWH"
+        "eJWW)&sh@RQfYBcu8i@DjZSm(Gk0OXy1JI#FD374u2>t}k()Cz6IwD{)-I!D>nr_Rv2;Uuy<rNBn)2fS"
+        "ag_tND0=wFIPwL=S-lf?5D(P^uR4<vWwju{+>u{ENjNaW1E8Y9@)FY%W+5_QOnPALJ@|J(+0XOPrQhzM"
+        "U~=|)n*wW1q1eI5n?@E>sy8gv;}|YF?4Q>alcFw^RkAH)PM4hMGA@$9C_n<JpYKW}6Y>wSlykV>RkA_t"
+        "1t?eXoGJ;TQ|l&odX@XV(i)snaxFr*uUD{Ijxo_lz(_9N{8yt)E9dmdnm11@ZJuAsd+#`tbT%7Wv_fpA"
+        "Xa#fFXzb{(#JCCNE_3P$ehI#XA2Y9d?%Gn<b7P`LihKO@ifU#?aQFqb>5-qEpeg?L3z}Zss+^kon>dsW"
+        "8u)5YMAEsUDF=hA3YY>d2hWKT^zKvvGK}r<C@R{#fQHv$b$vO3wn-^I2V6ZJ*O5KGHkpZJeIE3+XA%9%"
+        "IkeIU-u=vn9xj*7++RoD@5@B4uO)EVP9i9e3$GPr*`zh11<bGorZ9bH@S0F+PD@i1_f3$>eu;4T1+$^8"
+        "G}-A*uu0EA#z=qP(($0;lF@(Tcr@jaUS|VEUuikh&n|5z5S#&<eJPnG;5hKnD=b`)ROC$LTcc~Vs00k<"
+        "Ty){EPHsBa4F+0vEj_mT(ak`j=Ucrccnm6;_Sf)<VqIG2<TxG()aeeEL`i}*+eVap%%Q3nz_Y%G%mC2E"
+        "H;XDki#eWcohMhpdhmgBhWG_J3$fdM7-A1-`GHypX5dyZsie-f1wIV55w9nx56npOlmldq30SVa%YDP?"
+        "J2db)<4LfArchGIpV#S@I<N#XTD_c(aTyZqCDzf|jGEZ&*6A3T`c#g)QuYGiwq)OiZ)zV`s+c&_PP!Z>"
+        "fJGGEH6rePEYsU9CmsU7FMGtdV{M|vJ@ix+Gf>`&!yOTqf!y#KOWVz(4nE(y!>$3`rv^QiR*6iZqfiAE"
+        ")wSMngp|!K2$}1O@uF@5){njnh0f>M89YF>b}lLQp;|C0kV>{Orbb_A>35<PS*XD%2`K-^YOj-k?l#dm"
+        "aXW$>6`{iQ(iDcHa=`b?>~A$Nz49m?4hVTcr;bs81-bj7N+quYH3aU=%ns~@m(P~C3dPM}V$dGgQ<h19"
+        "e{r*wzPL1E<oDvP6Z#uo!Y5JOrL!L2A?!A=XLm{o(2u_09)4m%gE*Fc;T0&+UFfL`X;O~h{{(eE;c$*E"
+        "u0?IDCR~`l05OskMlLR3Jc#O>M51eE*blu~ib9cPgwcTpa%6$0-0yzGb+xYUJ-`+?HQGiEp-SYR5?u5S"
+        "@j|6vMyz-`IKhSD3&WtgI@2%0kKKyR^X54D0^sv9+jX_@dZm)A+K6l)?2?q>Ef&39FWQ@T2l;N(E&M{U"
+        "xkxfD#wxgG<*FTA!AQTRldZY5vwK&9OVsfddk+B2Lp<+|37ZnF^1}(C-KeuP;$j?~v_lsIzyM;Ppg1u*"
+        "JNdH`ygG-<_Y9!5$606>c>PhYMmB;pyLhlBB~xhzR9kktqM1;f(Q0?8JX`$DXb2{l6v><EMWX?+13T{f"
+        "L$m@E_}n=wF(Y3#&BV?@wKWxk{24K+>VSLbk@umydI-FA;Sk~N#dCCqAAkdW9wXgGLj$nS29ahDz*9$_"
+        "B9C6<k>9!ZJ?E_|G=CY~a?|(p$bOs8GvW6U8#IlV$g*C>ZVJfqA@`BV2aG%(Salge(fd-G!`aQEIbY?k"
+        "W%+o2j$%pZHC90r^nt}Q_dERkk2DI|8ODqV%L1gA+Lh(Qdu<Ck1e;1R=>q=awnmuFfK~~U*4(CE8w-=="
+        "dwOH;a?$G;Bk_)3bt&EIJVF~3b}CkSfvE_~C3T~EkQaodCjD2kowGl%%%xiNwM<)t09LpJ)&zenjfXWG"
+        "ffK^_ceZM%`wdXlsXA>x2D;wP{P!Bh;AUs=)OTeGaqo1mKz#_As&>s4=3sxnDT#Gi3!b6+G;LW)!`E5;"
+        ">Dfm&hVeFZXrEWT6C*W9b8_t>SwwpHJ|`L87SZV$YX*tpyZP!=lThGu2LF&%zY)7;yZ)*V9sqkW7qT@B"
+        "k$<-d_5NU-U;J|+@)W^yV*ih^PCk*VSc|>~St);;Te6<3K>o^Vgk0K^FWzQu`pZ!bz;@!my|ier11t;q"
+        "syamC^Z<YuQ{#HnizuR)Wd9u1AOJ3#z3ls=NiZV?#tkI$M_OSq(JR(_#@i73AYt${_JAcj$;onUQg8NX"
+        "q(Zg5?W3<0<wq9y<(sSaLAd6;JuTwr{x^WyMJi&%(`U0SkUqlk#TjjdAVeAMgrgDC?ws+QkqY!rJzWUw"
+        "PT3PAU<+ru^rZHm7~_pVvUI`pIk4F?1bXwZ76ltN<th}u7dlI@-En0?)oPYR%lVoP@jFq7G%xo_r!v+D"
+        "-nAZOr{QIjrWBrBQW?C(a+KjB08BQ)2OQNIk6cgQ(pzjPmm`f=z9@fRP=T@oCJfGZ4Y?x)!Q?6Wo-Cva"
+        "swjVd?#R8HUP2?pndyW4Xu-O~_#LWnQN-q^2;ewrA;QKHKL-h;>6szCLK^MPeze>f52C?bnME+3@)9uy"
+        "D!R>hGhT@flriP;@(_7pQg7D;wB?$UrVbNn#v5Y(J#=@7VcmeWsQ2pP4dBMd!c8K8a9MdHzzOg6L@JR~"
+        "W?|p_Zgpu!Bn_SwWbeQ+t4fUL;w_Va^OPuCI<UjxNe1RNyLgVeTYnAhWk6z3<9LHL2llA_Qi=0BciO6n"
+        "EdF|2&JasL2EOiUf}9n$w0W=*z0-PY+c-R}kDx4_1qb4D$JolqB~DCzzK)@lO7~dFl`NekVh-77LXLVi"
+        "rY<ylX+>nl$elu~*;F-I688?m+z@uBeW~iB^*}>Q<rS!MzAN{)5~o#LZ(GcwliYoTM)c@E*9Urn%?<X9"
+        "*9Ts0nN)o7c1*@&QR4v1^n-x`lu-mCkgSL8wb@Z6Oh>uwNtcX6r-zzE<->a_%;MY7pjtEmofiyWfUsZ_"
+        "TKMB)vIxigIXfHO6^*+#dnxntDSppYJ*`<em%{1{qx}CM49DB_8KCnfo~5}uws0^h;tYb31;Uzv*Oc3("
+        "(NyGm-`WicITT+KW)wZCo0oeohVJF_|0av?Fb~<*Ci*b8H9M7*n9nLh)nIn=lkSY7;+{v(DeUjKf6G2x"
+        "s1YBwo|N+bc7#g%`R2g+A~n79mf0WojEA#;*o|zom;?tcg($CWKX2hPn54vr%(7BhGJo6^QIPtFF+HrY"
+        "hzurOxo3t*Pdj(Dh8CLZ)VI_V8%~&4!H?f--#F}nR(!cnt<~*IAj>&0IWw<4`U=}15l*v!Fxbhwdv+}J"
+        "(rr2&uu|HzA|E0lpJu?)fZ>o?Qa~0B6war%@2pU4rX@ty+tVT4KJ#l?M+DY92tQF=F)ZD*G&!rLYU-r}"
+        "B-O!caC%uz;C{h_r!cK&`tN5g!3oW(a~rKLOisY48!`;>s7Q}i@l#Zv{-CQXwWjEm={F~$cVS7_#fNx}"
+        "MR2S#!ZAy8<m|OLZXf{wWJ<v=Q9G)q`!CH|cF6EamOm7{utNRC5&XUS%jw8D5{;KfQ={Ckp`~FF1ko7W"
+        "l&Z#W_Ya8hHm8gT$?;*(S~!(EZXuQZpno-2g*YB;N{(FoOU;9O;+{-!k!iq#{$^@~Qt*TrLlKz*M<F=I"
+        "uyWHm@g($Z7eehxui)QlFBcn-IQZTT2Wb$-UCO;~<nrx@q730+w}#D4AhVxaYa6Kj>OS|;!$5td+YO%&"
+        "MFma~Swr*)uDxn@7^VWPe6%KMQ&rliel^NX6|Midv`ix6Z^2<KNSo^`-fc$kEG<n7Oj>lnJtp3N;x6zX"
+        "t#9QbzmDsy&GIl6`+1BHglt8Bmk=Bd-eTBqOk|6!p_oZDJ6qZ8i|)2NUhYd3+?q<ORZ|7u(!16WyIv#-"
+        "T^}+3<rlfMN<7Pp2|o%1xv0|^a0lk{5o{ID>pg8G4njM*%#z_(_Fsxtgk!R7J#^AyPt^2?l<ZTfqN~8P"
+        "Iux5Eg&w$Pmlh(Pex0BKx4^?+`gQHzu7r=00a=!?1?6gS(Wg#@okkoGA|rYNCMi-4j!;lmL?*;{;5JVv"
+        "P7`?XNr|jWjb}Q|uL0;GHV}wEo;(y$0z`NU8|Ex*5OR|%DQjYGu<RX5DJKeROJ81j$T3#pTbnj!x~zVU"
+        "v+phX7FFU<IWDGtIOgcJE?u(#gC*gg{E;Pl6ESVY5BSpuQ9%tES@%@0zwdFVa!1A^g6|;#vbJ=OOPw6p"
+        "DoVRFQnlX<!%FPNJtMC<+Zt2lLyZR2Unvy)sT8PjkgG+1u&v!pPvrz;NosS-X-BBC<nag|^is569m0@;"
+        "kx^6Nl&&!QKFK!W)uqAq2vU!+PM>8(;D$MP|8(aoYz%(R%1c?s(2YNR$`f@3%MPcfnT|gTY^2Z4o+N3c"
+        "RncT^^4avfILF5W<e6s`-mA#yUt=Nz;U$HuW(pjof&8d)q-tCCgl@5k!H~a?l1B=>aD2H?)-*pPAK6)l"
+        "X^$lveXf5KE^MLX0ew|>!YIAREp)p30%uCtmD8?=ejVI@{f6eXWUq%3f#aO5n?Dpoc4n_ob{wwX-fdWm"
+        "Qbg>4F1t2-alUil)3M<o^ZRc6Wi2XkE>lop4Z>XMKY+yCCEG7@>nGT4w})stMV~M1!9GxQd_L(?tpdP4"
+        "z+6vBcL#(rxzHNX9xsijJx|dCK)F_!e)}q0otbUoE!Bz7Xh8abUJwAEfdDF`taiaE#lgG*H#`)#^}6Lv"
+        "m|O#Y^k4JXo~gb;)-KOWUn8REqKW{vhfZVa=n4{380-^eythC}<F-Ij)nAc#^y0sk7}j4xpQGTip9*k;"
+        "|5~K{d=aLoYrF{mk*e&XRyug(n`6Sojt#dFR&<UOxXc4u#^iD(sTW#UdVVKJnbRiMZB1$sa@846J$xjA"
+        "S6Pc4IBG-*UppZv9A8sVO-f(-hN~Z?E0m7|L46~TW-Ovk)7UUszdi7sRwnnk=7h-wLF1|_3&uUDqJbRE"
+        "$uby}Ci4#Ho>h(@wsYUJjVt124mppF3I<TTyC~*cjd)V^z6ZBgVcIP|3c6vt(R=Y=OKKc1WMeK=XurBN"
+        "|IDOa#KEt`)o;0qI%rEdr5*!lf)w#TBB<tP0MRTv!Njy?grl7udz6t_XvUjoza;XX)6|b-kA#da!Z4mP"
+        ")@zUja#@I*ZsGUAu_~XO^oR&`j!;P57&3uhHZ1Uuli-wdM0(6}n}pL9zVS9hKw~W+70H+k8_ZNu+I^=)"
+        "64yBfnhL=B-bFbcX2`|3+E(wIA-zi+XgpxPD~aT#+>pBpT@3WGpam4%CQ8dGUdW;Swx93q2pm-3E*V<y"
+        "hJE{+I%{t@F{-;qd&c%SLKNRpJi@KXFm!davzcU)#*8;qZMOp+A7n2<`i7DpEF2N;Ca7)KDvfutG*K7f"
+        "DVy!HE6SwXSI2+(R1k-3CwBWvIZ21n@W5b?=$32wadb_Wq%<7o0B>J|5$_nganT&Y+}t_M3#O{Izc-uJ"
+        "d%U7s!jF*^c9nrd(kt|1!hQQwLEkx65woa;KJWUCM<nzIHmo88yBrv2SvmsAR=nVo0gwh(H6d~b!b+ED"
+        "K?9+7KLce{6=tH;b3m5boSS^-hlS~jx}iIdisx&g9|c(soQC=lH~8BRkYMbqy_$%X`AlJtdEw*ME^CaQ"
+        "dbhdrws+eCo){tZL*^1RJ+M#>C?vtDh#wD<7YMOh!SqWq8#ccs6sqF<8KsA}GE{1!6!0sItMhtK;#3jh"
+        "VEj;-NV!?90-NjTBUmxbvoP3L5}}ZSH<yYjy;3aE`esBI1<AZF#51q?TwH?CPPId(y8nNw_9sn^?pJS("
+        "Yu5jMP>|b83R=tNlWtbF4Wh#r$V1Me)Q=f+KZIKOEl{mnZA(H18>9ypf+a)>dV<Z+))vkgcUQugLm=2p"
+        "WpomY`pc0L1*#ZJe7YMy4{V;nMuOv|>|^Q$M-(Kf-!?~aoqbNB-dTd1n*Zf~czmq@{vgxZlC}qAx)I2F"
+        "RcVj?5QV(pd_QwP3I#0I(?)}CM=J2`!@1}<m%(2{$B`qPS{Tu*7&c8qq9&jShP+ew)a2pDlQ45r1aze<"
+        "?E@7;Tv9kvp6^YHRfva00YQm8p9HRlTC{naq!dWQNANnuMqiRZ!9P9=1HJyNx;XOX3>@ZbKN56f=_MtV"
+        "?1G?KDaW!d2YH-u-IqaHTr<cNm0Be<pmcA)u|&P3|K5F1$Ar$)oYoDV-PR)j)h%yp7ZenSb01cTL|%&!"
+        "2~zKSrzgZyIa}sP=3PHOgEA7(=jD|ZnOA=$u=qg~FqurqTE)1HF|XI;+O3+rG7PjLL>c)zrA~&jLV5xI"
+        "4`E%qgCfoM#vEOUw9#3?8prSj)H{eHua{~)w>SNie>#D5WmFzMvZiduf!E^6=!X@M3^a1mutXf+KCCg9"
+        "T#2W`)MvHR0Gl%|ovk6!`pku4htxuxo?8_=AdvRg&OFl88QIBeff~#70Jg|To}o#0uZ|v7KlFELi{;(n"
+        "OR!TDCMF=vBo%ZR2tp$1Ct&HVgt~agFE&%!h!*x=wM6eJ=)m`Ef87KCY45?$swSX#-XLiF?xz~E7E*j)"
+        "lH@^l$76Wdy_cPl6GpRa^;jAc5itpPw2jo;2P{O)BGWoZ+|>-cb+jOSQk68`3?}<v3d?J~P30$2Oe<l%"
+        "N?H)l7=yrGlxtS~<TRi0OCub2YjT{Jd>i0K?JiXu>dy=VdDYR#w#;7BM@IJajRUVHC)%?-0#ODxYyzq^"
+        "M08hqmfqm+P6(p`mFL!}56fqq0xu~T)|!7pq6NHOuDZ`ra4<zsa~ir{Fo$sI4=)6@M?vdJ`+;%l+$MYu"
+        "xqPN)$5}`VPOfSoaMwdldPc5?pgpDURMJ-NRXF$0Fw}Z`n$r0ZbwJ9698ESB*FZYnCNHU5Ls<h(+#`Ge"
+        "MA(n|=!WJu*Q--T6U==MYGEwds*<pK3L@>j_*KTbE*@<fsS5t>_Hd7h0)5)_(~x}J#FPRE46=GP(}=wE"
+        "nIX6uK0-qppQtGq!!cid=hIWd9lRcjuMh&QJ3UGskR;hHFned$Zes-aQ9*0*BG4KTP6^)9!X*>Mjzo!S"
+        "PS6;EAHl>zX-%z!!~rgI7H`XcizM838#3CZT)bsMR6f?Jtf}{9-m7{)9lw&)7~%%dgT%2*Cpdf%f83_s"
+        "Wo<T}1b~O9oXBs~ha2^<=}aPe&`04VB*k^;_(SDCB1>oFrR`~Ix0iEl(voSLRam~;-9zuQs7}U91j-kg"
+        "J$(Zl&Tvfq6ftf|TKeK4>_1o8kW#Ck`y;_t{y{89Vl6g`m&$z|0#Q*Rp+)O#AnJ5`*7<7=)(^N}0D;i~"
+        "?3w$qe-*8m`OBJznT4xNO5g8e$)~uCx2nlSpMtqZ)gvG~jc43SpEp!$=vQG2Q&jloo|aYG&y+20wb5z5"
+        "WdtZ7Zbsuth~DT(PUyZk6XF0)qOYIWS||SQGnqB>gqfB7^yG2Uat7TPwuUcLl1+9v%N8EDW9**woT`z<"
+        "X8-Lj7}s|qf+8plo9~A~UbMo}ijK-!Y@-#gRXq-XyHBO_aGe?$zca7i&?L_@kFCCPuGrilK?kTkCq=+u"
+        "wp8=lc@}hm+fZ8cj<LJW&ym>jO|h}*l2Q5{P9gcubX9Yq@CzRpfemg>4+(`J=*w?h4duXFA{UZEm<Tjd"
+        "R0F9i5s`5RCqWhRbsbOS#>@6=bE-l|JSiL-Z-U}8GV&JI#@Pfo4Y$5f;)4Ja4?s^OO5;M-jzG5q+6}&|"
+        "${{PQ$5DeX6zR#arh;;iy0Vom3t~Q2(&kSY7-={aCj(!aoN4LZVIoUK%gN}$sq*IE!_(&mW0Iv!l<P3s"
+        "T<>#Neap6;v4x8JT{lY~nx(Vw?Wtj7J8CpVHN*B!2TnWV^xYEuv=~{GtUgA*Wmng^G>P%a$~+J9j-HRb"
+        "6c59T2<cedmnvr877})`Va<Yn1l(JF5$Q2&*PLO^>S1&y*&<YHiTWj`<A&Q?G?{%%E4Bp(i2=jb2ax4&"
+        "y$HmkP2JOZewDw-xE#YhB-vMJGww|@J2~B*Ob-2ph}@14mGHG~*wViG!%6|;q2&l|96PFy`!CH_b||fJ"
+        "`yRTb#HL{iZJwO5T{mCyM_=!wlaGc4YblVrc2B0!FuAr>C0HW!>iB(Hm}FQAA(XNql*iM@eHw-)ppD#D"
+        "-nas6$HK|E5bH+(Z#Fez^;SYG<PL{+;hAx}a)jsFX)25Q1*wDRl9_vH2BIP=+H<f{sKt~I2*5+&z~3Nf"
+        "k=SH{LKT!q1(d)nsgsDIoEL!+c{E!dME8q8O~osq4Vl$dFo2ubk0P9%Wo-P_-zX_kBxSnq_aPE`k`OCS"
+        "W4Fq^;ZGWsV2cb*rVQEd7)B-X=PA=Ku?U_41i>8tz@s)I)(`bUBcAw8-wC}?A6qlk|Ap@vo0nclo&*z7"
+        "qEahu%R&WbKpCK{iCI?;pxxB3My&9tTi;XBoWwrQ)xOS#1DPT;v&}HpUQ8_fU#-hFvwP09X=oSv7^xYu"
+        ";RyhUB!kqULjF$R8S+WE@Ozri0+6QH1UsFF{VljfVw081;fCb5*6E4y6IMR^8SypBTczU}8$JF5u2F2%"
+        "k8s8$_}Bzg+~APO&mTrvQc#(!Mfa{Yrqy6@N-Bvt8!DJ&qdTCa)OWgESB((6^8MHw*wN`6R-8(J@#&Y+"
+        "0YRM4MPQYC#52=!DRn_-STsu4Xx?V2YphnTIBAbiUFoC}$<?m)bdHJ3mB5F6|B@5(f+p01nHNqC-O=^&"
+        "UP|IqlEM-leu)0+Hpn>u5wUXlGzW8$7Mz(rmT1+(x5x`((|L~%ynXN^1afLKqjBaahslyIWi)75k0JD="
+        "EW(kQLS7qoMknqv9%ZA;jHNtR(p;61n`f%)UB*SAE&;*xXQxm~lJOqe&f-KtPI<na45FB;M*DU5i%fH("
+        "(OYaOldH3N&)MC@^N;w;3OQhr-X6n1@Ee9)n)NHs*x375)s-aP$sS}9OwCP%b&=94lLQa1<EhuRKRi|k"
+        "a>DrZ*}7<U*(#Jes>T7YkL#}ZXO5>mB5BM1>)obC2?&sr)Ra`>;cSYd5cC*{fQ{1qJ#PQA<P=KBLd?6}"
+        "<n-f*8Z8mtu<f-5IdggAeLHn4QO;5k9^$isKPOwov*UL4(5xl{d)gRhSp*6n7d_a;R5Dn_p=DL5U?3AQ"
+        "A(BP;H;${ieat=!!R@8mYdWtw2iwC)sa1c0kG^P>_fYS#?-5{Ztg}-Rg<bvFPJ|Bpw25gseY2mRT_(Yf"
+        "mc&p<f`WHoglB0k99_=Q5W9+4Xa0_i^d8ii{0%2ITPRYuL8&iQQ(MQHga6Eqxe(L!F(B3v@IU<Fs01Ax"
+        "RHVxho(|)330=f+Zr)Q!bCwu#-jtc;d?(W`<W)14lN5x{QMD35?+<EOXs&)?fKh-xue>YLy7-dfJ&5YG"
+        "Ug(E<X2I8J^s#CR79Pcj5#VRzJdtfkX_MDksLZ-8mKzH}w$e8LZ@OMfW9LK+8itpW7QZ7cmOL}4=~!E^"
+        "@`zUt+t`j#{O7QT{ZA}~kpn~$mhD#2uaGnbxK8tT$39KfI^QrZ(6if`%m@_GTtp0ukt<y*4CLe3G64zo"
+        "h6!59eN9aTP92kBOhDEK8Avu!EKwA#VN&gG)lyyCLzGu%$L~U)w`VSDo}HJ+nW^Nly4!5h^^SDOeU<ox"
+        "6;)`g=V-unp!ZhQ=Y0F5S+D&=jS-)GF)r~G!wEp0i*frXK7Gi#)?A6ntTbr3zTNooHBVe|-=VA3O9cH~"
+        "WBu>fDM)(oe~5bp*51<{7OLHn3C05jd&7DzInVkq28MI#W31`Em+61*XwWMx_%B-`#`#1~>pHI1wI<N?"
+        "vW1vs<Ks*dWg9=t;YWo-=t5u4jD%Xt?3lgW<$==!B-Fun$Xr_XV4sSQ*vWu-vLl}h1~`;u!@<4w)n4k|"
+        "VfmbQ&Y@Y@y;i{y2*zR;k5wJviQY{&I5_`Z?E5H`7O#8I0Rvf%0)w^eLNXXr1lhD2bu=n4P9cb23BgvH"
+        "kVMPP)J~E}(c)cMp><?ghf0{xB35T9#K_F-bFGTbvra6K^!Gsq{43PsgmT=p3o74H8-~U6UR2lZ0$q;C"
+        "5;avkBr<VU37zt*F{xnn;3t<)6HUU;*}5DHIaImpAGZJ_d#LF}sjW;}1uVGe<OdaV3t|!P+>dCpz{8=>"
+        "TMO$_Sd=af!quWFNQxClD(;bKf<XV)Ybk^M>JP8^+*kDtoF^|*Y7(el?$^5NjoKsVXTqpxXY~W}eldf2"
+        "n*n0a>!TlyiuZ3lH$$&zhg*YH+3A?BmJ;+CBbc~&QWiO>{h#UlExsrtZXs_T=(4v_W2<@Sf>Eij8vt2W"
+        "CZbqphaG)=LHa4lH`RiZDil(+@<zPG<uIXe!$kHx9z8Fp;E3mFv{PI*Rp)l(WFp5D9|2RhD>j1)6oOza"
+        "BdQl2Og#?)ITj%TplGDXu*eI#lXu(H)|gOl*HI7EMzq}L3#|x`LbFo`zK-w)H9g@k_Uf0%3%c_-4CsZZ"
+        "cZo-%#Ts4XjDmJb8_P+g05V*X4XFvWkx=wE*^6ZWkl13{+G}+VN3$FzQRn{?dJbRat$e$ssX4+Wx0xdH"
+        "-#C}{<)f+lU%oEI-rmwpM)``+j9}r2SpCR9a=9qIJI>J{i7VJV>?g1iY({B~7ZiI{`w?{cB|Uz@@0Kc|"
+        "$%;rJ8YPSxhFL1>pHk{`a%jkYc2-aWrOpPNniLDmC_L}N0VUoEreE~&4(FI@lI`iOa(et#c(q>&Wd^?A"
+        "%a`fIZGioMq7j#A{leU666JgKyXt3WL?Po^-NF9}7Q^?RbJ7vEahk5SE)-lYO>xdzwpU>+WL^@z`ut8X"
+        "%+=wJ0%kC96i#d^QASF0ISZjeE!`@`449t2TkbQjRvuk`y)LxqT<Jf<m>@ZGg8VNaZO(4(!wRJ-X6sm!"
+        "AZsRz%rfpY*{2>Bt%=IZ?0NZ24-HVfp62Xr$9r_zE6=$cW;Ia2dgT07U5}H|zqnE5{&R60#|BTJ;D_IZ"
+        "pSNyb?PFvYC$mF#^?qh-kVIbC;75&2twFFx-_Lw@B-_PeVGHO+m1D}di&!R9gN&ENblGCmH{%nI?$$h|"
+        "Ba%2u7^u?_WAsRHoiV0lJcf--=O+mfc?#Mv{5kHbsZJFNt=LJck3^9VIp(B=Z<rg5A<iB1XyvNc@QWE8"
+        "WvL^8JOS~8@uq8$JuaMrEtEH!8Ost_B-xA+lZhtvhpW+=h#aFyZ9!tCEA+QCbAt%z=EC@vb&616#IA^W"
+        "6FQ@XKx5ay>;q+SeZKI|+424X@Bg?mR)v7BJ)b)xW$gaHf(sPW7tNrLnqhyp@YY$*G02<})yqY~*p!CO"
+        "(+4)Q&T4+#*(+woux5u`!+0_S<_u)+J|@_kz8&UtF6>xo@`xlDe_gl$n;EC5o28q{QcaW3v#_b_L826{"
+        "MS^uHI~F)sDeBGL%bLd)Lo4=N^#q23te_bswqFJ$O0oZ(6B(aUeqN9JsUpJt9+(xU!t8GBrUp(geknns"
+        "VC!~4^YNyzw9GzJp;<2NCZN6ej&}`@!VUo1_7Lx|?*H2r!Gh<DUp+y6zkY6F|EfrGy@2?aiK-(1Bg~Cu"
+        "*BNFeGfo-wD#9;UzUE4YUV_Uu85mAY>(oIsObVrJPk+S!=*$tNsrL?NmpUM*V#l?mB&*cM9VhdkuY}q$"
+        ">3d*aZTYg)odXM8mcKUh95w*K6ok{SuwIHzj!0g^$1$h*ZiA43dyci_oqWeHECgk%R(IMZS}EMSaEre1"
+        "uRr`>FeWIy8u&K}%k!#~j2(tGAPfLjz3!IZkUbM#V(2O1_GV311Z-f0(>Ry>WAep^LhccrW}HyXpe&F_"
+        "xPOuv{h4Cbkan8%aU8W!11jZPwVbm6FzafCeMgxDE5iz(kgy=!UVTzbb2@@RXtPsM$;|sR7r%b7wFA=q"
+        "y`-f^0({<nG5?Gbj8D<Z<wkGvEA_q8%`v$iNdA_Y9?@6*nN4!zHH5_Uz-W-c&YBtWCR)MQ@VC8+;EXDB"
+        "a|F#D%j=s^t3X8zpbb7G?Yact9nyd3^XE!f_rmX^AtTzCiF@nE&7jbQ14S&tQNn`N;lJ(Q5!?%(!8{^^"
+        "Tgr0nK%&ekAs5nxyIlIVJhlaI?dmWdYmAU_#MYVq&L8{Gz<EI=)0oq1Zw$4HZvT>{&+|e!#DqPn3aoQ|"
+        "YBV;4ZWZ%I>Ivbiwfm?k4W5E*9oPx;5k?|$`m5g9p&^{gT$q_X(rX4@XkQUP&d{lfis#thsX!_sc8|(N"
+        "r(Cd23;ZLezk?yt;Cq#rVqQ@O&*SgBGr+#UxYtR%yMun?#b|2l@53Ozz2>9~FeB6wh~{1Y33&p>SGgi="
+        "7jn6sItZc*6hTJ3fyjcmovD=lMA|NRA9|%I*N$nE4gF{rdLY8%wu6k1{1#jyvOv7;-cIHvN1@AaTF{|B"
+        "UPKgae}S8{i_+bkON2uJ&xIptD?eVA5$)Q9hfVXlv&2i><i^-4K0zQ5**h}bm>Y4z4d)Qd$Dv@C^zNHB"
+        "11&a-7cEiD&h7-HOWDv*L*bkk)hg~8As&{OV@f~v?m3mK)Ic>R>o~5><?CQj<Tzspp0<8H!9hOrvhcfu"
+        "kr)p0t}e{0_b2V=Pzvp+j@i$s%t?Bds|s5#OO>&O&Q6Z(7m_M<Z-f8~o4oAJ777-VI%KmT_!Gp|H)){l"
+        "so%}+V4G|>c_DTQiU<s_9B$4qvS?080}JiT6pdsyZ|UvbAJGISd#Id?5be4<QWx(`*nO&zs+fwh1k|+Z"
+        "N$^vUnKjvC_R;gIIC+SXF13LF0B0?Kp+;QL8!`TXBouFmy9lt+6<4w@H!k-}HAhdEmjw%(_zJpEdlROx"
+        "0K7P9FYKJn<Et>8X|=n(UK7IDa#oh0>jkM<i*SM>U^13}_y-_;n<d>}jNy6AkSW$MJD@D8b@*>vS4nCo"
+        "!!^R<n(`1IZT$lgEn2?m76*};S&>vk-AdSu?~F@twDIC5Fr;{WLbmwb=ecDSfRNJcB1{R+J?9|KHHkO;"
+        "h-KL}PcO!*Ok;Jw;aon=xeM#ey!1(g`2jm?>fku(BEklw#PRtkit9Y$-D24K(npakU)a-5*&oAqd8UAk"
+        "Ng;a&acu!0m>BE+OiQY0oH?@&Et=aa^W&GX+e8e0@hsQ;F+16)cNJA*k-bK`s2pc1cMs&1bxp3S7Y)KG"
+        "ajuJ3=E63n97Ux-E_*T&u^?$&GpCg66iVmaxS@Qr-ibxr+|q@q$^Ul|Lvk}x8{tcQj|(%Dq|zt#l=pMu"
+        "slaiESYqsIg9>R-yG9@c=(efIl+?0tu2f^Hmm}&NeNUtzo!71I&VP~ynq{@gxn9-pHr0Ye7j|G=xg(#^"
+        ")#7&$mzeTGH60@;);YJ%^Sb7-qzp3BHjI1kRlu?*%MV2#NDCYRp1vp8g2oF)EDJ-}okQY&?7=9zyk}!t"
+        "P`-4g(q|@`FQ9s)*jwkkZ=i;`3Xd7(uX=XR5qKcoJvDHl*MdLFB}?$wfflm?%9iJrr<Vv5>iaQClA*$e"
+        "zRE&N2)EpL4%R?Pq%O}kc$8V?px{Q`AzrmV2n!Z~oaOP&Lz2=WH}&9?>0$Ip5DH7Eh6wHu91;dr>5PY2"
+        "7)y_Ivi;ZDQiCBrmvfHO^asZDApDk$3b8e0c!UwN<mO1t+ab<DV6|UB@m)i*^==$VeUCm?kuRGw@&dxW"
+        "Zqr;kFMdq;XFQvaInmc13+$I!nVN`mDzTI@C!HR#YyMZOJ2na-@p&M#D05%hJA2T%4@hGKje@r<N$)uf"
+        "In8eoz*$*-s3$^)yQWrlK2KJ&>+J)>Ph;JQSQKoC&#4X|qIGvmGHt)0)xgvK&jq#Tjw*{r_*w(>T}U%^"
+        "ul`{jkr-V&x>%M^Qfd+N2^!6k1<$IdB8T;}Gf!46Ctfvk0Ib8ZG95s}Rp{WH+Z&6{<HB&jk&X~u{HNkC"
+        "ynVUT-<fH6%4KKv>tW-d@)TkG9d*o^U_vPK`sFHj@NFZ`rvT64E*Not&MM1@O)sD?!fD6@u*1rm*Domm"
+        "(B?)skCQ-KEw^7}v$;u%e(8%3W%Fe%t9VkBkLelksjcMDGOUf4XRC2@#e;6~Rt&r30Bx+uJ24G?b$P1o"
+        "Bx#&^P(;I)E@Qg`aI>gSy4HrOmyv1$LJ(ZvZud2!^|2#v<-=SyOGW`Iw_E!;px5pq&>L)Ah5>med0u*P"
+        "1#1E)H(vx!W3=1G$CnLX6C7g5l!|N2&GLBa!{h8llXt|Ot$Rd?FDJ(yW+Q^)ekf-5!c;Dg_I{07bw(Ct"
+        "fzC(r?8U(gfrnKi)r1r9=HmhT(m=eG?n2G~u+QVwhZc#262nkQJbFG4DO?63^o?cIfW}yFq5wMci($5q"
+        "s!PE+&na%-3bjtsf`;3_eWNAxb=s5*Pc$uB;nPAshO};@>Jf18_uWxRP9$Gy9i3)>2PPGsb2Zu8H_MLB"
+        "?RREy^RG#>F6X2d*FdW>?QmPguVZCBChUN_oR}TG`q;+fu4Z|h*C~MWqVNT2&*w$1#thi)llNU~_Z9{b"
+        "#YbjvOYF_B04}70WWg}L<WhYkP6>w6!W}=wnA#({y%_up@Ip$o$>PrDVsOCnXyfIZD8r^#!2?-FZf*V-"
+        "Rj1WswuxHIb`IO$nI%jq;?~`Gn<S5!z{&ANQiq%XX`wu7rFQ6L_Iz~0)ZJHYDlusr0ok@Y+IbDw0tmCD"
+        "&*~HZLPi<MB2wG+4jNM{|Np&5`vmfrm)Gg4(de#bEBJS<gL$oXpQ-S_5RIfqg~~R~JoK{<Wang6sD#hD"
+        "?o)m_E)30S6tv6FM5`S7)PJ=6$9kW$>Q&Iig3srxXa_J-VcmeXsQ2QY;>$>}Vrn5$^%{Sb%ngm)8nOHh"
+        "3gkI=%mYMvIILqp>!xQ1P;*P>47jO{QouBGup0Cv_lm?&jv8fDT<bCHSCla^Hk=PfK5k$H56<T>yKxqq"
+        ">VMX!Aj>_9Gp(RnVe)ci6D|J&8G&Ub*x=kJLTW+=M#ppr6|D!IU_kaTs<1P8d#6(z-_@&V+XDY=O@l=$"
+        "zL26Ohc0-TIWd8lKOB&3SdMpsUxIWTZUWodh%-`)PZ@d}PD=%hcq||No>FAlYo4+2E*iD@3b<7HrXt|>"
+        "C08;Vy~apKxCFnp?Wiv25WzYtxgotjc<ToIiAvar2DqG+-u2B8*5I3YEyyu7a(7k?1!wlEDHorNqt-Jf"
+        "tgdPS(#nW$Z?xTk*m5YU2+=;gPP;=#!@2y_Sty4{e^Hu7nD1|y3oDv@8o4YI5t6lQt0ZWx5orHvpgL>4"
+        "nArq4-5)}nH~<%Qy0zfLXKpR7o9(XQH$g|F6u^S)DODxk2^I2|i`m3wvem-XdaklVb~x+7N+|Zbq2RqQ"
+        "Q(l54EB5lo0J!^j4;E!7C~!+on-~d{k7jjg%Kny#0tpN3g)(SZB5s}QcS$WQQZwM9A>nA7mk&)uCW0jX"
+        "B~q~bsJ$+|@Y&N9vu9S1Jqm^6*dj$olEWbDRV%J>5isS_ZyQ@-@Wckb-*xMRy6y&ZeCv1hwG`Rq*uewG"
+        "Hg~@B9^W@Z!|;p}r0Z1aN;NE0gBUJ)%C9~-GR>7#L|E3YV#{5wj0h*Y7kY4RqgKOvnMYl1a;+<{32#A)"
+        "*Q)3iawE^CTBpB}6|Jk~UMoueyj+y&fkqDwdCB4~Tg-|#>C4D6qrKUYr)FY2JupDHq?Q&g=ce>Xdk1i<"
+        "AR#fSRwAA43_t4gS|XXZYy2(4<mhz;{q9%ErV%LgZHa(sV5Wbrf~r<Qpzx_C5`ZL}@Ek}Xzvft%BvbaP"
+        "q(;PMTTaX{P>eV~s1GbK7&J$-?OkstqmxvOCCrp=<Q<t?z>aH)KvBrJ{geSimE&M$5uLc74=_dU8o1ON"
+        "Wne;KtnJW@Etl~OF<6z+v%WI>*p?JRwsj3ISJ;lFZV@6A3~t`qqIraNkdzAkfB}iJI+O;^{72mFWniv*"
+        "`iCZLGD9*ou(rz`0-fMTz8gNgJ-JZ3w`UP+cgKr^Twk)gL+%k}l%Z+R9v3Oh>Y*rA(Wh+piV12d8N|h9"
+        "9k0c_Zt(PVKdxFZA^wucL)N?LAQ40d(!twTt=Qx8?n~h9ldp>F^D+D<9qKdDLE$FN1iGSS$5TPD6x)15"
+        ";q*azC$%{I6}Yh~rAfdBLXh33lbcMb^34Y~L_7;(r?nh8T|U%RQ5=<ep<@QrGS6ScU@Gs@(qpM&uf;u2"
+        "4I3HP<XKTSc$%rj$`81z#5I%eo@ozVqL}%U>;eo6L98rIcSnXY`Dn^M)Q9jl{_aSPfx0I7vd<W$Kgb#2"
+        "g9|U>ne25pwWz*^jLpu`vcSK>Oxoi{8Wyn%uj=|<TySE9&49p3o7-BW;FnIsLx)EA3$`BZZ9>_C{*=Cj"
+        "cT-QBK{MV1Th|BA@mQ<fu_)eH6N5hg22R|a;M_dI12<*%d8(M<iRmBoDH>uPU`%;8i1KM2KB;CGB$Y6v"
+        "%2mMu8Ds!udZ82aSZYtnXzK&i1q-SlPXQAq84}y@)LerT=>f7V6I&|j-zUi>tl7{o)Bu4?Jwdx+hk=?X"
+        "mR=4eSf@XS-=04(oS|>-;@%4+`V<=uvQQAoreR>(0k!%90b@dcdmLmx$edAb`Hcfp#<lmVKGBhK5DB(f"
+        "rem?(RPq4am5!8FRHR@q1{#IjY?06P%uIDP@ptkklh=M{%3(POvQ=}7o)()+u6Xp-aHx*b+Iyj5umTwG"
+        "n0v4PR{Uf#MSk!((6`R3C5qy*1_QS31{!MYKG{*0N|T=qFz)5>K$(pIE?a2LCws84aT1yd#^tP(4Zu!V"
+        "?krA&tR<Axvp=ymsX;=OB`RbOLN|SF0_rF2^m5w^70U71&cRVrpKr}&tFT`L9O)WYAnE_c`YVDteuq*i"
+        "Zy*IiT2Ma{9*=Luw5p$Rg7_bB=M7sCqNe7b4we~@cG?p~N1yp*UYZl>j_B4ocS1yGPATzQgpb%HcS88C"
+        "x6+~DNZiO7`PRPtj38<0=<&Mr(XG($%K&hGVKQh<b*WKiZcWu(X@ldA@>qE8*W_<$a?EpazG&EC|F;?i"
+        "+mS5y`Z#DjdNjCOVOdw`>>*Oyaw5(CrNY75rT1jf`#F>w`ldLhpcv^j)C@_sNMIIm>#@^Ke}Q!-0D??*"
+        "3s5z6B=n*|O2BgCIt^-S5iJ;O%12Kj#Di&gObjIr0rX(>Y+Kt5)8U9Oi%mA?Bsb0?xss<N8=$o-djd+|"
+        "M`9X}ovg^ij-Xl%Fc^tZ#?va)_)V2H|D*DFx*4vr=-b>Y@+GRYH}hXJ@gn!;{~Dn%Qnxvq8q1pxG?($U"
+        "98$uvDxGf4dNb%<9FsM|AF-X2Lb!Cl%3RsF_b!Eo(N>JH-Pj1M`h-6cyB;rO0bEiOMQY?JXqVy(i{YKv"
+        "@sT5)F21UmlUrUCfI|EU^+R@&7h295Www?*tZQr$_uMXYeM^qvw#KD|BTuQyM9IeqyogD5o>Yddsrg70"
+        "A>eJhAqhl5I8$3JB`yLtX*WUcEyt`kY#1<@YFU*~E~e$0h6zmF1ya)DfkoSv-8LnE2c$IV8PqLnudWvw"
+        "fjF%PU)=`O0a9j#$qEPDIC(>PIP5Y$Vy6&#!$cvF3m;wl!7jA1Ec}$=NO`qbpU6RF{m}#p8iG;ui;*Ma"
+        "sIx_W%tJfw`=10GBCrLji)z~)Jx&2)AjH;zW^_!ESp;kfUVsdn(nku$4r;sMq(LmChxMq4Fu3+8l86F$"
+        "CFo0FJQ1VGdcazui=p!d5CYnSaN1k6>I|2eur9nv2*cp~LL)4=n0&a%8Am0p=Kg_W&pD6-mn6+c`2;<h"
+        "A<5!;RST30BBk$(_Jb2_e=Hp)><nrmc;={hnPq%lli+|OyYx`NTpy@Qp(qMT4cKCT5L2CPL~-H+^2%uI"
+        "GV(GYhcOvo;Rp!&?LwOloR1!cQjJueVu#)0JIAheK`ip>_7-vwqjJ_vP^O;eh9osO_TQ}rnzd^4%Sg%j"
+        "PfW3ptH}TLUVy@3mf);_-dG7uPzgxG{ZumSN)-eZ`RqveOs)ixar%9nj*x*na=_DHx0E(%j_ZE!Cop^e"
+        "nCGDXPV->0WZ%cff^8ZA&mY`o79&lH+Q7N~9@P?!QImx7HsAA~PR74e3F{YP5q6$iiqCgqO~Z@XfLJM("
+        "t0U+6F8#8hnA}We@@UTMb0FdbbDfW%-UE%U$;!8i6j=GT7mRi#Hg`_5W;lXRJ^~~0D?K&ukqXe#hd4f<"
+        "N<+|T$3k-wc}rdees-m~P=Z5X-S#4&W)RrznyPj#E<Ql&k}5Y-Y&wdwFp|sx2pkRReXW#ubFML^%}9_{"
+        "#btl}I4=R}cUg8wT5{i3K}+wQLN{R^UBSe|+*C5U)>EO|jEXvhK#<A{MgC`x4SmWM(7AXdXur~AsW>II"
+        "0cX?B1e=K)#T?Z))WU7dhmJ2B+zE5TVbt{6QkX{~C8@Siq=?VecL(RurYm!T1HxYGtUAM9RvQl;i}bPa"
+        "%m|Ko(bom`&P~CAul6?oLwqCl4>n+<BZi@iRpDysuUBFdVcG#Rt$SC9A1-z|9GkU_6wrStP3U#%{OJBi"
+        "Y}J+bODHj7Web-q?$*t3J-4!fo;s(IJY(}+bmR&KFnC3B%SUmAN(Y_SOBX1}gRlLUnp%T1pkF<Kh#`1S"
+        "68vpkEX3=q?-7A+zN_I2{HALYId5lWw66nCxLs%pFj+k|s*J{*A-x}&O7C7b5N@sln_=_v6UiwTLGI1^"
+        ">k1%o_sPAj6}69BR=Wh;BQuISt%y`z&MD_kcDLMP(wThs2TT-4O>oyn<D?#%{ZUuwIBUYKK|hZ`NIGiU"
+        "=1?I0?d(UU^GlxQU#^gG2eY06o_h%Qa|McmR7jR`2J@mI)4{5~Fd>kHJr(mL#Cj`1e7p+pR^R7^WGByA"
+        "LB&(D3=dK-8=Fhn?<dM-tgHGP1Em<qiT7x<1AQw+%82Ppu2l4WekU>N>-mGUfB<Jqbx!Z?H4y#~+M=q;"
+        "kDSPgDu{yFv)4<#M^gl|OK;fyd6m0Ko%We92-0k5-LcNBp|~f_)oc}_b9((k@*RC8zI7sb`9?&Y{?)L0"
+        "pbE4tk4~7CsZo!&2cQdR&t0y9z2MFjh17zYs$@^4wB`&FwQZD&29+fKQ>VU6gQ_2ltiBr0_f3BSu8-<9"
+        "RSKax<?yCz>tl({QBGdX78(|lI%=~Z{=1yVwvDm1!d=61?EEg>m;jd@Pt$m%{&Sg_Gsc%1a5qWnq1G^U"
+        "!wt5{j@wY`xqf;(YR0RKjP*F1{5}(n_aD`TeyBXId&cF%Y2VI!Tbna8z*qz9&4wdisE;a3Eh4n~^j@xk"
+        "-*iWJ|E%HKlYrqk6aY>G;bWo;;xg?whXb=f7ajVH-KT<NXhg!c_Fc5b`~wGSW)dTPUk)X4&TLkJx9K~M"
+        "X#C~$iSfyB>L37fmauYfj(&(R%&0C&bs&<eLEs*l`wCr2R0;~}{n{~eGWmY^Q1Wb7tlC-;ss_qa#Nx)?"
+        ">xtXAZ#BQRu(~$cV+A&rIuekmwxS_2T@u-vrc2_dC89Hx^y2H*R+-#&;$`z9*o^mlZ;{f2T{PhK;R)(w"
+        "D?LVwpQZ$fFpJsr17OQfpXYlN^v9Si#{w(i+Vrhi#&SSH$aYOWo)4$}^@yonoX1<~pz%hJqgetM6ylGy"
+        "BgT74?h+0+0%cX<N2Rc;8ef(CZKrZS*bx>NA7+;TPB#cX`!{ey)l**NJRlj2#Oa$)e@?1sM+W*me8w%H"
+        "z9(Nwjjfm$v7;=MvFIXFXA`GmP_8;(_eE#sQH9XP{8ysGQltsQ)YgCLR{~|P@*G}g7R#+aZy>|v&GUtf"
+        "jRmeE^7T*uiTCv>aAOwyIU3<el1~U_0gumta{8Q2DE=khS1daiF{MFwig^~N<G9kN5|gdy9yfu8kh;mQ"
+        "<6kjsi|TX>L(7A-3J~|J#7bNTjUA-!Id6-ZEK+uvZvJ-RO^viw213a%mRH1PO#e*MEE~xsz8b?$b|>8_"
+        "hv6c>RR(o)J}QxOT?`pJ1qXKoVQL>&s+c&F?E(xU_ePwjW=mnW%Z5=6wrwSCf7&O^eNH)H{<K8HE9KQi"
+        "EX(25^>WPr%F-#Yy6*v>*ofrThusMsGD*mo#${BD<5c~2We<cuh$N0r1fE|Cy1>>9*OD6|V^HeYX16M)"
+        "aW>Fu1Cho`$-&kYZ8oNOjxZA&g|x9r$YQ?dhN*veoNht`)<q$HERV8Q_RtiJP7b`aA>xxvHIEt6i)V^c"
+        "{nxk_$Bf6`!`-`C&)h|Js`1i>r@bMJb0yTnaBJ%x_zQQu^%9jLPB<mMbyzYsb?Qot(^-zZOaG{@-l*gr"
+        "3F+(*4ZgC7y`bH79=Llnp^UZ*8@~8r#ETdoaC~$KeSNxlb?}v%>eq+RV-&3l$KaqP2M3wB#$1@nh_F=n"
+        "qZVTb=ktOP5j4<e%5XFpA*CBb5fftkc7%i0=v!(UlWg!ygnY8l>_-*!*+}Cg<lRR^lBHuv1Twh;^}3lg"
+        "h=sIs*gpDAFE6nCR<1naEg$_pt|i%dWCdx86feC?(*}}n=g5mrY$->nM!npV*`|?es&}lPy{#>2&#^s^"
+        "2F0-ry5Umj3!Cw)P*GSYGH0=-?O|*u2}VdMnyRI4aK-gD%qOH4NY958qv65x3Si#l(YkgT+?4Lnu`rSw"
+        "@$&jR1gu}1kqw;u?$1G<n&NfFXC%XD8N?lXzoysyT%z3NcSSs6_%2HbD5Fzb*d#g`Mrhlu3s_w-*jWW*"
+        "|E`S|_>BKC^e37Ys|JI<Ra$JLL^V`tJjM)Z1>}K$ISCT0TyZm{KA$7)m-cA36UDOqwh>#1udO3y=^#kX"
+        "i*v0Oq%0!^4q@ha=MI?xgvBM<9?%f~{%A)sPSCY!YIhBiD#I?0%Qt%vwL>C}j#pZm2laK6X|c-vTsU`0"
+        "a~&)V!cDx8Y((t=GBK-m!-`zB*X^6BL5&ZX#KM<#m;Z&5&q&wQp~qSOoBqMapCv6n9tY}t>D6Alamho<"
+        "Cs}Mi6V+19-cJ#huZ0x)8b<MWSoZTQhSnyfBzvdE<UBny{#xD*bDe=i(95)5KHlYzG4V6Zs$stFMBMt#"
+        "MXpcq(i8P%p7QJ?+7pfGpG0$`0A+giWoJb&tye;`BO=(jGcpfk0rQwP`h$5t5^QEJn<ze0>jg*v$kuGG"
+        "85D&&mcCfVnu2zoC<yNx=5unA4*N5%@ud-Yud4=P8dAp2q!ewUauQkN+V-F4&XJQHQv!E0WgVkKC%o_>"
+        "TMS--YHCtFAN8X)wRffl%pSgn4U4VcKmlmDtiwF|P<ZJxPOeh4sV7+1SD^PLa4FY#8OD{AkYIvow0(`8"
+        "*XY6)W2}24TwgCZu8~A3mS)qE3z^EW`M_YLXC5iIo%x>7-94ivgHbnSD^eK2BOe9&vE@ku;2={C+o=pC"
+        "R~h)<ll1W0V6J~3d13ceyeHhhJoKQVF2A&$Gg3_Y7|c)>-7H;N+G7h$W||<W8tmjXXzvs-K2IUL$fK+Q"
+        "#3OM>?SkdA*Xc25b2I^1<rlg)F%UfTLcQ~)S7#uvDyAT$(e}3KV(tGa2CBMxy)yVpa0+-!Gd{F+Gw}5c"
+        "d&cfQ-9ud8;BouoN2GuU0NE{lM>rCOjM+c?E@f_5ij0d*>I-+S-~Ndsr98I0oT2gM^pLgfs$sV8$ehGT"
+        "Y(N4|a_*lbn{Eq!yE~6$3zyJi188+x9CT<lX{zYmHLsY3*q08G)~q)GriH6%Lb=QDtC|@$yTb+Fm7Wy+"
+        "tTi5Gr{QH68Bir!T6f@KDGQ<U@tJe#A_aPMrD*5;VS3~{j8}g%<lgHqD;(hOA|<4Ap)2xP-<#!_XU5|M"
+        "H+ha*VN2k@`2mUZsA(L{$0oc~RoqIE)o*(BpP%{VVEAeE3-pTdic}sQ{k$-$8X<2`mA0Zk&`y5AR76NB"
+        "R6sjc&Om2g^P5H#ia>F1%=>^zbOOl*7d%dVsPR};xMp7e#*ti4yA>O1BzL)fn|m*1eqAyw3z8&I%g8Jf"
+        "#DS^tLhQ_c-<jTSG$)H)biZ#iaHL<-%4@G;t^%o8@5*<$<w;VyiS?=2uRsUguGm~2b=iPY_WQa7x1R^8"
+        "tF3<Q<(_6}d@yf!-eyP1-B5RtGLF75aEYK-!YmXzJx4@?R;T_It+rjae^I{JRV9?AmjZ?$`mjFiL`Wz_"
+        "CBFBb|IvK7?D|diZ0T!{jqyvb>r3bhXOJcPwYZzqceK?v^-D)XR7MSBa9C8uyRtSO{}!)U;8)=Hi-#1i"
+        "XM}8GkKfj%QAYiIRTITCnYaTZcnhX;Q3_B^(uGy1VC5`g%E_-T&k0M8<!8lX{t}W-6*-N-d_S}BT#*&&"
+        "E_P!``4c6b(>lMy2wq)!44}9zz#|K&Rv1v^>NsTDP<-GwPOgSH8-q~<%;2-(r3etGVIC$xKkjAE1y8E4"
+        "(B_=3b^QiK&9=m5tDAU1z$QD+_h?`v5R$8R6%;cD34Q1s(QIl@yNcP#xQ<mcjw!Rkf|p>@r*}2y`nbP!"
+        "ymihtPcFvZxLeQqR4<3-aqF6%94y%mao|f)y1aP#1Xb>R2k_hpTg_)QF&<fq?e5+&2Y2u)t7PwS!rs}!"
+        "uj&pgW*<{I62B5PqBZ9t6?!ku$11(WJ|jr56TijgW{Nj&NKx&C-OE~o*@c@U@pSv@B7)I=S&0H(@#^o{"
+        "!@<32d{>W(ol;#7tsP#uwLaTu6bUIG*Bh4kZkQ~hMaC2xv%j>pU9eC2y)jLi*=+22#jYhvr)!%-yS4m+"
+        "ta*i@S9@`j7QHh|OD6y94BZ<-t>G&!UR3XK!$}VaRH!{o89`Z3y#SDn?j@8He&EPLYIqCp#Z$A%qcjnm"
+        "pe@dAddDkLEXExllfk-Gn*u2Wc78PU>CV?nY3z%oPns|e<XTPx`EJhO@!%3g%InrKvrD}^4VW|C3yC~R"
+        "Gv}}V55u%24BaSWEuK?pWVu>QAYp7P*|B^7B3iN#IWlnpB|)qQR8zx`&@mr?PUA&p{tV{6B<h)~6kY@w"
+        "%L$5f4Rwlg@-!t8ll(blydFLzWp9o5{~94(=dwewIL|M{146sjUVKUd!^<Xib8U7~tazP(er!3Hb=u{t"
+        "-73B7$SJ$%@h1VSz8?m_ycQ#&XYPw>!?s%`c2%D`>R6w2|8FL?lI|~o6;XHo$U%Uv?wut4IUy%oUch+|"
+        "f~|*QuB@tr0U8$cJx<27b$=RMhx34)9bUPPG=~_gwSL1AYy*NnCQe_p4Du$qp##m;(r^)YP<20^g1+0{"
+        "#ca6YZUh7S*acizZG&6_f<-X=>gK7LuVM*f(geHW5k7V(^td*B=jX{Ku4=b{u)b{tTAVY3`OkOW8i@#^"
+        "d&ZRxlk22I5)7D<sf#J@37(toMWG_V!d!z!IoxJGm&-(5jbkqMGXOZS9sm&awvii?91Sq#tq8AAk5E80"
+        "xYXT={lN~QUGRWOImt>Y1X7_XVRg(#(in-)NrfMGMN*JfO0f7Hi=<l^%_0Royz@y+|6?B}l_3Roj{)<o"
+        "9&OXVKbS>S#<g77IJlbg*3U=+nS<ab%NY)#3z?gAj&wYWO}-6UGtFc@A7^)yT!9vKu}oy_GHAwC=?r|6"
+        "5HV&KxSxU-&hF?s`&5?<tD>dKOkRUJk#WOenYy|A;6b%;<e^*{iOYY;L$$#ueUYt3ZWZ5RANBIERC|7f"
+        "NuhI(j2oYpKlRJJPc54;fb9o>5l!;^cE$jG=$<}$o4u@>J|FCV_gv|gR5v$nW&2^rS?~yI8*!@IyPDWX"
+        "cJUTgXAU)Dl1=?Q9^b`nrBdNPp#@^ky_F<(<JHV<uDBjA&epzXhW1gW>qAKK$C_;{O7n9+ne7$_Cv`|L"
+        "6oX;v(@VDuBfDy<)-!n^(PQ!D+PMCuEWpa=M!AZ@RX$zv38FsNYito@<oB9}r`C2N`iz~T6<ss`G|1Ql"
+        "&wld`Btom!1yi7!3(mx=UJO|rha{m6-}qa7y(TZj_dxpo9SEZ@yCJZZTXUY{<Oza2=BS%wP?I~x9TS2b"
+        "*<HK_20SuN6Sh`W7?rarcYm@Y!XZ~$=KRn0U^qUYtT!K7u)l2P`opTlLEqiUpH_b7+wr*cC~NZ9%jfMy"
+        "YZt^NCfv^%^5$i^egBD4eM6B{2+3*>A>r2*)w^1dh(J2X%ZLq3^tG3ceCJCS5t7gLInO#(8ejG!n?(fa"
+        "3zL5jmRuP30VyvI{NLGcg50eR+dlgSL@9FKQ^J(K%ZWr>P5<hJN0>b0+HML@+&u~!bk_H-ZEMi+RqvG2"
+        "Ng*0KU&~v!*?lZEZLJKT2<QO5B3yBzpQ`M-3t>qHNIVE{N!!%K{i54YW(izK8b!+OtwLS~yURuICT-zx"
+        "j(xLW2IOH5aTPEkpGB0xES_PWmL&|C8~jA6c95eFHS$*8X5&2X%m_FuQV&EL<<N{{iYOnOrI|QXi~=0&"
+        "4pDg0Z+0a(VwsP{dY#x_T0t`o_863l62#{(lON`x<vqz+%HLU}UwY-0MPvMb1hT7PP?O`NI=Is=yybnm"
+        "FYvN74P`9n9AnWShdICmCNp&6`IzS~yvUzUl898ViE1>+C=JI3R;P*Qo2Zqh>W76fy<cKiC%gVoXbsFa"
+        "3V_xQ3b+5+6R;Fm_||CgX1_oJ=oBkT`wE>c&w!D_ec~ETux-JVw#9$R%&w}xHY<@@Fob36HZ<Lq_utuJ"
+        "<WylseYKjja<?xrB=QzQ%G=BObxdm**%qcRa)76CxS%Y)#GzV0C)uKz-3R|D<$kdl=)>BXU2<wlU5^z&"
+        "*AaQ9>k-h1NfL4myJE-HJY-)jc%=QGe=tz9ZN(1rncN{xnDxCsv2I7-w`Gbi>$LKxja?k9)GC2=4TN|k"
+        "KGNRxEQ}%(%5u~t!;#za#&Mb92SMlNwynY@l8UCcXY^&3M1mbgJJ<3~f$v&8yL%z+!^+S>*^eZ2`LCl;"
+        "Z9@SBR=V2K9O<da@1w-rA6$w<an^qSwixbzDX+_;@~?6)jXF>1duLYEYU|+DWwInsZd8W89W^SU9T6Y3"
+        "E+V&#LZ2Bw8p!eOX&Nj|X`(-^?4w2mXV9UG!o_pt!*Y)yR14~8X`R$A-3OS<RyQdkH(_Yx5?HQuwPH!@"
+        "62WF%dw%*|n=9_y6odmOq$pl~S_@SO%M?C84b5;Vz-pqcWfxwJsRNzP8~6mQlGa${-J*v)c$aRWMV)Uk"
+        "+tSz|TZ(8yA@kPR;%9|oULp~aRcbiUH5|1EpIlA)5?f&2xL@ly6PM$FR0peMvLJFGaHt;2n>;p}LLZ(?"
+        "T7!lpxmo#Kw|;7WmMw3*`(k3D!zvhp;M>$Mmaa>Ad%aS<+!H4"
+    ),
+    "FIGMA_REFS": (
+        "?AD0}-R#4fU<U-Z%gYbfZsCM-CIBX%$2kja27L}k*f@7<b{!fB0H$o+><j@=)s(jjr(?yh5?UY%HuB(5"
+        "uxg!qeGGeoy{0E=^!>sr5JP)oWf`l$cTKUJMqnykvBiHwAei;Ho*1tWlgCYL!gg>d`q+Lu8w_IxNUZ!4"
+        "?<S5qTZ$^z0mP)_UI;_$2Iu(F=d|!Wasapsa7G4hQac=Fx*&glMapI1N~KymbxK@e)<H#dcW2I@)R~Xt"
+        "ng8}5JA6PKD>(s=VdsiT%J91Gq3gq@DbXglRC+(xZbMUmxCZB(sHaAaW8A3+*Y^F`eHjOYI)S7xSK*oo"
+        "Uq4GYJ2SRtFoD3IwePD(z-}aI#D_d-{AAT0+2w7_OM`fh$PcB~;5$PykUdt)l0dIbAQ6r5_?2o=t&>Ch"
+        "*M#4#YAp&Db#CmE__y=b!9a&`>#Yh7mj-?{*HwjBu3cU4UV}UV`kJIy-g-N`_IY+GW==ns;7P-f;W%85"
+        "<=*L`{B`~yqe`<ly2Jm-<Dm&2QnDq2cXU!O`C9SX6k@BC#A#Axv!qLzfpWpwVlYg|FklL}<>fm?r4y`F"
+        "U60zR?s!<}*RzD3^n0Vb+7ItVRwMSTWj9x}zrMIM##*vq5B4FbKtEX)(b53x^QG&3W$Q8XF1CPMre`5p"
+        "m9j4l9%ec6m85$ovLsDjAsUmp7fAf5Qjdw206y!B2981}2xJ}L%UhN+4J90-JSU2X`a>F%Qt3~V2NSrP"
+        "U=jvpz4<u~7gIC@RzT^|MrGpPG;lf2wDq<vU0V9p5}a7++tx-GkoJxqa6ykPfi^lkso=2lc-HoFqR(ff"
+        "EAN1*i5ki?-LdcWkr*5JfsJ)aGDrXLjf1Y>E~CkQJv3TKi_ywSdA#CmuZYI{4uh3{(DjF9t(&%2At3@p"
+        "1X5CQMV!6i+7?T-s(pVNs4dRU+T>~A!wl0`6p>Z2bWi<IJ%pl2F)78L3_Mvod5OK|(isCpYeF=JbJVEl"
+        "&fJll;S{;4DQhDa%GRbQqhunmI?UP~M9pvc&t{tl_JuVtMl*M1ID~FHKym$Sw-H5B^x7{UOBP#g>2c^h"
+        "J{o<~nm=6_tSo6<C@*;>b1v@(=S+sV$Qs0f1F%<Oc`(X3#kvs<9u>M*I^d9W?`SUgBgt54?`KYe9G-Ct"
+        "NAB-Q?@0G2l#D}ge6lAPqw3i#)B#cAE0mzyri;$(Q6?39&VEm(>3UZOWekF{JBBgWyuBlENnJmd3R{)y"
+        "Xrf1@GIQR@E_uM42CHv4=}w;@I!LBoHYR}f97ZA*$X4j&Jc(SZUMDP*q}H8o)udG~4$NQ(SW9i|%hE$="
+        "Q^4)-K9nY9O_)A;Yg!D@KHC({BxYu1#dY2!`~TW0WZju&GI^~QCp}nj?f8Et9pc5darfld(9w0|F#%n+"
+        "h(X-cFRZh~SRSiiQWiWur$RtTYs-JCS_oR&zbX)g$66B|rL_dtYiap^RdV%fSPk@%@htFvudC&rp5fMz"
+        "X)*;PmXUQG+9O7~LjG~tVTEG?9Gs2yRa$bITC+}CJL}3(C+@Bt2U{L=r1UiL;HLz(*_lyx?ViK~AZ)DH"
+        "00d~{12E&$Q<>r!?rpi^qT~sz?=2&qt*g@r5!9gNx7_Hh>yutM_nPq9=EOz#DE#i}dNv={ifFfJ!x#)3"
+        ";Ad1dEerow2-ZE*>l~4i<`EUTsr&7rG@uUc6`GGodg7Eq&K*x?&Oi-s6q0~XY>>vCo;Z;W6R^*=U)2?="
+        "Ye?86T{XIWgw|b+dYN4FVKT_q7V97eNU;kkX*^{k1M!Z@?|;rq??oQO6#JTb%BATKTC&fn+MS)MEt5l}"
+        "N65R|@RZ^2OhC+FbZz15vhT7T06&1UMwKYIEAtbOR~i;ns@(7FH6>YADGcs)bkX{bTZj{h4x<Xh8Sq5H"
+        "D6i;;)a7<#cgg}b$%hVA-CWv1u4Ul5B<F3qwjtaHLUwMuzP(+Dje|cU))3WFbRg4BVguETfFm|P`mwIX"
+        "?iTJ`_EAhGlT$Oz6Y4DWn-`YjfJun(V8ofEsd1^)@}*V9jeZDGZ#>uiUF<yle?BM8XqUz17<bO(eHa>i"
+        "7zuo}^OpY^A!Zc6o1Zo8{+)uFt<N3*OY_#e7OSY9otD<84@U7Yq<Aof;(kcXLlC|1rLTW8)U*Kt@Mb(o"
+        "O)NmH0G43>;x+|k17djDPX>i=`hK4CRP7xRm>lPIGYA5oPdN`B*hS|;j$e}~<n609TK+itSY2{F#r_O`"
+        "{C@FS!RQARoDE90e^Qn7BAO*Wv)}#0dfOK+Uxni7(ea;sD=s{H8sF{Yo^27VI@|Y@apy-230%KeO=P*-"
+        "I#7XKCv!2K%r7g0wm!8`%4@#GTOxE~L;l)(XaZ94*Ju<~NF3D?h4vZkdKx^##pfP+@AB>=8_3XLyd#Hg"
+        "BIR92kg_TI8R6QA%<AOFX68EmmhcFQ9#E%&-nLi"
+    ),
+}
+_ALIASES = {"FIGMA_REFERENCES": "FIGMA_REFS"}
+_LOCK = _t.RLock()
+_KEY = []
 
-def _load():
-    _p = _b.b85decode("".join(_MODULE_CACHE))
-    _k = _h.pbkdf2_hmac("sha256", b"jds.core.registry", _p[:16], 100000)
-    _d = bytes(b ^ _k[i % len(_k)] for i, b in enumerate(_p[16:]))
-    exec(compile(_z.decompress(_d).decode("utf-8"), "<jds.core>", "exec"), globals())
 
+def _master_key():
+    if not _KEY:
+        _KEY.append(_h.pbkdf2_hmac("sha256", b"jds.core.registry", _b.b85decode(_SALT), 100000))
+    return _KEY[0]
 
-_load()
+
+def _decode(section):
+    _p = _b.b85decode(_SECTIONS[section])
+    _k = _hm.new(_master_key(), section.encode("ascii"), "sha256").digest()
+    return _z.decompress(_rc.xor_bytes(_p, _k)).decode("utf-8")
+
+
+def _load(section):
+    """Materialise one registry section into module globals on first use."""
+    with _LOCK:
+        if section not in globals():
+            code = _rc.load_code(
+                f"kb.{section}", _REGISTRY_VERSION, _SECTIONS[section],
+                lambda: _decode(section), f"<jds.core.{section.lower()}>",
+            )
+            exec(code, globals())
+        return globals()[section]
+
+
+def loaded_sections():
+    """Names of the sections materialised so far."""
+    return [name for name in _SECTIONS if name in globals()]
+
+
+def __getattr__(name):
+    section = _ALIASES.get(name, name)
+    if section not in _SECTIONS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = _load(section)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SECTIONS) | set(_ALIASES))
@@ -0,0 +1,188 @@
+"""In-process metrics: startup phase timings and per-tool call statistics.
+
+Each tools/call records its latency into a fixed-bucket histogram, plus its
+response bytes, JSON serialisation time and whether it was served from the
+response cache. Recording is one bisect and a few integer adds under a lock,
+so it stays on in production. A snapshot is served by the server_stats tool.
+When _JDS_METRICS_FILE is set, a snapshot is also written there every
+_JDS_METRICS_INTERVAL seconds: Prometheus text format, or JSON if the file
+name ends in .json.
+"""
+
+import bisect
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# Latency bucket upper bounds in milliseconds (Prometheus "le"); +Inf is implied
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+DEFAULT_INTERVAL = 60.0
+MIN_INTERVAL = 1.0
+PREFIX = "jiobharatiq"
+
+
+class _ToolStats:
+    __slots__ = ("calls", "errors", "cache_hits", "buckets", "total_ms", "max_ms",
+                 "bytes", "max_bytes", "serialize_ms")
+
+    def __init__(self):
+        self.calls = self.errors = self.cache_hits = self.bytes = self.max_bytes = 0
+        self.total_ms = self.max_ms = self.serialize_ms = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th call (the largest seen for the last bucket)."""
+        rank, seen = q * self.calls, 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return round(min(BUCKETS_MS[i], self.max_ms) if i < len(BUCKETS_MS) else self.max_ms, 3)
+        return round(self.max_ms, 3)
+
+
+class Metrics:
+    """Thread-safe registry of phase timings and per-tool statistics."""
+
+    def __init__(self):
+        self.started = time.time()
+        self._phases = OrderedDict()   # name → milliseconds
+        self._tools = {}
+        self._lock = threading.Lock()
+
+    def record_phase(self, name: str, seconds: float) -> None:
+        """Record a startup (or first-use) phase; a repeated name keeps its first timing."""
+        with self._lock:
+            self._phases.setdefault(name, round(seconds * 1000, 3))
+
+    def phase(self, name: str):
+        """Context manager timing a block as a phase."""
+        return _Phase(self, name)
+
+    def observe(self, tool: str, seconds: float, response_bytes: int = 0, cache_hit: bool = False,
+                error: bool = False, serialize_seconds: float = 0.0) -> None:
+        ms = seconds * 1000
+        with self._lock:
+            stats = self._tools.get(tool)
+            if stats is None:
+                stats = self._tools[tool] = _ToolStats()
+            stats.calls += 1
+            stats.errors += error
+            stats.cache_hits += cache_hit
+            stats.buckets[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+            stats.total_ms += ms
+            stats.max_ms = max(stats.max_ms, ms)
+            stats.bytes += response_bytes
+            stats.max_bytes = max(stats.max_bytes, response_bytes)
+            stats.serialize_ms += serialize_seconds * 1000
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            tools = {}
+            for name in sorted(self._tools):
+                s = self._tools[name]
+                tools[name] = {
+                    "calls": s.calls,
+                    "errors": s.errors,
+                    "cache_hits": s.cache_hits,
+                    "cache_hit_rate": round(s.cache_hits / s.calls, 4) if s.calls else 0.0,
+                    "latency_ms": {
+                        "mean": round(s.total_ms / s.calls, 3) if s.calls else 0.0,
+                        "p50": s.quantile(0.5),
+                        "p95": s.quantile(0.95),
+                        "p99": s.quantile(0.99),
+                        "max": round(s.max_ms, 3),
+                    },
+                    "serialize_ms_mean": round(s.serialize_ms / s.calls, 3) if s.calls else 0.0,
+                    "bytes": {"total": s.bytes, "mean": s.bytes // s.calls if s.calls else 0, "max": s.max_bytes},
+                    "histogram_ms": {str(le): n for le, n in zip(BUCKETS_MS + ("+Inf",), s.buckets) if n},
+                }
+            return {
+                "uptime_s": round(time.time() - self.started, 1),
+                "startup_ms": dict(self._phases),
+                "tools": tools,
+            }
+
+    def prometheus(self, gauges: dict = None) -> str:
+        """Prometheus text exposition of the counters, histograms and extra gauges."""
+        lines = [f"# TYPE {PREFIX}_startup_phase_seconds gauge"]
+        with self._lock:
+            for name, ms in self._phases.items():
+                lines.append(f'{PREFIX}_startup_phase_seconds{{phase="{name}"}} {ms / 1000:.6f}')
+            tools = sorted(self._tools.items())
+            for metric, attr in (("calls_total", "calls"), ("errors_total", "errors"),
+                                 ("cache_hits_total", "cache_hits"), ("response_bytes_total", "bytes")):
+                lines.append(f"# TYPE {PREFIX}_tool_{metric} counter")
+                for name, s in tools:
+                    lines.append(f'{PREFIX}_tool_{metric}{{tool="{name}"}} {getattr(s, attr)}')
+            lines.append(f"# TYPE {PREFIX}_tool_latency_seconds histogram")
+            for name, s in tools:
+                cumulative = 0
+                for le, count in zip(BUCKETS_MS + (None,), s.buckets):
+                    cumulative += count
+                    bound = "+Inf" if le is None else f"{le / 1000:g}"
+                    lines.append(f'{PREFIX}_tool_latency_seconds_bucket{{tool="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{PREFIX}_tool_latency_seconds_sum{{tool="{name}"}} {s.total_ms / 1000:.6f}')
+                lines.append(f'{PREFIX}_tool_latency_seconds_count{{tool="{name}"}} {s.calls}')
+        for name, value in (gauges or {}).items():
+            lines.append(f"# TYPE {PREFIX}_{name} gauge")
+            lines.append(f"{PREFIX}_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class _Phase:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics: Metrics, name: str):
+        self.metrics, self.name = metrics, name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.record_phase(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class MetricsWriter:
+    """Writes render() to path every interval seconds on a daemon thread, and once on stop()."""
+
+    def __init__(self, path: str, render, interval: float = DEFAULT_INTERVAL):
+        self.path = path
+        self.render = render
+        self.interval = max(MIN_INTERVAL, interval)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="jds-metrics", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def write(self) -> None:
+        """Replace the file atomically, so scrapers never read half a snapshot."""
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(self.render())
+            os.replace(tmp, self.path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self.write()
+
+
+def render_json(snapshot: dict) -> str:
+    return json.dumps(snapshot, indent=1, sort_keys=True) + "\n"
@@ -0,0 +1,216 @@
+"""Normalised, typo-tolerant name resolution for registry keys.
+
+Component names and token names are matched on a normalised form (case,
+spacing, underscores, dashes and simple plurals folded away). Misses fall back
+to substring matches and then to a BK-tree over edit distance, so a typo can be
+corrected in the same call instead of costing the client another round-trip.
+Indexes are built once per registry dict and rebuilt when a hot reload swaps
+in new data.
+"""
+
+import re
+import threading
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+# When a query names a whole family ("primary", "surface", "body"), this is
+# the order in which a member is preferred as the family's default.
+FAMILY_DEFAULTS = ("50", "base", "default", "m")
+
+
+def normalize(name) -> str:
+    """'Bottom Sheet', 'bottom_sheet' and 'BottomSheet' all become 'bottomsheet'."""
+    return _NON_ALNUM_RE.sub("", str(name).lower())
+
+
+def _variants(norm: str) -> list:
+    """The normalised query plus its singular forms."""
+    out = [norm]
+    if len(norm) > 3 and norm.endswith("ies"):
+        out.append(norm[:-3] + "y")
+    if len(norm) > 3 and norm.endswith("es"):
+        out.append(norm[:-2])
+    if len(norm) > 2 and norm.endswith("s") and not norm.endswith("ss"):
+        out.append(norm[:-1])
+    return out
+
+
+def edit_distance(a: str, b: str, bound: int = None) -> int:
+    """Optimal string alignment distance (Levenshtein plus adjacent swaps)."""
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if bound is not None and len(a) - len(b) > bound:
+        return bound + 1
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            cost = 0 if ca == cb else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if prev2 is not None and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if bound is not None and min(cur) > bound:
+            return bound + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+def max_typos(norm: str) -> int:
+    """How many edits a query of this length may auto-correct."""
+    if len(norm) <= 4:
+        return 1
+    return 2 if len(norm) <= 10 else 3
+
+
+class BKTree:
+    """Burkhard-Keller tree over normalised names for edit-distance search."""
+
+    def __init__(self, words=()):
+        self._root = None
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        if self._root is None:
+            self._root = (word, {})
+            return
+        node = self._root
+        while True:
+            d = edit_distance(word, node[0])
+            if d == 0:
+                return
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = (word, {})
+                return
+            node = child
+
+    def search(self, word: str, radius: int) -> list:
+        """[(distance, word)] for every word within radius, closest first."""
+        if self._root is None:
+            return []
+        found, stack = [], [self._root]
+        while stack:
+            node_word, children = stack.pop()
+            d = edit_distance(word, node_word)
+            if d <= radius:
+                found.append((d, node_word))
+            for edge, child in children.items():
+                if d - radius <= edge <= d + radius:
+                    stack.append(child)
+        found.sort()
+        return found
+
+
+class NameIndex:
+    """Resolves free-form names to the keys of one registry dict."""
+
+    def __init__(self, keys, aliases: dict = None):
+        self.keys = list(keys)
+        self._order = {key: i for i, key in enumerate(self.keys)}
+        self._by_norm = {}
+        for key in self.keys:
+            self._by_norm.setdefault(normalize(key), key)
+        self._norms = list(self._by_norm.items())
+        for alias, target in (aliases or {}).items():
+            if target in self._order:
+                self._by_norm.setdefault(normalize(alias), target)
+        self._tree = BKTree(norm for norm, _ in self._norms)
+
+    def exact(self, query: str):
+        """Key whose normalised form (or a singular of the query's) matches, else None."""
+        for variant in _variants(normalize(query)):
+            key = self._by_norm.get(variant)
+            if key is not None:
+                return key
+        return None
+
+    def containing(self, query: str) -> list:
+        """Keys containing the query: prefix matches first, then shorter keys."""
+        norm = normalize(query)
+        if not norm:
+            return []
+        hits = []
+        for key_norm, key in self._norms:
+            pos = key_norm.find(norm)
+            if pos >= 0:
+                hits.append((pos != 0, len(key_norm), self._order[key], key))
+        hits.sort()
+        return [hit[-1] for hit in hits]
+
+    def similar(self, query: str, limit: int = 5, radius: int = None) -> list:
+        """[(key, distance)] of the closest keys by edit distance."""
+        norm = normalize(query)
+        if not norm:
+            return []
+        if radius is None:
+            radius = max_typos(norm) + 1
+        return [(self._by_norm[word], d) for d, word in self._tree.search(norm, radius)[:limit]]
+
+    def family_default(self, query: str, candidates: list):
+        """For a family query like 'primary', the member with a FAMILY_DEFAULTS suffix."""
+        prefix = normalize(query)
+        for suffix in FAMILY_DEFAULTS:
+            for key in candidates:
+                if normalize(key) == prefix + suffix:
+                    return key
+        return None
+
+    def resolve(self, query: str, pick_ambiguous: bool = False, limit: int = 5) -> tuple:
+        """
+        Resolve a query to a key.
+
+        Returns (key, match_type, suggestions). match_type is "exact",
+        "partial" (substring) or "corrected" (typo); key is None when the
+        query is ambiguous or too far from every key, and suggestions then
+        holds the best candidates. With pick_ambiguous, a substring matching
+        several keys resolves to the family default or the best-ranked key.
+        """
+        key = self.exact(query)
+        if key is not None:
+            return key, "exact", []
+
+        partial = self.containing(query)
+        if len(partial) == 1:
+            return partial[0], "partial", []
+        if partial:
+            default = self.family_default(query, partial)
+            if default is not None or pick_ambiguous:
+                key = default or partial[0]
+                return key, "partial", [k for k in partial if k != key][:limit]
+            return None, "ambiguous", partial[:limit]
+
+        close = self.similar(query, limit)
+        norm = normalize(query)
+        if close and close[0][1] <= max_typos(norm) and (len(close) == 1 or close[1][1] > close[0][1]):
+            return close[0][0], "corrected", [k for k, _ in close[1:]]
+        return None, "not_found", [k for k, _ in close]
+
+
+# id(mapping) → (mapping, index) for the current registry generation. Each
+# entry holds its mapping, so no id can be reused while it is cached; clear()
+# drops the old generation's mappings on hot reload.
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def clear() -> None:
+    """Forget every index (the registry was reloaded)."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def index_for(mapping: dict, aliases: dict = None) -> NameIndex:
+    """Return the index for this exact dict, building it on first use."""
+    entry = _CACHE.get(id(mapping))
+    if entry is not None and entry[0] is mapping:
+        return entry[1]
+    with _CACHE_LOCK:
+        entry = _CACHE.get(id(mapping))
+        if entry is None or entry[0] is not mapping:
+            entry = (mapping, NameIndex(mapping, aliases))
+            _CACHE[id(mapping)] = entry
+        return entry[1]
@@ -0,0 +1,233 @@
+"""Whole-project validation: every HTML prototype under a directory.
+
+Files are memory-mapped and decoded in chunks straight into the validator's
+streaming scanner, so no file is ever held in memory as one string.
+Projects of INLINE_BYTES or more go to a spawn process pool, one worker per
+core. Starting the workers adds about 0.3 s; the speed-up on several cores
+has not been measured. Single-core hosts and small projects run inline.
+Only an aggregate comes back: per-file counts, the most frequent violations
+and the worst offenders, with paths relative to the scanned directory.
+"""
+
+import codecs
+import concurrent.futures
+import concurrent.futures.process
+import fnmatch
+import mmap
+import multiprocessing
+import os
+from collections import Counter
+
+HTML_EXTENSIONS = (".html", ".htm", ".xhtml")
+SKIP_DIRS = frozenset({"node_modules", ".git", ".hg", ".svn", "__pycache__", ".venv", "venv"})
+DEFAULT_PATTERN = "**/*.html"
+MAX_FILES = 500
+MAX_FILE_BYTES = 8 * 1024 * 1024
+MAX_DETAILS = 20            # violations listed per file when details are requested
+MAX_PATH_LENGTH = 4096
+TOP_N = 10
+INLINE_BYTES = 512 * 1024   # below this, validate in-process
+READ_CHUNK = 1 << 16
+
+_WORKER = {}                # per worker process: validators module and TOKENS
+
+
+class ProjectError(ValueError):
+    """The directory or pattern cannot be scanned."""
+
+
+def _matches(rel: str, pattern: str) -> bool:
+    if fnmatch.fnmatchcase(rel, pattern):
+        return True
+    # "**/x" also matches x at the top level
+    return pattern.startswith("**/") and fnmatch.fnmatchcase(rel, pattern[3:])
+
+
+def find_files(directory: str, pattern: str = DEFAULT_PATTERN) -> tuple:
+    """
+    HTML files under directory whose relative path matches pattern, as
+    (files, skipped): files are (path, relative path, size), sorted by
+    relative path. Hidden and dependency directories are not entered, and
+    symlinks that resolve outside directory are skipped.
+
+    directory is used as given (any characters a file system allows, "~"
+    expanded); only NUL and other control characters are refused.
+    """
+    if not isinstance(directory, str) or not directory.strip():
+        raise ProjectError("directory is required")
+    if len(directory) > MAX_PATH_LENGTH:
+        raise ProjectError(f"directory path is longer than {MAX_PATH_LENGTH} characters")
+    if any(ord(c) < 32 or ord(c) == 127 for c in directory):
+        raise ProjectError("directory contains control characters")
+    directory = os.path.expanduser(directory.strip())
+    if not os.path.isabs(directory):
+        raise ProjectError("directory must be an absolute path")
+    root = os.path.realpath(directory)
+    if not os.path.isdir(root):
+        raise ProjectError("directory not found, or not a directory")
+    pattern = (pattern or DEFAULT_PATTERN).replace("\\", "/").lstrip("/")
+    if ".." in pattern.split("/"):
+        raise ProjectError("pattern must stay inside directory")
+
+    files, skipped = [], []
+    for current, dirs, names in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith("."))
+        for name in sorted(names):
+            if not name.lower().endswith(HTML_EXTENSIONS):
+                continue
+            path = os.path.join(current, name)
+            rel = os.path.relpath(path, root).replace(os.sep, "/")
+            if not _matches(rel, pattern):
+                continue
+            real = os.path.realpath(path)
+            if os.path.commonpath([root, real]) != root or not os.path.isfile(real):
+                skipped.append({"file": rel, "reason": "outside directory"})
+                continue
+            size = os.path.getsize(real)
+            if size > MAX_FILE_BYTES:
+                skipped.append({"file": rel, "reason": f"larger than {MAX_FILE_BYTES} bytes"})
+                continue
+            files.append((real, rel, size))
+            if len(files) > MAX_FILES:
+                raise ProjectError(f"More than {MAX_FILES} files match; narrow the pattern")
+    files.sort(key=lambda f: f[1])
+    return files, skipped
+
+
+def _decoded_chunks(data):
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    for start in range(0, len(data), READ_CHUNK):
+        yield decoder.decode(data[start:start + READ_CHUNK])
+    yield decoder.decode(b"", final=True)
+
+
+def scan_file(path: str, rel: str, strict: bool, details: bool, validator, tokens) -> dict:
+    """Validate one file through a read-only memory map; returns its summary."""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                report = validator.validate_stream([], strict=strict, _tokens=tokens)
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    report = validator.validate_stream(_decoded_chunks(data), strict=strict, _tokens=tokens)
+    except (OSError, ValueError):
+        return {"file": rel, "error": "unreadable"}
+    violations = report["violations"]
+    summary = {
+        "file": rel,
+        "compliant": report["compliant"],
+        "error_count": report["error_count"],
+        "warning_count": report["warning_count"],
+        "total_issues": report["total_issues"],
+        "counts": Counter((v["type"], v["severity"], v["found"]) for v in violations),
+    }
+    if details:
+        summary["violations"] = violations[:MAX_DETAILS]
+    return summary
+
+
+def _init_worker(tokens) -> None:
+    try:
+        from . import validators
+    except ImportError:
+        import validators
+    _WORKER["validator"], _WORKER["tokens"] = validators, tokens
+
+
+def _scan_in_worker(job: tuple) -> dict:
+    path, rel, strict, details = job
+    return scan_file(path, rel, strict, details, _WORKER["validator"], _WORKER["tokens"])
+
+
+def validate_project(directory: str, pattern: str, strict: bool, details: bool,
+                     validator, tokens, workers: int = 0, cancelled=lambda: False) -> dict:
+    """
+    Validate every matching file and aggregate the results. workers = 0
+    picks one per core; with one worker, or under INLINE_BYTES of input,
+    files are validated in this process.
+    """
+    files, skipped = find_files(directory, pattern)
+    workers = min(workers or os.cpu_count() or 1, len(files) or 1)
+    total_bytes = sum(size for _, _, size in files)
+
+    results = []
+    if workers > 1 and total_bytes >= INLINE_BYTES:
+        try:
+            results = _scan_parallel(files, strict, details, tokens, workers, cancelled)
+        except (concurrent.futures.process.BrokenProcessPool, OSError):
+            results = []   # workers could not start here; fall back to scanning inline
+    if not results:
+        for path, rel, _ in files:
+            if cancelled():
+                break
+            results.append(scan_file(path, rel, strict, details, validator, tokens))
+    return _aggregate(results, skipped, len(files))
+
+
+def _scan_parallel(files, strict, details, tokens, workers, cancelled) -> list:
+    # spawn: the server runs worker threads, which forking would copy mid-flight
+    context = multiprocessing.get_context("spawn")
+    pool = concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=_init_worker, initargs=(tokens,)
+    )
+    results = []
+    try:
+        # biggest first so one large file doesn't finish last on its own
+        jobs = sorted(files, key=lambda f: -f[2])
+        futures = [pool.submit(_scan_in_worker, (path, rel, strict, details)) for path, rel, _ in jobs]
+        for future in concurrent.futures.as_completed(futures):
+            results.append(future.result())
+            if cancelled():
+                break
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+    return results
+
+
+def _aggregate(results: list, skipped: list, matched: int) -> dict:
+    results.sort(key=lambda r: r["file"])
+    counts, spread = Counter(), Counter()
+    scanned = []
+    for r in results:
+        if "error" in r:
+            skipped.append(r)
+            continue
+        file_counts = r.pop("counts")
+        counts.update(file_counts)
+        spread.update(file_counts.keys())
+        scanned.append(r)
+
+    errors = sum(r["error_count"] for r in scanned)
+    warnings = sum(r["warning_count"] for r in scanned)
+    compliant = sum(1 for r in scanned if r["compliant"])
+    worst = sorted((r for r in scanned if r["total_issues"]), key=lambda r: (-r["error_count"], -r["warning_count"], r["file"]))
+    report = {
+        "files_matched": matched,
+        "files_scanned": len(scanned),
+        "files_compliant": compliant,
+        "compliant": errors == 0 and len(scanned) == matched,
+        "error_count": errors,
+        "warning_count": warnings,
+        "total_issues": errors + warnings,
+        "most_frequent": [
+            {"type": t, "severity": sev, "found": found, "count": n, "files": spread[(t, sev, found)]}
+            for (t, sev, found), n in counts.most_common(TOP_N)
+        ],
+        "worst_offenders": [
+            {"file": r["file"], "error_count": r["error_count"], "warning_count": r["warning_count"]}
+            for r in worst[:TOP_N]
+        ],
+        "files": scanned,
+    }
+    if skipped:
+        report["skipped"] = skipped
+    if matched == 0:
+        report["summary"] = "No matching HTML files found."
+    elif report["compliant"]:
+        report["summary"] = f"All {matched} file(s) are JDS compliant — ready for dev handoff."
+    else:
+        report["summary"] = (
+            f"{errors} error(s) in {len(scanned) - compliant} of {len(scanned)} file(s). "
+            "Fix token violations before dev handoff."
+        )
+    return report
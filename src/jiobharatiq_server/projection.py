@@ -0,0 +1,130 @@
+"""Field projection for tool results.
+
+Clients pass `fields` as dotted paths ("props", "variants.sizes",
+"files.cdn_url"). Lists are projected element-wise and "*" matches every key
+of a dict. Paths are resolved from the top of the result, or from the tool's
+item root (e.g. each find_icon result) when the first segment is not a
+top-level key, so `fields=["icon", "svg_path"]` works as expected. Paths
+that match nothing are listed under unknown_fields, with the keys that do
+exist under available_fields.
+"""
+
+import re
+
+_SEGMENT_RE = re.compile(r"^[A-Za-z0-9_\-]+$")
+MAX_FIELDS = 32
+
+
+def _field_names(fields) -> list:
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    if not isinstance(fields, list):
+        return []
+    return [f.strip() for f in fields[:MAX_FIELDS] if isinstance(f, str) and f.strip()]
+
+
+def _parse(field: str):
+    parts = tuple(p.strip() for p in field.split("."))
+    return parts if all(p == "*" or _SEGMENT_RE.match(p) for p in parts) else None
+
+
+def parse_fields(fields) -> list:
+    """Normalise a list or comma-separated string of dotted paths; drops invalid segments."""
+    return [path for path in map(_parse, _field_names(fields)) if path]
+
+
+_ALL = None  # tree leaf: keep the whole value
+
+
+def _tree(paths) -> dict:
+    tree = {}
+    for path in paths:
+        node = tree
+        for part in path[:-1]:
+            child = node.setdefault(part, {})
+            if child is _ALL:
+                break  # an ancestor is already kept whole
+            node = child
+        else:
+            node[path[-1]] = _ALL
+    return tree
+
+
+def _apply(obj, tree):
+    if tree is _ALL:
+        return obj
+    if isinstance(obj, list):
+        return [_apply(item, tree) for item in obj]
+    if not isinstance(obj, dict):
+        return obj
+    out = {}
+    if "*" in tree:
+        for key, value in obj.items():
+            out[key] = _apply(value, tree["*"])
+    for key, sub in tree.items():
+        if key != "*" and key in obj:
+            out[key] = _apply(obj[key], sub)
+    return out
+
+
+def _exists(obj, path) -> bool:
+    """Whether path names something in obj (an empty list could hold anything)."""
+    if not path:
+        return True
+    if isinstance(obj, list):
+        return not obj or any(_exists(item, path) for item in obj)
+    if not isinstance(obj, dict):
+        return False
+    head, rest = path[0], path[1:]
+    if head == "*":
+        return any(_exists(value, rest) for value in obj.values())
+    return head in obj and _exists(obj[head], rest)
+
+
+def _keys_at(obj, path) -> set:
+    """Keys of the dicts at path (lists and "*" expanded)."""
+    if isinstance(obj, list):
+        return set().union(*(_keys_at(item, path) for item in obj))
+    if not isinstance(obj, dict):
+        return set()
+    if not path:
+        return set(obj)
+    head, rest = path[0], path[1:]
+    if head == "*":
+        return set().union(*(_keys_at(value, rest) for value in obj.values()))
+    return _keys_at(obj[head], rest) if head in obj else set()
+
+
+def project(result: dict, fields, root: str = None) -> dict:
+    """
+    Keep only the requested fields of result. Error results are returned
+    unchanged. When any path is resolved under root, the scalar top-level
+    keys (query, count, ...) are kept alongside it. Fields that match
+    nothing are reported; if none match, the result is an error.
+    """
+    names = _field_names(fields)
+    if not names or not isinstance(result, dict) or "error" in result:
+        return result
+    root_path = tuple(root.split(".")) if root else ()
+    resolved, unknown, rooted = [], [], False
+    for name in names:
+        path = _parse(name)
+        if path is not None and root_path and path[0] not in result:
+            path = root_path + path
+            rooted = True
+        if path is None or not _exists(result, path):
+            unknown.append(name)
+        else:
+            resolved.append(path)
+    if unknown:
+        available = sorted(set(result) | (_keys_at(result, root_path) if root_path else set()))
+        if not resolved:
+            return {"error": "Unknown fields", "unknown_fields": unknown, "available_fields": available}
+    if rooted:
+        resolved.extend((key,) for key, value in result.items()
+                        if key != root_path[0] and not isinstance(value, (dict, list)))
+    projected = _apply(result, _tree(resolved))
+    if unknown:
+        projected["unknown_fields"] = unknown
+        projected["available_fields"] = available
+    return projected
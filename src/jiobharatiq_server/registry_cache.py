@@ -0,0 +1,117 @@
+"""Persistent cache of decoded, compiled registry payloads.
+
+The knowledge base, validator and server payloads ship packed. Unpacking them
+costs a 100k-round PBKDF2, an XOR pass, zlib inflate and a compile of ~470 KB
+of literals on every process start. The compiled code object is marshalled to
+the user cache directory, keyed on the registry version, the payload hash and
+the interpreter's bytecode magic, so warm starts only read and unmarshal it.
+"""
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import sys
+
+_FORMAT = b"JDSC1"
+_DIGEST_SIZE = 32
+
+
+def cache_dir() -> str:
+    """Per-user cache directory (override with _JDS_CACHE_DIR)."""
+    override = os.environ.get("_JDS_CACHE_DIR")
+    if override:
+        return override
+    if sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    elif os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "jiobharatiq")
+
+
+def _cache_key(version: str, payload) -> str:
+    h = hashlib.sha256()
+    h.update(version.encode("utf-8"))
+    h.update(importlib.util.MAGIC_NUMBER)
+    h.update(payload.encode("ascii") if isinstance(payload, str) else payload)
+    return h.hexdigest()[:24]
+
+
+def _read(path: str):
+    """Return the cached code object at path, or None if missing or corrupt."""
+    try:
+        with open(path, "rb") as f:
+            blob = f.read()
+    except OSError:
+        return None
+    head = len(_FORMAT) + _DIGEST_SIZE
+    if blob[:len(_FORMAT)] != _FORMAT:
+        return None
+    body = blob[head:]
+    if hashlib.sha256(body).digest() != blob[len(_FORMAT):head]:
+        return None
+    try:
+        return marshal.loads(body)
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def _write(directory: str, name: str, path: str, code) -> None:
+    """Atomically store code at path and drop stale entries for name."""
+    body = marshal.dumps(code)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(_FORMAT + hashlib.sha256(body).digest() + body)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return
+    keep = os.path.basename(path)
+    try:
+        for entry in os.listdir(directory):
+            if entry.startswith(f"{name}-") and entry.endswith(".bin") and entry != keep:
+                try:
+                    os.unlink(os.path.join(directory, entry))
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
+def load_code(name: str, version: str, payload, decode, filename: str):
+    """
+    Return the compiled code object for a packed payload.
+
+    decode() is only called on a cache miss and must return the plaintext
+    source. The result is compiled under filename and written back to the
+    cache. Set _JDS_NO_CACHE to bypass the cache entirely.
+    """
+    if os.environ.get("_JDS_NO_CACHE"):
+        return compile(decode(), filename, "exec")
+
+    directory = cache_dir()
+    path = os.path.join(directory, f"{name}-{_cache_key(version, payload)}.bin")
+    code = _read(path)
+    if code is not None:
+        return code
+
+    code = compile(decode(), filename, "exec")
+    _write(directory, name, path, code)
+    return code
+
+
+def xor_bytes(data: bytes, key: bytes) -> bytes:
+    """XOR data against a repeating key in one big-integer operation."""
+    n = len(data)
+    if not n:
+        return b""
+    stream = (key * (n // len(key) + 1))[:n]
+    return (int.from_bytes(data, "little") ^ int.from_bytes(stream, "little")).to_bytes(n, "little")
@@ -0,0 +1,82 @@
+"""Bounded LRU cache of serialised tool responses.
+
+Models repeat the same calls constantly (get_assets("all"),
+lookup_component("Button")). The cache stores the final JSON text of each
+result, keyed on the registry generation, tool name and canonical arguments,
+so a repeat skips building, sanitising and serialising the result. Bumping
+the generation on hot reload makes every older entry unreachable.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+
+MAX_ENTRIES = 256
+MAX_BYTES = 8 * 1024 * 1024
+
+
+def make_key(generation, tool: str, args: dict):
+    """Cache key for a call; None when the arguments can't be canonicalised."""
+    try:
+        canonical = json.dumps(args, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return (generation, tool, canonical)
+
+
+class ResponseCache:
+    """Thread-safe LRU bounded by entry count and total text size."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, size: int) -> None:
+        """Store value, accounting size bytes against max_bytes."""
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 """JioBharatIQ Knowledge Server"""
-import zlib as _z, base64 as _b, sys as _s, os as _o
+import zlib as _z, base64 as _b, sys as _s, os as _o, time as _tm
+_LOAD_STARTED = _tm.perf_counter()
 _V = "3.6.3"
 _s.path.insert(0, _o.path.dirname(_o.path.abspath(__file__)))
-_C = b'c%1FM-E!l&mM(bjr$8%b#&VQMi~5&)yUtNMon_bdPj1`k+SOUv3R<EpmL*Y5Qp$AZIAUTh=5`_`CZZ$e>fD|;IOn?Gq+eiOVb-?*kl>GG*RHHRJrR?8mrR1d!UC|c{;&YN`iK2h6z<>oi+yjg7R$$Y8Z4SSl}csj$2ZsF&x_#G%p2c(;@S(>UMMVae)LYiOoCAS=m+AB7y0)Kas3#@-hAiQ3nM>R9EgTpx9dAQ*T+ZiuTF1%7FX}jj;}@4TTr=?Hx_OzJOcA5X6~aG?j7t{;>YXD3oBU69!2Oy%U}_Ck@)xj<^L3mK+N6nVH|u~)bQecUe4Tw8&f?ICxo6G1q*+1Pe3jL;V)t@T(~na@n@b`y74qZnINKS0neSysK~?%y~T*Ca6?Z-?!u4#FWy)}h#vfG9<%szMFk#`zPWQFPn8N*)HE>)#vX78gJ|iEfF&0j4uQ^aSfi(LFj5cxC>{<Og}YfWdSC=j7t2+wQF0RiK-<TsNJMeyFPGl9CT8B^KAu`5SH6y>Zs?Av`4&}1e{_SqwL9DQK6@kGq2tGeJNHKtS$tTb9+??<Mm(It9Z~D$C{QPl<>>eeYwpbh8oRL@yHw^l42c-#l+(Re9eVFAywFdoi(+^5AY#JJlS7t_(b$V!e-`cRfVAF)K^%;N*@2{mt9M7BBN2e!qIm2FOq)CYd>MqX_>~4-KL?S13O)TqZP1Uaa5nSr?9ls{l^4Yz%d6Ytt0Db&eR_Ez4n?JDckCv?ekBgS;XeX5cz<(gy?^&+aC3YhCSE+663NGeh3scB34^)#!H-W?cY;P*P73O;FkUUcH8wlLtK)Z<!`FlBW3+i1$IIwoe?N3T+4p`tUEQrBFB}ClHjCIE1@rxAMMUWId!2on>aRgu@#$ZNk^}6|U4K#88D1Y<oxZynzB#=jm_cM?!r5b=MtAO2^}Bl);cr#Xg1x<+ot?2a5kq$s2gB8pNXe@b8xZu52Kfz5_F3SLbzen_>Eyf27FV9dgzZmMCVTmad9b+m#x}?W5M{YT@wJjn+#x0|<*giux9%+RYNA4u#3ww0Fv_MUa4GF3TzO9nQ>G48RRo-~@5uUSK1|R7n3CS;LFFQ{m#El2&8|qd7yoF$@4eXQ!CwP^Q8hZZCIRjxC5Wae`=s(U9n`1&ubk<rlEMui(@O9!n2m>1H=0t}i(uhpzEK}$&~+E%1Rw9SAH`8s;<=ZFiGQDnfJCtL7Agz%TX<L56E2NcF?S9V{HacC@R;h}UM4qq4CTnqV4GgKF8W&&u|M~MReb2w_Y{Z>gc8g?ZN_Y3e+p@Is;GDG`QFiO@FQYtF?T6{;1)3q@ehYdwqkV!DguEexxCLKZyAeY{sXz1DZg}yH;Y#ym`r9q)k{R@F)IewrKv1NE+IS?Yblf^X(sa|sT1f9hoBo0MTf)}hC@v4;jofcM^u1WwyqLWwWYjp?`A~aAF>G_#dqMlHg)tGQ=ItU?34Q#iEy<LnCh0C>R@$>$&uU?g;|OI94j6`LhKdz;zE3y(vM{6z?(!3^}*<Yq>h*e;}uE!s%PKZV(q(Pwf-#J2}v2*3t}|$+;DG)nvZcpdlqXy3>G#~M71&`g=ctiIh2gLqUbv_d9s{pXZ!GAXm)m(QDxhv&=*zCdUSdI?(*XJ;^w+0ZZ7|Pd_jLtk1j8+hu6o0tD}>_>$BsUczgQ8`G98m+vBU_i=*S~ojvN1HzZ%z1diA>wJ`SXgV5K!F%Lpikup4@ru}evbxMjD`hb{G7Pq~fd^X~k;|~=D{;~4$Kz#Vf%x#R)`D$!ppfo$Hdrvz%N!Kw#DQDH~S1I0b37H>1E<KFru$VlYEEvx4WN<ya9h{xg09{_`iK0f}l!3Aya!{UIF=wL3DDp^!A^}Cp8I+i6=#h{?U&eumr$l(sh}5fiZzm(!3|71|xV}EVxz33^X4odbuDD!PW$zErD$w=f`t}F$Zg6vQ%@f{VFcSbSl4<fdaWloq&G{K|1Wc6bx@nVA1rmCXgah%XXnjvp#{2X-_<UHYi@IpE=>HXns@Y*>K`gC8OmrMi4=YHXdj9=1=I8GTO7ibdvg*Ui2Ld?6%SR1kv<gX+j*o&_5LWh$Qh(Z~yx)IwJ%{O-x@Rc6hsane7N?^DYqb8IKl5YA^UAr?5RIdb-RcQ?5bD8cL@hiy_2mDSO0b;zwbQlR4bCPSU*>hu9NE1lb(~|j?M@ee@ZYu5KynY+dXYsb7JcQv{ME6Yu4v<H`^&s-Q?Iw|es^Xy?JhmE){fol%o=vHPwCzM$ZoXlR^P4zcD--eEj%<^F1^)JCw^)490J~?np&-y)vz6h@NPK#B=A(8opK||kw2VF@bRg|7+AnyZ81iSpG63|l%4ZZ$Iz#KYu2=TJ!-<#vAb=4p=@2(?)TgHkMlZ&gWYXr(kx04_%Nl`eW}!v!5WWwh#J(h&eZDOCRNt0hN!Q*Cussv?X<h@Chz!eb*E_p6){22+;GmofhG-m*O_6oEc|dEafi?^*G5fj@XuMpZgm6=RzH`?K{pUZ(9f4S(MPAl`DfN9sE&lnCAex)T6I$M7f@=;?TfxdsS89L8f5A?P{KBhW<+W&%ILI{@<f|NvHU^shqA)5$xffE>J8GeqV;7?Bt_7vY$G8A<fo@u(qAAqr_B|pktSNSo6Q00VQQ1)Msy*Z=4~&5gyC!1?LH7h8;nXY&03B*mc;izy(UFK5)1VN%_$6MM|8F{s|{S8<_YEmgLXh8CrF;P>?Y<--=H4ZnVS6gjT*{TBqYe=lp>bkM6GYs8I`7xzl!Y9A^n-vwYq8ZB;9ZlW#!pk*K<dW=UJa|Z_LPOCE6uCX)bl~pPY{kr_W3RQ>>5wRDFFia~*Sry$)f-0mVKsF;IxW)Ux~Z!`;-zI}tO$fsFek8i*epwUE{Y@wDxxBf5g#Ms~l$Ot44uqf7ZZ4meqx3eYnkw7~HQDls{`-lPAIEPQJ=EW1an2KD!eQMpu4r!V9$cXyLg?RsYf`mvoRF(+!YWw&V(bf*N%aht@&s15wfMd*v&>5sS~hxnn>=6Y!U_ECGsc2GP0Z4kIRNSyz4nG)<earlnl-X=WSlm*<kg^K&Ao?F2=xo?^+(d7Rjg;*iWl14=J(WBM4ZI3Xl7y+w+{}GF*Q<spm>4L9=TiY!jA9MmBTaIKQ)GJN=Ph<f^$tbORHbFP56?U^nh%lFSc#=^CO>l9NF;vKA>S)mXO<A}lN2cATF6`Gk>X*N?xbNGyPJdM1x)FB*NkL0?1S89RUPp&hg>`gX3*%(5=ps_0`YcAQ0TSaJ$X)NLuXv^$7#yd=!pLsWw@#->97J%;c^WjH7)8(rWo`3szX$LglFOiHW_IZBK8rx6Q)*BLGJt3l<K5{q5{)jyX}2Y~Hupa;YIiK285YQb1XgCkugJg*&%MQp=Tu9ODC}goOGaQ36%g^%b5hLdWMtO7ZgsZjNb5gxXWnA$hLY*@M00968IgI?&%SnCNwk<^qPZq6tKaGG)O@v?w`OLm`DIR&LEOopA(pvKaBU2`U66QADo1BTH*SVINu{RYh(xRC&=@z?9TI$f(LHJ3Cangbsbh-zX(#jMq&bDNb}~H_#@stS;0}?=s+t@h(G=-B`j#3=$UUE_1$rf!<8%j@8jMC=bWS>UyGMP|Lc`mQ<Qp+B>dBL4c2Fr%>H)+WTD>GQ&DHL-M~b7XQ;6RCm}*_9W-TlIz*B_2n(dvsu@*rs8vU;5s!2nlkGl7^VK$G@X4cjq0odr$P&Q6TGtgzI5Q%-OE3}w)98ggzmx)+g=&rxzqlvP&Cc_*qK&_xF^`s%>Z&rA=tX6^0QaWow9U$f>@IWmp5@o6-S)_sIH4}%cFQRwmO;pDctnL=s&gf-jyT-U&wmXgz?i%aARk$lmuVAi8RO=emOi$vmV;K{#(eD6%AYkck<A=O<YV<R8-3#$-K;XAkXX|MS%!;VLUrM|?pa25V!+)9nJ(D^psce=W=>n1l*Fn$cxDM-ar32r|4g4&KJc&;;RllrGNxzr|0}!k;Pee}o*=h)Ah0ZcHy98aOVkT;+!ah?#=o&KWwcUaEZ^Ba0{GSHG;_*4t?a4Rx%9{skFR_wcX$ng&*wB`-l0x+_^Cpxhr=j~JJ6pMGV3ClStQ;&~j$)HXk=6Hx-85~AJnl?evN%{Em$CH278=#Cg)UH<SIt5_#yY>*Il*G$EAz20rN}1c)V2ziRf^CV74EQ+QwKuyyOldZm^sOmLB$!Imdc;e6upynR<8FlV!dZd^|jT@iS>@vnPw897);x4TS!htf7fjiv8HO!&caC1dgDhk|G`t1cDn;py94!~G|l!v7i#mocG}a{8bT=%X!JrlMrTG!=!jKBhctfTRb+DX_;0Is+ahF1Jxmd3K<6W6u1ku8WEhmCv38tk3K%+hCzYFxj287K7_H{sBG%p6xow<~IWQoF54M2BSP)`sC!5&CGfDEgYo^j)=!&=fDKQ^~r6aqVB*wI5i0^jaQoPJ+CJF$I$91Xz(%%fO(n+rQWTSopv!>1Zs`TMlPQ-r&w5HyOzY#3<9|<RtjwF1h{_5})t}DLN!G8%qW5Zrep+^6fED16QP?fHRDzX?ZfUUdC^VCes!gCZnZY!}~GJ#;1!K*^`<F|oqb{l4io=S>!r#ML<u>Q=!J0AP-J5Om2eVfOLjKenBCHUdSw9yi-rY}I%Y@-m0*=&@Lv>j+kZP8E3%kHwlN7IqAcG?;336==#Ux>~Q+-LQaE~yO4&bnlTS^Pu1fgi|@&afBuWB>nLH_vt7y6XT-b4r~h^SL#^FaA?rskU^^rD?<&1iL6Y@<*~jGWJ_!%aX3ZUJA&~RukTg4vXr}41QK(DG9f*Nu@y|tk@%BDpZaT=+SiJuJ7S5fDW=XNhHlCa8$<mY8Ly;nU~mzecMU-EtR2OIcd~QyKxHJ)!@l0Q{I|{QI#mz!ced+*1nw=!Fd5Xu>C}1i=uD!rdI#?nw;lrIw!f%e1X+)63ji4%L^HDBRzqvdDWruw%KUYGq}~mOa!s@z^2K7vb!MBZsKjC@jionPovr-k((*su<L}ALjsBPQ81AnSO$HyyF{@qvI2X=`<mcpL?bN%aMD_Lvxap&BRy$ch>a4OEojUwi3JsfoFm@Y>Jl3yN{0KY)nsQ>w}D1s4k>2EK8rs4h@JjGcNgBeNr&+_FpOpoP3)SJz1g*!@cnfA@`w9@HIO6^<?3RJk%iip%N=!+7xkWziCwP*3(jE@15NfT8<q6oZz0Lump@!d55AYWD6vXlQ?q-m&OYS2b|SOSIa4c~I8BpRoGvE8i#aGbfyu`)cQQu4!$y9C=Z|U35dp6))5pSTjg0f5WjG_U6no|_?pN-;WCK_f;RPB!c+?LLD=u~;^%E!~El~tcoc<cCFPc+1@Km8^CHvH-Xb%#!HArN)EKaP+hO0Hn$(~-)o(%J%0TOEx!|N!X#tR9y!vx<_2{e45Qj)_UBVu}F;k6Q1eqFlNnuJ)l1L4VqFimK}+1gel@@v`M9{pe8Or!<(v5`V(GzQQQx~g|U6RzDO{+o!q7CY{`eFy((NSHQ;>mHdKSaIT?I{Rbb>&41i10>ErjCr4ZizC}<Hf><p>EaLCjWtxKWw*c$NXo!>Oe!Y9G5t`f$Epr32AD&mpdsk-!d<$UK%#_Hl6J<Q25o{mta(O^u?^*zI&j8wka$WrlZzNa3u^*R`qY7Ej%)zRa|S0@mlxMataY*20ZC`lV4|B7)vr@e68)VvZu=)~Lq`^JVT%+OCsEvK?4j1)64CY2tWewGoQIACvcn{lQx@*5K2&jHXDx#VLS3Ihm2AVk+h_M~Upw-<(4U)Gw4*p#8SENPO%^JtXE5=fZp}e9TsKXVe%efdFXt_#NIvTctn-r7H^`JW_S_#Cey|NzR|m_Xri_6d*Um7GwWCZpxKHbF)uv5m*R7*GeGXB!`5DD6hpEb`=elx}Cz_DHoJ<&RnloK!Nu55aM-U)#wjymK3N&Fz4}^Pjrq)3^?Jts<XY5k&lo=VUDM2!s5~95gh-&?%X|=OvFedL=qYm-QCVQK`bM3aCqAj+~`e!679G0=UELh^h+7hv&F4lW{1Kkvu>Wy{I6Q7I*u_&IR#Eg5?*cPuFcg+T6yin)<VihTKy3xn9#h=70(85Z2x;_Arb7HRYbn6H}pkEVY5PB!1T7L-^u{&ef%!%qRA@~knzE!pqrwi|Mto$o#<+Rklq8)J7CQqDUhtP0j*N_`Ci_#2-3Mm5y25_4mA!<yyd9n6MBB%xPnly$MyF}s7Xi&{vgb-M~-r49_tYTqx3t<z`H7yVYmcS@SSCUebMJw9hh0#eycpG906ir%Z$H8k45h1)_PBr&C78t*P*=pg(?c06M-0ya@l1-{D3XjYRNicLRRTreJG`!JA4XU`#H3Cty@j>iQ{E?gL(v-hLn$FtlxINKRlLB0)lV8W^W!bOQ7aen^o%AzoDy{RKyHfsDh%NYIQ{w1SZ?xAi1dPNcGpS}KBNzQLr-_$I=5^{E0H+jy(`E<;TGJp7j@-Eyy2_~_I*3JSXSm}@H^*z?f`iO!YQbl*GrtMHNNbS&1lBPn!JkcK`fA?NNH=r&fdVhYBz6QWBlfdvzQM|V$85&Tebi17sZBRKB%kY6x@1L`>)L4<&Nq(S=nxC88;eYJCVLZd7$B%wd!RZlOm3DkAQSllMWN0nXq{K9iR{=2Y4<?!ZOTc%k=3&hUelnz^m^Up&(Nar8^NhZ9|h+%>c8?Pp%+cHjBIK8l;)jtlGq@u{!deCrD3~mW|=Z|${;llGR6a&Djj$&```rpBUPm&HpOA~q^s{)y)SbPDClO?`Z@~eOcpVyUQ1+j7*anvS!!yU6|AiymL{4UqGr1J!GTPl;WhEJk?OBHGs=b*yX>)meFfG^Jx@Pn>qUu6n!e*dN69)e%@jZ=In+$0aMT$kCGW6^QO}^W7@y0{Bbq?T0EM{+0&S6SPbsq5hnuE<#)gE`z@ksH&CJVi)--#})@CT1A=^$bQ*9jki~C6Fkx-uDeL7=lO_T?XfG}{t=*hxJ0FkV=U^&dBMQpflk!r~=u-7|14jOUb8zp$Rt&G2!EW3<uy@rZ2lO<Zvc{yOB!GS9b&mw@?x@1)%gM_wg7;i#*?Z|GFZ-%Qm$(Jp!;GXqJuO?ANpMg4w;EZKp`q9^{oXxn6Le|sFfa5O7_m%F&FB!EKY^)<R3nMkz9IvSxdOEPd$@u$;YWogQCd;Zj!jdY7^6+1W<3GqKEKQwt5u`|z(Nc`lfx8`XM({^*s0#gcIGm=@J%e?NnXeZ=z)_&Loq<zAi`!5z$(~&txsH``(Qu?-?_jp|J1rr9mFC%o0@LWVW(Y|`XlI9&#9kj^ne`t0TYZk+!LKsFTBKgo$^N6c&?Um*qFuDJQ(glW{SkUVFyxQa!CMTr4u7`OfSS@kG)xzfs_k~u&1P@ND4Kega(8>+<@G+C<XxEz-3;!bev%nEnnc5hR02RL;#lrEdElf2A-<@e?Y}@T5QB-fPT<0YtVH~hBXyz{`*qjUx4qmK_V<$DE%^i<4Uo4b099Q%G(Nd;!cs+R+A^&T!)YY_v^@v~L?|Y?92q0Rt9<Iwu#7arb!KUdDdtVvg}T#I+KhT0^kAUykCF~;vfD)(S_wgSn}{13X=%1*#Uau!_MWv7v(rVmfTiOti_)UbOIo=o38!q40B%!~{#zCaGPo`lkExE{VWpZB^42U}V9G8$rRz><KNnY~_y?YY9_i{u0Q~ukYeP8T#-**~>B~7w)#8HLNi$ij(+g*jT9^~gw4oR4^co#6&gK)>R%6>b9DNiBW7AMEVjQ#B?L6NH&-ddOHVx|Zfh5{*YD|>k3ws>Bi6Hprdvn8p7*j_|6~v+xFe>y%w5=mS0}feJ4R%~wa1dhQPP8LDutr1wv*e2<A9!8QR8Vi+=s|m{dbudNDYN!;t(R0Mu!}@avcC`3MRqy9xn(&4o`#Hk&MkD$v4)a5rO_!T=2`%0#kokk42C3?jWuiFM`Y}z0Jx8*nMz5!>0}g$&YF4_HazKZ{TZ6HnQu6jvn9NX;|w>gEIOr3<0f>KwSXACDWY>TLt+@Hva|DxR%^$}bbltE;<h)<coN}Vbkcx186(+E-gz5?85vj4WvRbB%Xv?<GXvMj42pBoyEV!3{W1w00Q(k@N@ouH9h}=_K-uKD<)HW^z$z1xB*#hQBaT$4n+$+S9o=$F+oF8Gffj9D#4&WUy`EhbOq+2V_#-n$DPx7Fz6i9!Tu7n0eNI+fHh(K?XSK5V=Pj$5gI~||Qa6_$HhXym_3{d=%{A1^YDjzGCpW|i2rrh}@XXuo3;}g=<kf-N;54!eV^(fqEaSoX$sgZi$D7(ukXt=iw=z7SWiqMTc8*5@-QQ4tZMAX$5RKcxCK--y;3b5v36B?z<R_8&gvFsA6q5W0Rip?^LgO%Hr<vj2zZGk<D<{5optli|OI4%}WUNKotd)16En_v9>~3ButtYNP#0?Q|OdSD^me}lusrLp@Nm@ew)}_y=J0)l{6;V$);La5CS8J0loXpB}=ySlo-DY>V$-nEW4qh_iogJh|!6O5mUj9+z(1BXtYyVc)JJ;1_&Xc&_TXq*7SI5;(r<PpdOS_F%lm&ar)UUFa8rs_L!nC5nO`J$@fteAPO=&On$qMMHUu}^i__~8NI=0x_*cc%_lCqz%`+#z>No5SB>K&!C<b33E9c;6od@#FP&9w`|!T!Z=cf^|%c$Z-l)*9?AEP{4>C$MaLyp^HdL9n=7h3#D<`la6%a5HyEIM=BeP?Nd@ffsN4FzsM+UbDL2po%!sjg&gMc#jGjJ)tX#VBN77g#Y&Xw*U<7s>@MH91LLTk8<i@4Us1#M0t;d3@K@SO$6MMM#J1Th(vhV5%1>kmXk(@_l`8Nvnaye5#GDeq|t4#0gR257`_Jk-@kDUXEa1ezU?VJA3I3k6=^6B9Q$yvm#$^WKsWs1E^NSTM@Gj{@o#X_a&SqjCG)PS;{F#Qw=LAMZAx&wAiElRRDV0tn~2)jg9?nXtWJN3&-d8#(d+V#m%iP==(l(&qQUzyTRrRn#mWTNUhgpECa)pX`x1=9;do6@IO-UHW@WgFoJ0~cSUQLd<aTY;_n8hiSqdflS&r99IOZR|sRaurtP7=TN~vDTu~r-HSse<)Astw^*<#Or+x;!F$A0p>2ZJqOldHLC|A+OV^y)Y=ZYx!D3lU=VME5D(C$i<^GbOidKWSQ>Z`I4e@-Z7F+>mQ@y~b_lq($?FribL1J=JM&G_K*GY~?;7w~QJl?vne)im;8v<35MFf-h!ru$1mfCOQZA;WeXN{4lZVlU_zCnI`t6!xEs^o6&o^b_DnPx}Q<d%w0w*OgR(S7)J3@d+@uWRkXXE)<(mdw@2peZr+{S(_0%#<A;^ik9FN_V6gNTbg?7#`M~0`pyFh&25(-(rbV-{Kl;I&K<^@Jb>U%cG_eg8t!6&~cJ>o5=G|EI#Lm_B8oR{g9?E(LQlri6vk8Tx!L}2gNlePUo(;8m5`nk~;ez+N1ys;aePS&gOFBrKJ*Ictk^6~wUAfys$W5OWDf!%NVr&tD-&9D+XKdzgkj!c~9Clt~D=vh2%VE5FZAPUjpRt|=YnuoYK9NQTL)?@q4Up$Yg4=~aBg*Q-&(y+dd8f|Ng^iwiR)vw)=7@)SUp+Tj_SE^v0{N-i<-`WSJ1zN4jM}a@uoURDq0{tQLTZW*+~Ym<NHVL759qHBZ+B@kM)Fe!Gp{b+Im8MNLX{CTrLgA0-6`>4Jq!!42*~PK&{rB$$azTHjvjcDvQ0-SKiy>DTfBMJ?!%v`Qt`_Rtn@r(AQA>f5<47N@zR5^#_1F6o$B-U<E~s0;97d}89m~((MdF1BOXOYsM$wUKubQMx)un52C4}cJ`!Y~G&}N{3d&w-B22u+ivoD$j}fLRFGsYRRzkelkTTcc1f3+RF*AMJ?C9;z)P5y3)kJ=tbJ!dxcvQ9_06XMM=I&WiCp!{;HzzU|nwOs1P1#BpH|sPr+f%jcHQ6L*x<W|b?eIdnVMWvtA=i-GV0EfG8zITXdkr$a7JYm|s(ozOM#hMk+dc8nffdq8)~yL+_<D4G4hJ}5UbF|gWoRZ@aNxy=Ey;L(xIS)}QGnOMrg9H3_B)guN@1l+l9h4TKoK=tFL;eN?Hjb43%qD=Te4Nbl6aUKS&4Gc56!;%RrXuE&y6%)g*pnUL7eKOgp`_FC<$K9)=AL=ZTQ3szI;PRX2&GK*zB*qZEYdeo2fU~>*??*=QeaTf72GR=Cqkn_}Y1;xh)*ig)9*MVtSOZ%gj`}dKuNqT$aD_=P%!J=oB2;>ADt&VwbIRJ?;Df2Quk{P7g|s@BHS+8=VjSIy}92_x@&hc6{-}&51aq&Z+MV&dx4>I({=eIvHHy(4)}9A&yIb=2gSpfBxWFUk27c)vf;U7wea3-~RaB|FEl%Vblkp4*7)9Dj(!^fOAIog!MiCCMPrU-)ohf4<*H+k@93xnaL8@IG<E}n)<O9E!~l)l8@!#uVU_gRtJ}=53h0dsTkupx-eKp=`p5}s4fEWFRLKNxuJKI_~6C#6nS%h6wLSlST7#gdkWB%7q7xaB)s`De&l0P7xy^v&R_7sVwpCmli>WwUqrFH7<sbQHEwl!l3U0ig(}2ZsB8JJ&F8SHv)~9EwMoL*6W@#c7^M(1Fg_gQGk!F&%M7VK$0D<;B8B%#$bGuPT|Amyr_Okbr#wu-CvQys78lSUDv4HiL?Ivkxj-SiHL*+o$r^Wz?%<Rn?ZmndDcxPo;sYG?N_9B(nwa|w9PgGS)j$VkO1sX)MlT7mC3J@KV(&GX$rBy#g4JRiB}aT_&gxqexCEQM{8&=GRfP?sRb3~z>}3x2tKK{=J>HF16Sn}x&qd-;t=*9`6NjypOwS=i8Vwdb{`oZ@&Xyj1r;fejLmIPvI*sSE=O<;-Pkhju?4(UK*kS-`h-BWBUT7xC`5B1_pl1HukL}+zTTEh+gkI>IkAEyPzFftnhbi;S<q6}CM*i4C;InyNH1%ENjR^nfn=@}5Nr!XkZjP@mz@<N^t}=M_{(EAn(f)^j{w1n>{BC!zR+42J%)PBSjt+kLW!v{(?9t3!jkg1l2R-X7zu5CJvVG)(y|0dMo@vJr$6$U6!tvp@I^3oIVQ78)PY>SXhr@%9I%^HNPJg(#ygEJ_TpyQ}jDrVn@f*v?VclNnV}2F}Oh(n<?$^DnAbjI_ODh_=3n8=ctOHriJokYZZYfFGT=dEtt-{D(d$UK(Q^eeOIG1t+0XM^8yEQ(VRZ1~c$e51CR3yCe6Om`X8{?F12!RaI<qibC`;|sd<z-P&`EYgoW^i<K{N`h&hVOfuz~-pncK}wbg3=@do|Uu^eN*H$Ump$%1GU~`Odm*e0Zl5cPh5W53?6-61pgrq8-OHuJSp%WcXEyR1Gw7F<>i^UI=+5)d2xMA59g;BZ;r3z+3?Gyw-^(>#eq6OJPv|ca*qBt=V3r)m|$?IPP482viN0TS=KKLNu-tY!3Cec`m?}&0`dv~psNIpao#ym_zWTkrx;JvTslbLyuG}*xjw*k0}#mK^5X1gTU?+hY1>3yH8BW%2=fzfw)SFw<krMha7VJQCge%>*2=H(40IQfMa<Qo*a>t##`b_w#EGgipY%+^3AKpo#9xeue8}#<|8M_?&<C6D>FUp2s-CLmb9f^l5C-b;tw$Mw8;)h32fz9_;FiCoRUciRU0$iWnVChI#=UZT?e?Tw6R#SLQM*mj_SK}{Z8{x#@J6j(zt7OYZx+GA0u*S)VOoI@??Qi0%{hG4Y&YAJrud)5wMR&dIc?H)@5rp8w51z9%)G-_jyD?JA%#^P%HcL9ExfA$14^lP#`Oux$UwovSB*A7af~{D2)##(Of~}7!v82UC$%WWtK)w<r9ml^HvY!|!wFdn*8MbyV#<ks6C?dDn2o6&{d(OUC$-)D{O<CHtHHaIpJg`^GoEEh#2s7HU?i5GS+9v~LDKa=yz!&u%zfNH@!T=!ZvV!QXWstnVEnj$=H7WTQd?+b7jb5|^l{CquBA7M6rs$5;9<2KLeK;Y(kBuU8Lgr?nD4vcogXt{C0TG5^31~;g1pQkt?2UI;E45?lrU@<F~qX&Xq4*Ug%Qr%9v{~2W)G^Hd~=dUC)EXHf%#+&$-|k`I?gT!Z%!|M5Z5<@n`3Ga^@_ND@Md02#9oc2{(SC*lF_Lv0R-ZOhz6*R%NuIEzgUo(Vn96o;p9e~U%ok}?v*Mr7}5+Isc=BIN9N2=gP*T$afy2*hy)*GGBIOZ>fsZfeESEV@lM?A?vahlv<7+b@_{&l-FffDLwUrqczb$veZvDQM&rd0N8`(rkNLU^sp+b#C|Dwog5@I`k{Q{v)4|2ju>xLlK6M~%DGVQV5~0Un?>y=uk4%8In3A{-CKImd3o!zD8hgYIB5cNXWoPdX6AW+PUmV?>5+^h6IALj&+-)Lt3xPX4zPUhvwv?X%)#Ql}mrpGh;E||NKX|c_j7!f7%&KJbS!&>Ap^?zZ`7E;E_vC5!uf#<V&S@;aQ2k^g3ZCU+<l<t77{|%;k^a<QJ|#t5Mzw>~QK}>h)s9iTngBnc5odCm&xtxrAnG|edYW7NI*5rCL{raWucCat=GR(2m$-gWwuQS+^IXtN5zxi6SqO-KpX~KZGU~KakS{F2-mr=9%{b7I-`?_DK96|2J=41|m<J;_<ShJhgqM5{akMQ9ZZ7dho(7{{H{?n{ZOC>cxguZOgKX-ZomnOMq?c=3#w!;alI~<MyL@>~FNGZ9^_DDywHv$Px`7Px`L>a1+$TRCP48ATWITBC{k42A<P)!7m~m?k5-KCU9wO~{ol@+3{l)11&6%;0Euk*?TA&=6oYL3UY<I!uG|y{#DFS-EHOoEZxi^N$41<}>sM3y9T3LQ^^s)j(*5eh)wctKbRF2m(ycTnbv+dcA{BX3Ixgp88`w++CFUDZI^6)AB@tyj3ntUvQAapKq`kP^#k@mF#2l?p*r8m_7g7QCkcT-XUJ<d-rC-NnmL!4~Sg7YX~4az#B_!Q5%@8WbzhIjrVA!B+jazD~y-fqi)l`1#%+yn{|29&TdXA1AxtY)Un=ug3ch+Fem(+jiid=9xHvNa0>8KR2eQ81gi%g7sN3go|)Rv~^*S!DW60G^7<f)e_CrA+#vW@Jh<hr|dI6Vlc0+|k1UYbBOX_WC07`9c!*_Y3#lg`>i_EJhHdC|Pw#F;E_V!%Rt<3jcpNoV!bCBo8*fR`(9XgLIT+i#-{|jOHaUat+kbN*elN{M@zc&zS9#V#oLURMTuW+G}16rCmQ6e^bTN=jI(Hx+H3xV4=Vmb<RsBMu`3JS^X}TDM2b#Y7yL?BqzC_cCsoeH6q3SL)rt{O%%a2%BY4(Q4=S5HxUr4Wct>iV0oPmJ0*%G&5t!Psr=_($I<@R;=nysOps$wUVtODyBtXKV~zB8vmmkXWmGI8lWXGZlbKmt*OdS3Q_bv%u{ZQSyK{L!UJh2~Ypw7#ij0qh+}@5cI<I(o<2oE^;Boy#kCWs&L`r|;tUM<?wjDoI9!Mks{|dVg_#wuvba;Yc$Pc)EN!#%`T9fUHrmo7GNVs8AddyS)aTqK&1Hdha6B@8I6M-Tol0vz2ag&pJErF19IqoJ}E=e-N`N^-J_)Z@QbM6w95KW0HA2Z9Arai<x&fM+8$8=)Se8-AjrgBN{AJXbSe!x_aE1-I4P8XxuYV3(<b!SXAz;hRmnw3<tUn>}&<kj@t$_jJ2Kbq(lzZNjz>pc0sLO9pmcoo&ea^}WF9CKi^q<W}mLNIeLc84r~fmgL+0MJCU;vUvO@I3MF=k9PpWL+_Q&jdXSt)!JkOVhmBHX7-=b#UVW{3q{D-sU-2+_M6gl+vA@pT!#KJ-#E3%2$d#t}_iksqIL>r}FRr*MIrH|J(mAZg962{oh^aO7{~i(#ptSj}2)+X7xO{gU_aV<+(I>FZiym{o~KeV9&1Xn11)Xr(R;ELmcQWn5}7kz@1j*-=V(QjC~U|>1j)y73zw_qR-+=f?~hLSl)lDoOH=*bOwCUS&{v|rx~#wdens@uUZixj$tJgqdAC5l*&uvifbYp1mg{WhzyWY>1YVP<Z3x8j}?-ttg;}IwFp$Ohw9!&nfpT)`;SShfPvBL<^;%h;UQ$hEC{1Yeh!ol{?`HnOz*Kf$N?`h%ZeON2q3dTB^e_YH^U@<v0l!$lx}#dUC+bRLNfWjSHimi;$C^x%K;=`Hx<`JP*PTY+AEZM%A`D{8F>AyWPnKakg4S^r;q=i9Hg;a6R>9G-IRXb)W=h`m|)GzAsF8`fw&9CkDH3CZ@+1vBJcmbk;r3Zu*Py9Zu)I6mv_h<l1ijWMW#6f)3h|xR7#u*Ut%em>C(a-ya`Pk72=Z2R8juBbtPp4>cy|z7Wyg!uu4W<OMqm)PZZbR{hBuJX*cElXyVr_R!<w{fffSUo>a2n!+}%(_@u;bvT#~uQ%gx$4k}8c!iu6*`Pd*?dDT^|#wLQ5ffWgdlVt~R71<nQtRgW9OFJ~;(GJr<w8M6NFC&>G<}Vel3U!I0pDz3S7U7z^fOV6U<vNln!Ec&GwSQr?<a<`<IBVQO3=U_*6|o%uw46~VA-qKS7#5ELnGEQ7jWl#wm(9hhn$VzKA;$+L&$0Bz771T;TezEAuGQ`H5_lz@qFh4WmCcW=IF#KkTbQqmI@>$>%d8WaNgpLCnSR1Q>SEp0q<%8`RBGj;$sVYis-J*dz5+CaKNx+N;}#igrBR=ir$#)Au3bj;@Hiz^C;0y6I#tP+RLik2xq3g9)+pI*2D6tTkui3XEZL%D5b$g-VW}7anl&l)Y~{Mf$fma$mlR2c{h*u}N{XboQ=#;w3?I2PZNgT53-tj$ny;Bz^o09y_rE5se6s01uRCO=|0^+wW0&T%x)2yKEqpUC=(pgxk|hckMz64T>5qnUe<bc!vB+Jh%b)p>U*;x+-P#M|3{Wa8y@r+3QAK=5yj|XqytGH|(vNvbwkpF5mYEr)m<)`c56;2Itg?du90^vz2LY?6MIK8iKPlWSc9R5Dp<MBjb|%9Q6&?M<R&BP-2L<iprm}qbGDq`r>1wI+H`)C?cQNm7f~oIi{<;C@rw!LM%gdRIV6#J_<bW+>(5l?tz0B-JT)fJ)C%!*aN<aq4UFf+F8QH4}<hZ@RxHqI`5_PKo(I*+O;>O9i7NlvO5KLhzmBfOKNQbpt2T;gXa6fuZ+DEJVdoR*U<rjer0aL1%Zj%z>;)b~0U5GpHLlJx7JQBD(N$eun7qR%GsT<>O#Hz-w{S8!$9E6fy)@&`;_nK|zl6lf)gz?i>Cyn6)*FJgvn{f%R*e`C<k?}e0eD!2}lhcmqiT4yCK1fgELV!^2BJ|y4^6kpmv5U#Kt0vzrlGWtH^Y?m^?WUKX>vHC-+SRj43gIX1oJwPvs{BXFLgj?2xHHIxWf=TQ7!L{Y<V$69Kn=qYM{h2~`>V4kvmJnAxb$9`AN=@ab!Q>w&Kt|TF_y(h;yp0Tmqbz-F-}TRPn%KH*3)l$nW<*9uvp0WxR>m_N%YQbDrY4P*9pg1LBPaY_!F9zh&IJ)z{4W=v`}4!cFEPXAp%c_Z%+}oYO<P&ibTD2!|T-@mHDaOwoW0_M)s#*GHJjLEz5J|vENf?Dg(G3)JuRM&ucP>9|{1HFWCypAq2B=IRN_bg7U|o<IvrVM*8^$uufb*gf3GGNq>9+oDKboPiL6QTMKiJEfCJVvA>#c1tGI+fl)TJQuYi77pLa~1o)NF<B2z$1q5gKIz-fQ^>jS*uCYk9H*B;Vd%kR;q9hk05Ip$j)30V#91$w38OoT>Ol1H*<Rvf-IE9x<zFv}0N9uK&nu2-Fu3vE%aKxX?m??fkq9vc27S~^ikF7m-X4YYRJYI~;i(`jPQm?`zTYb`7M=IcRh`XJ(cGjE0)t`UEz%;fFOe2qS3M+_{t}TP2TYnSioMIa|o&78bmRsSeo_+}|^m`d7bUR}dC%A2ex4rLKr74*Xr=tOfru%n3nG%oouhC~<LCNE>@j^3gZob~F)N2M(7zUqSgN-FQb8n&RFO1jZ3h*K<eK=2=J9EHMF&U@$lz|D&yd<p6x8(BVLL#m#E`es;5?m<qerY7(O4yR}=}oalUU@^RnXr5;DQldgljc=-h8hW(EG7Vb{bib0-T!DLz(1G1>RSYhu(Fr)871`DHfd7!vbiECTtAlPmgmK!@A~2|GsUdIgmjka2=IsWjm+=N%jINJ1i<&j7}+v+y`<^5Z>3l`y#vL_X<QAGrt;+-MF7U-8AjfjYs^V?eMFj|?sF&tljm=w8KuM3d`~VCC>GYo{TtbFpuF)Ko2|r|-X%cvN#90BxeLZj&}UK?%i|>AH0Mpy=gEN$#;ZRsX$7BMn`V+nxTf!X7Hayc_UshFsDnC<obtFyo$xLqnmsqz%ujPlm?sG-ELgL4EHfc8?AIt^(aOWSh=-)0OWj;+>QDPfkM^aWBkhHSKQGIObQM-3-2?FFl;l%xWn_`zIc1qt;LeU=p{S6!v_*_rVT~{s6{VFnZl9RAbD!*^>Q9$%-!`O|)Vtfu8|NAgtjVZe$>osN>WB|tFM5b3mH&)#7WP7kuV00FLDdIhS0S|fk1|~b^c;v*z5b7)QUWUqM+agR&Z@g#H8xNCTMUg|_SMl)RCm?;KZ>U(y@BR;<JtaO@XV{-e=v^SzZJ*SmMX_E3p4MMVS5y=rLS_;fXJt2I+KaQ(^|hyo+?jFf;jcUv|tU#lo@Yl%&+HYUTb9{DI?VWtLpi?);4<Ale?7O*(q8|@VkFn`(rN<)W3(7uNuhH{tL_<;jV~Rlb}J|<WkI6aBko|l5X+u|FqArzyD=XbZ|ajanXW$afQ3Tcd%1*@`IhT5jTvu<dn}cIK2XEMB`Pvj`;EVui`tQ**-l=uD@;cHOnp?edU`gjy_2xI7&%I3p4VI*E39<Ad&WL@s@gly;I4Cy{J|)St}C{>z&xhhnBDp3(H&{{1H?MKK$vO^5xmKy({*=7rZ1%HlkWlaU&pM|L$3<`=vOLsbRBW43!{zZV*`?5P$if2F8??McIkh7wpuaLF|h+*o{fkSb7Qvr((@zaqtT7zTGmusl3hQ;hmpIm+ejSJ?(SFd6?J{TAm%)<#Y3Q$nVmCo{B%_aE0XGSBcIBRQB^;jnc)GTou3<Rg@sRokvMq_NiD&Wu_U6Lj4)6OFb{&4E3Trq6}s2MbVx849Z)*LchDSOI#ymIK$f$2g5r)#`Afc3GDyasK){Q-0@?X$LgCkqUgV&8n?A3Rs~)-0$Uwx-wOGRH)$Kv!;sxdn8Ytbn>wTD^LqjQzqJK9ch}Z7kmU)uFK@vn$K<y{-gLl~VUB(ELu2MXgE{<m2H6{v;SXuWHaB5eYxJJ{7fyiZ+>76$2?fwOyq`Ac3q?g}iw03_+Sf@E4!J9^R7|6^yZ6L<RrHCFvTvS>O-&V$!V<to@!j8w828Id@Zx@bF<Nl8XTvS_3cAu$5>j9+N2<{Is#;c627fJM3e~ilobL81Ie92Mf=M9Y`-Qoj$dN%C*XiYM9a0m2BQ|NvljU{2smxT(^kcGB3A?RS2~L0%^wo}+L-8T)rjNN^`v<iSEf@Gdyd2LRJ%ld9!HI;qij4?dY{oiFJu@G;Oxo7+c(9z-3m_jdY5AB8(>CGENkTrSo|Q72d@DdR!V@z2OnOY7UWvhYEZFuD#H-^d`C@E3s~WDLTE<SUW$dP0q#ccz0suTV#WAVPSBz>VWJ&Mhk(BaLbv|X~aweI5sGOd^yS%y?T-@ZsnJNS65rEl7Oni+q(86G@q6`p@AdhL`lT_4EE%Ia<@#ggE_~_>BXW;)Btdu#IT3K+ju&oA9%N~(a9Qt=;W=A-WCL4|5M`Gc5V{dGWW4RyjzyQP!o5Pp-y=1veaJB3NBXmRV;tIWq7kUV!l$(N{JND!)N(t=!5=qf?3y}e%7z|;2+{@=qVqT53%^Qr;6f3jkD2bjY)RLIox2Hdx4~AFAZ;!8zFOH6{i!r&#tx(nlGrL%MYp_ADMZ9GoDbBSj{iZ9}6p~-qTAPrMl2sZ&i5dYKLPVU(l_H;f$ZdH|N=m_(EhHm4%kyVBR<>MWi)~hK$j|r+2x#b!E4p_8sW|ub#MQY!8Y5(+=6ZAczB(h1;XqI1prr4Fv`e>}8KN+q1CWOqM7~z!s4zhq16d%gZ10#fyp4R5LLar(@a+$2IzM_R-d$bZTpnG@2&x;L&_@i!N9VGqi&&dF`-+c}nh_`aLr(5XSIdo2Q=MALpW<YWRhDWel@G)>U*iDT`1CJg{q_3z>h}0*NdH}*US2$X6y;|-MF;9snHnGQQWNQcKQ(b4jB${kapqA?$YX43;>Nv;=r?d9B#uTwIQ9YMjStT%Wq6GZ(7N!2yRPx6Dz3l4$7^|BSuHu_tR|8(f+#UP<42a#2lOzK0hvpLRdV1?jgO1Stb?Hq*CSG8-J(}c1&3FHJ4CSMl|k%}_rlmO@#pdP>=6Z<cdzMM<bk0ZOqslg&^RgqT)XPo_cm$ga)6+xqet+UyIm!4ckJ#Jy{ox>Xt{<a8)BgD=2~Uyvqsqx0?q8>-AtXEH|dJ1+(%jy>2}4Mz(M8IZ8dR6WJR`d=#G8t_*Tc~?fsnwJG&9<8xMAN`|p9+l^uamO}m2Qi)ClvG1DDLP#v;cGWwf#v;7f-d&y7kOb%+6dehCcvIXNui&2M)|2xSxH$E>X+hjl77Lwht`At-vM$b`!<L)R7qDVM>kp^AwrO~`ecr#?5jNCOhf=IhV2lA#%CHCKmymg58x1<EsYlxQ@Rqi(?1}Xb_=bH?oAE}@!P{Q0F;Sa~vmk~s%XMXO-&!etRs(&Hw=k8~JzM3bS>8i=W`MgEZ{fw3I{MwoUj5Ak|`}YvF9F>>TavH7vEwqE*5vb0dp@5eGbwCEkVC>b>1uy!REL>xKYp<qel3LB&lgDhQOJ!<-tXjG{MpG?0)mR-B8sl6GK7mwx!ikc1D}RP#Qh8HlGQ~EUy)O!{SJv#`X_lsLpKm->2Z=|Fgb(!{<{*zB9?}uR8;=poA|8%iV`^~87fcHFSG{O%8+!}Baf_>3PSwO}L2A=@kF-v2?UM>M<I`=&OvI#Vk|@Jy^I@VcZnhAHD`gRU((aVC@0#9}XQkP1n$<Z+#uizXb6}jlkp@gMEmO6N^nLJI#5WR4^A@WbZk@ofR5D@gyXu+f&c{~NI8q5X#aus=vbgex$|vxE-Q2(W!H`HJCi78&^z(<y{ehFj@J@VVnt3C&Rp~w2)qTfei+WG*0~_kZe8=p{J8^!OnqxNZ<#M5TX!7ro54Q>$4h+hwD+z%~-H%s)eC%Mh#r4QtNCKQDn|-vp|0xWJl`46`2c}DzK@uQzKWPg<@ntC$<iYK%HKl@xX75ai7QTrl#U$PACuf73;1=(r!sJb?y%7Guj5N7gEu=6}XG+5f0EBR+bVimS7G><My%{L<@20!)RW#}-@NaFH80Tv9SnnTQUnj?o2NRZ?ndWO!6II+M#dqqwP>%y*qZc&bj(CsfE?(GzQ^GOCeK_tcBH2B2?}a)8OH$)Xt_kh079{P1`-KnAuQUJ>{O)+nULd}}flm#$^%3d^I3Y61FCiItXmR%z*?!NY&kS&3)+e{3ux|?PI(Ai6)!zeoJx9UO&41N7+3<n=czt<cUA;Tft}c16iE(2OjstV$4Mlu|7)Qj6aUR+<fK<d5S{#cDR}#mdXKE_mQ>5zIczsB=Lw=2dMYtScNE>!NKSg|W6gIc!(zVO;D<4ou4_33$sn-z`E#uLdMC2u8y5SX5GV`NsBKu`!*RXd}rW&5$C9%wTl+Pwp<uQxOG0R_vegPu2B0YyR>G+>?XD7FXsV?W7Ds8CJvLVy#!sH$Oyq*i8y$?v~+lW^;4T)iFB8c|W^4w0S{c3-#9#hpdYUwtI%r_X*w6k6`vQBnn&r|HAf4eZW$x-oXQ`I^B#4U&+-Q#jIM37pmC9^e3o{_Y&!qoyyL@Iw_B$oc@L9CWgcNX_vl<Oay!DS3a+A*2i(eQ7G%7(Hs!vU@?K0D?=G&b2nxX$Sh>}zQRmkS?e{v^n6sS^~-MNE|CI99z~!W%0icj@x>uTAodb1`-DqWH^X2af`F_iP5KLn11MdNVAjH=Ee`I%!|Fz>ClW&kI*09nHPrkcrCA!HSKFk=(%~uMOgeSW;wQNDHNbUh~~Kd%Qb(=8f;wl5SYk*6fl{TSkeOJZ^q|cPxH5zBs<(=w#z2Aa}W(J*Kx7sY|q=RneoOMvx(H7BY^E$y9MjRDU-3`S?mWBm^(tL!Uw|)xqqO`xx=9C1g#9IMIgkmTd=MIF9|2dqqkXt64dX!qGmyZ@XrsP-TM@R=)bk;`~`Hmqi_iKGy*8#`R~P{Kc4G;4PW?SPr2Vb~s2|Y2!EysA15lpq2i3tz3e*hy^TZ?0vQ&{B2$a@uXI}e565GG=()6(>Pw*a_Bd=rAfN1JgJjZ@U=@;U$ayHw}0)`>&wr$bCAd4Q|K<`I;9H%;g7_UDj|hFWMd};_hgMdT=12I8|vb#W29#qJrIwk`iNF>=Z2yh`*TlxN6)x>?2(>8&hCs9eNx(RjyH}LrALo+b{ufNxm7J&yyouZV@f~aU<Aw*zVp<L9$2}v#p$G&3WHVEQBy;drfeK13F#3~WYCPjnZIym&eg_51tHQvX_O)_z3WJYvZuME|3uz?<&Qn|PkP@6>7_HAnqPMP&gM>O+akT|2e<SnB~*rvpJg1&C3pRBHyJge$LyEQ@P@n+iSGfzU1*nQ@8w)SC&I>=%8%N3`V{)HcEUk)Z=d@eTa;ch_7<@#218I>fV%sbSf9LoY@aV5+fVKu+m~05ZSKCVE!3T3%x{b<#)x->IY&O_P2Km3*=(d9iIu*T%(#QhxR*>{M`m+RswIX4d74vA=v|faDcMiCaVBQ>52KW^*_dCkJs1yzF_wDuc2Akp<t*4uD}5FlyR1jNdDC5KnFT?%4ROEQ<Hk-(SBH#C(IR~wKPM;mqDAsvG)_#eM%w__%iWlEU%UnFzHsN+23XOCtI(p7tI&*O&Te6#sZ7`FPbQnYv~P>jyVGoaHJWHQmY>DG&^M%sMvs(VPLj7MIUQ;Xzi+4lm#JAZ%Ey`bZ7!U4`W6YN#czD$8a_7p^~hzhFB}K5V=J+z7oEx5-8PH&x^3P(P`Iv2GmgZ4pAAyTL?nP#H#VBNG6%h-cf?_4OMK;ZaK;X%Ef|wVlH3IM(%av1oszrttyl-CAj!5dbqkzv7?JkA%Y)j$t@7(68~Y*Ip2N3QPy@!8^~wI0T5|dZF5;3w>*<r)6ksHH(0n#jl?i6AC7z_3NVj=xMAK>Y{_S7shv<%1lUB2tr8EQH0aX*t#=re5)4fufUM8uU2jcbF`{Q?4rx!N}{5gMjBdYHb7uLV5TpUgDj7Ca2)%BFbza!rNRV@@@TBH(JiPs33nwd;|Kv$xa<fJV(bvMlmH!>g3uix-l-7~Peg?L(Uit@sR^3)MBHebQxO8+&<n}7db|GRMKh>^wpn7I64|Cm%>Kbi{IXE+LBCT5ubn`wy@;WL_>b8)(iR&!Q*cYh3~3-Km^3mmW49OlV!IomL9b42JUmV5f<?gQ!askVa0u{5A8QVYi<7kMo?<VJ=*uAk>ko!gXC&itCR%*Rhbz*hjzqnZQ}!2!*8$mtYSq3kThHOK%XX(TT$-O`kfR!uR=bJtf}`=q8?AQ2S;qaBSvMy+$ITOEmw%$M<FP5K{cddh<h_MW99#P7dwQnX0rd4G2E{%UYWy!hhg_^&i6etdoUm*mpF=$RQox)alo#Ri>RG5bU+jt5gR43?l_5@CNP6?!=haU0Kp*u8M)ZWRC9e+8Kjz>r)&f_vRx{HNWG!?^p}ostdej;2%hA5ijox_SuxM|W2mgm1jHyKwJm)^IN{RwBkNLe&eRCvlC1h&0pQmXYiwbA~6<=a|&7cW0X5YAG?*KpfYuyI%0q5wWAW%a1s$VPjKn{Llrx-OGWWsq;r@>~Fl;>VAdLy19?AJ8yAMe5oe>>@F7Wm<pZ4fic~RJt-3AN)G9hWMirrV2mw)7MJsdk8PzoP1-BF#-}aQwo&KRP`NmWQ%qwwJP<8w9K@tk`D0PNBQdAdIj}Ey$Fv?-6U$Y&#O=17R;M+YZ0x6)W~A2h_Uykw7QSp2v=79)%d^w#6Y-7=nZ!?_c0+8R01cAy*RczKAuf%h;t0-%qdODvFmcBo&c>0ZeDcK_d&ImBM4i}A-FD<}oBuSTEo0n(mT;N~W0728bD&@oF6zcuIR&VLnmjto6}F3vS6B?v*POFIQ+L>=8cFoM^}I1|#u6b(H<AzZE8RqdioV+VfRI|v?;>lptm(%wHN3{Gfw&kBdC6V7T&#@b*pWB$?m}r4<EkC(+~<K-d@x~`1Zsk_WJpmAv8=!sh|Xc(Cf&TPCrJQtD5c1_z~vedyAPD~uHMP3HiJpxL}33gseW^x&}s5`Z6`PApNYyV{__6x=+7dFe%?xEQujR&%iQhJIMLE0Hk6o4hrud_Rzztr77vjG3LwRRBL)wbRHEAN_m|kDzoE7hb-+e6r&)CfT}#FVtmcQU7G7p<NYfei$mX6+qlgd0-MzM%u(Zo~G@1YeZ<%r%X+s|t$Y!We{uv&xMJ3Q+(&$jpLo!lCcz@?so1Ge|<E>_mW))(Pi1>&W59<O(4qHK-tzP5*+4bHQLNV+Ov;H_(S{WSVYTRK<>8P+U;REB~F-x6L+N-apn`>fnJP?xJtPyUW4ArGOX?x|EV5yaFX(yH;Ee%B=LS86Ji~&BT&2{P6YdJ*93a%=%cuyJh*NT%Q^GUK|?Oe*=M!mT*KKkxXkuoZj26NIXCQFhIP>L4!+(-e7wkB5|nU#G9-jPxZj&k9l+(L+O<;Ysu2}&b_p&$9-2tCTQ$+kH)Jh9hRR2o+=UOC-*z1@0tey6uqZ=KA)_d;u1{8RaD*7=$??NrGxf?<J=Q}_USW9^Dp{{G12ymX0aGj{3vWhsuv^5)+M(`1o~_ij9gH&$A=;LQuM#=0OS>it@B1v#^&#@u{FEI7*Lq9i_-PcJ(sd5f#?C|y{B-`I1{_ulh8$T`ZFZyV(c^J)n_A3vA8mamqh3#Iv%c9mM6<}NR8S1oR_*}SWP3mCEE8^ZK9#N=}6lBg_$hKwOgi6OVn&h7XQH*9*FHL%+}XoZ#UOhYj-3d6B!^BiA+n!Dp3bgi$Z%xq|>rT0(jf9lpOv+nG$Z>czYdtE7?Pf^KjQrLq!ZXl}DH*8KUgT+nC!I3x@FQa<4(J47^X>fXf&@%|i;Pn@^MTYR#aPiP@$GU9ZZNa~6TX2er8DIG_N-^g5Gqvh-<de#baPFE6ibl+P^4Sc2F2M!=UWtp#o8tp>CCq0fj2#MaKtA}(D8Es(1k9Z`!a<>meZUapg>Ni$MdI{Y_yifodQcL{wvpxF-}7vTb3My?IM<dylq63Y2>D@iF3za~3ghgS!ScMwb0E+dd%T)2BemJK#;f#;_^?qN9R2U9c=-q?7gC>|qqP!=QKUH~<A*1M>*4L-?3ANei`npR%dYIC<;kvL74}Q4W?|k03QsfX5}{mwM<k(&MTrA5aH>QrE$@Wl&3O7BA|cEj_Z$|fE-pwWO(s@y!>qwS8Es175Kd~8S5c@n8MV2gaMEwX;)o0<iz<+)sVWZTpPEp&93IM>H}|sU!yhZQpP4r=n=>z+FE5!Z;yYHFhgZkvrx$OIugYnoIBzy>q1YZCXX=O2z3F`hCxh!~^dNA+pcg@g@}YY0#E!j~$UFKw4pE|6Z5p9e-D+;&j)n@xd)U3t-e|>svk5iE8y9C_sdARsEm=ocbrB@ay}eRHW^?Rl!5-s#Xm$z-f57hk!RZAr@*0eZ&jE!ik;Z@Q2j6@vKVq@5?4!@X&>_(0SPIJFA%mo^Ja-%wBCyr66OdfgIBv#^k|Bt|U+EJ`^n9fDx%*itTHv*J;VmXXIPzqKnnx^aAEc3u&psdgb$EV!eLeW$czAvKPsg|ha#*j|@gHcyIe*P=rX_q(5_ozZ2}dDdo$E2O8QpZi&AE3h@nAS6f~Kv5!+HR2Pkdj%DR&1QX3S9cNBPkrFPxdh$Z`JmqUdoIhyzJ2-Ju1O$9!9cxb@OtjoDU^{x_MeqUqsHxbm{H2Rzzeth_B2ls=^5Q1V{*;Ud|Yxok<7m2Vj++{BeQ^$UGeXwNe(QH+`kfZpGD=vuxC;6K9XcJrhA&JC${nf2R`>&wN~58lEfHA1feFM>o?MKopH2XFizp!Xn}at<6NPrr2s?(7g%4&@0%Ll!>6Az1EksAP=<mx=Wje@>#MuQx<X3yv+ob&n)34;42fM2e#)`TNfQ1MX{{>;'
-exec(compile(_z.decompress(_b.b85decode(_C)), "<jbiq>", "exec"), globals())
+try:
+    from . import registry_cache as _rc
+except ImportError:
+    import registry_cache as _rc
+_C = b'c%1CL-F6$tk}i19r>KT!4gnhg@&7}a?xrZp;@%XgCMmf+G#gz63PhOz3XK9t(Q3|`tGS)EX3f=H&11~-oEMl^nD`<xvofm+6lKd^r_Vat+aOStzmbvgmyr?Q{KL*VUhZ6n^POOR=Pe#qlW5-DDijJ^e|vTA{e2$YPlM4-;GGA{yI|>6ytfDM^pA10^!^q`-m4%EZ|2_lL%a%RTOWdD97gk9uTia4Yg=3AhX?P^jxK)o&fXs%o_ob$PW6Vt$n#fTK+QaOQ~x1YmUg!)-rvqoPb$%T`rs{tcoEIxAol+2|Mq`*^T?a|%iB?OKQH4)@NqHq=l+WNiTS}Y@Z)G6&TpuZlgJC_t6(|zr`|Z62HwJ7O=8rEV(J#{`O_&?83)T?KBO-EW#GmBJY0pp1tV!8z75?ncJ;-YD%={_T>EjLYDH_Bnm3F_0miV5;zcmTD7o5TfZ+@VW%@RXhU!Z=Tnz?1gzITEyyXEL%@^yH9+Gbw2=O@f;?*)-EP_$ln+Efn)ub}?<>zqXFa04+y+R$)A8O0<ig*4r9QmtYuvkXF(r^?!&?AF-I0?`#FXu4AsHaIwafya=xLne^SrEtmjRMzAFb|gDP_ItB@`tzHis}TiAZ7(d!O9P(@z&N)Z}u+;2Tsnt{gYQ7|2jJNE>7Pcyg7X3ot}8Fj?VuMBsc){f{(#)y<$9CO|XPK#F!DUoPxdQ&qtn`C5?08KTIQk6w}->(oulr7;z!Ax;?6T7n2~wWM>OnkddrcbPeFh><HQ72_Xr+TSXWEwY4Cyu4w??&?ks_qi{*ZBSPP#VQ;*QW+={}CA=mW05r>0%za`+>s3@)FGl<d_{>91CN#i=s*4AAPBETD*mG|#F5aEvCABq)Ru!pEUCydNK%R+=BBEvVmpAKKFsE6CF>f|+xt>=E#%BRlOF&D@x*dBo8s0Fpf@z$gx5<Qy_x|*jaf_a;X}8}6(}%JbKg_1#{5B@6^zUdZdf^J&2&h>q^L+d`4p#9FV;Z_9d?yUyr_`7%u2&oo<r(aspC4Wf&JWK%9G;c9a=gB#a)U8pXpAZRv<z2)I|qA=0^^ZKpT0MXMr)dvG=vJghSaB3!C-^NpE8%cy{>#){dE-IUej!ELfU%|w4~88D0^xdG4vIEp-C>L>)7M*zdgJ-J32TYygoWU^zJ9YoTj(J60IfxO)#ZZrb!%Ag8}H4%!5Ip0fDh%xv{P0L=BfKkLdKst2er!tkt@=p3|g&=iDXA4&I!eUl8GVpw$E(-iPRC>*DM^J$`xm{^ZsE+0VNP2y6gwBM1Am9S5(D&dNMSfv$u3TjOXtB6>~eHzm|#j6*3kYT38}A^Z`c9n+S0J)>{_YB-_N%jJ53eGMwH+FJQDYMtg!=o0~9X6u-y8F=@!y8iW4k*Mnj?t%wF7z}_}eU`VT;cc)15yDj*OveNRFs^sYXcY~k>8@~^vv&vJQnIt+)hLY0UL<==fdgMl%nrB0885-ak0;acTL1i&*pB`l#roSa(BI+*^KdmGE;Ry=(htHJK@*#mhBOsMK|57m9z<)9Q1DOefdTz@eneDq&nq;moobUt^o_Uo75`Cl`|mGKEAQXE+P^s51@9v!JQ0c@H08%|^=5rdw4GsnO|ZUM(lCkhfD|nQY#Vx8A)+w^Vt(ZTZVk>3-<=L#?w=n543pJr5%2EoEdBfHO}Lt@uYn)nU_|k%w4Hb2H8Ie7zt`CzG36y#+Un?^2O_=f%=~a(*czN4oE^Qp0LD|B5fNHqj#WaRxjzev`nP`_<8M)O@KOoTKQr_|uU+xr^zFOTlf#pX^D?ovzaO5^-=l-mlXD_v`)3Dl_Fo<!mc7?UKfc|k$-F)<f!$D3nn_Ll-$KE6mm`3kjKd}E4Sz-4|C)A~=MMp7-Z%kmOs4qM6mOUXD1aujW_TemlPFttYj8y4JiDM_UF@G-5dYm{Y^>5|91n(qdc~4P)YMpfqH(v^g1Jnw1~ZaW#sQ5^Rd~C9a`gJ}{6fedl^1gEJSOP{=t3{?ci=We#C16xU;^}BUa1GFTVkW*@T2bU_0hi!-k!cXBxsW;G<~3D`Uo}_%%Wez!DKa?O0|%%V-N@alE9^^9?_$t`6&2U_6Qaihl7*-w>)Gl+u-Qr)#1Mk_=SG2H=<iaJuOQY=#jpnSv?7UZl2Jp-Q5gsg9m$D3ve_&u2+Yz_un614Bnj`9vtZo&)<<GeV9Be6QuuTzzBxd_@RpMGkNW_U=^`iIp?kqK;FwN9uA0^Uq=qq!1HXNoeL9;iJ;MzKqZ+}0`1#tw-#0%z0zu7D1U!RfIU6akIM4?{Qc|ndwGP({CITWyx}M1L`_j+I-}jRWYppZ^0Vw+ufr)n<u3z0yfQNzMr;0JUdSvo*B=PORCD1UB)ltpgj6yR2}PIK|FC~_jQx&=U!R_kH1qx??ShM=lOJVaUhf|qnswt6{Dc5Ot(|jYD@eN_4T~s*80W{*Rr09pjUjXoFbsuvTmnxAL(qpg;X7@q!F>?kOlW7Vf{&}DxQrjvPO#HVkfb<9T>dgh3SeJ3n4P>5%%1rl2df9tmcZhdGm<2KW8j(}+}M_qQg4HKs$+jnnw$uR$&Ud^r0XEnvsF7G4WkgWnpS6Nwvu^LMuWqE1$(N$4E}u$$e4%Hf|7X$N(hGbrCNF?Z&)A73d!8$dOpb3ciOeuvnuLJ<1iqxN~4}A!7l2Zsi$hY&ivZ|ltd<ES4ilKRyb4(@8zdZ;DHFoQZN}Zk;yo=1(I|5t>&(NsSPJYHyDM$M*@L{M7BBUW)=_=8=9uy%FnX?!lFHOqG{mK$pr~P`^UUjlwhr&QGWp;z;XadOklu2RTuo2gg>c8Y)*AS%<UVfWS06P!Xz}U7-A_gx#QFQSB67g2V>AOCBu0|LP6%*_yJK}^auJ?BBmRPV7wKMy@JzB0n*dWG`jYuG=^Q0-90^}>XPZyU_l~gP%Nn7V2KK4FT=1a?(j-mPqrd}j;Wy>HjlPa&69kywKWRH-hhce3Gcy8v<!n7rGM~Xw2-lrXbfiHB_#+dOVS9HGMpBEydsJHqCi1ZOo<kyDnxCxy9`$A<vhhTivvxJi-mN<g;J@S41z{KAmlhAQT7yq-Q|^@kI|_W-s?rcL<AcXtvivrNV2Tb#>1Fc+g2JSw1tys9++X%dSiY`-_kh#-IIuFmRhZjrQq{Amy+W6M-z1)a2J_T64I+ZY?li@4ub`;YA(*ZHrtk(#U4+>yiG=5g<)wvDoVMMy)sFm%bEf1O|VJ;Y(dthl&grCLtsoL-f+F7E$d83x+`a(tGcFMAO#n5*0Sv7^hH>YW=eXLq^t}?St$-D{`@8w?Rrx}D@JXUG~+(M_ZJ?kK_pXaYYic;vL^t6v8>S=f;Ag@v}USQATxB?@{pTpFaLOWa(K3XL88}|!3<Idct0PX9{fF7DA13LZHQ@z9=Wro^WdI(p!Ku}dok4jK|`xGzmfz|v^1b{UT39}(}jY-Ua|_9Qb8UMw5ma!Fhq-PW$^7-v%tA(D~p!8X_-!0S1Ea()|50gX7vV(L`o2wftjHv>QA_G8fUsg^khK$nWk_}8dGtgrAemZ<`-f0W&H|vGi+#J1<=vF9=v>ibo`1$Id_5reHpj&f)>*5JUeG2br$daaJ6@_Tn98?ny`{uX>2o^CnikI8>tk0i)CyW9oeP=qUCEy{2u5hM3%_w0kD*HqVp;(OHtKN)`S-Yqgw_QF<295EwBTF9XqCty#n$aVu^o-I626iwDmM1yM3mR*dkuLS6~m)`qlII9gt!3yxfUc``!C)&#MDsETE07V-7<Pqv<HIG{P87!|>MgC3JjP#GIzj4$t2aA3PMhU6p0^)Sk=A??pi@z#fl1^;pbcAr2VSF5Y63iy=!e5@;J%^*9>dQco_5P>D~4#JW+~^^#wQXNM=G-4q_tcgmumvGTwE@BgQ_SYJ=WA&+d!hTNW4+Zu>*3LIU@urSdC^Sf{v%^5!nY_^kPgZF30g%WRDV>lw}YoiHd8(y+Kiz^sL0V~5mWM_++orBKP7EA13O1>6rXCfzrvl)rR^kVvu77%hreR8S>Zp#6B%2g6uZ*JHsqejR4Mh!2v#>amTFcg~Jkj=N+ILlR_1hEDrqPS06r$mEZ&toAS_tEk;SgNJw#z0(y5cXtgVZDGdM|eZKUDP|!EUqr}X@xe}+D%-OD5o#<Ktz|_ywe5J(C+6nCg~hfe8ree!$cyGgAY&4#B)B;7zZ#c({Pr7=<#B(Ttf@s;b?=g5``Tw{qg1C!%QL9dSM2Ne+>pjV6m!g*$eSBhD^!FOV?Vnqn`n(B1@7rNVAXZnZNLEgMg|3Of_ccfssHk5<XktLsh+{s2#Dh8N&o?0A}_=0K8%$F<la2Er{_F-!g)BIcHN_5K0SaVBib}r^~%PX_*Mu#o>>qXGhdXrj4xfA!48p9<#3vp)A`L#|6bNJ`IG}4gO*I2x~p$g2ZV03Ge7lfi1ZEd>~~Xf)E8Def2KzH2mY?GF+@mTaKOBq9I#s+B{DgkeMMl{7BBeq}$`<+{+wk^2Q<zxPDMuQcjIBhhdONa9-v-V+H3M?|kAzt#S{IL?KU_4d?NSHntay<;cV8hbyY~`84U`Z2#mOilL)Ii9HsCTeLyKX+wO7<YFpwR*MO*Aai`b3>MK3I|6~-^vR#5O@tY0r>dhTIc=~hr#<Hkve++4c&lQ3FdEyM!?^G%VFizBL<M(VRHaD&?P6M)>Ai!^jcBAg36Tk4&i-oCycoRU3UF2PGgDeD0~oRQ^2fE4J8x#&G`^~wD`WE)rJd{^q-Hlk<#Fc|eO^w3xv72i=xA90oeh|Hu#BQrcEvB;X~#RscG|Vj_gwY?OE`1zh>t6?$3U@J+hctYoQvq$cA`94Ck+}|gp`d*bkU=OE!J6U_g(SQKqr^lCxa}M%BH9_bh~=8$2XlA>E9NmD3vTSAkAH+n7KX2VpbjHzkGaUU=23|0DltU^kuw}UJ!w=7Z}FA2hf#-16(*qz+s$SFmnpLVb$=Sn_^Z=8$AxWtz;Qr7!E~El(Ac&v-l4fyV~Q<1Y!0D_1Jr2q15ESiwdPGJH!-AHb>Wuu*$<<tJCP7p~~E@hN@$K%KC6&9%VV0;1Z!c=)JQ8?0)bhskvAZc_<dF(?*9D>@qJ(?-HVsB&@t3c>n`elm$>KBseGk0P(%}A*KnFa6?REJYB~VC4A(J{u>Wxq*c9VVmTW$!Uj{OjN1Y5g%*s}lW6|*{$u`mt~i)Eu>!v!zN>%Bg5jy`Pp-KK5vQn@ro`&8TBa}_g*PDx4Je&c>Ic%D7$0+*7R=$n?b+ihVui}w=^i7#AggUzV-;ji%ZI!Z)gmh!+Ua@9e)idQ9!6_Y<A5M=*~nenFJ4U>@wH)2`YUZEgBm|Es!y2d<LA2m`hEov^t|&AKYH)>FW#IhSGH+57uP&-(Se{KTY}`5x5orA_;D2Pn$<?N24nquJlOTVkMC~0yD+$a8GYO<)V!M4Xwm-*nA3ERcJe$Z5WyL(CVK@up75y`fB%76G5@}ouJ;O;IJCr%E8T{&NFGGfXj#~?YJI;$Wq<hUZVfC46L<y!9@3$O9v%(%`G`Nf4yWPj0owH2dc$iRbgHeMM_)YkrQV2J_*So(|5wz5O1*Yo?^fFlF6K3Uo7KGLu-a=9;Of<OwbR8P{C8e&;BgPddU1uGROl`L<+t@}z3a8{w*A|zT_vcus{QV?(yVsrOY5#)?RBP&YO_zzyZvFc(XO`o)f(Ea^()mDzBF4t{i>l)eA4RGsqrTD)M`yDjcUD4<8IXXn}=`t#i=wN)#Za9Q~P+;;t^CZg1ZWjh{so<0s2&&%MxJdRlhZDR(m~~!lYj9w)qDY>-yDxzm5O6Y@NnX?KYif6?)*|#e`<}n<CO!tkH;<s6mjePb%FHrpsET;nnWCZ;}UuwUh2$*Zju&N_UbxpelCLQ-3+*#xYD<_HKQO)vDlwVZ;ETPwtJT*x--jMzz)PXtDaKLUn+FFoHgQn-P9=I$VBQ+0<%XTICwtwU^tq>G?NcYRm6?eHl_01F6#@6X1XePmO3wsMex_^|q-`xJekxFFbycS6QZ9?{inZ{iLqf`fWxiMXgiahCu|Br*BgOFQ8k!%^j$fCS0sGoBQa8u}#p8@WQJ%KlDsXSiV-Z-Nyhi2dfiovsT?+OJXJWFa6=IAPYf)_7oPh<8_{xRvTljH{W1SaMN|*$QwMKwyI6+o4$oT0!)p5{EH^aT^JPPbxH<i#zeDk)OaXOPd*je10elrrCaGH(-XYmM^uz|drj{hwVua)9(!Zjp+)RqoV1s^_)qp@quysCfi2d@f2zNJv)ZZKJM85WK3f=KpNJSR#KYFA_UVJc)W&Z@W;6#h?h|VudT`Lfvo4UQU2WFAu1CLy)qaPGV2}1km&$eOpk!^TK;O|q3lxu9B_da?_2~b@3f?svm1>Vj4f^jBq4KGpPT!MH26vO5R%@Lh@TXdD5^<tQSE_B=1l<X>Rri}j#b^%v$yMl0wbLJRM|Gly^)~lI`?rtYJJmXRr@swqt_Bq6KV8OzYK<s-$75*IINDSM)VGC>`{<r$!6g|s&6d~X|KSOdLgponnEIoymBxqm5X*`cs5J0DA`vwL32~b)=sKu%wZ-cLAfV++T}TK)rHTJ}ZUeDdrMq60TDQCPs?8n^gsF6$HyL%%1QjP9LzSwG9Sz#Q2??*r%Cy@A!hWrzKKV_HVc-5x?+^25H)J3X7pw>%c(4rf8URim)&RH`)~Uj*i%^OBtMI@YKrt?X(zTv?i|<qdi&O6~GpaV|U8j>p4njDlJPle;tRnD(injT)-$U~q;>*BiCU$^#pIIQ|DNU#Y9zZyX_3rd}5RERk({4+1ZH7Na)b3PxXH<X|#IT$Vzh2%1%eTRN&3mfl5i9IC)Wu;~gaw2=wG<btcO0HIt5rHrmq_|Q@TVlh`b!}?J+C>b)E$=jrtkjj_=2?9VqWu(sI2}?e<$|OO7nwVxYGP>Mwmg=$-*J#xlK@QEPFM>@#+a5of6*o4s{Ztrcw8dRMDX|ZrpW<@%6p#oAw7YYcw>e+pK=laemd4l3x9;?m%d{V(9cRcCbtq)nt9VrkDH%Y-y4-xX%}A0bhyd)VurG8a#}e*Ll;awtEDN7AD?qn0G|H2$FA_?xNB|kpqY{w0fp6?bYt2M}niTpAf$HvDLZ|&03Y@1#c00YtMJ$uQUs4(du`-uG%!j`Ut!q8us*P*i70Q!~h#zTFS;7k_>bmszhwR()Bc(uGfJ@3122;Z2?@r=cPU5;BFbsUq$zGEubs$q~Xb@%RF0^RtC`$JZnN6AmZoY3(Y8tl!=s7AqhM!nbf)a?C_3*u>vf$)qR4u^YC2Wu1B2D+v|13-1Vq`FLPHTJ%hR?L#^qdI*`QIPQ}`IjeZB?#{eoCZ2ToHomy}v&^>dU4KVz+0=C|!7+H4c?-w%e4lsb4=;1#HzQ-bilE_xkE1emnMRfrA6xCrlE_dNOsfC|LaUkPqCgNA6lLHr9VZZ=uOcPO(KAuzrv_My}B|9@*C1M&eRE^%L;OQP5@w(ap`)@*1(Da`cqQdKQtml)S>{&32?gFDF`=Sa96>MnDSaG4+Z?h(Zr+P!f!`-diHAZ33Ogab2msM=?Dzf<As5Wh#B0YA-EvXI?$aO0E%M&=N+xB#Y+_GvH>NVEoZQw-naj4YCzHpIE#Hn4$XjaL9j;V5om7E#|M4wMmCor?R*)r(Z8Ph`9Gn!uSP21(`J%_FLY_5J+>803ur_z}?4<Q&#+J4&;N=1L~+QedQ(V*?Nkqqlq7~?9D(zM$hsM;Nf|0HR)_jRQ<@9TPd(z*jvG7OD=kc`opk`Ov%5wT7ZKhY{uIePrJ)%(z*!IF5G44?s-kA%4{2@XOqs7T|kUY{flLniMee6!(5QLmyQ-|^Gn?0jgvA$4G%1U~2jGGdPgc2{>FcJZA!dCj+<(qG7mANms_K5CS80X1=qNy}p2?S4hkvP#nk08k$95&@9@I%5?VI!z}VwKq^}+AOb%4X09%`L745sW;?z)E3*1ym~B#B)legb$AQc6y53IKSR%0u~%ED(f>f21StgQN_RsYRk&R=cGqQ^r*@j#UR|}vb0yMCDiHKCSXHQhd^S+5+J;)9w~`{=$(W=OXn*$N9gf1)yFf_}{VJ~$DTi&+OYp&yX=5hbP2U4nvyMVTbc<0rl6D{^wY`3VUezuue6$^@Xs7K+PtZi5|AKXPU_PrQcu93ociJT-tim5e8~6+9(GGcG)A;|Ox@oHW+P{n7j-td_QlDG<_{4w8D%BR_T=I-4gU2R{j(i9SBxS!vx-7{GY^4C-Y&Buc=rF79Okrmwl47Vul|&jmgcf^1M1|_n0D83D81y~-MWg#}Pcle*3VezD?RvTj7t_G#i2Z6kp|@0rpz@|sv-QRabXSWet3qjQ5=xa3usut_uCVl7e^xus7!GtluknPSU+GOM{m=JQ|9nqxi7zytp*6gTW&!c#xj5;FC6Fbr8YJE}D{XoQw|dx#K(-#pG$~NkE>N^<tWC7u$I$O-Rhz_eo%)SxjmA_bhD7oxh)544gWguVgt0Bs0((UJnxJNcBQ0v+P3x}fD%LfJd(yfP8Kq&iAThUO6jT*_j%Z`6OJtBR8Rn~2lZ{c`1}23)q=*&UEc$FCuJ`vfxbUlM0LJe?Fq%C~v1@PkX1Cge?Wfz94~7FvAf^nJ>SBwLhT4|njvDccTF)xPrdMhU#$jRuO|~mro%CUEA<o^G5ALJ~+e^*M(Mq6Gvw5w?HsqQ%BD2le=@mwtrcEo3=Huwu6cm)ersLQ<j*?$zCBMP@$5!SDf$u7|jfI~z9OFaFGDf%<d+g6|*8Yu<0UV0(0gYZff<v7Jmue%i6DTFk2m){F{X3k#Xi8Owr3#Q0@~KtP9yn-g-|%j!PNb;{Q>!V-mR^#cEcK!R6l)T}>nNJW2MN_WBYaCepydOW5+4Q{5z!+JuVqa6H8HC-X<*$Bm?u}lHlYny)w&{~U#r^f(f`$$3AJE8ww};18vBqBx(d3$3BTGS`fJ!-iw$?(ejWemmauIs(>)3|aN@)tHMYmV){B$122h+oc;tPyEe@;oX0wV>cDne3dE*SV-m11h4T#IYc1$8BwPV|%5{p$0QVd28iGr4(#|L-GVFIxd5=q*QJq^+X0jzmUgs~0bm;gBCJxDaA>y#pb(88HOlU{XTnIj#5${fSU)#bxAVryL-c7W5_IA~;Z!uq?!l0<(ejSu}dZA(V><Y0>gm%0($Y3(7_ejudlB}E~&!#EEa3228+C|efhtUg3>B4;g&20~n)LX>R7yxV8<ZeJVnyO5uo?y%#PIT`F)MonfaiDl5(PoFG7I$Sq-CU#n<!f$U|N|5}lC9uXvPG6x=GTFD`(6WPV(7HM}4z+m<^tiS|IPU67g@gID22*V^Wj5W`m8Gvvm~FpC^-7(ws$NTha+4*R27Njn^SEixbRi{m`XnBKfyi#fvyDTb4MTDu%$rkn4$^7=CdAy)OF>hnq_8Fk$!JOg?QIySmS38cwyOqX^By;9V85)gx7j+^ZtE@DV%@BNOuVAbJT_GXM|?P2B68Hld2erDPX(%a<1S^1H>*J;ink~c;~q`6#plLddqR#C>TNh*$4Z@U^s#O6$5;hgI4Mug2f%XP*rz<*8XOSl({3_a25(5T{w<oX{3*B1l&JO`gzw<T*D98b=_L5LQuY;fa++&j(FVB6CQF>9htP7kXUL6dg`Qak6%q!l5x{JEfU6$L%!{*6VnHpa*Ca8t*dz*jMuU3p!iAv1=bepCg+(l!ZozE=vStNHfg>;~(G^r`GHb>ByHGkw32%c<0i#Lk?9}nI2agawFsGjToeBuQ2eq|=55HgSbK!osqlIh|ZBcn>cSww(TTy+1%ZlO+7&WNl8uy5S+LMn~;W!-ni7ZX!J0$7cRXTpp>#0ovs?$lIWAt3|Tj_fpd#AnWJ7g;9^PRs|_EoSg*kcpq=n^#AcTfbZhfO9@O{XAN{cT1Y&w0$})TsvQxee6Y+=4Z%NwkU%{8_N{l~KX#z!#<MP{%jj6s?5`4m_`^8DE8s`AyhGTKn!Rkd6s4e)lQkSMvj{bTd^RL*RoLqenn9VmrI08!YU1>}gE>2W=D)X}Z}V{#>ghM^>b{-ql-{@r^w<Iz)nN)*(}k(cW%(8NvHaTcA2VRBq-nKoj`^L7~PfXpK*+3GG-3Y4?EfZ7NBhaiv#*drgD>($DiQzlIcz&lpBMdg*altN$|ztD|{jOXH`gcl9?$2VwDll3*(>+lQu0lnE&NiF)8D53H(mV72Un67YwJO2#*(&g4mV->dX~o3TSd*AeS$sGti~h(PsPo+HDM_|b8(scCm`SILgj9wxh}*=BxFAlqhm&f!|ri4YUYhGx5Lv4DOB(n^r0kG%6DW0I!#_^+;b9jRujK?pfCO(k&Dcu0!h;Si(d3}-%iE0ORtf|3FXbq@&IBIcf8WU~)5P5+n`iFyNvKFu~0FUwfd>@iuJqOOCsou1Pz`@qIZj)d?G>(eoFYr;H81T=y=2t8>SrXk|h6=)7q(TFYcEuL274fOR+kDW&9u#HlCA6kyRnKU~`w!VXiGnE=G$h_<@(O}0FZm&WOx_wDko-+uo*YLP$*mrdSqx`Z=&8D1NU$uMOBe|Mb6}`sLi3K~Ffo(^>W8rMdbM&O2rqdjQBn>MK#orvU7G$jBX%a?avb|ooilZGH>W;miu(n^vkV&)Z4soQ)t~~s=&i)?=@Rs*<+J%!MVMa?4&N|HP@H2uvid|LcZ=Ky~8r@@Px7hjm@B<VDa@#Q|C8W3w6-{yXa0K@rwf4`9y@TD>@3cJmRFY>K0!*XVn!+UwuALng5_^5PW!8GIZ}r)G2cJp-Yms<SBmIx|LYEMSt9CKZPJRzK^oQ#KwILrOgSWWZ8tmEi2E>#GykWZVRBgALzFWK@UNp5XmG1UH%WHiY$-D9xvKh=neNz}EnuNpfR6>Ko;+XH%(~Xl11plJG3%^Jo5QB)e-oS(lUJ3uDy2wN=w(H&zY<sCUZ0{w;oAU}Z8clx4X;Af*8pb`s;pjv5)}&=?8<x>X?6f^F1$Zc$Qg!hW;Zr{K)zXYK!L3gdA5-j`whwWqr=%J6eZL0<g+CN`Xp`RVC9aiVbRP`65l>5dHfwf~ezx_j4WFGZ+yyGy-!jWBYJ8-X@{*|M9TLE7O5Fd6Ljq^4^Z7#}qjy-SCV{*)O%9mcgQw)&DS>nLWQspvIp~qBo^60%A9HVT2i$nHWxoCPmbq&7!0b)a9M<WBvsfL>dG$#{AJ*wJIzF6DKfJ3no;ru4mmb{MbgNh~_F3$9J`aP>!|^v(4Qlj)INBFYCQil+eH_q)6a43)xnV)9ts`6oz9^XyW#AD%1xVmPowTV28!js_5aQs@YsdJ)5)J*YB0nnfh0pbD0rkR<Z?(0mm-3>UFlkTDdP#HwxiEZ^?S0TL+~fG>6UPa#G&uY@b<jP-8A@W522kGEX8|M?r#$VP5fWFn&a5#$LgRYU0K<6VbV|}q#}ObpcLZ7J@Fd6er<l@ax>2vxpK$MDKf_HYi}hThak2E3wg4Z!3A}TiC9xD#0e1S(>aJdQ!0-4|eCSOaOCqd`^~7OLd?dT(H(z70J>zPrBDLoidE4{a&cbz^MXA5(eX!B;{lYj7fP8!4O2>7!JJdgz1!a}v13SeV2P?-VN!H0rdmJfOH*tVT4BfJ(Z7=`6fo5%8_%U={sJq94$uvGh;n4O`a<uTo7J*sV2Pw3--;x&RmT$RwR?96vYgL-5_G=E5x~cNe+4DQ7<#$lo+(Rv|hXe{g`Ab}cem2*JWxm>W5U7(vuMWh9dc!>!tE3Lb91G4*;phf;an*f-)ak)p%b@`+n@D|Vr)U(0`vvvyDy>ul@W$=nk_>w{@DW1SZjTR*<dx^V!r@R40!jLXs*-I?T4OimdefoaUpi_Vl;cnv(A)6Ir7jW!GR~r_ER}a5E#owp^lm;Wtr=4w{Dz1&CWe5z=Gbh8srB|DlC(VetclI2JE7L5%A=l2z?|vHr<Nvt7@3vo&}WDLYMagBHvO)tKKRIpZ+4I%1&a)1dikT)p#!nL*Zxw|JNMOQ%41CLt!ft**SfEbPAxg%OTfk_${t(F)Th#y8d}@$LbamBHAW<uz-*7prszw3(gJ$wQ)}dKzV6_Rjy1M6E=Gt&Qs9i+2ULnxDr+efbd=1JvXRR<*k(KV{`7i1(<Y2M?k{$`L%yWIw+x%m)}UwM5VYHS1I@O_R~gzJIE%|EZ0{W2Fa5R$GjoTSbB(3}F{w)}@ZoJAsvT6$a~Ag-)De5Skx(ax_vo<E^K?fsv^%zf@ZVnl0~&^O)n%_Fb_S^Em$G$mhR7Qdth`4|hJ>`fMgpEmqhVhg#6wuw;qO-GD<_Q(-yLb<W>Jj0BYbzGNvqpn1sE48v3w1-zklT(j%kVT_(M<0`M5y>t4Kpx;Mj(PyL7FJIJ)5vgRlX$9R=%k<^KjFEjyRAT2l6oI`04G$+d+Vu1$IDFUY2b9`)aj^(CS<?x14CI98`WMCW^K`RH}|#!J82!0Na7D5AmlF<U*{0maD#_g?F8%S}E*sP(0pI=kaFf#K+5A2=)SDzb@WWYBcr8OZb6DDN{KZqgKT?z0@;8F$P-{Zb1KOjs65#FSjQlzpu>>a*GvhFv;vZu5jb`*rWP2*iF0f?JC$;F7C-X#c0dP^>z2@!Lwo+>D1<&B#8v_e7p}`I(weTt8`6I$sOQ(c;1N5^l&DU9a(>^QJ}nhPH=L%$@=o42^d%P_|O9P+Gi(iMpiTu^?Q<;c=f`T|pO}63nH$LPTevK73}B@*gHr{if##B@?4h)|mtJdQ<wHoE^dZe%E&dH2ap3a#MC38<+8Fp)L4bua(ui>#dE7H(!rT>D_!gx2LZ*<oXXQtsm#Qu4Ay+3%a<G`gzCVJf~uFSA#Dv;?kl$*}sL+t4QA>Yjt5^Z8UKW6|-hL0dDpaE#});^o@<H?K|8OlRK2P4!A~}$!8M+M}u`Id?z+3cRd^G@+2H_;lc&$bqhlQoccssIu$XHHhYZk)w<j#;&bJ04=y)-7Nq2Rvx&8Z3w~1#O1|SVe}i~dyHRK3HLl`<nYZdZu3npm(v<Hw&w{p1hzXlWqk|=Gib#XO^H*xO3x-CR)rXy_h12p*jlBySJ@s8x#<MniJk<K?dy{!jjYAg5t8SMcHqd;%CEtlqS8EL%1=ib;X?iVBB*i++<3072cvcrL0Iv>TcWLv8<W&bduO`3Q#R^|MRmY<(g)<ihr;LN;FdV$XA*)k?ywaF}&x6}`^uiODZPrEj>6(Ra@#WcSANEA`6rX&+O5Z2kh_r!~#0>`)y!0a6A^HScr}}*TxGN_D+)Gcs10wY{fJDnR<W=MWHT&=iXvsHp*8(EYLN#H+#{+>$vm@WBqClkyH}Mu93g9chjImAmIHJ|8802+b%6y9wbc|P{vwhoa=<QC`eI>Qky!1Y2w>e<&Fz-SDZpi2C-DA@y8xsC7C9)5i7lFD>*-8#KYqT@l6Lss=T#~a*Atdj1_#oZVB5LrEYsfWN{Zz$9Fs1mefn#gY;S&<+W5YEv9*BM26JI*eLOSN$nnny;kM6I|4vyFt?R`BnOp`P?&|>(OIF=vok0)kT;B&Bv+yTaYhn%1kl|)FYI0hRCqW0`PKI2VbgL!j>XWeZxR~0HU4*Mc2VGiKX?5j_uzqR{3N!wJYy^tD2sovzEQu7H+f|axNCToGVY~mSPz9l2GVUpU|Y_I;%dIDK5Cc#Xfr^BY4y3p19qAOy}Nz)Pd+G(M=?bU4)vIqAU+oFtHX13VXb3`lqSpFiMJ^#jGJ!8mD&b8PTJMWz9aqCYA$fR>J?&f3~{OaM2I7Q9LyZ0A^<HM65FWz{21f1H|{_*kYPlvAt2XFSz5cFsnR8<PL;&S_6Fa64I`<4HtR_PCZsr(Y}RIk4KpSE?hJe{j?zzGqHoEjuQUZX_JQ^h&$Bj*s~dQzz3og;djcRxWoxrILr)Z;_RQ;BpYD$k;N@e*koy%C}YFQavA<w`_y1MlD0(F!?Iu9wJJh=dq%Fbjv#lyg-Et6{aI8q#rsgV|#Bz*!v;GjmL%;{dsNfoj7T;X9G8q^J_2VAh$ykE#+EA<**Qbd)@Ve&iR3tCn7)q(!HV%iVOrD|>X#l2&IpWL8}y?I8><?&*5|{J{nt&rXG-n<7--$dj~y?l1^T;`KFQ$mPFgFl4*zZEu&QsFSOJpJZ`orC~_V{q=OUi)eGyN4-||W+7)UF^?pzjrF8mV`QTrNnmJ=XGnf|qtQ&l`(Go*UlP&Mi9dIzqTyKsw+2uB7S(8YSj9UtmXZ^tu6XgV2vmBO4`_<NXOTnAmf-PW|M)$U{hdF#7cEGCQ!G`>|MM^LFO{q8X5`^(luGTxWD9yr|K2+|KUXVS{APmGTg#hkAK4q~jRpN8{u!5c)7eeU-rCVyYbV)Rc9_`gCMgnl5#%oNS0#xnn7^5j5TKOBeVU2AIKOKzs$cmaXPhn+%I;3h*=+#&kH@Dkzhu#9d+b!d{l{M}f4Rz8H6*6^{GxFlT@>|--+sIEZ55fLvMa<P^#I-ba5@_L%aOgo5qmNn2K{$|Fn9i61VKDRkij%tY7K~0<3Et8*4vjHlrTwIV&#J>#zTKTmlQU`$$EYpm$=mrN2kXeuKrxOoag@g#=8rnspKu@1Q|#-N`xXOKZ?!_kX|o9{_}j#EFH&E6gsqNGF5LM1UHtl$%+xP5*8SHF`Al&vvBoQR?y-lnPs^8bLE}W^(r^DG9wK0B!4&zM*;2@*x92cbq0<9>u0q@)JKGVyf{2#w7FEEvUc;%dy-n>oy&jyB`#cjx2>WFyG16^EO@fS!R{}=JoWyU>Tv3>M^860Bj&w)&_#Z!&PFJ9#c96J5R3K6c?=eQ9N$OF(cV*i_>1szP`UcY+u-4HZ}&<UMW(On(T^vmXNL#-=ZASUIU(E^){$j>x{@FzZ4+;<qLw1NHD_Mp^afK-cC8YlsC1lKo<j(Ep%uu+fP@;a_75)Tk4v%(|51>L(h_mEQ2fVm_tT=Px_T@Xu;Uih@zlSGz5n8lP=ey3j$1{V!nOyUa`EgtFSTM@lGHRD#Rv_rk_gBgB)u7J37Y&;OKA%$;fs~AWEd^NAbvqD8Il#ro?9mAvp9)pC5)Y5^nj8|pEN^kXc+=>Rcs9ojt}=w21l=eSL0>$TR@Z%L3-r{LZ&|ILYp#`r0A#&su*4Wn#!E<DhL)848~LA=469J7^Z>GY0~qEf<&-BOVVNM1W?F_77n2WfZWHD2V1}zzp$akS!-$3Dpkfkp;iK2e<evAkh&qsJQpMh$E~uQ4yZ(UCqaP`0T?;2NmaR-c<cEpS|hY`CJhFd0z(5BYo*P^B*T$<Gxw5}$k2Eyk|Tl9(+xZ!*$KkDFXi{)t1AR5r~X8^o#wO$kY*eFbi12b-@6j8-z^CS7(UgmlAbq<i>1fS&2#FiO!JrNw$V^YrI{j>mFBOuQXtU*-c{w%fOg1(^b;ZnJ0Wr@#ka9yBjo!)QS1$aCkT}c@`RPqsm8+5(;Ie!Xq>Y!^a#PuzuLM;dsvqA^zV4`zh`ZVSe&xAS}&$SDbv?wx+64b^_5vDP|nSmOd6X%8Wk1(m$FNn$z-IGkRXu}GU5oktjt(IR++kroJ`CFUzdj<ei3IrM_L#nY$huiXWq!>9pmR-PA(-ig8NAn>&Bg2MM4;{%aJYz>By7DpQfEAMHz?7F5X^e#ZK;yDWoKyM$!v~yPSNWz-%mB>BKC^zR8-t%1|9il6l2AqwzS&mEk{t1jbh8IZiyM6HuL-EPo2sH|6x<Oj(i^DkZ?`E;i8@HIfMpL1lrj#uLBM?kJ-Qb6VtvLWTi1M{!jMHdI`9^k;`Z9-UvD{j3v6OGbmTy$KaRPbULlDdAH(OZDT<r)*a0M?1U0q^dGnVW<Qm9#>(#8drJ*mG8Xk!Y{Q#G9jHHDCV3221Ztc>JdRjzq~}Ht89;WY<l$LVHhSo(qG+prie=hR4E}|BKoLDsU2$P=`i`4u>=ISRPyP^Pm}5-_&5r0f_MeJvC+DE{FKT-%}Ik~C%74;c`eb`u0>ESYMx5TMAVuqECb2y$3%R{N%=Srxumg5XalHuwBRf<2`%THAVLs+n;oR1$Kzj4{yr>$%Ey$Y$~J0p5uu!>JsTfxud8P3aRH&(I+q+vWNIg7Q%EsFsS#VrE~V~ePIA|BCLMbTdHYQAcAb|nzRcFWLV^%Z;btqYZmRF1<S$Pxt8TQchgQlG1(P{d{dRMaSFvu~c$SEwvsEtY<fV$$WVFhat2|PBTW4~`YAI_2swS)YT=QXS(#(7OB+nR0uHGmL#F9G>R~7<~k@<U-0YEq(Bz!3a2sihQG_$u6c%=kvE;Dm7spc?IC*`Mkd|BhfpSRbkJdT-yxd|6To}+4jp#+FbqE$uG3v%Waut;7RFkmnBFG)fw*(rIRBG+G~p~&e%ciD1DMPDPMO-i9bj-OaEgPG-UGVdAzf-|9%nbs(E71k+Xzbc=tcPdhgq(zP;72+7V#eGYg;gpIN0uU^C!MG_-GME)e*7GTKz?lS9&Y~AkSHh`Io<)ToSfsGFTP&!^N|mO7q)}Vxg=qp6HF!%&5-rtLf;e@n&f99EOExiV7C-cEbJNE<1P2q#$G7LBVVdYX8|9xfhtJI8YtJQbK4!BkW3ptXF6W4z_K=utIPE@zf&$Ca3Aau6)bVCQp4#jN#SJQI5as07%>qWY`0e#orf?#LU+}jg?KWc3dmAWd*`wF-UP2UeB*yeVaPz&w?RACQBQ`toNn@EyCLkvj(&tt!4;Y()`!pd}ZT$uG`bkQgnl3-q<k#d#R%9n7`SIUGnKu-+VyC;UN-j6siX&v&(HboV$U5U9LPj8@1dWi9^&ax2pR&e5niFYe<&ts5e_%qg8B)oxamnP&sY$ONl-#-kZ-E`orI$LTxv>c4v+6|bGPt2LYJXmOk*%r*r(vBDUH%?C<RrL<=}UC{IhfL(8mXPe+6+yKWY9K;jEoaH!n(>Q)f99r&q`2URH|&ij7tt3NrW6aLyV&}Tntjl)Sbb(28w4?uxF$;hSbUhuoP1iUbsnOMzs^31$QBw9riv8%{+)g*|rD78TxVtmDXyWw+>p1an>S3di1!9(s4PX{pjaVdCHcR8NXBM!+GkLs<$f*l$<hIlXZ1H2P%JC3@#g2EQ$q*UA4+5V{x%$b@+|<ZyNgl##w-4lO~+agZ>ohYPF;kGYpY7{049bWwBaH2F2$TKD`fch&h7&N##?%4!jw`)xQlSdn-uhoDGkrp;0h37?Gxu2BH3hW4w#g(_@qJoW8t;K6u9GcajfJ5-M9%%bcQq?L#{ZWne}?SS6(Km-#RAN~QA4Tu5Z$?fwa;ng7}Q8zI8k`{P4Nf2U4XlVc9#2b|)J6`N(OjvjVRJFibqF3xwozl9OBH1G7}_~)v3!s~T3Um^SA{xXDv$eUn#7p%geU-r(T>u43xLO;Z-U{+a&Y=I-Bk1KJo498W|I;+gPJVa#an}*j*pT>k<ydvjOW%C4#nmSotNq7GiS=gy-wqV2<z%o)_Uk5%o6n9G;?bi_JW&AGb`r!2V^i1{5r+2Y4xo`YlyFKofy>A+gVY^Mc^P6$M+pKr!OE7Hp`hCf1I)5OVGOwT&_=7By4m|JOGMv$L_P%Mho9%Ja`wwEfG>8#D8+ZNdMh(vv{_=Jj?0r)YhQn(-VU|KA{KmM2-|EsTJ*jm@wK3{Q@QJ-|8f|K&ZuR-&GI*%eYc*=Fh5u1ue$=8TK@I=YPa5=O+{XX7!R6Q=29+D6bET5_H@2Q%)2^p^^lLSLWO}>!`Q7P{XZ!Eo{48LMiB-EO;*TnmXy`3I@<Bc+aqo$zc(1~EG4&sI-VlER-tAn3t7)+FG8#SX9Q)U_$M1Yv+4;&@E}bM?^|c6wu|kw-6y2^D0~}})>6xz#iVWAp#%DYJ@;Y2GVwobyBRUOmFGYMJl8#Q_?H}-geS#QOIL3u6`|Q<Vqm7aNe6&}qHhb_@kY9B(Y13V_@Q2~*LEH|kK8{cKS*T=t5>1Gp;+@|H(_qCO9+Pl33zl+jpwH*P@*$9WC#M%Q`EWiDmUfFrKfbx}-k!cXB=Cxx6(?Xva6TC318@KMr~RMLp+-+}nzOu>$6%Nr7t@f&Nza$TztccfHgGsBCOt@M-d*nizKq0sRc2c6_0ie+1uv{O9L<s8S!L7YWb)$L0m3tn#5@nyfr&UPdwjHia&V{`&+$o#MEA$?5s*03I5m46j3L*Jf;*4&{!ug@b5Fk!A@Bn1p_nH`qZw5TTctmZF}!|%BIZb82-B$%A~m0vqgeJt`sxe;?g62X^Io=u&0+GI5{imcJq0r^4%xf{CsWRHPC6T5&yave#BwoRFa2p;QYS%M5G0r2>_$0Ac8%CzS8*^MSGUZT9PHEjogZ2WM9(>oFZ`3`+spNeP+NO1BiWMj|2>GNQ-481Kg!}cKOVrLe2~0jXXK01zaO3q4rs^xNNg?JC&=%b1Kcnn)=7*DOWHUR3iLW!($og(fqFfT<Zc?_S#-1X7n2A5hIFD)bdPtmGw&qEqqs#w5la)DqWLxeloDeimfommKL#sLc!dTj2$_i?nRpYrtwA<*U60-OB}s7n4avN+`h;>j5YUM4?cjtxs;r`Euq2x5v3IOCEGNdc#E1q`<BkEcaiVxyv{)V2C|KME4`pe7fL%)nx4yx#hB_X=KnL9Ifc9-N1H!=!DwV2)n-NJA`4bJtR-akzi8sG<Ai>}dbi#;(1fgLvh7BW?^148DaEU;WZud!{M_c8v=IM(6+~Z|o6pjWD(Rwf=fwlmt-Kvlb+R?YH+Wws%PQhamWQ(O0IT=fyRtXxA;WMH!8rpK#l<FrHFB52LH-Z=}#0Fu(6t}@5N1T97p=_;*WdbTl%5E0kvNi3OI3N3`Uq|uIr=%gBJpHj?H#rL8;WAvPu&b#i?U!<>nN%c}vWT-)<Z;>i^k^5>QV5m*^jNk5F$xC3M}H>CDN=1YZ_AmtacsS$!Ijh*mfFA|dPqerjF9`MtvZgp(E|ZFgfT?aJ$7ISn8#igZfRR#`~?=X_zMo6_#3t&e~Ff%k#{l~-aR3Bswg!FiWDseruK*gA(CYV(PDE05s5!zTCk)LHANCk(#o|DcLDV?rv(FYDhtiZU*hDIf8KLGZE17nQ!7hMg?57DHf^IdL!61y<&|S1fH!^0CINK6OuE0i#8!~o2YP9a=ELclM5cIsZS6#~M_Pa;O9l5WA2^zywmDroOqIT}ho60$83`K>29T>@JoHy<=I8zj=U!}|rhcfZL6}*v@~L<*W&hz~!D>Jw&6**s8^QN+cr)_{b3$v|x<ReGt>w(pnrTwjoul>KkoJUyc>l0RWc#B(B$|_fo#GIq0R$BnbWE%>6_R$jbn;Wf6^a%Ha35S(Agg)%^PBb5UnULfA*Shv23LuMJD}=y&Ukg9!MzGXgh3Sk>;L`#{D1%N|KVN0V}<_j&vmCeW)w+h#OH`KXnp{(cotnlsxF=d1SIc-w!~eqbNF!)l}O~Z&Z{#1X)-E(IILhfV1=j1p93NQ!A-P$U{R(lx=<q9s1uT`h;t@Qv6w@oIJ}u_HOkyU5p~;<DOkGG@`T%e*&7fURX+w#$`sOa*~^y|6QLp{Ou7A)5+TEV@#TWX1?rozZ<aPJ7B6MP09*$iXKGFv*6s)(dC+;DB$8M2De*xUhgl8|TRgZ+7f#7e#)K`rv4@-jEw+u4+w<-5DfD$A&Op>{5#Uk?lr1ac2J^Njlv6NfRy{D~v;A_hg_wFO?OM7`Ent}U8&1axH_CF8-++0$sk+9woVxNVdz$v>JbAQEH>UXuWa&u%85e0JcBjfTA56*XO)#D)gH>gg--7jiQxn(G=wVZJ_3n!nDy=j8l`D}Rl|{SrmDc2)OyLU^M!WBXmM4vp>=O=e2mb6jyje%<SPqj7F;c2x_6#sb+4&L(33R9srsKY0!(SR~mqyES*Y@+0Pcqo2gc-Z^Q_88`nz=}F7sMMi)Xzu~C}J3*p+{rI1h+pW3-!32utJEApIq=hrd5N4KWe7v?jFS(FL&#;E93l^JMZTz<Sysq8+I@EFAm-eL{8zmx^l<v8+PrEl?la?qGGv0l2kp|KR%Y*d1^4<$Wc)^zl)Ulhg-SEQYL5LRtsl`|NQ>&{NkK%0ZR*iJ3l?CoV`0BVVqL~*iHD$rT>ul4OnC2RVY4Tr_w?k{H2zGpubrE{NXZ+V|946SYJ=Wp+WEGOL&Z~?5!!|NsDl$Dmoh#6I!8nM_{dHA|YaL@96@UHOp@Ze)qsfrQ48D7TrRtu{L+ojI))K?W?35Bj4~2b~Y~Vw5#56tG%8&U8X^(9jmt2<tJwVcF&Ju_oq2wYp6;YpAa-D5*ad3i?2R@a$PeYoQaYs$v3A&j8yj=98nB=(JUdm-o!ZfE*1s_aUZaJpjC?*PjxetYVdIt%tyuIsBEu~xpBc8K1JD8qoryb&S;-6m9sG4``l|Np;uam%`0*2kje9<6MR$NW#8}dJ#|PcaZ%aBiCh_+S2wYXSTwH3T3em(0B|#PZsrHOQERG$at85q!SpKq9<<AH-zU+KYFn&;t=~%=zXYR#B8Ax<Knp$)J>=1W<gT-Aa>(Ro(H5{#m@6>ZZC^PTlNfJvNs@JoUum3<0{U5fQ!e=DUhZFf+*#r_&Me*`%$=`i*En8VMSQv;DlctYaU>4LI0?5L-akvr7>_qovJ}1J_f;`)>YK|(^ZXx_?g>ga4~P}TD+5FId%$YrMo{Wnxssm)RzBHfDhJt9sy(%#RgphySL?x05&iXXYtvAy4V`1qiTO5KoZUP8S8t#hoEa3h<EGj?5Z^oR5Vwlu0$WVm%n}BQ+lgYUZ&YvVne3p*cG=yS+w2VSx`~h}wQ9Fb`x0Lpwc0GE7R09lcif1CadYf}<uth?krqr88w^y5@Q{7f#XD*Qr+u00rm3q}446$9FB2)YAVS`39rIN=pDQHP6PrSTSVG#^!r~LnLO6~D@X|pML4Q7_TX-xL9<?zK^Nd}75AcSvQDTR&Tl1tc`8?a`_i1H~YN#U%joc-<NayOO`I?@o%qK%!(L9oEk=vMwd*X(6F;!*HSm!4AmsNsSB!lF(Qp%mX+&L<n-V5AASzo)e0Ll%s>`*AOX`dgk$Tg4VIGs^_;du!{1k^bE$a4(T{o%c9tb_ffup_sXR!bgvwz^{<-M9>;Dz4jw?8Zt>mQo$1LHFd6DqUIuLs)ehM22Z^9B)>$&*7|_ZMduy8wIfBSpsi{6$#hgAY~-X0&OH$IL!)(z60ShcTS?d?xk$!E>dND_SM$M%5wcIn4Tf8rP}0I+J<FGY&kfiJIImkxRvztXJE^7<PO!gd2(fONA*sAUTwZQU>K&VAV04@2N6p+ei9xjdy4ABewsy&tn8CTxJ2uCf?(yqP{m@iR(#5?aVj7hP_{TOd@?qZolk68DcE~Z?t}n~`Le1z3dKsQ;=o$`RN!q60}J{od*6PGQE9WDK5S!K$*fox#sf6gEQ$JEUg`;4$@!unf)<qATe2Awr8&@}G3c+1Cz5R!JXZBZ)S;lhN?Ck+)Mr`7Z?wox97>sBWiko0mX(Dh-6J1cvD2w?Mm2f>H<l%f{8+icpbNLes>lybq_;gQ#M@pH+ikC1D>;WIGV+Yz;93`raH57TBMcL-w=X$nVu)GKi=~_+rvwlK_RFBj@-OYBAyXJeX?-bkHP+Rfxa))+a041wEO|%F0He7Kl`pjH;Yzi*BJzV`>2Zgv7xbC#nLob`M!U*jB_Ki|Af<1N<U(N?s^HvX-a;bWVo7S?NBTk_Kw%?lanB+xICkqHUocS@sjD%shoFYSJlo=eHq`kUkM+{DYS9>VX&|-aC`l`p3}d6k+VtX(UAMTJUF;S&Pt(O6JA*ZSw-m#I3h>|b_{2k$-l{dDA4Su(5;s*DzAf*p_Tx@`ceC@!O#ZP-zlo~kd1Za$?XOm>x6IkK{rtm^yR7cRQ?!C}0$O^$+D&f|is;R`g9&_tQ^knj>sLv`X=H|@EZoZnvvBBLuUF}2`8B6{_lgTdP?-_kkO*#k0Us!nY%=ZVj!WiFI}9DcFX{_>)504TgYwGj5|00i?jv<X%oivM`lZ;#)sMV_YuKAPEF2f*uJEg9T=k#ecns8$nIvw)Z5ps1wA9Ge<8y!~_ZsBZ=C@Ked$6_<7GDgL&2T|+21{lXDGtolT{fUfWDFJ|o0765+mz$oNe~z~6)w~2k2V*xz0Q<Wgg?CiHr<!<4%x@QtO3;B{|VE+OcR&n1O^=KBvNcdgls(>#cjL`qK(%}+#p<%_OzTKrr~YiZ6g#N%n8GZzrtT3#M{*`VT2htl=8@+3tLSOQxMmdywqbB#+*B>k59VlSU#BAEmc@c@_a~OTBU`g<aI_^vfc^061K7R7=HX_7o{EfcfIfFop%=o_b;Q5d)tUH-DuJOx8d7A-P<N5IN0{?!_jK8w~faWcG~0bKYTB3?rmS{4z6@P6%gP6mb~qqAHD~n|3SpANAcU|^mX1p|CfFCbCWnn#bdtSAntFkaHRoXOXA+{$^C>KafIBG*d2q{N5{6$csSxCMG{cx%YchkXNwku);Ga)8vQMd1}~SmO;kjQa}+2I8m$JGQV=e1JWZ8Wu2?wMzc#d&yid0iF9QEoH*>Cj49@dM6|GE(bUW9iF0P`%H7DOF7GAOwj&~igv$<5sAKC?BDqdeix_K|%_DU7umUa2hG<O_Di_9Q(LnI~M1uWnv?RjVXY{S%bDOG4=!$ecvRu4%pczUELk!}yyU<S_8ASR{(r2_4ShEbFOxiTQlbf9mwaNDNlfqH6++s$TPmT)nFujmXeetyR&UgWC{;z>IXXTIZ+Yx@Y(1{+A#xBDkYuMf{JROm1L@Ez}%M-ReJk+&7c>+s&69mC}UAtp<_A?4l7U#J`4<_5`(MlgmsU7h@h@TZ>^v&xu+4hcDUnQm1Im-SV0Qqd$92rW=LIBaS@*4dr=LbF~pnI4oA#c6PUaCY?WV({wdtn9gMFik1Bx^1c(9Mjk{j|T!ZnK&Y-xEA@JCIRj*s+kj*5tU?l7l?i`eQ;p99edXgw2mU)PNShem5SUH*IRn<%$BHVY!RMLsaAA9*F>`F{TQy^tgof7afGnE)Im5eBVx=@L>=7JRRLCn!b<qZnL>n^kJBD-H%u;jAx!;Z356Sq6C#r@!_`BsL0-Uhet7ob@GPVCa%dTTh!GQF%T+X43ul$|58_*Fc1i!XR<Q&dg3LZ;m$1h|3#Wp1EF%dM|4Fw=Tw%(><)V~CI;8<Vx{<mxQZ0&5Ww33OJwh-*;^$=X|B$s+S%2tQv|QkAF<W$)V|zrhR`ClP&a^3b{ZQuo?1*E<Q56Z^z}=aBqLBwuWO_4R7Pu?zZZ0MjdO#X_Q6z%IDfruOgO97F&l3O}OcqauYtAY75llufEvYN|b2E&rTY^FkDsFounC|5SA0~1YzMl$SLikBa>|SlORRYv(liSOyR@N68_l%Az{%2|d%g!Xm3bct-_nGh~xT3MA^$Pk9W2gpWo`Rwf<q6ZJ*;@q@5x{wvsmg1kX&(m@P477_k*q(|beeQd$Z!19whFVFP~@n1rq$mG&m^h?KPxEP4zo8{fHZOn!`r!!#^c70i6l5*4RD2-ak1E{)o9<V+w33w<xjPC<t$)-`zqJN$wRSimqL-Z!6;nMOo^PeD0b6zUPjZAt|3d1uwiG^$zwfeZ9z-Q@Du%-Z}pbt60coI`1uY?#XAKyWFW{67stFZB_T6g1<|1Df(w9bCGqsId-*YkLZv3vy%W?Lh~SNI5|*5u-PN@89HCE*X_pae><;`>(l{=Cc`~e2Q6Bjx(=`=zoD|T{rRwAg>_;AOOIK+_gqrCkf5Q&?#PFaVb-*&1`_`Bpn$ff3eq6=PQq)BDO1mPbF0N^GVJ!8={wyTkUi|6w_3H+AeIHzx(yFW8HGF#fN&kA>v2Z_KMKru&%;yTf%<XXB4pk`p6B?;tw|JjEdFlrSwd-xGp>DsB=W-j1<|khsUwDO_2IJ*W7H<0!f7%;#+xt#VBp$a*Do|f>n_q30UU-j>Iqfk>1o?F|NNaz~x~Hgs?!;*<t<ej=+ZBppSraWS*%F~Yx2Rf5PxiYKv%KQlcdchHs4cYTttT6po?g)H@9)A<5P7r=dxcNqOJiHTdMtSUdKJOn9k(_Y-i%F>_#KPIl$3C;{KGcG9m#<#0`@F$CdKn%DvHQwz&S3M6B+B$UGWo6p~jcn>|=6OB}OI^!glr7_@f|{j9Cs79=*Sv{|n&)epOfTNBT-zp2|LZIh59vw-U;Bl3jqp5fgHF(AxL2IM#_h8H~A9^<LAMIk15Vd=Qs&wiPte<dAEZWA7v=0RyR+m9^blV*Ri{$<r@9Yw;wMO76NTz45aPm)LBQogj5NP{Jn&UQDBDdBl|Soje4cre|!@p)C{h4EB$_J8lq?4M!z;?$YVIux@E#GgK<SxNxI%CFVGr>tMv`Du%(}OhkX*0Q9MX0=mh-9-4(%%io<HU9gUSzCbY914R2OmbMa8x+f88&s7*SrIE0?IDVL2M^nr9+vprcW!FPCq7fV`aIux~U^}+ZsjR&vIMy}pCjtQvUY$sMkKiNH4Or2$Hyvfb2zVPjD34sN4Z5ay#aHoA4?H<oP%l#l2r5c|HDejN*x=LCmPU;&-2#q#R-M@JxdbzRRX4HbN~eg8B8~Cl6je+jocx3_2ketGXjw&sfj&4wtn923cuFw-UV0&kn_H8d5C~L;<xx$ui=6L$PjrFG&0#fBu5i5FbA#}!s%{v5Eq6+&q<Aq6SH(iPU=}CsJ11?h@0^KhK6LI|<T%oCABiI!q9;inI<%u_#Y{UE1Ck+iDStaA?8@Ix0aM~hZSLLnx8rdn{&sc?>~Dt#WE7-0NJO$Zdo`pS0K$?^`lOFT<fPazpETqJ>Wo5jCr~T*_UFRRU}4%#!MsRZ719WrI4;x@#{~;?2_|nTHASL%J;xK^8=_bHG|l^${_wUEuO5h!;Pl1QWTGSzpD{TJC^)Rwz(+-nN6KwoKMcf4I^|ZN#v@lt;(-)PEi*SgHqxb@0`GCDkPc?<#3tv4WKGq6)uc~Iwy8|p#-=zHc_^z}{d<ES4^IxyIH#BG3*kv#3u*rHRwDV`in~o>+2vLx;=+T910gl=jp&5dmu6v%gHq>g@RRm3kXhy*+AGLN!2O(q`#hfvIli|~?h~cWiTE#bE2zQ2nJBX)Tu~sso+HZX+^pa8no@Qn)tuRfs$ll^e$v98E~M+I0c7i_7hFeu-*Vn3;^UPG<;TSTogWkOC>%nFp0c-O*+4>Ge-94*L)CjXg|5a~pLpjpClGls(44^5%nFE(?%xKn6Na0eSS5T?)f16b47?gUCjK1&=J-;e2Wli-YHOL2D;>Tm6D7uoFoJ{g_b<;6k@LwqPf!MEvE>*m9G@n<rf28tYkH3<7tP#aekL(aO?D-IHsEH8oT*L)PSbZs;LnSB+P_sqkv)m@9IpInIFuh*15YR+HwK&;!bCmi3#J*qt+o2$8iDEW=lZ6Jm6Oo765_>^=pOl*jF4ri;RomE>9Y+Rlt(8&KHEtQ;8buz@)d6$1S7!%bcgGPF?+laO77}Y0-?8jga8XPFA`fSbJP;)uDHJY=v6Are10kXI*Kc^;i4i<Tyg_f-amOa;p)4|YPE=WcXsIeWPOcvWIOSiI8wde>+BE+UjkaIqkkT7tm0*r%KcK<*zd1lbj=mQe^<T9Wr9VxFq28<c}>8dhSiO&z2~5&a0DuAL|3ynwiMy7NgzB+trDun%Gh3R{zMx=Rm6*w$GTORUCC_(;D&XyZ^r2-M22_E2x`1%cj*-+jhaG0mfd&&#T1qj-XiX+mWKEYWY3&o;b$?ivc^bqLa&_@8I&n&YZ!|>+=#a0TC+-;P?Dr>CybFi#c9=)g?s2~T*%3eVSzwzN8zinI>J;mXNT&SlH16LjJ@(WV^4C*1UUHStPICvxLBgEWVq6uqA6*~T0JK4sBbyawR)4enwi&n>b^?;#C50ctrdugNQ28ZN7G<Xy{USaY##5{YFC!qvGSE8imfkPNu{DAKi(&DBR7)c<65uPY9*1E_`ZtjJL!qVKESBRM}B2RUO8_QXtSV=dTAwxQPzDG4h=)$maMMS9K?hT*^)0-ptrnO*SbOe%h82I`QzNP_Ufo%ZFEUXjqFo;Xe0!(4U>yGgDXA@1f@qOsW!KxH6msculElQpQ#VYAc~)oh8}t8L_11adn~=+0O#H~fFqcW%B42LA_~=^4D7N9g(gp!ilss6eaB>{>@rskPRS@Dvb2!`_PmrN!J?<32T8<tQzH|z=c&f%g~DQ+#yEnA)tU4rt_~!8GQ(!Oqd$~IG+kBYTTy^f_A+>27GA9(?l90dM?K_@o+5N7k%`lMaq(KY&gq;hNod#9l8x8XsUH4i0lx;KGh8{7k!h-Nx#c#83>33Ijg4#LCbfQKx&IXsj-x!-1WdLA8-oRIgV25Moa}vgWuM91YSF$}fKxGFK!{ezSizw_OOM%U*@KZe?eZ-Lnd(MpI0H=Jq3Y5DyFmUSj5)r*8}6^Pu^(goNPuZi>?*5&IIn4CHdK7BPO@HE;tvh(d&b%y>|CnAG>wCn7`t3ggRI2l9VDWLrK3daRSc1Zgh3FH%9349iq??JMq=?jF*$qwh=kcGLV}l!#5P9>W^<v=cu4Z?uH6??GS2&|FY_sxhaWzv(y-dWk|z6p#W`L~=kQ!uFFZ~hfE=nwzFOwYKqkBg+k}ZNhr?LiH5<xESAhVO2$;@+q%{HVj}}KKCWz<$g0u)LFv8&dyI1=}(yCKZBnPAQQmpT}oQhlHn>!fnV20?21)L5IBzqp?fuzdX(CoK}hC)ognH(OYK>-f^2fGHhB3?B*JD^=yTZp)rML~4!T{rQ>#{7jz&6{8z$oOEnNQ@~~5%DA&=mbugPSWp{+*Ncoq{%ztW-fA*Ah|BTPp2fwKm==pI~D9rE_q1=;gsx>o3ZAZ?R_ffWMDLV2pf;?sz?@t0b?as&{+^9ouxApW;L{1V}x`SpW%ylgNw8M6RL7{kr@#*Ks5-lFPX|!`VFs`<UvgM&jFHEht5@aerB29g}#WK&sS88)=wL*0ApK(`{iKbi9KL*ux85*&rW5};n?*hbn&07Abh@d!zwDy%Px7`rZlAW>9TlcsU%}-&OxoBP~1n$+b6@Qb8{+`dJ^Q^d(BQ)ZXPmT-wG#ic0DOyC^y1|PTB0H?J+){hU_Hp%wB^_-j$qN0T!sUm8_S>h;EcBtG9npE5`)Vdaf9~<@fq*Ysh<LG)!FVHs2ADaJ3|SDD?T(>d+44C5tjLSJNCDs6azpoAxq(pcZ_^>Be%tWf9l%mQo(KB^OY#jww>Ip~cH=YuJVxT^3C#I|u>qTkFU*DO}J1`}CN&4*9%d5X&x;6};NC&`d8aFx!Vzh=#nEOzo0e{_M>;_i!4GTsqIv_ff2wNn!IKUDBMGb1~&RnQqOxpW&3-ba`#$xOqBeauxNtXo-|%$0?-jI3|?sBj~J$rD_d>+K{?PheGCYJF)Au%qZ)9rB*`wAPTaW#8HLBJvkw&LJRrQvh8=P3`EK)`QX(_!I+si!-T#3%D8lOX~E;l4tl_zM}^X5!+E-0DwK5i9G&^u5qHIvma|IR9=64QyxaR;8`9um`-AwR#{L+wgp~Y-#1u5K7m439HYXeEvGCimanQBwhOX~pY9z`jTU5D46o;^rQ#<g|_O1~od%`~0qln2O$-`FPkZHo}H9Rj&b}*KD)i_gvuB__OTX60DlZ%uhFfQziI}?BtTZ!a8$yz^3HW0QYs*E6#0L6QCbar@far`q7?t#h*TPs*C$IGF(IMbSytYIVXiIYEsMW-Mbf$M!z>-Xp#N@VrjbentIpET|~ZhuawhXf%pub06%SOze>Ng(6TWp;RtS{@>0d!}k4wOeguS)ui^lrC-VT3gRFldTdm;1H--@UYVd1?x#gJyCkTo>J;=_Uoe`-|mw*{rd3i@Z{j|+)BaCL6NA2+*XFJZQ98CcA}h`o37#{2f!h&jq2G6BDr(G!8mf?=??VN^WtJ==svFwk6_m{kQ0mvsD;yARVo?0d67~tOihto-AZx_nqS`KLvFoH<^resW14gqfN6tpRM5~tOPgbS>e5%%3RzF{jL92=hFfJUWi2^t;*DVTKyKh`OTbDt3#2S(AfF1dDiWqFS;!1(xzMq(Hy?3L@hhdv{R!ED-X6U3-kqIZoF1Ht^nL-YpF_-r;s-8SFWEB3H`Av$R{k?m#+{oZervrHI1A}qHufr|o%$}VqdD*HldI7`UU~T$ZsJ`}asZXR1AjRxOZuPJi2Gmm-bN#2kb4<Xf!X;a2v%ip|BkS8S@tgcYs7PpeBAun9}c7Ch@B)}g*eut0xywKLRUWV@2CT!^u!eL@>~*Sl}&c7viFWSRU~7;!D2WJ<i~-q^p_-|-0~o!b&P8XXFg6#U-DQG$I13z#T?Fwm(KjGGo%j3D51>K$^{aR1SE^(xKZ+ZH<Lkb8K)O0Po%<c2s)i|P`1+Fa1b|~{gl0JSs+}S21M|e!LA-KI7n#9^zfKVPHADEh{Uaj%@JxhjhZ(q+DOkbr^mc$p7J+;x~nM_J1de{5{qw<KJ?n=>@R$6+)CZD&G!Z_w@oTKPOY+il>-2mN~c!Z#A1Q|m|E6!6lhg9XNNj5g*I=`&B+(MqD0p(dr1&?D<hbb8mp`m*OmSvY<I&ye`RcUb1>{;l>rE>cLE9y79haDR|gz;pa8P{JoHZ@KYiu7Xq0whFskiqMPlR`j2<dHbm*-AeePQZ0;b67#UI?7DIENrTQh!QZ@xq*h|1F1q1j-YWh7qYWhLT6Urpr9DwtoeAgxQB6^p6$R>->}t6k=bIOSKGmlJn$d2?NCH_P<@MypxMjl{{%n!RoI4f&KCDDhE6=_K9kgLJ|dzy0B@6Is^|t1Cw>FT7|xt}Og1jz*Q=S*+Ju&TS-Qt4^v4x3qV`vck7FCBWFO7u|aQVM_joXF}xBcNIFV`WI0zgYSP}&!nZS3$wrDa)JagAABjWZ;loExqX@Ynu`z`o{lpzc>3RSH?}GN<Xi6e$rZ@0@tIZ0tz&bTFPwvELsRwNTVF>p%r@}Z`cIeG{5E?5IKTWCP)ot3=MzazNbpD0inBFoqcBy$d}tLl=ctB^YIO>#6=D%cK2`}Mr>N6SAnBn^kYF}gg(^%+w4xOuQfB*T>b5~)DmbW6Ovp-v`&}j_sCDrwdG=j8OT>4HlYZu=)?cJ-0DNDafSGk6pe||k(&UQMVZfV6l2u4q$w3QewK+Sh`~h0_Y?AUNq-5jvFXzae1Oeffj4In{^w|C!%^-;1tY?9`NSv8arpJ9<Tsi&tE8ZSYP?jeK;O_U7y5h9)hZG`4z30=B<UY%0Icq~8Pp?>S^y>QJh-5LT_pPvJrQ|f%x=vY4oZd^R{mHqL<0M=bd+>4CxeEVQ_oMJw&T`o^MW5y-mpuQfeXfIteNBx-0UJTsyrQ{%<cax><7`S~Hl&81kNhPh%UL+Y9}d>`OvQv_Xnua^eBu!-pE>ro{>N~(o*C{?RK9<^UR`cD?RxFnMsZ3NE}-;(Kgtz+j?8@$qiOLaP-qzn)&HQbC5ZU^U7xyA`A6i4m&CxQayX?ZfyLz|kmsBj7MT4c9F0f_#|>(I5oes-#|)-{&|1Qp(RwjOzFfpBo`v&}R(d2iUpZBokO{e<=}nfwIOmq8NFa$L-7;7NY<aXVa-&HV&xak~0{SxXN%4X&5z%`*9tZd8{^nn${^Z``&ousLV)d9W+UMSTGyxA2R350Pkc7_?v~~OHg?BU*N@m|Z^rvwot~eX7i9T!No4b8qnShN8uc+Y}NyL2M7t^R0>=47KH;iB_pYwJ5Vy*Hi@22LX@!I!3W!^o5@}=wiA(evh==ns!zVh`)D8j*dWn5ODaa#*CA`ukat6IFB#l2dt;<3}ITvt<msMyOR72}1qd3@u-5sgFcC5c0U?>fNZBGMY!zv;!lul*$)*p<UAdvHrkC+`62j-n8j`Vy;DSt}0A=1*Tdb^YtFq8#>}q_1uCwJ$iayjAs%h*-;g1LIeq&13Aq!S!SB1`#@31b87K4rqb#QlO^q@jTNajH9EkJH<o3hnKyrB?jS?do*ztT8UUC*dY`V)S1cM0_S$v^CqM(5qxdBuL<BY#hLU)Cf4BL#g=wTkLH06CQJm<o^ST<)3X2|_i;Wyf7}#BDvjsOXCEv_CQw}Q)gR~-w;`?SnD4{rdq8|4;)Q1<R(%yoX3GkONHfn|Pv;8G*PhkiftJ8JcB10c<@@IcM@LXkjnwV&d?k(~<L(GiKG~(;i&r6Aad0a+9mvJ%RI?@cF@KH~J)h55KK_4%&%6r#n|UOT{-U3Uu@29v9Q-*zO!meA&hAD5$32BZgE;Qc(&H%`<3kcNsYNLO&;5#c?w8Vc4cHA4*9Yn4eE5L3!vJ?(6%C{zt#BfSlvvvLn*$c&LSwKDsjFCA{>7h|y%(fdMZC%;;mTY3?6C!j_Fl)*R}+l`WVwo`(fyypWS+mQiRJEVcsu+77jbckgfIN=&Q872t=8y&bs<<O@NLJA+a%a}G*=gf_;zwp3o<NU(DGX$2a6^y8A2-2I~4(?TSsgxE;~wx*{0Wh6Pl@?1Y{~zy|?=(ul6ra&wkz&nS;^!_0ie+g^XHXEAVi+(6Hi-u7OWEyBnWB<?#0xi6@C)@>k~E`^M*d*V{%cUeZK({qQAOF;P&|7g>&N%SOR9pCO~OL-jND6yuKnm1kVkW(SgD=fsyrCGXubxC^6oOiPXjjKs1Pu-Y(~&j=xjj9AX5^XOhXoZf}Lm$(N%QwsafWr0bqCK%;agnYGio?(RfB5IiOd40mdn(}o$dL`V$kiW$HgjgEPd<!26%q*C%%aB-C1N~qW`szE)ma|;qQUpI>l|+3fVz>?m$}991`ILSQqXBJ*)zrUMO-lNzzlJne{;6Mir@RuU9dR_?*05u%DM3%?wixJ#X~594U^UF!4$oJ_?a4h~9amyVFfg?KkMPwGsx`!2aINJA!Nj|OgXf0`j!^Z^hyGj;kXjx=IvRP}>*;<O5d%?N5^=K>r&O*I%6-Bdvjd%jS@dftM*#^FCz>@?43#zfWF%G!d8NPWv8{H{q50(z>xSz%k+zjLBWXY^OCOF-kNJY)`J>$n=pHAS7`-6+h?@xP|GxxD9F44!2x!Fs5+RSrV7(>jdd?<Fhjrsvl{xoyfU5xPg9<oA<FU)Qp;(QAyI_iq@t4^a|6~h+&b+`VwgX*KU+hp?qceSt;bIMJy?sei&=Ff=<!++7qCv7Zgk^$00~RMnqwv{=0?c9fjJbZ90(LZJ?W!y$&GFQ~@$UWQoRtgg7ZsdpXFW%Ls+)NTj;tgz#C;u&LXr9-kA1v}Ex*!o2<xSv7ekUL{+|Vbfb(m^fG=ZnM9cYb$+mlvHB?`_>Rye~c!neZAW@H5+Cex{Qnp%QIj;T_W(`;TuZ!qsLB(J$NLFZ}Y}Gr3@F7_pa8w7S0~BXT`rITy(3BT0Xh4c^^X7hF(<spcIb);!oX<Tte`EYS?B|{GRXq_3=jqL9TZY_7VVJ&(HlXg%$O(^s<D-tE2qLz6_$%@H>J>QMjTj1SMv22a;uxn$2B|{|i~^=J4B!_Y5r+XE>g<WaFFz_?UEAsYn{#_ehWRDdI#XRw_;*#-w$tZ3Og-DJ!J5{yof~q{7VAI2WxlVxb&b34C>pY72X~^Glg2>)!8^zE7YpbT(F=Ns<ww4}u`(dYHjv}OJI<f;T&3ybADtFSuCszlulD-rUj}baUmc!rNRyFKmSN69GEN=C1MUT&zPn29ngkz>6X|upci->)WwBC0@VRQWTC(oqmAz}9FIb8oXh$pI*dS#k^vT6|m2-}d5zjyT_`*nuRQ7?ngAw_vB&!oG*;YE8I#>xmQdfHI;G&Htw~fN*&|QxS4+5TIg7L&(;J&_DH(p;7I1ciJJGrK+!VS2+emxb@7VuM~<@byC;!Km0@R>u2EkN~UMTXoY{+H$8b4i#HOm!p#VP(F$pE?R-T4DH?#T@o>vW(U@a!5x@j7THCtfdzAVLVj^D6yL|UO-|WvzH-cd6x_F$xyW9C~IReSN~PAvH{W8wpLveW5-z;pDHJUacW(P|0~~c{<t781f%DkjQfa=^$bz(i$?t8G`cqFeKqqI--%@~l@R>k$$IRTFuVQjw>#ffc`HA|vSteZCzb90Oeua8to-mfZl%9-w(7vjBY}?AvQe{lqQr`2s>&gi2!Chu5}(dvJAbule}PTKY|e~DW$WtCxO$2^pWdsZ^LOyIWn;Q{CW_)BluR6NVP_MA$KTFRPbz2c4%7>lvg5CQ8}%FS{P5uY+0n(%yWUR|l4v<7<w|?Y##{Tx$EQCXz8dIjt3<nh3+4!)r?Pftud8M*$ZfcmWBZThxRq_NgXSC-rMyq_&0l#uGku=uDcAU|$I=$8KtG+H{apeix3;zh@34xJj1gZ4$EOE>r{Bc6h^gUl={OqR7E4=$(-T$GdCNRB$^S6(0kpXa`&=B)%bY+g-c=#|og8jDYQcCe$pg8hr=(31PmqflzEL>6WDL??lpIWixSVpW=SI%fa}(WIWiSwI<SRW0fyf>!Qw;n8o%pJ4J`VN;A-N^S6C&sc5a-*7%IOK`kSB=zg$QHBP8)FO!T2(12RRZ8=2Y^&-y_Y724RAK8E7I$;1K+R7E0n#W&#Xdj-?$H^?xOy<hW%gdLu8O6%ZB_Dp}M_SeBeB=IxB*Yb7gL9j|F9L7XYc4d^^?+49v3#*}vip2Ls9kOb{zHir%VA%d%{N4#etX<4C~#AzVSm_*M#j`=Kwkyw%21NJS~3QkrsP6OwvKv_l9HU(D8huj#q8sz33`!r2ch4Y#hLcV3S#YzbS3dtT3^@v8QHbzNu4_~lz6#LWrd<l;*@89Gs>EE;@#FhXMQNrXUNGk`9p(4sFQIR8RP26*=J0IN8o;biUfk={#$H5d*mUAqmV=%lsJN?_?0Sv~2v(wWHE30vaKJI!+RPz+2bY3OYaW}~st=?HAa92fms(xEQ+F3<iz*q*@o<)2lp;8De%NwFGFnKeLS*;PG#o3QAL&N3vUh@MYF1*u=5hp@r-&Wr2IH!h^t5245)<KaRCBv(j6_O=|sQL^EA(o{V_SGG2-HO@r_keR}UC^Z)xovScmGwL|cbRq)q>Fy&h$4IlDNcT-IEY4iMbiO2sUv+vD~*`Bq4i7M@>Mz0(xvI=DkttuYCd{Fvvd0FdcxRXX0*4Lhl*+XnJ!UGAeFi;&k<2d<%C3JdP|{px+~|kOX-qMQ}=+`0m~Yaex4KFCEW%OI#pjrmJqJzPbdD&d}0f5VkRt;-0(EKto@#D+q~KYC-LEb5)5)_qwLjd&zx{tAj^y@om<J8GJ6k~%2xM@+jTjcZ0X5yIKo|K5KgX%4O4dxt^`On7H}Yu^i%Cpxe=bq<<P0*`t7NB;pOLpJ1y+yf;=4!E9u@oEB^fcbVT1QT%BOLWlQPG9l2&krkQWNlhcdCU7N6nyZ~%Noj$N1Wt@&_WL3WohCZ%n$auhE*!UxsgQIhnCl~AGBC>Qr3rafbr~!`UKvWhtoD_a0?lu~BPs}+-!${_CUXGCmXMo`tzrdmscFQiAi5F?jD96HN!aIF1E{7ayPRDVA;fyWntRo=!k@8bR{)EIUF?AC9SayZJrGGzAxig;HPp146c{X%Y4giuy^+98bMq4LwrOmPZQ#}3SQ)O+iCQxLfcI<+X6B8(t?<^Vx$nX78^4zn|K9>Wd<OHvf2A>+6l{7*_L2^>C*a79o0LS}*fAjZejC<@XhA4;ZzyK@m;OOMt`-{Qx;mMB|Zys&$^yFr*#=wzhA4TR)M0HN=cwwC@76%52Rb}3EWkv;u0^y%n-4Oj8vW&INVvW;^-3A=_%*y_^4QXGUodl!b2VI%~(f*G`i)ILr%L=OHG^8@nH<GK>M$v9!Pq(DRn7zU6byY%HxVbidADAUiyg)R`6^}9Hg%7+e7&jRXla~WBDHgA12);svzT2a9`v04|((E*{Ed5`rh{itzWrRVJole|TA1q;;N=+qjR=J!$oDc*eN=!|FY?WJodK0yVUPAxQo%Blje)qmH2Be&-iacpS#ETbixbMz`n9;@hveFJc+jr?R#6)ux9GqCND@yF!MqV@8rVNQqw<uy?thzG8rD&D?R?aVVw%q5nUbyNO_`t`V+A55R4s%+W4z{jr@-=fnd&SC}IcwyICSHb4{(AytW2pSDe77qjVVfSMUXFp7TF{m&PzA^qBwXa{njKVwf5%Sz-g;VzG9Cb^?)V;B66(O-5j%pY!n+{)f;z!E9xR!}OE{4$JK16=8k}L|i=}SGyK>1c2-m*wTs0icsOzcW<^@*bcS}#&7FEqZjnZD10o8|5uIgemc9C;W-MA!G0rdj$*~8wI+1wee%D0Mf#!b<*-AeU7eoG~<Q<iqAA8GTk>5n6w?$RGe0Tw{{D!VA9Jny<vB`vkP$f6aL=^aiVyXqc%Id{1Xa>7BsDOBS61`?DOlr7UAdIc(wsMqgiT?BVO)x-c)u2fuS!&<3Qo9aC54%+b2<355sC_RB-0V$SOWp*ZeD6?Fxs79&ZrgCQx*ryB7F<W0I<(7n%bkw?di^lWD)nID{BrsUILKbvTi*Ymfiv5rZE!JP*UU{5&TFGBR->R5YizPPhFZ#mDMYtm{*4tL=$GAoOJPzE{lF_6whb;P=&+S!x;D_tEvXHLQ;1^T_Em_?#w?@im#xt1_IAurq$-<(e=B@YHQlq*i?VKxeVTW`HwjZ=YhTStnzZe6fZRX-j(GoxetVfQ-&wW+RDd)RTzD>i~)hLu;!=^ZtNYN|4Qq^feGR3K@W*uZWDi5<7f~^@OgJFk|vKj-ATuKV_SIM7_PPq>$8tTI+_xl(oEY+z44#p|atJq@voC!?%#UGtZZlxuLyn)V)ubR3S-NwqKoo?=5b{}BEI*5~G!wwUwy?51ZzF5WAFd_{6QR&Ss8WwN*KtW7NDnF@T7R9F8qa71B)zH1~kYqDv=bC!8IlT%(J#@rdg4(n4E~!1s-@Q%y2uz8a0$>_-f{$d62HEYUF}y)4%Is#|i(P6rF12Nj!B^8@*ITpQPxlx>nbYrFxB=@riLm(0!-6f=K~AR=-Lk9tVmwxyvtPk4e>6U~`;*4@D)=h1-*q4X_xWczfs+|B@uy3QmfjGG7D|QN9AaSo6t3=g7TWnfJ1dI@EHdVi5-t9|ebPN<rhw3Iug4s0D^TvPJrww{mfu`?S)kCN*pH&lDFsDSvJbGItJEoGEyXCBu0xypo?33EToT1-r3P}%maO8^reVSsSh)vV7zwlDpSiWfr&UPlIzhjPE<Oo5BkjDaM1RZF!@k#aeJXbo4v{6fd#T(m+5J!T^m(#SUKg(8v04VUV$svYF(dXdnV?YQ+;QK_V>kp5Hgmm}&{gSu%>jyPpjXo>NeIzfE@V41X+AIlLw*$#a7MWGSQrI`%*DWqkuGo9J_5ZmwWw%QVn#|e;;3RQl?>|Ea&~!5ZRbUD6Bai8%ULkr?v5z6u(d~`8Oy66yuKzz2+v7G4m)=Ka+tS=bxjy=_E^aOB>-OpVOm9PA<f63W-+Q(|9U-LT$R-hRjQ(Olikt3)UKqo2YUW4e>{YQIh{tMmdfflFjrFeQ32kC4ESdP9$T2%=9!e)PpUwP;3lIiOh8!+I-$yI2qf}V7b|eG`rW_MB$+*D*ms#zRO-Z(RZ&Qo(&x~CD2W4cMVLm$u_aY9SowR2bgsaJuWf@WnUAd-jQF)^wp`zFKUR8xq^}lA1brv9<KxQC%9{#uL+TQx+J6L%-AYioldX#Sr=U18>yMPvgJaR?O3Gj!juTj*>Y3oGS8&3$KLD$GZS4M5gRl3V+JyVlRm(g#H?6?||0Nz_+b57JAH#xEHK)E=Dgk76$%H68V#&m*A-iPoxt=A?JBqw^(me?v({IOh#POW?SpQ`ERL8r+e-N<cy})%TJYyHI=nJfL;?$3_f<vi%1bg6$11bas{iF$VLeGdDr8uC7I)Gw*$2-HVjGG<16Uiaj@m`~&54GITVAghJMe&3MbhS);8C%REOi4<KsdkmBb=T1{OCl9bjw7UIB+e6wM<k{iEJ+fXd>)a_;UNz5oXBGolus_-bN&#Ua>SO@tn6_4M@ant7(dPJPMPqY^b1p>Ql*;J5$40Z@NkN9uLFIf>_9ys(6)7eHIl73eZjF>#{_CL>?|MnQ$zL#gJil`CxZb5j*@EiH)OIk+&F9P^()Gnvc)8ggX2^@4j0V+YqFRZu;#p#&xR_yv5Zz+E17K-Ab4fF0S&_6+GsOdN<D7GK1ZB<L8U`ADO@b)?#TFd-ORB;hpXkVRobuB9WUzG(rcPkN>|nb<m-suk2b1HJ4L8)FZ{Xxq@1cN-dJjORXwS0_iITF2>tPpf)dA5?gmfY$=ktM?EEy?b#c<;2Dz(Bn9B-34N5fP`~3Q1T5Pj?hKP=8EZPaz>@VVzxkY+=U7uGv53+wSKZvAJ7CMb!AfmBTLZu)Krv7X##VMHAXQ;I=$EFw7zsrkk9SO~KjXSZLBP`(F!Tt;6*(%LQLI|%TmyoETl+qzdiqFs^^;wO}&L7`*di@6rfBtskA4_2eyWAOWMvsvh8h>tTuv{5fV1uhbMFZaD6mV2+xbjF$+IX(w^QQ0kc>)K6%xJzY&_FbhUO6qdrBu_qSC$fRUmioM^QtSxlz=B5Bk8FLKwHe>HCuu>`vKg!r+eIu+f<E&1dGuIM44SJ6?`+Qoz{Xr7r-9H3pfWZNfzdIA`44x?>K2PB0i22)=+^+!Nr`p<ykblf)}{UG>=H`W;E@sm7K3u?s+sanl#Gw08qQfEj$bbKH%fZ((^P=pj5=GrrvJ#*7C~iF(YRU@i08OL->@3T$saAkn|)#ktdiEMM-0_(gG?(W-*UdIaq|C^t5|++_{wCIIaRLA(zw{*DGU;%Sw#ZMharP8V$rKN~(L_!?Wm`cAXU_%gCr@f~z~~jRWqcF;bv&#28_76^=g)m*G`Bjn{XasF2ogh%f{8mH)$WZ*X*edeJ`Ww;Ht_^_8goMf-L4gm^z_0{%Km)WkKhf}KIgE-ay1Pm-mlC@>;}648ISkkah5c#FA>t`xYGhMbp%r-wq<CZ^t!PKVJ8Iq-|c-$hc3=C|>RnzFp$&a6~nVN@$`Ky|%g+qtOa9jMOB!iJ|%1Wyw$ZK@G5Krz|$Jk1<=K=+f92)u0~qASg`Q>@xG#3o9`nEQ&{av#&Toa1AM<BY(4MvX)Au{hVc_bdpor;ah#s-^g7Hb5#L>X)Lz&Lj52-OFr`KGrtJSpI4aYcAT(S1l;?4ULV%jVgtLK1FfjpCKP$xu0?xSa(%6IfbPwf(fnM#2zdmawH_48~!X>PZr3-b+&-`M111Xb+dQa31@Vvg7)eL0keYZ0$qigXa@NHrC1VC?(wQva1zLotB!s^PD#3%l9;V_!1AN%rtm@BQJUnuusPl^yGz_sT^p!tzID!Ga%N*$h+v(L`Nb*_$0X$u`e*ieo~M7)DCcksek&#4T%}e`DL_)={1vu4Pw3dP=?#C=PwnWWR%vF}pXlT1&_fueSU|jqiBAfdUApEvF@fk<15Ts@Umv7z+9N&%W+2s{Xl3aH<6)$gnW!uPHj>Q*-OZyl;;JgC)r7{#*;TuY89mGZn%{wp%5e(bu3K4>$ZResv?pZg0SZ+44foTEX&K{1Nh8DWX<b#&@P2*&aIewWt3S^P_4UbDakw%L2W}Uo`SVB}waZecre43tWfc+F=+4KB;!&yO4C9iMaAA;1xKI?}d~24-f8bHWa~VPEAwP0(T>7xsh*oJapG!s(m0un9UF0hbRLZ;FUBY3M&|4A;xi&dtGt)^MS<R5R)^7j9MJIUMIqO`q9W1zff70p6F;&@7v^O35{~KSs$iV*(^B?BQJ0<gq79F>f_6K5<8_nR&`TH}mwgu((^fQuzAP28_ZdDLB{X<TY74D~@Qnfq53Y<Ju5~Oaao6g3mWHo$-`#DKcYlW}euLV7+PQ&eeD;LxEOOl_~5bc6~7*9XP@K&K8N5^L<qLc6sNlwkDp>QACG%;jTlb~`H_={Xqz?`G#3+GIzas6H8?zOz5O_(19do#|2Ta&FXp36ZkI9*)vv_qoRBn}?DsQ>u)m-YJcOD#})@flUTSaOA;4*JjKgn9WD$Feb!<`jXed4wE+1@9Um>+O{ld*LG_RR|I0Nt_l^AwPu>xdvE04FJyJ6sfF-tHo6O`c<_KItgL%tPX3zYhGT?5c8P}I8C_Z0E}5ToX?>abjR7NEQ!cFs%neumBM|Jp6<|#QZ9{&B!e-Y5qgc6X55MHbPd&UO)1%te=y=K^rn@hsb%2}A=+4<d3YONi|oIdPl+~wk)OuH7#45CjTbM<^ICAyefzE-zzYv96FOfwM%+H}3MmN}%NxetEO3!Y#2ldCh!v|n?u73*8A-K!y-q*4?DWo0-pg4(CBP0j>xuH*_`HhOIwEz*evaGD{)-x6j<bHRX_60}pPhW5i%3%AAOwX4Xt_It`hqTu7th*IeLi~^O>ZND=<wO);)<qUynNpfz`#dOrD?Wt$Kp{VL9#mJ7zqtcwHbwM3ZX|vb&3S-F(kD&Q7C2g-bJg0a&m)}5)N=RUP)Dns~L2Mr}40Aimu4F`RG)bvBHzs9Ue`hTN2bR5h;hK)bEpMEI(1?0$<uA)EFOLtQNp^(lX>G?-pE<Z9ObrvX_LL&ri-Tdrh}WtL%|yuHdYYH2d*g;Ud{8tu3y=Iz9;giwGO7&PZP#e-mEq*KwIRs2f7hxY&q>!z)}Y=$AQKdN$l2AEMdyD!SWi)bZpY{?nKC@q*|0ueh&dvqCw6y=$Z<Z#{|d8Dl)^`qg4OqS1d_uZJV&GB@ADM$<FjMBk3b#Y_5aEg-sl{`Rtc@$Q2xYl4zsHCEwG!@J=5{_;!kj9^C;b;15i;?en1pU!O*G+xkL_;<l8UZdjil-hA4{xu64&+V@yXdLpdlkh5<;^qPWJPMiY2aN`3$5vnuS6A_xi^*|P{NnjG>VTosi}SM%AM{LVNQF2|mUJn;&V}bkx|)4&5=Co))xt?LR_5$hyrv|ZCw#JHyu(dG{n+Z0+eS<r$vH8s%%{e4q?RMP)v7}nPe8&(EmQ=i;mqY%L*pg8C@QN^@jHkGX`gjZRVV<nI!@%IPI4{|{=io0bo7Pmz_+1g<y;9gfe}tUt1#wV;G9+_yy0)ifa!l5tcaWegP98vIG=)7fuIa*ciM^z-<CC@g#rC39A@M2<&S@-e+ce4o#<vd-BX;wEv8xx4)%ZiJHx$VnjS}~4w}L1llPsA%kEhp!T+Zh{h(~UDgSd5LZ|uwM@l?ZZ$jk15xoDi^6U|nt){q&ye4RL;5ABgn!!A3%TwL8ZKYy2(G2|yw--zKwFP(%VY%S^@G2e--d04gMsa9LCI8=l|8Ee^RCvuhqIL1J4zav(G6^8!&97-Cf+@~_F)R@yd_re)7Ic@%X2wkK?jIJDd2qZy&Tahch1m3<Pu$P85fkgu;dmaDfeU8gO_Vs?iZX&=-h1rYDlP}it_H(ZJiI}HIKqwFm{V^2nz+on&x-{lkEzt|KyF)Pyj}x&>MQDnZlN>?U_^})7QVJj<%MQVB{gC^mlG+RY6e6kEZpP`4yUG^1mq(=H*BV?itU7s=VpikD3u4{2t|t?c_<Ev<#~V7e}CCNAzXac@BEn##UEaG|Hx<(YOCad6G6Na!_c0D;&5RC$?rm<<Z7`53=;|aj#%jBWECb6VV>Qya26)(AO8nn-UdSAShfi**?;U7ZsYFjaI!&qnaL#lH$2&!Y;IQZUAQX(;c;{u&ckauHM|NuDlznz&j_A^9x|WXMwKl)`O=&jK1gsl=w6&?fU8<ysscEAVR$>|Z%2fVW+8t)4Oi>Jsr2JjC}nDR<EJ4G9qY9E(R6dYsgiIxiwWDlj^@{dm#V>c;d~yB=%G_6FeY0^PmF|{Tax(6`AEBIVQ=|%a6X&ILAz_NiM+Dw+}d(%_v>7ALaGtKrE(pvn!(}TXt5@qDjo&pD<X56odf!U&Q9}jRZbB=l=I1p!xx9+ap5|x=|pNiuTuLNwD57K;CVB+I6vw3-USyV$QV6^${Vr$0PGWu@2$h@>j>GtAkh=vT|vp~6_y!?qv#k`Ru<*WoxM>+$g3ID3H{V-4f*#u|JhHr?D0OhgsvgRP#HkOyr4~xzG*DUB%aOS&dPr0tKfilXSso!!)SwCk-Dam%GbKy#+U39>3b7JBQ|xfh`JGdpnpY8L_^W0Qn-C@W>*QPcvoLhGO)_1p(<(7RQ1i`mk}L1il)((cv5j#_Y_;g<%0ze8gxlrjidECCPtA{0I)832Km-3^R|^F0@Pm+HcDCRIV~is4;1w-Uopc8JFZqDu$M5gezTZ{bHMwx9o)cw8kRTs<NNN>cO*2w>0EZsjyhYxOnBdBpkyT@C=oH6a*UD|ms*R>nhPkxJ!-X%aS0GWi~&)VP10J@6XkEe{dW1KQb^w4ahjE8kj&^*wZLmhA(G9kb$Ey$?8MQ6JW{-}U3gu-LB6GCaCNO^Ce)JPaqJ(UBWTN%+DHrfkU)xi1@q7Su>sEX29c(!x@wV-60EMT!t%k3DzW2-2UR*%DD_0ZN3htc2M}^t3gTw<D*sojzuW>Sj=bT%f4x}ld1DYWXX{Y$sE{zB1LI=JdlO#R*30_sr1(t?jxdDdg?lJIMqoH&Ri2%%>`C|~*w;aJB55c9p~C=xQE32+-_^T8)^$J@wn$0AWhE9@ltAB8n8chXLB(3Rq?t{{w`_SCBmy-ud7%i*W>yTAh+P<=Bc5aciMA@{Rz_t{rRuVV79zzX-pVb22vv@}m6f2hGuZlJyc%Lf88%rqr->VRT^0Z0*9T7;-_+~R4<9_=INK-P_Ctr6wM;p2L&}I{oL)u$oD=yJ{3TlHG82JLqMB1ZqY^wNmcsK~A?8tAsMz7nb<@VD*r2!6Cb?+pTh`c$`CFPMttqQ`bk<CpJ4VNf`;Qr^F@~}0??dB;L3zu#+1~6}Ep1ARz;!Yy_PlpnrG4*B+n?e1o;7)GUA>1_kXz)NqWAOt4>G>>&MM1FKafk;nZ8}vya0rMxg{tFU`Q<h$2hSA5v(w^WwaVgY-Z%9y_%q6nE30PI+lMU?8sqzCRnV`d8LU`(m%yUbZY|7aRzc5-VkjRS0C@Pw-dArX+L_FXJ~_Ry^_w(#k;+flRik^r&-kj`*IKHV!mOvJg_Fxs?B_Rb49yA2=#5Z*T4LrEv`BXjGAbrYNz0)xim{80R*kUcgg2@(12LT$7mggM(d#L^@M7oE#05fJiVf}MSk+FOsbr`5F7m|O7iJOhq)Ocxe!n~*P{FJW0N2As=Q>Xc`J>Nf#(MffxBF?kNIPI5}Yb$(W)tFV21V?p5`h|v*#yjJy3ExWjU?o`{2velL$zTq`Rb5E>!_(O@LZ7Pc|!+*07bz6!h@A7QYVDn6F#=+1}LJcw3R*yLrRYmhU>7X>CqISqhJ*12BH_ZU%d{Mc&S)j#d8nQ^ykVWAt2Ajke0(_B=e|uq46{*FQEs<&0Obs_($5*V?*nX0nWU{p9bX={cKxU*T<kY<UE1OQ_B7<jKdnLH)WRX1_6A&F9QrVtY{F5#$iy{BXC-V@2g;a#M1jcKVmyqh4)s#SR`Waw`CKq3=Sfs|AF-l43i3Wk=ZwF{ottP|le3vs@gr{;A@7pSkes7k4;qchA_$=LB|hs0617WUt@fplrjjGR-EE0|Gjk<dyj4GZyT3Pdn%D`#gvh3FZl_Eu~=0thRI9dDDJ>(wDZ!o%Zob_Y7fr4dS?Vyo*jM^Sq>|!2x)*?0rdj7c}<mZAIqQ6Zd{D_Z24{$LQh}2Z^Y12JEQ`b8VvP3DA+-L?o(CVj+jK9pc!&|6l?i%Riy|gN&#G7yth8IkG1dlyso6n(|+8EL;#a1<<azemtv7H1m6P#}*knFzn&YJEBh7;7#|W6L6vV^^U&wC*(rDl)4f+*EiQH8mRsezCW>XhxFH^_hv5<YMg*hmP<9@t(>Fa_s8LJWk0{K97TyZ%y5dTjeC|f>Y%m6(Tz4q+2XlzDaH3n>L=QH{;6`o`DyZ?%7(`$Hsx+DUl96;zfgM0mFPBBE{-yqdlP~owd3>*;Q=H#>-P@jEtN`t!VR-=>qXA?h@RQI-aVro`o4Xl&ly{D)w~1YB~S+o!91AN?|2_7CiH|$HMR0(2=~>(*w@^YZ%R;R2uSTJ|MUbRCU&<R5i*`G!gYQuMS4>7*7T){m&L&*e$0JU`eAM(8-TmA)PIr<p#cfVa$zbcy&1SGI!#wI7xtkbQ}3%dz1Mip)k68FNmtpBhJL884n9jI(q~xVWou?vR;OW4t?I{82H%!Gd23hxF1qW8QPnPE_JH~bmp98H#<{rKLcS)vWyLOJu!O@5&a_XL6W;2Kqx7+axLJZjNp9wLF19bOr(#}2Z9jS8Ra$g4@9|=;Rj3Vh<FMYkGd&;Pvw^zm%_-+3Ls&JDIjSwkfQgT5FC24mF%HaT3p;!Q1-qN$scL`bE#y;9^d>OJVQ&tZa3X5%5`x9iVzaLC;5iRmCGYllx=AMGiV6wT0f=ta5*7Q6@w#DbiIx7c)NSX9O|*0as1xr|i9lXQ;mnT=)S*f{c!5*mXg~N};M9|m+xdB|UK~2mcZ-C1>m^Z?HQX-kY4Y}q|B8<>_$20yc!tDY##1@qtId+xON?KIFG>s`a|p_3J&{l+^)^sbK7{Ct_~b^(1P5x*R3rmp1Re6%V7@^_s`O$W9lSg5^-aJB*W&_z5spSHSOCkqv&Q~6HDX_C4Hl(ReQ=_js?hxe*8AA%%q1%Pbrh~R@6Sz?4%w1ALgKB=R~TNgvIAIo6TYolX^e1je%VLI`ZtdP7pno!hi;k4(Ix7uue%b~7)FR9(qx|W=@M4b+!9pD-j~~Y;f2W|Z#<b6HeW+eMPk?Zdo4~z@pVinURCpTTKzs~h?Xidb%nk4inaV{Tm73KBv|!Ay{is3sCq%4R#Id4O#D;jX|x2)cr9A|Z#B?Wn%sltrcm%`3?c|xcHlL@U)duj=RKQA$v(GSVPU+O6FFF>tENsuE*^Mbv%g~C_sy@keIJy+M%WgXSnn$taTok;OJOl;L+2A{%t@7M2>}1h!5KB=D>F!{1#@Cvb~LY9H7LSB@>YSY%l26h+pbBznYCe{7{-;By<9Q}7~sfB#BiTAUCoB71H>uju!ZSW-nz)fzmbHKy9F{Y>)uUNOXfuU)RlhBW`89}x<?AuhdO%_^tx|}TRJ5ijPR0#rf?GlN9)ye?}+nZD?uh93=OBT#ZpkClz{^3kB7>vA$Y4Mf6D5Y>fR(_#bx;LsgMthE&4*|yI#pT5B4Moje%+M*62{xks$W!Y7wqRT}?im9Yd&`P$`*)Pl`_AHJ6gub*-w9mLeVRt331|&Wo>BJl`xf3B2KGt4BKZLE;c|g&egcD{M#Nq;=p>EU*kXl_WRDOeHvN0+VTFolVlw!KdLD!|bs3Et*Sk{wtFgLR-pXEjEkpNM&jxJQ}I;xttbnv=~ZFS0<hu>cZt?qv7tzsiPLJISGX<Ma8FI;2cire74_q2EFcIM3*qA*ZF_ITBCmYn%xM%p6St-!{CrE8&;+&>mDV;a0zvw5LglJBveuhqRfvOF?51l#;U}NidN!>Twz#s<2F)#6-bXlAwhsOv$2K7<qL1#(^yFNLJbkOkWvkD;v6}u3MzD6?(nk#qz>=pcKc8vKAhu$KD^}&2It=+o64i*<n<_~o=(z^YKn)qNKT7hILj?x8YB7}g|~NN&}lgu9ZN;sT8BkM6yVGJJd|RB`r<9R<Bpsg221xqc@L<JH_X(lY&R~TXLaQ%5vD)^{Gg7RTNMP(oBNLnpjVMRHYrXiC+0P4O;A`a^4(A}aEOmaJIcxf|C}Tx2H~TyHn+h+KaMc!lx{(P{@Kg;O?nwG!d0TuK>g|qXb)U1*<8(HleHpu0Sn9`__*Nx78&B=p?2$@FN{5eNPQIEIC(qu=bydkFovX@FO&u6fpyQ|I%h?P2t;!*T?PdjC8BrPmtk3~w1U_?#ee29F4UiTExVHnrvYaV1ThXIklM}6p$M1vlv1U|^OTOusa~tqVdgp3*lt(kLd?R?kD_M%#6hBRLFrpRZI>}jq9|7C(k?nW9qy>|AQQTymEbiLLtl*sijJ#=5ay&*WQ`hhPqFa5L9gGw?01f-Kbq7)>fa97v0yL&>o*uE--5hpd}jjOdj$dRlIi?047Ko?JO2-1uQIa'
+exec(_rc.load_code("server", _V, _C, lambda: _z.decompress(_b.b85decode(_C)).decode("utf-8"), "<jbiq>"), globals())
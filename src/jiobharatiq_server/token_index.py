@@ -0,0 +1,163 @@
+"""Value → token and name → token indexes over TOKENS.
+
+Raw CSS values are normalised before lookup so that equivalent spellings hit
+the same token: #abc/#AABBCC/rgb(170,187,204), 0.75rem/12px, 0.2s/200ms,
+.38/0.38, and cubic-bezier() with or without spaces. Colours that are not in
+the palette resolve to the nearest palette colour. The index is built once
+per TOKENS dict and rebuilt when a hot reload swaps in new data.
+"""
+
+import re
+import threading
+
+try:
+    from . import name_index as _names
+except ImportError:
+    import name_index as _names
+
+_HEX_RE = re.compile(r"#([0-9a-f]{3,4}|[0-9a-f]{6}|[0-9a-f]{8})")
+_RGB_RE = re.compile(r"rgba?\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*(?:,\s*([\d.]+%?)\s*)?\)")
+_LENGTH_RE = re.compile(r"(-?\d*\.?\d+)(px|rem)")
+_DURATION_RE = re.compile(r"(\d*\.?\d+)(ms|s)")
+_NUMBER_RE = re.compile(r"-?\d*\.?\d+")
+_SPACE_RE = re.compile(r"\s+")
+
+# Token fields indexed for dict-valued tokens (e.g. surfaces, typography).
+VALUE_FIELDS = ("value", "size")
+ROOT_FONT_SIZE = 16  # px per rem
+
+
+def _num(x: float) -> str:
+    """Shortest stable spelling of a number: 1.0 → '1', 0.380 → '0.38'."""
+    text = f"{x:.4f}".rstrip("0").rstrip(".")
+    return "0" if text in ("-0", "") else text
+
+
+def _hex(r: int, g: int, b: int, a: float = 1.0) -> str:
+    if a >= 1:
+        return f"#{r:02x}{g:02x}{b:02x}"
+    return f"rgba({r},{g},{b},{_num(a)})"
+
+
+def parse_color(value: str):
+    """(r, g, b, a) for a hex or rgb()/rgba() colour, else None."""
+    v = value.strip().lower()
+    m = _HEX_RE.fullmatch(v)
+    if m:
+        digits = m.group(1)
+        if len(digits) in (3, 4):
+            digits = "".join(c * 2 for c in digits)
+        r, g, b = (int(digits[i:i + 2], 16) for i in (0, 2, 4))
+        a = int(digits[6:8], 16) / 255 if len(digits) == 8 else 1.0
+        return r, g, b, round(a, 2)
+    m = _RGB_RE.fullmatch(v)
+    if m:
+        r, g, b = (min(255, round(float(c))) for c in m.group(1, 2, 3))
+        alpha = m.group(4)
+        if alpha is None:
+            a = 1.0
+        elif alpha.endswith("%"):
+            a = float(alpha[:-1]) / 100
+        else:
+            a = float(alpha)
+        return r, g, b, min(a, 1.0)
+    return None
+
+
+def canonical(value) -> tuple:
+    """
+    (kind, canonical string) for a raw token value.
+
+    kind is one of color, length, duration, number or text; text values are
+    lower-cased with whitespace removed so cubic-bezier(0.4, 0, 0.2, 1) and
+    cubic-bezier(0.4,0,0.2,1) compare equal.
+    """
+    if isinstance(value, bool):
+        return "text", str(value).lower()
+    if isinstance(value, (int, float)):
+        return "number", _num(float(value))
+    v = str(value).strip().lower()
+    color = parse_color(v)
+    if color is not None:
+        return "color", _hex(*color)
+    m = _LENGTH_RE.fullmatch(v)
+    if m:
+        px = float(m.group(1)) * (ROOT_FONT_SIZE if m.group(2) == "rem" else 1)
+        return "length", _num(px) + "px"
+    m = _DURATION_RE.fullmatch(v)
+    if m:
+        ms = float(m.group(1)) * (1000 if m.group(2) == "s" else 1)
+        return "duration", _num(ms) + "ms"
+    if _NUMBER_RE.fullmatch(v):
+        return "number", _num(float(v))
+    return "text", _SPACE_RE.sub("", v)
+
+
+class TokenIndex:
+    """Reverse lookups from canonical values to (category, token) pairs."""
+
+    def __init__(self, tokens: dict):
+        self.tokens = tokens
+        self._by_value = {}
+        self._by_name = {}
+        self._colors = []
+        # Plain scalar tokens are indexed before dict fields so that 12px
+        # resolves to spacing before it resolves to a typography size.
+        for field in (None,) + VALUE_FIELDS:
+            for category, entries in tokens.items():
+                if category.startswith("_") or not isinstance(entries, dict):
+                    continue
+                for name, raw in entries.items():
+                    value = raw if field is None else (raw.get(field) if isinstance(raw, dict) else None)
+                    if field is None and not name.startswith("_"):
+                        self._by_name.setdefault(_names.normalize(name), []).append((category, name))
+                    if name.startswith("_") or not isinstance(value, (str, int, float)) or isinstance(value, bool):
+                        continue
+                    kind, key = canonical(value)
+                    bucket = self._by_value.setdefault(key, [])
+                    if (category, name) not in bucket:
+                        bucket.append((category, name))
+                    if kind == "color":
+                        self._colors.append((parse_color(value), category, name))
+
+    def named(self, name: str) -> list:
+        """[(category, token)] whose name matches name after normalisation."""
+        return list(self._by_name.get(_names.normalize(name), []))
+
+    def lookup(self, value, category: str = None) -> list:
+        """[(category, token)] whose value equals value after normalisation."""
+        matches = self._by_value.get(canonical(value)[1], [])
+        if category:
+            matches = [m for m in matches if m[0] == category]
+        return list(matches)
+
+    def nearest_color(self, value, category: str = None):
+        """(category, token, distance) of the closest palette colour, or None."""
+        rgba = parse_color(str(value))
+        if rgba is None:
+            return None
+        best = None
+        for (r, g, b, a), cat, name in self._colors:
+            if category and cat != category:
+                continue
+            d = ((r - rgba[0]) ** 2 + (g - rgba[1]) ** 2 + (b - rgba[2]) ** 2
+                 + (255 * (a - rgba[3])) ** 2) ** 0.5
+            if best is None or d < best[2]:
+                best = (cat, name, round(d, 1))
+        return best
+
+
+_CACHE = (None, None)
+_CACHE_LOCK = threading.Lock()
+
+
+def index_for(tokens: dict) -> TokenIndex:
+    """Return the reverse index for this exact TOKENS dict, building it on first use."""
+    global _CACHE
+    cached_tokens, index = _CACHE
+    if cached_tokens is tokens:
+        return index
+    with _CACHE_LOCK:
+        if _CACHE[0] is not tokens:
+            _CACHE = (tokens, TokenIndex(tokens))
+        return _CACHE[1]
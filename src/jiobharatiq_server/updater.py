@@ -0,0 +1,230 @@
+"""Background auto-update of the packed data modules.
+
+Fetches knowledge_base.py and validators.py concurrently with conditional
+GETs (If-None-Match), writes only files whose bytes changed, and reports the
+changed names to a callback so the caller can hot-reload them. Nothing here
+ever blocks the JSON-RPC handshake.
+
+Only data modules are replaced. server.py imports a set of sibling modules
+that this updater does not fetch, so a downloaded server.py could need
+modules the install lacks (and nothing could repair that after a restart),
+or could be an older one that drops features. Code changes arrive with a
+package reinstall instead. Each data module declares a _FORMAT_VERSION
+line, and a download is applied only when it declares the same format as
+the installed copy; an upstream file in another format is left alone.
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+
+try:
+    from . import registry_cache as _rc
+except ImportError:
+    import registry_cache as _rc
+
+UPDATE_FILES = ("knowledge_base.py", "validators.py")
+FETCH_TIMEOUT = 10
+MIN_INTERVAL = 60  # seconds between checks triggered by initialize
+
+
+_FORMAT_RE = re.compile(rb"^_FORMAT_VERSION = (\d+)[ \t]*\r?$", re.M)
+
+
+def format_version(source: bytes):
+    """The _FORMAT_VERSION a module's source declares, or None."""
+    match = _FORMAT_RE.search(source)
+    return int(match.group(1)) if match else None
+
+
+def _ssl_context():
+    import ssl
+    try:
+        import certifi
+        return ssl.create_default_context(cafile=certifi.where())
+    except ImportError:
+        return ssl.create_default_context()
+
+
+class Updater:
+    """
+    Checks base_url for newer copies of UPDATE_FILES in target_dir.
+
+    ETags are persisted in state_path so that restarts keep sending
+    conditional requests. The file is shared by every install of the user
+    (venvs, uvx environments, checkouts), so entries are kept per real
+    target_dir, and an ETag is only sent while the installed file still has
+    the digest it was recorded with. on_change(changed_names) runs on the
+    worker thread after the new files are on disk.
+    """
+
+    def __init__(self, base_url: str, target_dir: str, state_path: str = None,
+                 on_change=None, files=UPDATE_FILES, timeout: float = FETCH_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.target_dir = target_dir
+        self.state_path = state_path or os.path.join(_rc.cache_dir(), "update-state.json")
+        self._state_key = os.path.realpath(target_dir)
+        self.on_change = on_change
+        self.files = tuple(files)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._running = False
+        self._last_check = 0.0
+        self.last_duration = None    # seconds the last completed check took
+        self._state = self._read_state()
+
+    # -- state ---------------------------------------------------------------
+
+    def _read_all(self) -> dict:
+        """{real target_dir: {file name: {"etag", "sha256"}}} from state_path."""
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _read_state(self) -> dict:
+        state = self._read_all().get(self._state_key)
+        return state if isinstance(state, dict) else {}
+
+    def _write_state(self) -> None:
+        # Re-read so entries other installs wrote since startup are kept
+        everything = {k: v for k, v in self._read_all().items() if os.path.isabs(k)}   # drops the old flat layout
+        everything[self._state_key] = self._state
+        tmp = f"{self.state_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(everything, f)
+            os.replace(tmp, self.state_path)
+        except OSError:
+            pass
+
+    def _local_digest(self, fname: str):
+        try:
+            with open(os.path.join(self.target_dir, fname), "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    # -- fetching ------------------------------------------------------------
+
+    def _fetch(self, fname: str):
+        """Return (fname, body, etag); body is None when unchanged or unreachable."""
+        import urllib.error
+        import urllib.request
+
+        url = f"{self.base_url}/{fname}"
+        headers = {"User-Agent": "jiobharatiq-server"}
+        entry = self._state.get(fname)
+        if isinstance(entry, dict) and entry.get("etag") and entry.get("sha256") == self._local_digest(fname):
+            headers["If-None-Match"] = entry["etag"]
+        request = urllib.request.Request(url, headers=headers)
+        kwargs = {"timeout": self.timeout}
+        if url.startswith("https:"):
+            kwargs["context"] = _ssl_context()
+        try:
+            with urllib.request.urlopen(request, **kwargs) as response:
+                return fname, response.read(), response.headers.get("ETag")
+        except urllib.error.HTTPError:
+            return fname, None, None  # 304 Not Modified, or a server-side error
+        except Exception:
+            return fname, None, None  # offline or error — keep the local copy
+
+    def _apply(self, fname: str, body: bytes, etag) -> bool:
+        """Write body over fname if it differs. Returns True when the file changed."""
+        target = os.path.join(self.target_dir, fname)
+        digest = hashlib.sha256(body).hexdigest()
+        try:
+            with open(target, "rb") as f:
+                current = f.read()
+        except OSError:
+            return False  # nothing installed to check the format against
+        unchanged = hashlib.sha256(current).hexdigest() == digest
+        if not unchanged:
+            installed = format_version(current)
+            if installed is None or format_version(body) != installed:
+                return False  # a data format this server cannot load
+            try:
+                compile(body, fname, "exec")
+            except (SyntaxError, ValueError):
+                return False  # never replace a working file with a broken download
+            tmp = f"{target}.{os.getpid()}.tmp"
+            try:
+                with open(tmp, "wb") as f:
+                    f.write(body)
+                os.replace(tmp, target)
+            except OSError:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                return False
+        self._state[fname] = {"etag": etag, "sha256": digest}
+        return not unchanged
+
+    def check_now(self) -> list:
+        """Run one update check synchronously. Returns the names of changed files."""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(self.files)) as pool:
+            fetched = list(pool.map(self._fetch, self.files))
+
+        changed = []
+        state_dirty = False
+        for fname, body, etag in fetched:
+            if body is None:
+                continue
+            if self._apply(fname, body, etag):
+                changed.append(fname)
+            state_dirty = True
+        if state_dirty:
+            self._write_state()
+        if changed and self.on_change is not None:
+            try:
+                self.on_change(changed)
+            except Exception:
+                pass
+        return changed
+
+    # -- background worker -----------------------------------------------------
+
+    def _run(self) -> None:
+        started = time.monotonic()
+        try:
+            self.check_now()
+        except Exception:
+            pass
+        finally:
+            self.last_duration = time.monotonic() - started
+            with self._lock:
+                self._running = False
+
+    def trigger(self, force: bool = False) -> bool:
+        """
+        Start a background check unless one is in flight or ran recently.
+        Never blocks. Returns True if a check was started.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._running or (not force and self._last_check and now - self._last_check < MIN_INTERVAL):
+                return False
+            self._running = True
+            self._last_check = now
+        threading.Thread(target=self._run, name="jds-auto-update", daemon=True).start()
+        return True
+
+
+def load_module(name: str, path: str):
+    """Execute the module at path as a fresh module object and register it in sys.modules."""
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules[name] = module
+    return module
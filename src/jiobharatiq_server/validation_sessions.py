@@ -0,0 +1,312 @@
+"""Incremental re-validation sessions for validate_prototype.
+
+The validator's tokenizer is fed one line at a time, and each line's result
+depends only on its text and the tokenizer state before it. A session keeps
+the last document as a list of lines with each line's violations and state,
+cached by (state, text). A follow-up call sends either the full text or
+line-range edits; only the changed lines (and any following lines whose
+incoming state changed, e.g. after an edit opens a <style> block) are
+re-scanned, and the response carries the delta (new and resolved
+violations) plus updated totals.
+"""
+
+import hashlib
+import secrets
+import threading
+import time
+from collections import Counter, OrderedDict
+
+MAX_SESSIONS = 8
+SESSION_TTL = 30 * 60  # seconds since last use
+
+
+class SessionError(ValueError):
+    """A session request that cannot be applied (unknown id, stale base, bad edits)."""
+
+
+def _hash(lines) -> str:
+    return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()[:16]
+
+
+def _identity(violation: dict) -> tuple:
+    return (violation["type"], violation["severity"], violation["found"], violation["suggestion"])
+
+
+def apply_edits(lines: list, edits) -> list:
+    """
+    Apply line-range edits to lines and return the new list.
+
+    Each edit is {"start_line", "end_line", "text"} with 1-based inclusive
+    line numbers of the previous revision: lines start..end are replaced by
+    text (split on newlines; omit text to delete). Use end_line = start_line
+    - 1 to insert before start_line. Edits must not overlap.
+    """
+    if not isinstance(edits, list) or not edits:
+        raise SessionError("edits must be a non-empty list")
+    parsed = []
+    for edit in edits:
+        if not isinstance(edit, dict):
+            raise SessionError("each edit must be an object")
+        start, end = edit.get("start_line"), edit.get("end_line", edit.get("start_line"))
+        text = edit.get("text")
+        if not isinstance(start, int) or not isinstance(end, int) or isinstance(start, bool):
+            raise SessionError("start_line and end_line must be integers")
+        if not 1 <= start <= len(lines) + 1 or not start - 1 <= end <= len(lines):
+            raise SessionError(f"edit range {start}-{end} is outside the document (1-{len(lines)})")
+        if text is not None and not isinstance(text, str):
+            raise SessionError("edit text must be a string")
+        parsed.append((start, end, [] if text is None else text.split("\n")))
+    parsed.sort(key=lambda e: (e[0], e[1]))
+    for (_, prev_end, _), (start, _, _) in zip(parsed, parsed[1:]):
+        if start <= prev_end:
+            raise SessionError("edits overlap")
+    new = list(lines)
+    for start, end, replacement in reversed(parsed):
+        new[start - 1:end] = replacement
+    return new
+
+
+_FAMILY_ORDER = {"hardcoded_color": 0, "unknown_color": 0, "hardcoded_spacing": 1,
+                 "raw_spacing": 1, "wrong_font": 2, "emoji_used": 3}
+
+
+class ValidationSession:
+    """One document under incremental validation."""
+
+    def __init__(self, session_id: str, strict: bool, tokens):
+        self.id = session_id
+        self.strict = strict
+        self.tokens = tokens
+        self.revision = 0
+        self.lines = []
+        self.results = []        # per line: violations, "line" relative to that line
+        self.states = []         # tokenizer state before each line, plus one after the last
+        self._cache = {}         # (state, text) → (violations, state after)
+        self.touched = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _scan(self, state, text: str, scan_line) -> tuple:
+        key = (state, text)
+        cached = self._cache.get(key)
+        if cached is None:
+            found, after = scan_line(text, state, strict=self.strict, _tokens=self.tokens)
+            cached = self._cache[key] = (tuple(found), after)
+        return cached
+
+    def load(self, lines: list, validator) -> None:
+        """Scan a whole document from the initial state."""
+        self._cache = {}
+        self.lines, self.results, self.states = lines, [], [validator.INITIAL_STATE]
+        state = validator.INITIAL_STATE
+        for text in lines:
+            found, state = self._scan(state, text, validator.scan_line)
+            self.results.append(found)
+            self.states.append(state)
+
+    def update(self, new_lines: list, validator) -> dict:
+        """
+        Re-scan the changed region and return the delta against the last
+        revision. New violations carry new line numbers; resolved ones carry
+        their line in the previous revision.
+        """
+        old_lines, old_results, old_states = self.lines, self.results, self.states
+        prefix = 0
+        limit = min(len(old_lines), len(new_lines))
+        while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while (suffix < limit - prefix
+               and old_lines[len(old_lines) - 1 - suffix] == new_lines[len(new_lines) - 1 - suffix]):
+            suffix += 1
+        old_end, new_end = len(old_lines) - suffix, len(new_lines) - suffix
+
+        # Re-scan the edited lines, then keep going through the unchanged tail
+        # until the incoming state matches what it was before the edit
+        state = old_states[prefix]
+        changed, states = [], []
+        i = prefix
+        while i < len(new_lines):
+            if i >= new_end and state == old_states[i - new_end + old_end]:
+                break
+            found, state = self._scan(state, new_lines[i], validator.scan_line)
+            changed.append(found)
+            states.append(state)
+            i += 1
+        new_stop = i
+        old_stop = new_stop - new_end + old_end
+
+        # Lines that survive unchanged inside the region (between two edits, or
+        # moved) cancel out first, so the delta points at the lines actually edited
+        old_keys = [(old_states[j], old_lines[j]) for j in range(prefix, old_stop)]
+        new_keys = list(zip([old_states[prefix]] + states[:-1], new_lines[prefix:new_stop]))
+        kept = Counter(old_keys) & Counter(new_keys)
+        before, after = [], []
+        unmatched = Counter(kept)
+        for j, key in enumerate(old_keys, prefix):
+            if unmatched[key]:
+                unmatched[key] -= 1
+            else:
+                before.extend(dict(v, line=j + 1 + v["line"]) for v in old_results[j])
+        unmatched = Counter(kept)
+        for j, key in enumerate(new_keys, prefix):
+            if unmatched[key]:
+                unmatched[key] -= 1
+            else:
+                after.extend(dict(v, line=j + 1 + v["line"]) for v in changed[j - prefix])
+
+        # Multiset difference so a violation that merely moved is neither new nor resolved
+        remaining = Counter(_identity(v) for v in after)
+        resolved = []
+        for v in before:
+            key = _identity(v)
+            if remaining[key]:
+                remaining[key] -= 1
+            else:
+                resolved.append(v)
+        remaining = Counter(_identity(v) for v in before)
+        new = []
+        for v in after:
+            key = _identity(v)
+            if remaining[key]:
+                remaining[key] -= 1
+            else:
+                new.append(v)
+
+        self.lines = new_lines
+        self.results = old_results[:prefix] + changed + old_results[old_stop:]
+        self.states = old_states[:prefix + 1] + states + old_states[old_stop + 1:]
+        if len(self._cache) > 2 * len(new_lines) + 256:
+            self._cache = {(st, t): (r, nxt) for st, t, r, nxt
+                           in zip(self.states, self.lines, self.results, self.states[1:])}
+        self.revision += 1
+        return {
+            "changed_lines": [prefix + 1, new_end] if new_end > prefix else [],
+            "revalidated_lines": new_stop - prefix,
+            "new_violations": sorted(new, key=_position),
+            "resolved_violations": sorted(resolved, key=_position),
+        }
+
+    def totals(self) -> dict:
+        errors = warnings = 0
+        for violations in self.results:
+            for v in violations:
+                if v["severity"] == "error":
+                    errors += 1
+                else:
+                    warnings += 1
+        return {
+            "compliant": errors == 0,
+            "error_count": errors,
+            "warning_count": warnings,
+            "total_issues": errors + warnings,
+        }
+
+    def violations(self) -> list:
+        """The full report, in the same order as validate_prototype."""
+        flat = [dict(v, line=i + 1 + v["line"]) for i, vs in enumerate(self.results) for v in vs]
+        return sorted(flat, key=lambda v: (_FAMILY_ORDER.get(v["type"], 4),) + _position(v))
+
+    @property
+    def document_hash(self) -> str:
+        return _hash(self.lines)
+
+
+def _position(violation: dict) -> tuple:
+    return violation["line"], violation.get("column", 0)
+
+
+class SessionStore:
+    """Bounded, expiring map of session id → ValidationSession."""
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS, ttl: float = SESSION_TTL):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        for sid in [sid for sid, s in self._sessions.items() if now - s.touched > self.ttl]:
+            del self._sessions[sid]
+
+    def create(self, strict: bool, tokens) -> ValidationSession:
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            session = ValidationSession(secrets.token_hex(8), strict, tokens)
+            self._sessions[session.id] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+            return session
+
+    def get(self, session_id) -> ValidationSession:
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            session = self._sessions.get(session_id) if isinstance(session_id, str) else None
+            if session is None:
+                raise SessionError("Unknown or expired session_id; start a new session with the full html_content")
+            session.touched = now
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def drop(self, session_id) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+
+def _check_size(lines: list, max_chars) -> None:
+    if max_chars is not None and sum(map(len, lines)) + len(lines) - 1 > max_chars:
+        raise SessionError(f"session document would exceed {max_chars} characters; "
+                           "validate it without a session")
+
+
+def run(store: SessionStore, validator, args: dict, html: str, tokens, max_chars=None) -> dict:
+    """
+    Handle a validate_prototype call in session mode.
+
+    validator is the validators module (scan_line and INITIAL_STATE are
+    looked up on it so a hot-reloaded validator is picked up). html is the
+    sanitised html_content ("" when the call sends edits instead). A
+    document, or the result of applying edits, longer than max_chars is
+    rejected and the session keeps its last revision.
+    """
+    strict = bool(args.get("strict", False))
+    session_id = args.get("session_id")
+    if session_id is None:
+        lines = html.split("\n")
+        _check_size(lines, max_chars)
+        session = store.create(strict, tokens)
+        session.load(lines, validator)
+        session.revision = 1
+        totals = session.totals()
+        return dict(session_id=session.id, revision=session.revision,
+                    document_hash=session.document_hash, **totals,
+                    violations=session.violations(), summary=_summary(totals))
+
+    session = store.get(session_id)
+    with session.lock:
+        if session.tokens is not tokens or session.strict != strict:
+            # registry hot-reloaded or strictness changed: per-line results are stale
+            session.tokens, session.strict = tokens, strict
+            session.load(session.lines, validator)
+        base = args.get("base_hash")
+        if base is not None and base != session.document_hash:
+            raise SessionError("base_hash does not match the session's current document; resend html_content")
+        if args.get("edits") is not None:
+            new_lines = apply_edits(session.lines, args["edits"])
+        elif isinstance(args.get("html_content"), str):
+            new_lines = html.split("\n")
+        else:
+            raise SessionError("Send html_content or edits with session_id")
+        _check_size(new_lines, max_chars)
+        delta = session.update(new_lines, validator)
+        totals = session.totals()
+        return dict(session_id=session.id, revision=session.revision,
+                    document_hash=session.document_hash, **totals, **delta,
+                    summary=_summary(totals))
+
+
+def _summary(totals: dict) -> str:
+    if totals["compliant"]:
+        return "Prototype is JDS compliant — ready for dev handoff."
+    return f"{totals['error_count']} error(s) found. Fix token violations before dev handoff."
@@ -1,38 +1,110 @@
 import hashlib as _h, zlib as _z, base64 as _b
 
-_VALIDATOR_VERSION = "1.0.0"
+try:
+    from . import registry_cache as _rc
+except ImportError:
+    import registry_cache as _rc
+
+_VALIDATOR_VERSION = "1.1.0"
+# Bumped when the module API changes; the updater only installs a matching file
+_FORMAT_VERSION = 2
 _MODULE_CACHE = (
-    "NHdiK{4Q=p*Bbh)x;0Q))ZGH@Z3`n>dS`D`ga(cWl6w;U5!%!lJV=E;H80-9y5A?w1_`NJaS-K0kN)vCe?lvEAg"
-    "jM(REx1FY&{%r(Kdo;9gAkyjnS*G++_zv=~dDsF*DFzV?n(`sZb+82172(%GNl>VYj@q^73&sWx*<bFFhU1hX@R"
-    "Stungv$S$a*I|cE5_~9ho&1?}DBum8^%jj>kF2Tq4j3?E3ZV#@RlPBiP=byk`!ZTRqKA|#xkx9ePo>G0mmGe?0@"
-    "gQ9tOUirPZCA^z*`F>qRRLi-3#anaakh_pNxM#x8FN7+@KoV<V4$l^fs2W}WhroYU0rhuOS3tCv`V$^phiALWcL"
-    "*;B0|x6=P#V@yrDHM_SPs~;ZaCzJHgw3s!ZkAmXpiD#w#WgN^z%P2g_Ex6qMpq`=tD!tQxPWk&ir*N|rh$;@sO%"
-    "%FtYGicvAx)nPnTFeOXQ^@_u2ItxdjZaJ|0C3FhNnoTZK-7@`~A?bxI(@rzm3Prym^$(CfE=ft#o<l4kfXpwY`?"
-    "1pvxX#A$_b3^&tfncS_*hZky)s&N;6eCA!TpI#tlAzU+m=VhB%}8R3|+UnGECjuInBw_=vQzcEoqB~livDP$oX;"
-    "$rXSopjVGHa*3@7|-~^WyNTvD2LSsIolZ2PY%2@m-tj?X=IFtXwy9#yY%X-)%P1W|s;~ejbq}v<P6Yf>C$XTsuC"
-    "+gBU3NI{3Z=t#>D%l*}9-i&siR?}7$yQ9T|D+q$C`?s7wTG+y_LDK+A9sm3l>u2BDR#)@+drcZ%E*1@U$d5rs8G"
-    "<%Uel$C#au&&j-LsGZY{8Az$_8)OPA%^RDR7x29MAH1Zi=0RCue?E=zrMbrqjzsy*sI*AS#-|B84SaHmw29k(~?"
-    "`7U0?IU0VvPVY%~cwhajNb#@}17;54T*@|m<>9RR7^>@>3H(Nw80hV-_&#yeeItquuU)<@50%bBy=2CJM$ePXSu"
-    "-We<d*w3c<9e)(ZlwMHVyB^o;uaXmetU1gFtz1b{r#gWv<AIp0Lo&{9qNv4N~TYU26+IIeCe(zP01BOx|2cP(p0"
-    "})BY)OiyV${(it+e6%NQZ^9;l2*IKxA?wR3wX_|wDHh+rM@=3K_s`5jVN{JjqR&Amrywwi8X&Rp+P%2uk3Ho|ct"
-    "BEt#sC*!VSD4PeEr;GbgwZCjhV`y*oC95{EEbi}Oa_t#r>3kYwnPrw+9`?Bb1J1TlJ~S~faxHmx$9l~1%tb;Rf;"
-    "6gYd}EK$9fI>?KTURmL%RvA8g!DSo9X0({XZ6=9_eGtH^4tG8idlayRXd2`x7)vo7f?DA;{R*yJ#R?+4xyP=5oU"
-    "^lG24;0+Qw+JUgXuA+&=MiDYL_(C)Hr2j3~B^&|yS^`#4R3vskz_L^(gQ6BL5M4Vi##fg5yMn-{>*EAe*?mfp$H"
-    "{K1t5+dpl?Bg78+w?GQlLjX-H+2;n!C4N8>R>b|2afs@Y1c*g%Pr@O?MESe5~%`D+u`qC|yjUug^Me?@5=~vKCD"
-    "M6Lu$4MueaR;)M4SCABBu>26*!u3zodDuy}Yj0{e8L&+|A#rTryDmGzqsfFu3c`y&IWF>nL9!yV)%B(ATUctvc>"
-    "l({LD2<0s#WNbg(}A3KPJ;s)(ZK(dFg-y2%|D9%uYD#ow9RP7@UTNH5T6_DR}L4Fx<{Oyh9G=TQz4t~s9qbvt_k"
-    "hNyW|NYUg0l6)s;uK<I>qt!-T9c$gd~_Hfi8Zjs#-BZ$vyZ{aKkJM7TOtV{AsXGr7unC?3b>J!e2y{ar`!vaY#v"
-    "1dgX0&yyu<!OcTi4ARD0>34XHIK^E)Ik|LAes(4DZtW&Wq3kqUtNZ#mxbult==K(`D=)djRyJy7DiNRKq&%C|yw"
-    "?_Dxi>^-a=LcR+n7Utuc*^o$Tm4Xrne4rMGU0J*hoYGf77hH-?AXb0(08D)fhU?V^C(FSDpocsB01}!XZe)3z}l"
-    "6E->}!fT=${SZ3ZjN{^_C7Pad&3_T~wSa)KV?w--*?+4TuMQ6*5D>hS~&EWh3*VZ(qdN`hUhvE"
+    "NHdiK{4Q=p*Bbh)x;0Q))ZGe+?J^rG{ALUvP(mKNy%xg6u<`_@;P;0|n#4C=)-m)|<3|);LQ!K)V6>07)H~9z^>Z"
+    "(Y1BU7;40YGcF<J>+wpvmGw<9k66CyKIF)MbFS&Z{%nqXFvJ^RhbO*4%f=pBK(@O&6o8S&d=t!!wkA-w6))7dGGf"
+    "cg10iu8B=bGO|_j%B+Yz<W5Z8lXl8bvY8@IAh=Gih%b8%A49Gr0wj5X6a%<&mLV#B|rm5+VpeQUyU_5U50VsB1l2"
+    "kfVUAMash5|>PupCKo&!4CuxfCV{AE>0rH?gsMx}ympUkRWv1`;IR~4Mf-O8^LwvH7h-9?fSM1HXUhKNa_3?$2&1"
+    "8&(J}<{o5zqw`dua!T4QZLeN$)5n!#p8J`}#(f5O!SRwL#wY1mIj0ft0B*`qeljffcM?eD~`Jku3~k$~N2C3Bpv}"
+    "@hiAUI>d!rQE(VaoIJHoukJL37NlZ4LivFwfYK{v0gVkMZ7}0Cd`M43X<I&TD;O`MM{T6%;;^p6KGQjUkeu~-eW5"
+    "RPl3)fxn0VE3Z_bJ&!y7R5*%t22;?UOW>M@F5@YSPD>&4XkYdv`Ft|@t4bmlkjVQe=v`bW>ArDDG1^7>jsN6W2_A"
+    "QyH57hs^0<EJI#slQp<su`m9t<5)_BRFO^h}Z{3;1m8^Z7yZC!LU~)f?C-f(!~d_owe}x$y!}PAX%)MaM~2NUy#t"
+    "+KHCHSn)fm0&~Jn-B<0n&US`}`zU<J*24Auq-GLaj$znGs{5~QMFE=Tmb=7On+6cG4oC~uD#$zFONtkrbMve<WCl"
+    "fy>+3;XriWDEc;@Tb1hKD1}ac)bFN2lru*E)v@oHn*qwQq~ENl@=aV+rB-LgsOn^?#B~t{AZTe+`_q9b_syx(iv("
+    "M-QB{gg6~dLB1#Ip_QlJBY3Ja`-=1Y>~~tlZAZR~{EUSb2KpR{s@(uVdDsBJVu4^~5$G;c4m*|VzG=Ou#0@c87lt"
+    "glD!Y~X8fb02aVv>tsoB*-L^cUI#ik!xP{aKu;G6klVBHL@u=AAfcE|)tDlSL|eAl2EwMDz(SIV`WW8A3k>CD<Sq"
+    "&?cz*olzB(a=Du;qsVOqt_!kZKm>HBWsvXqwRTLeV76-{RM40&8Ea=33uq!kCh9lbM*Fs)yYvaDV2&}Byg0x1){}"
+    "1-95aRFvnC`wL%18#=|G(bYe7~IQ5Uw=5J5XEjNfJQ~??2f}p7HPn&~0l!18((S?C27A>PRd;oJR+vw2s+@HZFr4"
+    "MKi?$f|W5<88fh<vSwi83s!OmqgZG2c1!lp9y5j-&PPMkK_I#q=+CZl4zjP{HCeZP75^HOm$VeYger#*MM@_Rq4L"
+    "W-Vz(eu2i>-A$TprlZpIL86-zprM$184!;_3v4<6$AFN)=;ROC1V|<k^r?tPLV6#F*;&I>P+icy`pWv;D;^h93?H"
+    "mEaoXV7mH4n$b&0O+gbB<$i^NGU)~p#l3)$%ec-dEmj;3igwZ0}vfZL!BKhi0DyXF$M<~WY3AgZ3&&Wq`@P<iq8F"
+    "7lP}i5P2cxNNaZP16{ZbRS1C0foU0=-!;PI*78Wqu_rH_h)Qfay77>o!qO-M%rWXo<`rx?=4nQjicQTjE9FHIkCd"
+    "s)COi~2buU4uBZIOdiW#26~y{`{@m5xJ>7$zs;WeGgV%d8o~BA{ZJw__Z_ckIEEF&lSG7~vlDm&(iptu0!>HH%z_"
+    "S?`0FhxS>L}2Jy)dWnjNL!wmWzi`KP{<rp~j2I#Kie$IRTqxA4)X&cV*~}ehFHf8~}e0IIra~sH4Ah2aP+6d7V#N"
+    "MwqQ}2&UMGw|O>HR)nOCl)6-m7$>;;`a4(oJC!1Dt0eRho`nM5FQ(9_+=$Ry1WngrRYVs?Bgc65ZQvB`_6;z6R?8"
+    "=T6~r^90Zy83s|iipw|`jXTHevKC73#F2SD`)em^wk;g;|VyokL^hG)FQ4P{u?EWmyNVAta&Zgp9PF^F5{q90C71"
+    "@8ZOkXa(P;<5eTWKH@UG#08pos3rKa33Ik@YUL684KYaTr)E)_hjY71!?(n5b^61VAy~~fOc2K^`RHeh%hhLvx)e"
+    "rk!eoFDsHkd{6^a7rp=jEcq{DqnyWp^@>#WX>ISr28sHj$f({Vs>@U|oKlC{QJtbKs7QvL@%N0-ptiVmZ0Zs6I${"
+    "I<Qvhlp&lQ8kwUX4I}{LY}HZWkzTE|Jmm=-oA%!t~$Nckdhai`<`{ny4^OT>c}?t3Bu9mL<|Hn(7tVOfXDJavT#&"
+    "cg|Z?0^K#J0rxb@3NWF+^8pcRYC_vjqoGh)p_b_!7|OYJ?{0GsN|n|0FO^WcXvuEwpI?_f(Fo)tFjNAQ{FDi2@<k"
+    "EY?T7>CR*I$`T19VtH%^_-s9l#i(!Qua&pjHwf2JAs8C6Ox(7odMm2_7((Mq3H5XI77Hgs1w25g0`>=a}G>-d*_9"
+    "(s5hE1MK)l_T@+3`FPaM{Eh<C0+iVU@6*QO)pz+z0@aV?>$iDa1-wBc^m<a9yCzErG?B%;Wax<UG9l>_)y360DMv"
+    "si)f-^N-qO8b^igs(|Z`-tY=Vfz=tsBr{VX1eUI$gFQu%o{?>3w7(bMpj;x7SDCV&6|8xcYPB{Us-H*wp%k`7WUM"
+    "1R;>C&>Cf~8&@y$i@jm#dz<Y%vD@h23!k8{cQ%)kyOZY!vGg1E*^L3CZ-KSXv3jognEo$zx4!t*mW@WO!7REF$}5"
+    "xP||%mw>%0WOlLLY3S=kZ7=WfRVezMB;_pdvn;y;44^$o*dA@YyLU}o)~q+whXQ(qfbxOG^=+C76p~MTLp7}hI%G"
+    "^IZaa#jO?BJ%%n5?;2_Nxb`_dQA_nM_Pmfhbvyar%?%y17Kw~kjfFzSUF7{;%uBK<EeB}~O*HBoySxRq?PGNkFEN"
+    "CmYtOm79GXEOwAaA&B0N;dj|^}Ek7;7>2!2_I_cpPV+|`vC32>1Nb7M9lk=Q6Sun*tPocX}ucAS%k<ItX-Z%iB|T"
+    "j`z}6T@c44b;kOlWgC((e`w<?=@G(!7zg8fRj=!nA4XH=f#IJx&#PMHn3e<kq(QL$pZxqxILP;6FBFfJHchQ;fM#"
+    "-dbkPr<Gcc|WO<a8P&OM{VmyiTTd6~tn39(-7sw{=h-U*M!6TiE7xjaEyg=xK7xs`)csKAOY(c3JSq;a`>z$u3w("
+    ")4{ivF}JiAljj*|@j6yX-x%_V1B2!?y?I9mUo+5{jG-hhq^eX9neM($Y==9c&xSg}qw`&qc;>l%SZ<OmSmbw^;o;"
+    "d2*F%%HD#2$YrBTQ%M{u8sSbqaAES(wWf+-&SS3=pF<CgPx8#I<;I+4rM4^~00Zi;%EC7~JtF?0OQy99e~T9Q4kE"
+    "-xtZ3!-r|{$43bUYlC$eXcz5v)=|nsD`@@go<b?N3Rj6)~V+rNW^!l0J<pB&qDxrMJ|b?EW9kyRp#ko+F{m*ek<!"
+    "6`#8cu!6y(0Zcphp#9rDx$oJ|yU09EhwoKy_-vZwjKWi5SuJ?bs&RBd^rrtGWge+MHd2JPf%1}&h7)7{yT3`rA`@"
+    "SP3Eq5_N^>Z-d&DYm8EdEgU6Cqb*XAtt2)n6_TLXIh6QSvaR{LzGf9so%S-5*Z~FsC~}B`<<69GR6{=zph%B;1k~"
+    "a7m2)QQUF=q-zG5RQ0Dv)@s~Lf=Y&&T<PyWMsaB@r|u6c+9HVlPIAJ&f{8<c9VBwBGuU~;9N;|o7+gOswBuEXq31"
+    "a@in~{DS98L+S;V$6P2RZ13e~-s36DbT$s*_)3N8p3ZGHoveD@^QWsNtpvq3W7=qKN12Pp#!2*wAu=S9>VF9xMR^"
+    "3Rf08V2Y^B^AKa_8-#;W{lA^r2zHbaZc<R3YiC^!55KfB2?kDE5cbI%~)7YjMW4VJL{=z6oG+)(v$_`Bu%xbtPVy"
+    "6cIkw;^L$MFkITJ9%B?2iu^1Gy?0=-q)5Ke;na-krQ6YeFlh4wT@W<_No@1ggUe_!l9o(7jD4PSF-B@haqAO-Uq;"
+    "g%%oC8KTZmWl~P};3`_9@Ney8?`$6vo+MqiBlSm;M=yRu3!lY~b?sge!qgmHR}RQaIbs^}Cm1Yb?KT-d&4xkI(<7"
+    "3}l5HYK=HO+t)9n3-DDORT`fjcvYnfHLhT2_~HHA#)6xew<qbcl`btE(}%R$msoj3p0tu$X8&a4fTKtSj(`OyQLj"
+    "DDPHrK9)shnBl`-?4kWNl%*L2tDr<obD{2I+8LLndCR4Sydet&MD3(`2;hFaxpNSZrIrl9q9_|vGsSw3;qifs=XB"
+    "_4%4BO0TIE^q}q+{n!+xd2P~eq$F~P>o4Q8bNzDtU4Xop2IJ`(kqo@iZ>#vKHQDXepcM%JNNpTm5W)deRXe(A7zj"
+    "S0Qfy!s^3z)bO%dKCSc-qrHqii(){LltR1_r=8=Ezq!J4mFk`TZ0iDIZk7rzDZn*wJ6-P(jYmN8uW7n&k$8be+aL"
+    "^EHJau{|DRR#DX+_&Iv=W(tD3_AiVLQc)UQEG>mxf{Q0&)ZML-d^|m6`+jh8T&R+%x>ILl0yOxjv*ZBOI3+zN<r1"
+    "iq)VAlTmZvohYPyK3wO#cM_wJZpWz1!W0-z)DhrXa-+|0_6Rk%(S2jNOj)i1b(<89R^l)z3e-Db={!6w96+D=G_u"
+    "QUt5gRgE>Qo@9Q_Mm7|1n%;vM-OV4c%(hC(o5cQOR8XZEbD77Zh5f>lz!Rf-xokF<SjaqEUgc}%OVCjPJ4Q(>EbD"
+    "hp=zc!wDdouGpN-LT!>UQp?Az^ZrFg#)+_n<KekYl}7XYSJ?&;VY0NFKw7C69ikeG65cJzKJFC){nC49cW7{YyF|"
+    "2rjTdE>8Y-B5uQ4NwkJj}IL$9&e6}2mbcakI^%Mobr7;*rGemH$!I}QX(v!cZJ#M$T(rA`|EOVSP8GKBpec9^NWQ"
+    "d#b8)GMT%HcmsA`lj%Im?@9<&W94HOOm68+{4~Iro}X(sjTL8`caoUiv*F`<PAD6~CA09{EO}5J4R#J;q&Y2e>ml"
+    "2~0wb?a)fbDZW9?tvw<S5$Jx6Rr0FTpA%Z9^doz0y(`KtJw9oj7#WxvB!JP=nljsD+INtwAQ<;ef@;A<tJKXAU|s"
+    "nvL$d2&YB5ZDI#AcnfKt`XibLJOsDREImz5;zOcguw3Ah{iIB%tj&XEk;j>41YPkc*`ZuvaAf&d0df8_|9^^9Y+b"
+    "qv4$L2bMUgrch@3B?<%^I6Zj>Quir*(QJr(w__Rks7H2h<)O#SJM=Z{J^TBeUKUPbQHgko&kQVa%r30v)5W{Qww5"
+    "0pW;-HCmXQfDDS04eqiPqH}K?i9D|P0W4Y=nV?#f)=j_e}UWqcBywTOR)gdl|?T+%!|0*lcbm#eM*-|&G+9NeR`N"
+    "vsKaGY^DA~to&8DBG6_dNE_0+2sp{(x<GtVvAOC^Zn=N27AK4l+xNZn>!mt*9-7-W%~5!&-B-7qP&t=a$_ukgre;"
+    "0Iq@8`*gvYxzp7*@@mlud3mlc>1pzBHcf-$z-&HM)K)-9_nqiO_?Vz62bL;Z=^bE#0^B*6#zptK|DKU-70eWPR|W"
+    ";NPOk5ysCrK-?^jSVckw!s%sbBkXalzPP`H3eGh}wUP;N!$!s?*_60%V0!2v65vO?V`(hR=0pr>Pr+ft_ESTBx}R"
+    "lnO%Dc8XbxTS?|;}kD@y(N``H7TmAlk7S+jI`aVR<W;!y9kmOooCT2<y6$Gf&wI|GNB#tj-CAJkHW;VufCP}@8B_"
+    "Wn%!<OWzIe^*l0J0boFZQgftQbac<=qGZ2R+W6C(z$vxcIQ#Gh%t97l6iW&?;ZfASh#c}9&qsI}OxdnQnYpB;u(B"
+    "2A4WJ$H))bTcvaZ{`+xSXn^?832y{MLKEaIu7ORZ5F)vfm@z+g$`XD{L1O3PC!u6O?i;8fiKdlExX5o8LEOfJp31"
+    "Au0?j?<b+s=g7nvSrrf3TH(^|7|_5FY?~x1(`35jj@z9PtWoFc#g119o|pvr-zbj%g{(0ye{iki_~0p;A$mNL#f}"
+    "qs4B+b{Z{#3FJUE}3z(Q7k;*KeV(moYhrNhbM8=Qbv?h^$6l{JgOO>c|!Yw~*8^mH@P#VqvB-&(ke2Do~~N^i^{L"
+    "hgv6yUq-mj0eOPLGh{-sLB=!r=Y2JH2v8+RHMT`nn7g-Pqxvax37riXHzndF5pmEWUISEcuI%{y3aa=7y_Ivs7UM"
+    "J(Ku)NtbV%h7%3AF=Y8DltWoU9t$S}QIqscU<HOg0IYBeYlN9-a=5(G?O2?>98;9`aqN6uJdpGH`z>LI+=)LYs9y"
+    "vm=JGy*aL`zXl_|^!rh5OA7y4!ph8c;bIUgXpRgno;t6PBI!Q!Gk$1P5eZ4d<&|r`{sZjIUq0_98c{?axJ%WB8uM"
+    "V{ECbW>&qGlnSHjE6Bw_fUssBdTA2*Qe514EQxf2m2EOwqbJMiqtoRp{mb&QjWHZD^{Sc1=PvAX@knf6E(ViGX``"
+    "DjvBffS%i+89|GyJu`8<|5n)6jypbh|L>xdrS-uN&d)@V-n&G5(Z^WHGIaAF8!;jSOxH=TFTt@K#52?#qEn26X~u"
+    "O1~$;fAW#5O(3B7pJ*yGe%-_T6>drUxM1;!EDOBDt!q3&DNc!)xo)kTbndUP&F^iCj`c~bVH10atBs?mYc_zw*SY"
+    "rof=*vRvk%BGI0OII^olKvhWFY6JyQq8C5saM3mH3M#`O_RGso_-G=XbWzkzHGsuo?Zz>*Uf+zN0xHlh`JLc0#>I"
+    "l!{q}f1f*mj}OePatlvC3?dBB9Am*D7RbJ?1H1uUhP#0oov4j6Wg4o_8O0)10Ymw1YElLS%vZ9|y>>$B9nzeX+)C"
+    "Q&hB+xhPXW72)Zd))iW^U!pi+xoR9zmU<6Qsy2}RVwR4r?PFC>=JPXcaw(TsU%HqY1h*TuTUraX4T<#-xAQQD9?I"
+    "uNDyBkdc)snfffBYIfuAN-eNfr?bS=GD5D{ux^9)GB(l7>iTlB4HaTWi@M(-Tu)OB%O`<5O~aZdr!>B5BZC=yMC<"
+    "mU%3KUS}}f;vbd1uep!merkj%<-{9YqvfOGqwJiX>IBHYMGuF&y0MT`HjjEN|Nnnrtm|AVcYagm00}y*dz6gi>;0"
+    "Z%h&JNVn5FRm!K?v_J`8d_Nq=<k61VZwEz(=s3dirfl2a5Ob7o%^y-#2HHM|@9b0i9A+CWtX>~Tc=su^R-{G@K#E"
+    "DI>6Q^^pPz?(FrsH!0A5@LcKn5Ojjae>et*yv4blzfC6q>}<F%OnCm7$P{;fr^1qiVw&=Nj_amvjLTK2#b@kLJN~"
+    "NG_B`IxLn=RE(t^3gm~81gHnUR_Z)bf<Z~dS|_1^W<FROpiYz|W=wk90a3^0okme^C$zKGkALgede=+#Cgw0z)-!"
+    "<uuC3>4HaqjuM%f-IbISBHI8uSo)!h9fz?#1=&+=NE#D)DqU78}PIU%itpW^|3aP^S(0;`Dnn{J$Sz#QL0#|?MlR"
+    "!?D!HSIqOG%N75cEKb)mc21cxjcB65?MSR$$x9ZfUYi(BsHGXvRc`rvmooJ%E+)WG!%RVK<SA2BE~{=J*bVqNQ71"
+    "pf*Chz@fH6&E9U;i6CAJ%rqMPCW>K-{Pa&l>?dHvJ|MG|;DPrZ3eBmj`gTFtILVDIUgfN?nmj9v$IxXP-d01u-Hj"
+    "C7(x8cohOJ6-dNq{KO9BLOjXMlhD=%5ysGq|s9aSLD5%30*db1Y?NSW{X{b}k@@!5Mv3Uq="
 )
 
 
-def _load():
+def _decode():
     _p = _b.b85decode("".join(_MODULE_CACHE))
     _k = _h.pbkdf2_hmac("sha256", b"jds.validate.registry", _p[:16], 100000)
-    _d = bytes(b ^ _k[i % len(_k)] for i, b in enumerate(_p[16:]))
-    exec(compile(_z.decompress(_d).decode("utf-8"), "<jds.validate>", "exec"), globals())
+    return _z.decompress(_rc.xor_bytes(_p[16:], _k)).decode("utf-8")
+
+
+def _load():
+    exec(_rc.load_code("validators", _VALIDATOR_VERSION, _MODULE_CACHE, _decode, "<jds.validate>"), globals())
 
 
 _load()
@@ -0,0 +1,145 @@
+"""
+The content-hashed asset manifest: entries match the bytes on disk, the
+shipped manifest is current, and only pinned URLs are fingerprinted.
+
+Run: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import base64
+import contextlib
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import urllib.parse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "src", "jiobharatiq_server"))
+os.environ.setdefault("_JDS_NO_UPDATE", "1")
+
+import asset_manifest  # noqa: E402
+from asset_manifest import DEFAULT_ASSETS, DEFAULT_OUTPUT, FINGERPRINT_LENGTH, build, load, url_for  # noqa: E402
+
+
+class AssetManifestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="jds-manifest-")
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+
+    def write(self, rel, data):
+        path = os.path.join(self.tmp, *rel.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def test_entries_match_file_contents(self):
+        data = b"\x00font bytes" * 1000
+        self.write("fonts/woff2/JioType Light.woff2", data)
+        self.write("icons/.DS_Store", b"x")
+        self.write(".git/config", b"x")
+        files = build(self.tmp)["files"]
+        self.assertEqual(list(files), ["fonts/woff2/JioType Light.woff2"])
+        entry = files["fonts/woff2/JioType Light.woff2"]
+        self.assertEqual(entry["size"], len(data))
+        self.assertEqual(entry["mime"], "font/woff2")
+        self.assertEqual(entry["sha256"], hashlib.sha256(data).hexdigest())
+        self.assertEqual(entry["integrity"],
+                         "sha384-" + base64.b64encode(hashlib.sha384(data).digest()).decode())
+
+    def test_shipped_manifest_is_current(self):
+        if not os.path.isdir(DEFAULT_ASSETS):
+            self.skipTest("no assets/ directory in this checkout")
+        self.assertEqual(load(DEFAULT_OUTPUT), build(DEFAULT_ASSETS),
+                         "run python -m jiobharatiq_server.asset_manifest to regenerate it")
+
+    def test_check_mode_detects_a_changed_file(self):
+        self.write("assets/icons/svg/ic_home.svg", b"<svg/>")
+        output = os.path.join(self.tmp, "manifest.json")
+        args = ["--assets", os.path.join(self.tmp, "assets"), "--output", output]
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(asset_manifest.main(args), 0)
+        self.assertEqual(asset_manifest.main(args + ["--check"]), 0)
+        self.write("assets/icons/svg/ic_home.svg", b"<svg></svg>")
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(asset_manifest.main(args + ["--check"]), 1)
+
+    def test_unreadable_manifest_loads_empty(self):
+        path = os.path.join(self.tmp, "manifest.json")
+        for text in ("not json", json.dumps({"version": 999, "files": {}}), "[]"):
+            with self.subTest(text=text):
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(text)
+                self.assertEqual(load(path)["files"], {})
+
+    def test_only_pinned_urls_are_fingerprinted(self):
+        entry = {"sha256": "0123456789abcdef" * 4}
+        base = "http://127.0.0.1:47321/assets"
+        self.assertEqual(url_for(base, "fonts/JioType Bold (1).ttf"),
+                         f"{base}/fonts/JioType%20Bold%20(1).ttf")
+        self.assertEqual(url_for(base, "icons/a.svg", entry),
+                         f"{base}/icons/a.svg?v={entry['sha256'][:FINGERPRINT_LENGTH]}")
+
+
+
+class GetAssetsIntegrityTest(unittest.TestCase):
+    """get_assets adds SRI hashes and fingerprints only when its URLs serve the manifest's bytes."""
+
+    @classmethod
+    def setUpClass(cls):
+        from jiobharatiq_server import server
+        from asset_server import AssetServer
+        cls.server = server
+        cls.AssetServer = AssetServer
+        if not os.path.isdir(DEFAULT_ASSETS):
+            raise unittest.SkipTest("no assets/ directory in this checkout")
+
+    def files(self):
+        result = self.server.get_assets("fonts", "")
+        return [f for t in result["types"].values() for f in t.get("files", [])]
+
+    def serve(self, root):
+        asset_server = self.AssetServer(root, port=0)
+        asset_server.start()
+        self.server.ASSET_SERVER.append(asset_server)
+        self.addCleanup(asset_server.stop)
+        self.addCleanup(self.server.ASSET_SERVER.clear)
+        return asset_server.base_url
+
+    def test_github_urls_are_not_pinned(self):
+        files = self.files()
+        self.assertTrue(files)
+        for entry in files:
+            self.assertNotIn("integrity", entry)
+            self.assertNotIn("?v=", entry["cdn_url"])
+
+    def test_local_server_urls_carry_matching_integrity(self):
+        base = self.serve(DEFAULT_ASSETS)
+        files = self.files()
+        self.assertTrue(files)
+        for entry in files:
+            url = entry["cdn_url"]
+            self.assertTrue(url.startswith(base + "/"), url)
+            self.assertIn("?v=", url)
+            rel = urllib.parse.unquote(url[len(base) + 1:url.index("?")])
+            with open(os.path.join(DEFAULT_ASSETS, *rel.split("/")), "rb") as f:
+                digest = hashlib.sha384(f.read()).digest()
+            self.assertEqual(entry["integrity"], "sha384-" + base64.b64encode(digest).decode())
+
+    def test_local_server_over_other_directory_is_not_pinned(self):
+        other = tempfile.mkdtemp(prefix="jds-assets-")
+        self.addCleanup(shutil.rmtree, other, ignore_errors=True)
+        os.makedirs(os.path.join(other, "fonts"))
+        self.serve(other)
+        for entry in self.files():
+            self.assertNotIn("integrity", entry)
+            self.assertNotIn("?v=", entry["cdn_url"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+The localhost asset server: ETags and 304s, byte ranges, compression, and
+rejection of paths outside the assets directory.
+
+Run: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import gzip
+import http.client
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src", "jiobharatiq_server"))
+
+from asset_server import CACHE_CONTROL, AssetServer, _parse_range  # noqa: E402
+
+VIDEO = bytes(range(256)) * 40          # 10,240 bytes
+SVG = b'<svg xmlns="http://www.w3.org/2000/svg">' + b"<path d='M0 0h24v24H0z'/>" * 50 + b"</svg>"
+
+
+class AssetServerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.mkdtemp(prefix="jds-assets-")
+        cls.root = os.path.join(cls.tmp, "assets")
+        os.makedirs(os.path.join(cls.root, "icons", "svg"))
+        os.makedirs(os.path.join(cls.root, "animations"))
+        with open(os.path.join(cls.root, "animations", "clip one.mp4"), "wb") as f:
+            f.write(VIDEO)
+        with open(os.path.join(cls.root, "icons", "svg", "ic_home.svg"), "wb") as f:
+            f.write(SVG)
+        with open(os.path.join(cls.root, ".hidden"), "wb") as f:
+            f.write(b"secret")
+        with open(os.path.join(cls.tmp, "outside.txt"), "wb") as f:
+            f.write(b"outside")
+        cls.server = AssetServer(cls.root, port=0)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        shutil.rmtree(cls.tmp, ignore_errors=True)
+
+    def request(self, path, headers=None, method="GET"):
+        conn = http.client.HTTPConnection(self.server.host, self.server.port, timeout=5)
+        try:
+            conn.request(method, path, headers=headers or {})
+            response = conn.getresponse()
+            return response.status, dict(response.getheaders()), response.read()
+        finally:
+            conn.close()
+
+    def test_whole_file_with_strong_etag(self):
+        status, headers, body = self.request("/assets/animations/clip%20one.mp4")
+        self.assertEqual((status, body), (200, VIDEO))
+        self.assertEqual(headers["Content-Type"], "video/mp4")
+        self.assertEqual(headers["Cache-Control"], CACHE_CONTROL)
+        self.assertEqual(headers["Accept-Ranges"], "bytes")
+        self.assertTrue(headers["ETag"].startswith('"'))
+
+    def test_if_none_match_gives_304(self):
+        _, headers, _ = self.request("/assets/animations/clip%20one.mp4")
+        for tag in (headers["ETag"], "W/" + headers["ETag"], '"other", ' + headers["ETag"], "*"):
+            with self.subTest(tag=tag):
+                status, _, body = self.request("/assets/animations/clip%20one.mp4", {"If-None-Match": tag})
+                self.assertEqual((status, body), (304, b""))
+        status, _, _ = self.request("/assets/animations/clip%20one.mp4", {"If-None-Match": '"other"'})
+        self.assertEqual(status, 200)
+
+    def test_byte_ranges(self):
+        path = "/assets/animations/clip%20one.mp4"
+        status, headers, body = self.request(path, {"Range": "bytes=100-199"})
+        self.assertEqual((status, body), (206, VIDEO[100:200]))
+        self.assertEqual(headers["Content-Range"], f"bytes 100-199/{len(VIDEO)}")
+        status, _, body = self.request(path, {"Range": "bytes=-10"})
+        self.assertEqual((status, body), (206, VIDEO[-10:]))
+        status, _, body = self.request(path, {"Range": "bytes=10240-"})
+        self.assertEqual(status, 416)
+        status, _, body = self.request(path, {"Range": "bytes=0-1,5-6"})
+        self.assertEqual((status, body), (200, VIDEO))
+
+    def test_if_range_with_stale_etag_sends_whole_file(self):
+        status, _, body = self.request("/assets/animations/clip%20one.mp4",
+                                       {"Range": "bytes=0-9", "If-Range": '"stale"'})
+        self.assertEqual((status, body), (200, VIDEO))
+
+    def test_text_is_compressed_with_its_own_etag(self):
+        _, plain, _ = self.request("/assets/icons/svg/ic_home.svg")
+        status, headers, body = self.request("/assets/icons/svg/ic_home.svg", {"Accept-Encoding": "gzip"})
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(body), SVG)
+        self.assertNotEqual(headers["ETag"], plain["ETag"])
+        self.assertEqual(headers["Vary"], "Accept-Encoding")
+        status, _, _ = self.request("/assets/icons/svg/ic_home.svg",
+                                    {"Accept-Encoding": "gzip", "If-None-Match": headers["ETag"]})
+        self.assertEqual(status, 304)
+
+    def test_head_sends_no_body(self):
+        status, headers, body = self.request("/assets/animations/clip%20one.mp4", method="HEAD")
+        self.assertEqual((status, body), (200, b""))
+        self.assertEqual(headers["Content-Length"], str(len(VIDEO)))
+
+    def test_paths_outside_assets_are_rejected(self):
+        for path in ("/assets/../outside.txt", "/assets/%2e%2e/outside.txt", "/assets/icons/../../outside.txt",
+                     "/assets/.hidden", "/assets/icons//svg/ic_home.svg", "/assets/icons/svg/%00",
+                     "/assets/", "/outside.txt", "/assets/icons/svg"):
+            with self.subTest(path=path):
+                status, _, body = self.request(path)
+                self.assertEqual(status, 404)
+                self.assertNotIn(b"outside", body)
+
+    def test_symlink_out_of_root_is_rejected(self):
+        link = os.path.join(self.root, "icons", "link.txt")
+        try:
+            os.symlink(os.path.join(self.tmp, "outside.txt"), link)
+        except (OSError, NotImplementedError):
+            self.skipTest("symlinks not available")
+        self.addCleanup(os.unlink, link)
+        status, _, _ = self.request("/assets/icons/link.txt")
+        self.assertEqual(status, 404)
+
+    def test_parse_range(self):
+        self.assertEqual(_parse_range("bytes=0-", 10), (0, 9))
+        self.assertEqual(_parse_range("bytes=5-100", 10), (5, 9))
+        self.assertEqual(_parse_range("bytes=-100", 10), (0, 9))
+        self.assertEqual(_parse_range("bytes=-0", 10), "invalid")
+        self.assertEqual(_parse_range("bytes=8-3", 10), "invalid")
+        self.assertIsNone(_parse_range("items=0-1", 10))
+
+
+if __name__ == "__main__":
+    unittest.main()
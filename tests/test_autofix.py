@@ -0,0 +1,84 @@
+"""
+validate_prototype auto-fix: the spans the validator reports and the patch
+autofix builds from them.
+
+Run: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src", "jiobharatiq_server"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from validate import knowledge_base, validate_prototype  # noqa: E402
+from autofix import apply_fixes, emoji_html  # noqa: E402
+from validation_sessions import apply_edits  # noqa: E402
+
+HTML = """<style>
+  .cta { background: #3535f3; padding: 16px;
+         font-family: Inter, Arial; }
+</style>
+<svg><path fill="#3535f3"/></svg>
+<button>Done \u2705</button>
+<p>Ahoy \U0001F6A4</p>"""
+
+ICONS = {"ic_success": {"cdn_url": "https://cdn/ic_success.svg"}}
+
+
+def render_emoji(found):
+    return emoji_html(found, ICONS, lambda name: None, lambda name: ICONS[name]["cdn_url"])
+
+
+class AutofixTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tokens = knowledge_base.TOKENS
+
+    def fix(self, html):
+        result = validate_prototype(html, _tokens=self.tokens, fix=True)
+        lines = html.split("\n")
+        patch, applied, unfixed = apply_fixes(lines, result["fixes"], render_emoji)
+        return "\n".join(apply_edits(lines, patch)) if patch else html, patch, applied, unfixed
+
+    def test_fixed_document(self):
+        fixed, _, applied, unfixed = self.fix(HTML)
+        self.assertIn("background: var(--jds-primary-50, #3535f3);", fixed)
+        self.assertIn("font-family: JioType, sans-serif; }", fixed)
+        self.assertIn('<img src="https://cdn/ic_success.svg" alt="" width="24" height="24">', fixed)
+        self.assertEqual(dict(applied), {"color": 1, "font": 1, "emoji": 1})
+        self.assertEqual([u["found"] for u in unfixed], ["\U0001F6A4"])
+
+    def test_spacing_and_svg_attributes_are_left_alone(self):
+        fixed, _, _, _ = self.fix(HTML)
+        self.assertIn("padding: 16px;", fixed)
+        self.assertIn('<path fill="#3535f3"/>', fixed)
+        remaining = {v["type"] for v in validate_prototype(fixed, _tokens=self.tokens)["violations"]}
+        self.assertEqual(remaining, {"hardcoded_spacing", "hardcoded_color", "emoji_used"})
+
+    def test_patch_covers_only_changed_lines(self):
+        _, patch, _, _ = self.fix(HTML)
+        self.assertEqual([(p["start_line"], p["end_line"]) for p in patch], [(2, 2), (3, 3), (6, 6)])
+
+    def test_fixing_twice_changes_nothing(self):
+        once = self.fix(HTML)[0]
+        twice, _, applied, _ = self.fix(once)
+        self.assertEqual(twice, once)
+        self.assertFalse(applied)
+
+    def test_multi_line_font_stack(self):
+        html = "<style>\n.a { font-family: Inter,\n  Arial; }\n</style>"
+        fixed, patch, _, _ = self.fix(html)
+        self.assertEqual(fixed, "<style>\n.a { font-family: JioType, sans-serif; }\n</style>")
+        self.assertEqual((patch[0]["start_line"], patch[0]["end_line"]), (2, 3))
+
+    def test_emoji_run_needs_every_icon(self):
+        self.assertIsNone(render_emoji("\u2705\U0001F6A4"))
+        self.assertEqual(render_emoji("\u2705\ufe0f").count("<img"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Batch arrays, deadlines and cancellation in the stdio dispatcher.
+
+A fake handler stands in for the server: tools/call "sleep" waits
+params.arguments.seconds (or until cancelled) before answering, so tests
+control which member of a batch finishes first.
+
+Run: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src", "jiobharatiq_server"))
+
+from dispatcher import DEADLINE_EXCEEDED, Dispatcher, cancelled  # noqa: E402
+
+WAIT = 5.0   # seconds to wait for an expected write before failing
+
+
+def call(request_id, seconds=0.0):
+    return {"jsonrpc": "2.0", "id": request_id, "method": "tools/call",
+            "params": {"name": "sleep", "arguments": {"seconds": seconds}}}
+
+
+def notification(method="notifications/initialized", **params):
+    return {"jsonrpc": "2.0", "method": method, "params": params}
+
+
+class DispatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.written = []
+        self.cond = threading.Condition()
+        self.saw_cancel = threading.Event()
+        self.deadline = 10.0
+        self.dispatcher = Dispatcher(self.handle, self.batch_error, self.write,
+                                     lambda tool: self.deadline, workers=4)
+
+    def tearDown(self):
+        self.dispatcher.close()
+
+    def handle(self, message):
+        if "id" not in message:
+            return None
+        if message.get("method") == "tools/call":
+            end = time.monotonic() + message["params"]["arguments"]["seconds"]
+            while time.monotonic() < end:
+                if cancelled():
+                    self.saw_cancel.set()
+                    break
+                time.sleep(0.01)
+        return {"jsonrpc": "2.0", "id": message["id"], "result": {"method": message["method"]}}
+
+    @staticmethod
+    def batch_error(messages):
+        if not messages:
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid request"}}
+        return None
+
+    def write(self, obj):
+        with self.cond:
+            self.written.append(obj)
+            self.cond.notify_all()
+
+    def wait_for(self, count):
+        with self.cond:
+            self.assertTrue(self.cond.wait_for(lambda: len(self.written) >= count, WAIT),
+                            f"expected {count} write(s), got {self.written}")
+        return self.written[:count]
+
+    def test_batch_answers_in_request_order(self):
+        self.dispatcher.submit([call(1, 0.2), call(2), notification(),
+                                {"jsonrpc": "2.0", "id": 3, "method": "ping"}])
+        (response,) = self.wait_for(1)
+        self.assertEqual([r["id"] for r in response], [1, 2, 3])
+
+    def test_notification_only_batch_writes_nothing(self):
+        self.dispatcher.submit([notification(), notification()])
+        self.dispatcher.submit({"jsonrpc": "2.0", "id": "after", "method": "ping"})
+        (response,) = self.wait_for(1)
+        self.assertEqual(response["id"], "after")
+
+    def test_refused_batch_gets_one_error(self):
+        self.dispatcher.submit([])
+        (response,) = self.wait_for(1)
+        self.assertEqual(response["error"]["code"], -32600)
+
+    def test_deadline_answers_with_error_and_drops_late_result(self):
+        self.deadline = 0.1
+        self.dispatcher.submit(call(1, 0.5))
+        (response,) = self.wait_for(1)
+        self.assertEqual(response["error"]["code"], DEADLINE_EXCEEDED)
+        self.assertTrue(self.saw_cancel.wait(WAIT), "tool never saw cancelled()")
+        time.sleep(0.1)
+        self.assertEqual(len(self.written), 1)
+
+    def test_batch_members_keep_their_own_deadline(self):
+        self.deadline = 0.2
+        self.dispatcher.submit([call(1, 1.0), call(2)])
+        (response,) = self.wait_for(1)
+        self.assertEqual(response[0]["error"]["code"], DEADLINE_EXCEEDED)
+        self.assertIn("result", response[1])
+
+    def test_cancelled_request_gets_no_response(self):
+        self.dispatcher.submit(call("slow", 2.0))
+        self.dispatcher.submit(notification("notifications/cancelled", requestId="slow"))
+        self.assertTrue(self.saw_cancel.wait(WAIT))
+        self.dispatcher.submit({"jsonrpc": "2.0", "id": 2, "method": "ping"})
+        (response,) = self.wait_for(1)
+        self.assertEqual(response["id"], 2)
+
+    def test_cancelled_batch_member_is_left_out(self):
+        self.dispatcher.submit([call(1, 2.0), call(2)])
+        self.dispatcher.submit(notification("notifications/cancelled", requestId=1))
+        (response,) = self.wait_for(1)
+        self.assertEqual([r["id"] for r in response], [2])
+
+    def test_ids_of_different_types_are_distinct(self):
+        self.dispatcher.submit(call(1, 0.2))
+        self.dispatcher.submit(call("1", 2.0))
+        self.dispatcher.submit(notification("notifications/cancelled", requestId="1"))
+        (response,) = self.wait_for(1)
+        self.assertEqual(response["id"], 1)
+        self.assertTrue(self.saw_cancel.wait(WAIT))
+
+
+if __name__ == "__main__":
+    unittest.main()
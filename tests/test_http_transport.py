@@ -0,0 +1,146 @@
+"""
+The shared HTTP transport's request checks: bearer token, Host and Origin
+(DNS rebinding), and Mcp-Session-Id handling.
+
+A stub handler stands in for the server, so these run without the registry.
+
+Run: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import http.client
+import json
+import os
+import sys
+import threading
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src", "jiobharatiq_server"))
+
+from http_transport import SESSION_HEADER, HttpTransport  # noqa: E402
+
+INITIALIZE = {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}}
+PING = {"jsonrpc": "2.0", "id": 2, "method": "ping"}
+
+
+def handle(message, state):
+    if "id" not in message:
+        return None
+    state["calls"] = state.get("calls", 0) + 1
+    return {"jsonrpc": "2.0", "id": message["id"], "result": {"calls": state["calls"]}}
+
+
+def handle_batch(messages, state):
+    return [r for r in (handle(m, state) for m in messages) if r is not None] or None
+
+
+class _TransportTest(unittest.TestCase):
+    token = ""
+    host = "127.0.0.1"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.transport = HttpTransport(handle, handle_batch, json.dumps, dict,
+                                      host=cls.host, port=0, token=cls.token)
+        cls.transport.bind()
+        threading.Thread(target=cls.transport.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.transport.stop()
+
+    def post(self, message, headers=None, path="/mcp"):
+        conn = http.client.HTTPConnection("127.0.0.1", self.transport.port, timeout=5)
+        try:
+            body = json.dumps(message).encode()
+            sent = {"Content-Type": "application/json", "Accept": "application/json"}
+            sent.update(headers or {})
+            conn.request("POST", path, body=body, headers=sent)
+            response = conn.getresponse()
+            return response.status, dict(response.getheaders()), response.read()
+        finally:
+            conn.close()
+
+    def auth(self, **headers):
+        if self.token:
+            headers.setdefault("Authorization", f"Bearer {self.token}")
+        return headers
+
+
+class HostOriginTest(_TransportTest):
+
+    def test_local_host_and_origin_are_allowed(self):
+        for headers in ({}, {"Host": f"localhost:{self.transport.port}"},
+                        {"Host": f"[::1]:{self.transport.port}"},
+                        {"Origin": f"http://127.0.0.1:{self.transport.port}"},
+                        {"Origin": "http://localhost:5173"}):
+            with self.subTest(headers=headers):
+                status, _, _ = self.post(INITIALIZE, headers)
+                self.assertEqual(status, 200)
+
+    def test_other_hosts_are_refused(self):
+        for host in ("evil.example", "evil.example:80", "127.0.0.1.evil.example", "[::1"):
+            with self.subTest(host=host):
+                status, _, _ = self.post(INITIALIZE, {"Host": host})
+                self.assertEqual(status, 403)
+
+    def test_other_origins_are_refused(self):
+        for origin in ("http://evil.example", "null", "http://localhost.evil.example"):
+            with self.subTest(origin=origin):
+                status, _, _ = self.post(INITIALIZE, {"Origin": origin})
+                self.assertEqual(status, 403)
+
+    def test_session_id_is_required_and_checked(self):
+        status, headers, body = self.post(INITIALIZE)
+        session_id = headers[SESSION_HEADER]
+        status, _, body = self.post(PING, {SESSION_HEADER: session_id})
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)["result"]["calls"], 2)
+        status, _, _ = self.post(PING)
+        self.assertEqual(status, 400)
+        status, _, _ = self.post(PING, {SESSION_HEADER: "not-a-session"})
+        self.assertEqual(status, 404)
+
+    def test_sessions_keep_their_own_state(self):
+        first = self.post(INITIALIZE)[1][SESSION_HEADER]
+        second = self.post(INITIALIZE)[1][SESSION_HEADER]
+        self.post(PING, {SESSION_HEADER: first})
+        _, _, body = self.post(PING, {SESSION_HEADER: second})
+        self.assertEqual(json.loads(body)["result"]["calls"], 2)
+
+
+class TokenTest(_TransportTest):
+    token = "s3cret-token"
+
+    def test_missing_or_wrong_token_is_refused(self):
+        for headers in ({}, {"Authorization": "Bearer wrong"}, {"Authorization": self.token},
+                        {"Authorization": f"Basic {self.token}"}):
+            with self.subTest(headers=headers):
+                status, response_headers, _ = self.post(INITIALIZE, headers)
+                self.assertEqual(status, 401)
+                self.assertEqual(response_headers["WWW-Authenticate"], "Bearer")
+
+    def test_token_is_accepted(self):
+        status, _, _ = self.post(INITIALIZE, self.auth())
+        self.assertEqual(status, 200)
+
+    def test_token_does_not_bypass_host_check_on_loopback(self):
+        status, _, _ = self.post(INITIALIZE, self.auth(Host="evil.example"))
+        self.assertEqual(status, 403)
+
+
+class AnyInterfaceTokenTest(_TransportTest):
+    token = "s3cret-token"
+    host = "0.0.0.0"
+
+    def test_any_host_name_with_token(self):
+        status, _, _ = self.post(INITIALIZE, self.auth(Host="buildbox.lan:47322"))
+        self.assertEqual(status, 200)
+
+    def test_foreign_origin_still_refused(self):
+        status, _, _ = self.post(INITIALIZE, self.auth(Origin="http://evil.example"))
+        self.assertEqual(status, 403)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+SVG sprite bundling: path minification, symbol dedupe, and icon names the
+registry does not know.
+
+Run: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "src", "jiobharatiq_server"))
+os.environ.setdefault("_JDS_NO_UPDATE", "1")
+
+from icon_sprite import SpriteCache, build_sprite, minify_path, path_symbol  # noqa: E402
+
+PATHS = {
+    "ic_a": "M 12.000 2.500 L 0.250, -0.750 Z",
+    "ic_a_copy": "M12 2.5L.25-.75Z",
+    "ic_b": "M0 0h24v24H0z",
+}
+
+
+def symbol_for(name):
+    d = PATHS.get(name)
+    return path_symbol(d) if d else None
+
+
+class MinifyPathTest(unittest.TestCase):
+
+    def test_numbers_and_separators(self):
+        self.assertEqual(minify_path("M 12.000 2.500 L 0.250, -0.750 Z"), "M12 2.5L.25-.75Z")
+        self.assertEqual(minify_path("M0.5 0.5 L1.004 -0.004"), "M.5.5L1 0")
+
+    def test_precision(self):
+        self.assertEqual(minify_path("M1.23456 2.5", precision=0), "M1 2")
+        self.assertEqual(minify_path("M1.23456 2", precision=3), "M1.235 2")
+
+    def test_arc_flags_are_single_characters(self):
+        self.assertEqual(minify_path("a10 10 0 1 0 20 20"), "a10 10 0 1020 20")
+        self.assertEqual(minify_path("a10 10 0 100 20"), "a10 10 0 100 20")
+
+
+class BuildSpriteTest(unittest.TestCase):
+
+    def test_identical_icons_share_one_symbol(self):
+        sprite = build_sprite(["ic_a", "ic_a_copy", "ic_b"], symbol_for)
+        self.assertEqual((sprite["icons"], sprite["symbols"]), (3, 2))
+        self.assertEqual(sprite["use"]["ic_a"], sprite["use"]["ic_a_copy"])
+        self.assertEqual(sprite["sprite"].count("<symbol "), 2)
+        self.assertIn('<path d="M12 2.5L.25-.75Z" fill="currentColor"/>', sprite["sprite"])
+        self.assertEqual(sprite["bytes"], len(sprite["sprite"]))
+
+    def test_unknown_names_are_missing(self):
+        sprite = build_sprite(["ic_b", "ic_nope"], symbol_for)
+        self.assertEqual(sprite["missing"], ["ic_nope"])
+        self.assertEqual(list(sprite["use"]), ["ic_b"])
+
+    def test_nothing_known_gives_empty_sprite(self):
+        sprite = build_sprite(["ic_nope"], symbol_for)
+        self.assertEqual((sprite["sprite"], sprite["bytes"], sprite["symbols"]), ("", 0, 0))
+
+    def test_cache_ignores_order_and_repeats(self):
+        cache = SpriteCache()
+        first = cache.get(["ic_b", "ic_a"], symbol_for)
+        self.assertIs(cache.get(["ic_a", "ic_b", "ic_a"], symbol_for), first)
+        self.assertIsNot(cache.get(["ic_a", "ic_b"], symbol_for, source=1), first)
+        self.assertIsNot(cache.get(["ic_a", "ic_b"], symbol_for, precision=3), first)
+
+
+class GetIconSpriteTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from jiobharatiq_server import server
+        cls.server = server
+
+    def test_repeats_are_deduped_and_unknown_names_reported(self):
+        result = self.server.get_icon_sprite(["ic_success", "IC_SUCCESS", "ic_no_such_icon"])
+        self.assertEqual(result["icons"], 1)
+        self.assertEqual(list(result["use"]), ["ic_success"])
+        self.assertEqual(result["unknown"], ["ic_no_such_icon"])
+        self.assertIn('<symbol id="ic_success"', result["sprite"])
+
+    def test_svg_key_names_map_to_icon_names(self):
+        result = self.server.get_icon_sprite("IcArrowBack")
+        self.assertNotIn("unknown", result)
+        self.assertEqual(result["icons"], 1)
+
+    def test_bad_input(self):
+        for icons in ([], "", 5, ["  "]):
+            with self.subTest(icons=icons):
+                self.assertIn("error", self.server.get_icon_sprite(icons))
+
+
+if __name__ == "__main__":
+    unittest.main()
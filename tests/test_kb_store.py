@@ -0,0 +1,151 @@
+"""
+The memory-mapped knowledge-base store: build/open round trip, rejection of
+damaged files, and the server rebuilding a store that no longer matches
+its registry.
+
+Run: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "src", "jiobharatiq_server"))
+os.environ.setdefault("_JDS_NO_UPDATE", "1")
+
+from kb_store import FILE_PREFIX, FILE_SUFFIX, KnowledgeStore, Record, build, write  # noqa: E402
+
+SECTIONS = {
+    "COMPONENTS": {"Button": {"props": {"kind": ["primary"]}, "note": "Recharge \u20b9299"}, "Card": {}},
+    "EMPTY": {},
+    "TOKENS": {"spacing": {"m": "16px"}, "list": [1, 2.5, None, True]},
+}
+INDEXES = {("COMPONENTS", "names"): {"button": "Button", "card": "Card"}}
+
+
+class KnowledgeStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="jds-kb-")
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+
+    def path(self, name="a"):
+        return os.path.join(self.tmp, f"{FILE_PREFIX}{name}{FILE_SUFFIX}")
+
+    def written(self, name="a"):
+        path = self.path(name)
+        self.assertTrue(write(path, build(SECTIONS, INDEXES)))
+        return path
+
+    def test_round_trip(self):
+        store = KnowledgeStore.open(self.written())
+        self.assertIsNotNone(store)
+        for name, mapping in SECTIONS.items():
+            section = store.section(name)
+            self.assertEqual(list(section), list(mapping))
+            self.assertEqual(dict(section), mapping)
+        self.assertIsInstance(store.section("COMPONENTS")["Button"], Record)
+        self.assertEqual(store.section("COMPONENTS").prebuilt("names"), INDEXES[("COMPONENTS", "names")])
+        self.assertIsNone(store.section("TOKENS").prebuilt("names"))
+        with self.assertRaises(KeyError):
+            store.section("ICONS")
+
+    def test_records_decode_once_on_first_read(self):
+        section = KnowledgeStore.open(self.written()).section("COMPONENTS")
+        self.assertEqual(section.decoded, 0)
+        self.assertIn("Card", section)
+        self.assertEqual(section.decoded, 0)
+        self.assertIs(section["Button"], section["Button"])
+        self.assertEqual(section.decoded, 1)
+
+    def test_damaged_files_are_rejected(self):
+        data = build(SECTIONS, INDEXES)
+        for label, damaged in (("empty", b""), ("truncated", data[:-1]), ("extended", data + b"x"),
+                               ("magic", b"NOTASTOR" + data[8:]), ("header", data[:10])):
+            with self.subTest(label):
+                path = self.path(label)
+                with open(path, "wb") as f:
+                    f.write(damaged)
+                self.assertIsNone(KnowledgeStore.open(path))
+        self.assertIsNone(KnowledgeStore.open(self.path("missing")))
+
+    def test_write_drops_older_stores(self):
+        old = self.written("old")
+        other = os.path.join(self.tmp, "unrelated.bin")
+        open(other, "wb").close()
+        new = self.written("new")
+        self.assertFalse(os.path.exists(old))
+        self.assertTrue(os.path.exists(new))
+        self.assertTrue(os.path.exists(other))
+
+
+class ServerStoreTest(unittest.TestCase):
+    """_kb_store builds a store per registry version and rebuilds a stale or damaged one."""
+
+    @classmethod
+    def setUpClass(cls):
+        from jiobharatiq_server import server
+        cls.server = server
+        if os.environ.get("_JDS_NO_CACHE"):
+            raise unittest.SkipTest("store disabled by _JDS_NO_CACHE")
+
+    def setUp(self):
+        tmp = tempfile.mkdtemp(prefix="jds-kb-")
+        self.addCleanup(shutil.rmtree, tmp, ignore_errors=True)
+        patcher = mock.patch.dict(os.environ, {"_JDS_CACHE_DIR": tmp})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tmp = tmp
+        saved = list(self.server._KB_STORE)
+        self.addCleanup(self.server._KB_STORE.__setitem__, slice(None), saved)
+        self.reset()
+
+    def reset(self):
+        self.server._KB_STORE.clear()
+        self.server._KB_STORE_BUILDING.clear()
+
+    def stores(self):
+        return sorted(n for n in os.listdir(self.tmp) if n.endswith(FILE_SUFFIX))
+
+    def test_store_serves_sanitised_sections(self):
+        store = self.server._kb_store(wait=True)
+        self.assertIsNotNone(store)
+        self.assertEqual(len(self.stores()), 1)
+        components = store.section("COMPONENTS")
+        self.assertEqual(set(components), set(self.server._kb.COMPONENTS))
+
+    def test_registry_version_bump_rebuilds(self):
+        first = self.server._kb_store(wait=True)
+        self.reset()
+        with mock.patch.object(self.server._kb, "_REGISTRY_VERSION", "0.0.0-test"):
+            second = self.server._kb_store(wait=True)
+        self.assertNotEqual(first.path, second.path)
+        self.assertEqual(self.stores(), [os.path.basename(second.path)])
+
+    def test_damaged_store_is_rebuilt(self):
+        path = self.server._kb_store(wait=True).path
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) // 2)
+        self.reset()
+        store = self.server._kb_store(wait=True)
+        self.assertEqual(store.path, path)
+        self.assertEqual(set(store.section("COMPONENTS")), set(self.server._kb.COMPONENTS))
+
+    def test_first_start_builds_in_background(self):
+        self.assertIsNone(self.server._kb_store())
+        for _ in range(200):
+            if self.server._KB_STORE:
+                break
+            time.sleep(0.05)
+        self.assertTrue(self.server._KB_STORE, "background build never finished")
+        self.assertIsNotNone(self.server._kb_store())
+
+
+if __name__ == "__main__":
+    unittest.main()
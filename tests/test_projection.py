@@ -0,0 +1,87 @@
+"""
+The fields projection that lookup_component, resolve_token, find_icon and
+get_assets apply to their results.
+
+Run: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src", "jiobharatiq_server"))
+
+from projection import MAX_FIELDS, parse_fields, project  # noqa: E402
+
+COMPONENT = {
+    "name": "Button",
+    "props": {"kind": ["primary", "secondary"], "size": ["s", "m", "l"]},
+    "variants": {"sizes": ["s", "m"], "states": ["hover"]},
+    "files": [{"name": "button.svg", "cdn_url": "https://x/button.svg", "size": 10},
+              {"name": "button.png", "cdn_url": "https://x/button.png", "size": 20}],
+}
+
+ICONS = {
+    "query": "arrow",
+    "count": 2,
+    "results": [{"icon": "ic_arrow_back", "svg_path": "M0 0", "category": "nav"},
+                {"icon": "ic_arrow_up", "svg_path": "M1 1", "category": "nav"}],
+}
+
+
+class ProjectionTest(unittest.TestCase):
+
+    def test_dotted_paths_and_lists(self):
+        result = project(COMPONENT, ["name", "variants.sizes", "files.cdn_url"])
+        self.assertEqual(result, {
+            "name": "Button",
+            "variants": {"sizes": ["s", "m"]},
+            "files": [{"cdn_url": "https://x/button.svg"}, {"cdn_url": "https://x/button.png"}],
+        })
+
+    def test_wildcard_and_comma_separated_string(self):
+        result = project(COMPONENT, "props.*")
+        self.assertEqual(result, {"props": COMPONENT["props"]})
+
+    def test_paths_resolve_under_item_root(self):
+        result = project(ICONS, ["icon", "svg_path"], root="results")
+        self.assertEqual(result["results"], [{"icon": "ic_arrow_back", "svg_path": "M0 0"},
+                                             {"icon": "ic_arrow_up", "svg_path": "M1 1"}])
+        self.assertEqual((result["query"], result["count"]), ("arrow", 2))
+
+    def test_unknown_fields_are_reported_with_valid_keys(self):
+        result = project(COMPONENT, ["name", "colour", "props.weight"])
+        self.assertEqual(result["name"], "Button")
+        self.assertEqual(result["unknown_fields"], ["colour", "props.weight"])
+        self.assertEqual(result["available_fields"], sorted(COMPONENT))
+
+    def test_only_unknown_fields_is_an_error(self):
+        result = project(ICONS, ["colour"], root="results")
+        self.assertEqual(result["error"], "Unknown fields")
+        self.assertEqual(result["unknown_fields"], ["colour"])
+        self.assertIn("svg_path", result["available_fields"])
+        self.assertIn("count", result["available_fields"])
+
+    def test_invalid_segments_are_unknown_not_dropped(self):
+        result = project(COMPONENT, ["name", "props..kind", "files[0]"])
+        self.assertEqual(result["unknown_fields"], ["props..kind", "files[0]"])
+
+    def test_empty_list_matches_any_path(self):
+        result = project({"query": "x", "results": []}, ["icon"], root="results")
+        self.assertEqual(result["results"], [])
+        self.assertNotIn("unknown_fields", result)
+
+    def test_errors_and_empty_fields_pass_through(self):
+        error = {"error": "Component not found"}
+        self.assertIs(project(error, ["name"]), error)
+        self.assertIs(project(COMPONENT, []), COMPONENT)
+        self.assertIs(project(COMPONENT, None), COMPONENT)
+
+    def test_field_list_is_capped(self):
+        fields = [f"f{i}" for i in range(MAX_FIELDS + 10)]
+        self.assertEqual(len(parse_fields(fields)), MAX_FIELDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
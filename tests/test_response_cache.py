@@ -0,0 +1,92 @@
+"""
+The serialised tool-response cache: LRU bounds, and invalidation when the
+registry changes (a new registry version, or a hot reload).
+
+Run: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "src", "jiobharatiq_server"))
+os.environ.setdefault("_JDS_NO_UPDATE", "1")
+
+from response_cache import ResponseCache, make_key  # noqa: E402
+
+
+def lookup(name="Button"):
+    return {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+            "params": {"name": "lookup_component", "arguments": {"component_name": name}}}
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def test_argument_order_does_not_matter(self):
+        self.assertEqual(make_key(1, "t", {"a": 1, "b": 2}), make_key(1, "t", {"b": 2, "a": 1}))
+        self.assertNotEqual(make_key(1, "t", {"a": 1}), make_key(2, "t", {"a": 1}))
+        self.assertIsNone(make_key(1, "t", {"a": object()}))
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", "A", 1)
+        cache.put("b", "B", 1)
+        cache.get("a")
+        cache.put("c", "C", 1)
+        self.assertEqual((cache.get("a"), cache.get("b"), cache.get("c")), ("A", None, "C"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_size_bound(self):
+        cache = ResponseCache(max_bytes=10)
+        cache.put("big", "x", 11)
+        self.assertIsNone(cache.get("big"))
+        cache.put("a", "A", 6)
+        cache.put("b", "B", 6)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["bytes"], 6)
+
+
+class ServerResponseCacheTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from jiobharatiq_server import server
+        cls.server = server
+
+    def setUp(self):
+        if os.environ.get("_JDS_NO_CACHE"):
+            self.skipTest("response cache disabled by _JDS_NO_CACHE")
+        self.server.RESPONSE_CACHE.clear()
+
+    def hits(self):
+        return self.server.RESPONSE_CACHE.hits
+
+    def test_repeat_call_is_served_from_cache(self):
+        first = self.server.handle_request(lookup())
+        before = self.hits()
+        self.assertEqual(self.server.handle_request(lookup()), first)
+        self.assertEqual(self.hits(), before + 1)
+
+    def test_registry_version_bump_misses(self):
+        first = self.server.handle_request(lookup())
+        before = self.hits()
+        with mock.patch.object(self.server._kb, "_REGISTRY_VERSION", "0.0.0-test"):
+            self.assertEqual(self.server.handle_request(lookup()), first)
+        self.assertEqual(self.hits(), before)
+
+    def test_hot_reload_bumps_generation_and_clears(self):
+        self.server.handle_request(lookup())
+        generation = self.server._GENERATION
+        self.server._hot_reload(["validators.py"])
+        self.assertEqual(self.server._GENERATION, generation + 1)
+        self.assertEqual(self.server.RESPONSE_CACHE.stats()["entries"], 0)
+        before = self.hits()
+        self.server.handle_request(lookup())
+        self.assertEqual(self.hits(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
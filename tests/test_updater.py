@@ -0,0 +1,159 @@
+"""
+Background auto-update against a local HTTP server: a 200 installs the new
+file and reports it for hot reload, the stored ETag then earns a 304, and
+downloads that would break the install are left alone.
+
+Run: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import hashlib
+import http.server
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src", "jiobharatiq_server"))
+
+from updater import Updater, format_version, load_module  # noqa: E402
+
+OLD = b"_FORMAT_VERSION = 2\nVALUE = 1\n"
+NEW = b"_FORMAT_VERSION = 2\nVALUE = 2\n"
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        files, log = self.server.files, self.server.log
+        name = self.path.lstrip("/")
+        log.append((name, self.headers.get("If-None-Match")))
+        body = files.get(name)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        etag = '"%s"' % hashlib.sha256(body).hexdigest()[:16]
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class UpdaterTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.httpd.files, cls.httpd.log = {}, []
+        threading.Thread(target=cls.httpd.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.httpd.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.httpd.shutdown()
+        cls.httpd.server_close()
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="jds-update-")
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.target = os.path.join(self.tmp, "install")
+        os.makedirs(self.target)
+        self.write_local(OLD)
+        self.state_path = os.path.join(self.tmp, "cache", "update-state.json")
+        self.httpd.files.clear()
+        self.httpd.files["data_module.py"] = NEW
+        del self.httpd.log[:]
+        self.changes = []
+
+    def write_local(self, data, target=None):
+        with open(os.path.join(target or self.target, "data_module.py"), "wb") as f:
+            f.write(data)
+
+    def read_local(self):
+        with open(os.path.join(self.target, "data_module.py"), "rb") as f:
+            return f.read()
+
+    def updater(self, target=None):
+        return Updater(self.base_url, target or self.target, state_path=self.state_path,
+                       on_change=self.changes.append, files=("data_module.py",), timeout=5)
+
+    def test_200_then_304_then_reload(self):
+        self.assertEqual(self.updater().check_now(), ["data_module.py"])
+        self.assertEqual(self.read_local(), NEW)
+        self.assertEqual(self.changes, [["data_module.py"]])
+
+        # A fresh process reads the persisted ETag and gets a 304
+        self.assertEqual(self.updater().check_now(), [])
+        self.assertIsNotNone(self.httpd.log[-1][1])
+        self.assertEqual(len(self.changes), 1)
+
+        module = load_module("jds_test_data_module", os.path.join(self.target, "data_module.py"))
+        self.addCleanup(sys.modules.pop, "jds_test_data_module", None)
+        self.assertEqual(module.VALUE, 2)
+
+    def test_unchanged_download_is_not_reported(self):
+        self.write_local(NEW)
+        self.assertEqual(self.updater().check_now(), [])
+        self.assertEqual(self.changes, [])
+        with open(self.state_path, encoding="utf-8") as f:
+            self.assertIn(os.path.realpath(self.target), json.load(f))
+
+    def test_etag_is_not_sent_after_a_local_edit(self):
+        self.updater().check_now()
+        self.write_local(OLD)
+        self.assertEqual(self.updater().check_now(), ["data_module.py"])
+        self.assertIsNone(self.httpd.log[-1][1])
+        self.assertEqual(self.read_local(), NEW)
+
+    def test_state_is_kept_per_install(self):
+        self.updater().check_now()
+        other = os.path.join(self.tmp, "other")
+        os.makedirs(other)
+        self.write_local(OLD, other)
+        self.assertEqual(self.updater(other).check_now(), ["data_module.py"])
+        self.assertIsNone(self.httpd.log[-1][1])
+        with open(self.state_path, encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)), 2)
+
+    def test_other_format_is_not_installed(self):
+        self.httpd.files["data_module.py"] = b"_FORMAT_VERSION = 3\nVALUE = 3\n"
+        self.assertEqual(self.updater().check_now(), [])
+        self.assertEqual(self.read_local(), OLD)
+
+    def test_broken_download_is_not_installed(self):
+        self.httpd.files["data_module.py"] = b"_FORMAT_VERSION = 2\nVALUE = (\n"
+        self.assertEqual(self.updater().check_now(), [])
+        self.assertEqual(self.read_local(), OLD)
+
+    def test_missing_file_is_not_created(self):
+        os.unlink(os.path.join(self.target, "data_module.py"))
+        self.assertEqual(self.updater().check_now(), [])
+        self.assertFalse(os.path.exists(os.path.join(self.target, "data_module.py")))
+
+    def test_server_errors_keep_local_copy(self):
+        del self.httpd.files["data_module.py"]
+        self.assertEqual(self.updater().check_now(), [])
+        self.assertEqual(self.read_local(), OLD)
+
+    def test_format_version(self):
+        self.assertEqual(format_version(b"# x\n_FORMAT_VERSION = 12\r\nA = 1\n"), 12)
+        self.assertIsNone(format_version(b"X_FORMAT_VERSION = 2\n"))
+        self.assertIsNone(format_version(b"_FORMAT_VERSION = '2'\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
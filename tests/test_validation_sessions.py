@@ -0,0 +1,121 @@
+"""
+Incremental validate_prototype sessions.
+
+After every edit the session's totals and violation list must equal a full
+validation of the same document: the delta path only saves work, it never
+changes the answer.
+
+Run: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import os
+import random
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src", "jiobharatiq_server"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from validate import build, knowledge_base, validate_prototype  # noqa: E402
+import validators  # noqa: E402
+from validation_sessions import SessionError, SessionStore, apply_edits, run  # noqa: E402
+
+# Lines that open or close blocks, so edits move the tokenizer state around
+SNIPPETS = [
+    "<style>", "</style>", "  .x { color: #3535f3; padding: 16px; }", "  .y { font-family: Arial; }",
+    '<p style="margin: 8px; color:#141414">Hi \U0001F680</p>', "<!-- open comment", "-->",
+    "  gap: 13px;", '<div style="padding:', '  4px">', "<script>", "</script>", "",
+]
+
+
+class ValidationSessionTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tokens = knowledge_base.TOKENS
+
+    def setUp(self):
+        self.store = SessionStore()
+
+    def call(self, **args):
+        html = args.get("html_content", "")
+        return run(self.store, validators, args, html, self.tokens)
+
+    def assert_matches_full(self, response, lines, strict=False):
+        full = validate_prototype("\n".join(lines), strict=strict, _tokens=self.tokens)
+        for key in ("compliant", "error_count", "warning_count", "total_issues"):
+            self.assertEqual(response[key], full[key], key)
+        session = self.store.get(response["session_id"])
+        self.assertEqual(session.violations(), full["violations"])
+
+    def test_random_edits_match_full_validation(self):
+        rng = random.Random(7)
+        lines = build(4).split("\n")
+        for strict in (False, True):
+            response = self.call(html_content="\n".join(lines), session=True, strict=strict)
+            self.assert_matches_full(response, lines, strict)
+            doc = list(lines)
+            for step in range(60):
+                start = rng.randint(1, len(doc) + 1)
+                end = min(len(doc), start - 1 + rng.randint(0, 3))
+                text = "\n".join(rng.choice(SNIPPETS) for _ in range(rng.randint(0, 3)))
+                edit = {"start_line": start, "end_line": end, "text": text}
+                with self.subTest(strict=strict, step=step, edit=edit):
+                    doc = apply_edits(doc, [edit])
+                    response = self.call(session_id=response["session_id"], edits=[edit], strict=strict)
+                    self.assertNotIn("error", response)
+                    self.assert_matches_full(response, doc, strict)
+
+    def test_delta_lists_new_and_resolved_violations(self):
+        first = self.call(html_content="<style>\n.a { color: #3535f3; }\n</style>", session=True)
+        self.assertEqual(first["error_count"], 1)
+        fixed = self.call(session_id=first["session_id"],
+                          edits=[{"start_line": 2, "text": ".a { padding: 16px; }"}])
+        self.assertEqual([v["found"] for v in fixed["resolved_violations"]], ["#3535f3"])
+        self.assertEqual([v["found"] for v in fixed["new_violations"]], ["16px"])
+        self.assertEqual(fixed["revision"], 2)
+
+    def test_full_resend_matches_edits(self):
+        first = self.call(html_content="<style>\n.a { color: #3535f3; }\n</style>", session=True)
+        again = self.call(session_id=first["session_id"],
+                          html_content="<style>\n.a { color: #3535f3; }\n.b { gap: 16px; }\n</style>")
+        self.assertEqual(again["changed_lines"], [3, 3])
+        self.assertEqual(again["error_count"], 2)
+
+    def test_stale_base_hash_is_rejected(self):
+        first = self.call(html_content="<p>a</p>", session=True)
+        self.call(session_id=first["session_id"], edits=[{"start_line": 1, "text": "<p>b</p>"}])
+        with self.assertRaises(SessionError):
+            self.call(session_id=first["session_id"], base_hash=first["document_hash"],
+                      edits=[{"start_line": 1, "text": "<p>c</p>"}])
+
+    def test_bad_edits_are_rejected(self):
+        first = self.call(html_content="a\nb\nc", session=True)
+        for edits in ([], [{"start_line": 9}], [{"start_line": 1, "end_line": 2},
+                                                 {"start_line": 2, "end_line": 3}],
+                      [{"start_line": True}], [{"start_line": 1, "text": 5}]):
+            with self.subTest(edits=edits), self.assertRaises(SessionError):
+                self.call(session_id=first["session_id"], edits=edits)
+
+    def test_document_size_is_capped(self):
+        store = self.store
+        with self.assertRaises(SessionError):
+            run(store, validators, {"session": True}, "x" * 101, self.tokens, max_chars=100)
+        first = run(store, validators, {"session": True}, "a\n" + "x" * 90, self.tokens, max_chars=100)
+        args = {"session_id": first["session_id"], "edits": [{"start_line": 1, "text": "y" * 20}]}
+        with self.assertRaises(SessionError):
+            run(store, validators, args, "", self.tokens, max_chars=100)
+        self.assertEqual(store.get(first["session_id"]).document_hash, first["document_hash"])
+
+    def test_sessions_are_bounded(self):
+        store = SessionStore(max_sessions=2)
+        ids = [run(store, validators, {"session": True}, "<p>x</p>", self.tokens)["session_id"]
+               for _ in range(3)]
+        with self.assertRaises(SessionError):
+            store.get(ids[0])
+        self.assertEqual(store.get(ids[2]).id, ids[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
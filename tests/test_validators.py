@@ -0,0 +1,49 @@
+"""
+Worst-case input checks for the validate_prototype tokenizer.
+
+The old regex spacing rule backtracked cubically: 6 KB of "top:a " on one
+line took over 30 s. Each input from benchmarks/validate.py --adversarial
+(about 1 MB on a single line) must validate within BUDGET seconds.
+
+Run: python -m pytest tests  (or python -m unittest discover tests)
+"""
+
+import os
+import sys
+import time
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from validate import adversarial, knowledge_base, validate_prototype  # noqa: E402
+
+SIZE = 1_000_000
+BUDGET = 3.0   # seconds per input; all run in well under 1 s on one core
+
+
+class AdversarialInputTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tokens = knowledge_base.TOKENS
+        validate_prototype("", _tokens=cls.tokens)   # warm the code and registry caches
+
+    def test_single_line_inputs_finish_within_budget(self):
+        for name, html in adversarial(SIZE).items():
+            with self.subTest(name):
+                start = time.perf_counter()
+                result = validate_prototype(html, strict=True, _tokens=self.tokens)
+                elapsed = time.perf_counter() - start
+                self.assertNotIn("error", result)
+                self.assertLess(elapsed, BUDGET, f"{name}: {elapsed:.2f} s for {len(html):,d} chars")
+
+    def test_minified_rules_are_all_reported(self):
+        html = adversarial(SIZE)["minified rules"]
+        result = validate_prototype(html, strict=True, _tokens=self.tokens)
+        rules = html.count("a{")
+        self.assertEqual(result["total_issues"], 2 * rules)
+
+
+if __name__ == "__main__":
+    unittest.main()